@@ -0,0 +1,31 @@
+# Microbenchmark de búsqueda por ID
+# Compara la validación de un ID de cliente recorriendo listar_clientes()
+# (implementación anterior) contra la búsqueda por clave primaria actual.
+#
+# Uso: python -m benchmarks.bench_busqueda_id [clientes]
+
+import random
+import sys
+
+from benchmarks.comun import preparar_base_temporal, cargar_datos_basicos, medir, resumir
+from gestor_clientes.clientes_db import listar_clientes
+from gestor_clientes.clientes_validaciones import obtener_cliente_por_id_validado
+
+def buscar_recorriendo(id_cliente: int):
+    """
+    Reproduce la validación anterior: lista todos los clientes y busca en Python.
+    """
+    for cliente in listar_clientes():
+        if cliente[0] == id_cliente:
+            return cliente
+    return None
+
+if __name__ == "__main__":
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    preparar_base_temporal("busqueda_id")
+    cargar_datos_basicos(n_clientes=cantidad)
+
+    azar = random.Random(42)
+    print(f"clientes: {cantidad}")
+    print(f"  recorrido: {resumir(medir(lambda: buscar_recorriendo(azar.randint(1, cantidad)), 20))}")
+    print(f"  por clave: {resumir(medir(lambda: obtener_cliente_por_id_validado(str(azar.randint(1, cantidad))), 2000))}")
@@ -0,0 +1,70 @@
+# Benchmark de búsqueda de texto completo
+# Carga un catálogo sintético de productos y clientes con nombres acentuados y mide
+# buscar_productos / buscar_clientes con consultas parciales, como las que se escriben
+# al ir tipeando, contra un LIKE sobre listar_productos() (recorrido completo).
+#
+# Uso: python -m benchmarks.bench_busqueda_texto [productos]   (por defecto 50.000)
+
+import random
+import sys
+
+import db.data_base as data_base
+from benchmarks.comun import preparar_base_temporal, cargar_datos_basicos, medir, resumir
+from core.utils import normalizar_texto
+from gestor_productos.productos_db import listar_productos, buscar_productos
+from gestor_clientes.clientes_db import buscar_clientes
+
+TIPOS = ["Teclado", "Mouse", "Monitor", "Auricular", "Cámara", "Micrófono", "Parlante", "Cargador",
+         "Batería", "Cable", "Adaptador", "Impresora", "Router", "Disco", "Memoria", "Gabinete"]
+DETALLES = ["mecánico", "inalámbrico", "óptico", "ergonómico", "portátil", "gamer", "compacto",
+            "estéreo", "rápido", "reforzado", "USB-C", "HDMI", "Bluetooth", "de escritorio"]
+MARCAS = ["Logitech", "Genius", "Redragon", "Kingston", "Samsung", "Philips", "Noga", "Sony"]
+NOMBRES = ["Laura", "Martín", "Sofía", "Joaquín", "Lucía", "Tomás", "Valentina", "Nicolás", "Ramón", "Inés"]
+APELLIDOS = ["Martínez", "González", "Pérez", "Fernández", "López", "Díaz", "Gómez", "Álvarez", "Muñoz", "Suárez"]
+
+CONSULTAS_PRODUCTOS = ["t", "te", "tec", "tecl", "teclado mec", "camara", "CÁMARA port", "logi", "usb c", "bater sams"]
+CONSULTAS_CLIENTES = ["l", "lau", "laura mart", "munoz", "alvarez ines", "4000012", "cliente123"]
+
+def cargar_catalogo(productos: int, clientes: int) -> None:
+    """
+    Inserta productos y clientes con nombres combinados al azar (semilla fija).
+    """
+    azar = random.Random(42)
+    with data_base.conexion_db() as conexion:
+        conexion.executemany(
+            "INSERT INTO productos (nombre, categoria_id, proveedor_id, stock, precio_unitario) VALUES (?, ?, ?, ?, ?)",
+            [(f"{azar.choice(TIPOS)} {azar.choice(DETALLES)} {azar.choice(MARCAS)} {i}",
+              azar.randint(1, 10), azar.randint(1, 10), 100, 1000.0) for i in range(productos)]
+        )
+        conexion.executemany(
+            "INSERT INTO clientes (nombre, telefono, email, dni) VALUES (?, ?, ?, ?)",
+            [(f"{azar.choice(NOMBRES)} {azar.choice(APELLIDOS)}", "1100000000", f"cliente{i}@mail.com",
+              f"{40_000_000 + i}") for i in range(clientes)]
+        )
+        conexion.commit()
+
+def buscar_recorriendo(texto: str) -> list:
+    """
+    Alternativa sin índice: trae todo el catálogo y filtra en Python.
+    """
+    palabras = normalizar_texto(texto).split()
+    return [p for p in listar_productos() if all(palabra in normalizar_texto(f"{p[1]} {p[2]} {p[3]}") for palabra in palabras)][:20]
+
+if __name__ == "__main__":
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    preparar_base_temporal("busqueda_texto")
+    cargar_datos_basicos(n_clientes=0, n_productos=0)
+    cargar_catalogo(cantidad, cantidad)
+
+    print(f"productos y clientes: {cantidad}")
+    for consulta in CONSULTAS_PRODUCTOS:
+        resultados = len(buscar_productos(consulta))
+        resumen = resumir(medir(lambda: buscar_productos(consulta), 50))
+        print(f"  productos {consulta!r:<16} {resultados:>2} resultados → p50 {resumen['p50_ms']:.2f} ms, p95 {resumen['p95_ms']:.2f} ms")
+    for consulta in CONSULTAS_CLIENTES:
+        resultados = len(buscar_clientes(consulta))
+        resumen = resumir(medir(lambda: buscar_clientes(consulta), 50))
+        print(f"  clientes  {consulta!r:<16} {resultados:>2} resultados → p50 {resumen['p50_ms']:.2f} ms, p95 {resumen['p95_ms']:.2f} ms")
+
+    resumen = resumir(medir(lambda: buscar_recorriendo("teclado mec"), 3))
+    print(f"  recorrido completo 'teclado mec' → p50 {resumen['p50_ms']:.2f} ms")
@@ -0,0 +1,63 @@
+# Benchmark de la caché de datos de referencia
+# Mide lo que consulta un alta de producto (listar categorías y proveedores y validar
+# un ID de cada uno) con la caché activa y desactivada, el costo de releer después
+# de una escritura y el de una escritura en otra tabla, que no debe vaciar la caché.
+# También mide validar solo los IDs con la caché desactivada, que no lee las tablas enteras.
+#
+# Uso: python -m benchmarks.bench_cache_referencias [categorias_y_proveedores]
+
+import sys
+
+import db.data_base as data_base
+import db.cache_referencias as cache_referencias
+from benchmarks.comun import preparar_base_temporal, medir, resumir
+from gestor_categorias.categorias_db import listar_categorias, obtener_categoria_por_id, modificar_categoria
+from gestor_proveedores.proveedores_db import listar_proveedores, obtener_proveedor_por_id
+
+def alta_producto():
+    """
+    Reproduce las consultas de referencia de agregar_producto().
+    """
+    listar_categorias()
+    obtener_categoria_por_id(5)
+    listar_proveedores()
+    obtener_proveedor_por_id(5)
+
+def validar_ids():
+    """
+    Solo la validación de un ID de cada tabla, sin listar (con la tabla sin cargar va por clave primaria).
+    """
+    obtener_categoria_por_id(5)
+    obtener_proveedor_por_id(5)
+
+if __name__ == "__main__":
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    preparar_base_temporal("cache_referencias")
+    with data_base.conexion_db() as conexion:
+        conexion.executemany("INSERT INTO categorias (nombre, nombre_normalizado) VALUES (?, ?)",
+                             [(f"Categoria {i}", f"categoria {i}") for i in range(1, cantidad + 1)])
+        conexion.executemany("INSERT INTO proveedores (nombre, telefono, email, cuit) VALUES (?, ?, ?, ?)",
+                             [(f"Proveedor {i}", "1100000000", f"prov{i}@mail.com", f"30{i:09d}") for i in range(1, cantidad + 1)])
+        conexion.commit()
+
+    print(f"categorías y proveedores: {cantidad} de cada uno")
+    cache_referencias.CACHE_REFERENCIAS_ACTIVA = False
+    print(f"  sin caché:           {resumir(medir(alta_producto, 2000))}")
+    print(f"  validar IDs sin caché: {resumir(medir(validar_ids, 2000))}")
+    cache_referencias.CACHE_REFERENCIAS_ACTIVA = True
+    print(f"  con caché:           {resumir(medir(alta_producto, 2000))}")
+
+    contador = iter(range(10**9))
+    def escribir_y_leer():
+        modificar_categoria(5, f"Renombrada {next(contador)}")
+        alta_producto()
+    print(f"  escritura + relectura: {resumir(medir(escribir_y_leer, 200))}")
+
+    # Una escritura en otra tabla (como el stock de una venta) no debe vaciar la caché
+    def escribir_otra_tabla_y_leer():
+        with data_base.conexion_db() as conexion:
+            conexion.execute("INSERT INTO clientes (nombre, dni) VALUES (?, ?)", ("Cliente", f"{next(contador)}"))
+            conexion.commit()
+        alta_producto()
+    print(f"  otra tabla + lectura:  {resumir(medir(escribir_otra_tabla_y_leer, 200))}")
+    print(f"  {cache_referencias.estadisticas_cache_referencias()}")
@@ -0,0 +1,60 @@
+# Prueba de estrés de ventas concurrentes sobre el mismo producto
+# Varios procesos venden a la vez un producto con stock limitado. Al final el
+# stock nunca debe ser negativo y las unidades facturadas deben coincidir con
+# las descontadas.
+#
+# Uso: python -m benchmarks.bench_concurrencia_stock [procesos] [intentos_por_proceso] [stock]
+
+import contextlib
+import io
+import multiprocessing
+import sys
+import time
+
+import db.data_base as data_base
+from benchmarks.comun import preparar_base_temporal, cargar_datos_basicos
+from gestor_ventas.ventas_gestor import registrar_venta
+
+def vender(ruta_db: str, intentos: int) -> int:
+    """
+    Intenta registrar `intentos` ventas de una unidad del producto 1.
+
+    Parámetros:
+        ruta_db (str): Base de datos compartida por los procesos.
+        intentos (int): Cantidad de ventas a intentar.
+
+    Retorna:
+        int: Ventas registradas con éxito.
+    """
+    data_base.RUTA_DB = ruta_db
+    exitosas = 0
+    with contextlib.redirect_stdout(io.StringIO()):  # Silenciar los avisos de stock insuficiente
+        for _ in range(intentos):
+            if registrar_venta(1, [{"producto_id": 1, "cantidad": 1}]) is not None:
+                exitosas += 1
+    return exitosas
+
+if __name__ == "__main__":
+    procesos = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    intentos = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    stock_inicial = int(sys.argv[3]) if len(sys.argv) > 3 else 1000
+
+    ruta = preparar_base_temporal("concurrencia_stock")
+    cargar_datos_basicos(stock=stock_inicial)
+    data_base.obtener_pool().cerrar()
+
+    inicio = time.perf_counter()
+    with multiprocessing.Pool(procesos) as pool:
+        exitosas = sum(pool.starmap(vender, [(ruta, intentos)] * procesos))
+    duracion = time.perf_counter() - inicio
+
+    with data_base.conexion_db() as conexion:
+        stock_final = conexion.execute("SELECT stock FROM productos WHERE id_producto = 1").fetchone()[0]
+        vendidas = conexion.execute("SELECT COALESCE(SUM(cantidad), 0) FROM factura_detalle WHERE producto_id = 1").fetchone()[0]
+
+    print(f"procesos: {procesos}, intentos: {procesos * intentos}, stock inicial: {stock_inicial}")
+    print(f"ventas exitosas: {exitosas}, unidades facturadas: {vendidas}, stock final: {stock_final}")
+    print(f"ventas por segundo: {round(procesos * intentos / duracion)}")
+    consistente = stock_final >= 0 and vendidas == exitosas == stock_inicial - stock_final
+    print("resultado:", "OK" if consistente else "INCONSISTENTE")
+    sys.exit(0 if consistente else 1)
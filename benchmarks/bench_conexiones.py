@@ -0,0 +1,43 @@
+# Benchmark del pool de conexiones
+# Compara cuántas conexiones SQLite se abren y cuánto tarda registrar_venta
+# sin pool (una conexión por consulta, comportamiento anterior) y con pool.
+#
+# Uso: python -m benchmarks.bench_conexiones [ventas]
+
+import sys
+
+import db.data_base as data_base
+from benchmarks.comun import preparar_base_temporal, cargar_datos_basicos, medir, resumir
+from gestor_ventas.ventas_gestor import registrar_venta
+
+def correr(tamanio_pool: int, ventas: int) -> dict:
+    """
+    Registra `ventas` ventas de tres líneas con el tamaño de pool indicado.
+
+    Parámetros:
+        tamanio_pool (int): Tamaño del pool (0 = sin pool).
+        ventas (int): Cantidad de ventas a registrar.
+
+    Retorna:
+        dict: Conexiones abiertas por venta y latencias.
+    """
+    preparar_base_temporal(f"conexiones_{tamanio_pool}")
+    cargar_datos_basicos()
+    pool = data_base.configurar_pool(tamanio=tamanio_pool)
+    abiertas_antes = pool.conexiones_abiertas
+
+    carrito = [
+        {"producto_id": 1, "cantidad": 1},
+        {"producto_id": 2, "cantidad": 2},
+        {"producto_id": 3, "cantidad": 1},
+    ]
+    tiempos = medir(lambda: registrar_venta(1, carrito), ventas)
+
+    resultado = resumir(tiempos)
+    resultado["conexiones_por_venta"] = round((pool.conexiones_abiertas - abiertas_antes) / ventas, 2)
+    return resultado
+
+if __name__ == "__main__":
+    ventas = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    for etiqueta, tamanio in (("sin pool", 0), ("con pool", data_base.TAMANIO_POOL or 5)):
+        print(f"{etiqueta:>9}: {correr(tamanio, ventas)}")
@@ -0,0 +1,116 @@
+# Benchmark de inserción del detalle de factura por cantidad de líneas
+# Compara insertar_factura_detalle + descontar_stock línea por línea contra
+# insertar_detalles_factura (una consulta de nombres y executemany). Las funciones
+# por línea ya no las usa la aplicación y se conservan acá solo como referencia.
+#
+# Uso: python -m benchmarks.bench_detalle_lineas
+
+import sqlite3
+
+import db.data_base as data_base
+from benchmarks.comun import preparar_base_temporal, cargar_datos_basicos, medir, resumir
+from core.utils import obtener_fecha_actual
+from core.logger import log_error
+from gestor_ventas.facturas_db import insertar_factura, insertar_detalles_factura
+
+LINEAS = (1, 10, 50, 200)
+
+def insertar_factura_detalle(factura_id: int, producto_id: int, cantidad: int, precio_unitario: float, total_linea: float, conexion: sqlite3.Connection):
+    """
+    Inserta un detalle de factura en la base de datos.
+
+    Parámetros:
+        factura_id (int): El ID de la factura a la que pertenece el detalle.
+        producto_id (int): El ID del producto en la factura.
+        cantidad (int): La cantidad de productos en el detalle.
+        precio_unitario (float): El precio unitario del producto.
+        total_linea (float): El total de la línea de factura (cantidad * precio unitario).
+        conexion (sqlite3.Connection): Conexión a la base de datos.
+    """
+    try:
+        cursor = conexion.cursor()
+
+        # Obtener datos congelados del producto, categoría y proveedor
+        cursor.execute("""
+            SELECT p.nombre, c.nombre, pr.nombre
+            FROM productos p
+            JOIN categorias c ON p.categoria_id = c.id_categoria
+            JOIN proveedores pr ON p.proveedor_id = pr.id_proveedor
+            WHERE p.id_producto = ?
+        """, (producto_id,))
+        resultado = cursor.fetchone()
+        if not resultado:
+            raise ValueError("Producto, categoría o proveedor no encontrados.")
+        producto_nombre, categoria_nombre, proveedor_nombre = resultado
+
+        cursor.execute("""
+            INSERT INTO factura_detalle (
+                factura_id, producto_id, cantidad, precio_unitario, total_linea,
+                nombre_producto, nombre_categoria, nombre_proveedor
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            factura_id, producto_id, cantidad, precio_unitario, total_linea,
+            producto_nombre, categoria_nombre, proveedor_nombre
+        ))
+    except sqlite3.Error as e:
+        log_error(f"Error al insertar detalle de factura: {e}")
+        return None
+
+def descontar_stock(producto_id: int, cantidad: int, conexion: sqlite3.Connection) -> bool:
+    """
+    Descuenta la cantidad de un producto en el inventario.
+
+    El descuento es condicional (solo si stock >= cantidad), así dos ventas
+    simultáneas del mismo producto nunca dejan el stock en negativo.
+
+    Parámetros:
+        producto_id (int): El ID del producto al que se le va a descontar stock.
+        cantidad (int): La cantidad de productos a descontar del inventario.
+        conexion (sqlite3.Connection): Conexión a la base de datos.
+
+    Retorna:
+        bool: True si se descontó, False si no había stock suficiente o hubo un error.
+    """
+    try:
+        cursor = conexion.cursor()
+        cursor.execute("""
+            UPDATE productos SET stock = stock - ? WHERE id_producto = ? AND stock >= ?
+        """, (cantidad, producto_id, cantidad))
+        return cursor.rowcount == 1
+    except sqlite3.Error as e:
+        log_error(f"Error al descontar stock: {e}")
+        return False
+
+def factura_linea_por_linea(lineas: list[dict]) -> None:
+    """
+    Inserta una factura con tres sentencias por línea (implementación anterior).
+    """
+    with data_base.conexion_db() as conexion:
+        factura_id = insertar_factura(obtener_fecha_actual(), 1, 0, conexion)
+        for linea in lineas:
+            insertar_factura_detalle(factura_id, linea["producto_id"], linea["cantidad"],
+                                     linea["precio_unitario"], linea["total_linea"], conexion)
+            descontar_stock(linea["producto_id"], linea["cantidad"], conexion)
+        conexion.commit()
+
+def factura_en_lote(lineas: list[dict]) -> None:
+    """
+    Inserta una factura con el detalle y el stock en lote.
+    """
+    with data_base.conexion_db() as conexion:
+        factura_id = insertar_factura(obtener_fecha_actual(), 1, 0, conexion)
+        insertar_detalles_factura(factura_id, lineas, conexion)
+        conexion.commit()
+
+if __name__ == "__main__":
+    preparar_base_temporal("detalle_lineas")
+    cargar_datos_basicos(n_productos=max(LINEAS))
+    for cantidad in LINEAS:
+        lineas = [
+            {"producto_id": i, "cantidad": 1, "precio_unitario": 10.0, "total_linea": 10.0}
+            for i in range(1, cantidad + 1)
+        ]
+        print(f"líneas: {cantidad}")
+        print(f"  línea por línea: {resumir(medir(lambda: factura_linea_por_linea(lineas), 100))}")
+        print(f"  en lote:         {resumir(medir(lambda: factura_en_lote(lineas), 100))}")
@@ -0,0 +1,42 @@
+# Benchmark de exportación de facturas a PDF por lote
+# Registra ventas sintéticas y mide cuántas facturas por segundo exporta
+# exportar_facturas_lote según la cantidad de procesos del pool.
+#
+# Uso: python -m benchmarks.bench_exportacion_pdf [facturas]
+
+import os
+import random
+import sys
+import time
+
+from benchmarks.comun import preparar_base_temporal, cargar_datos_basicos
+from gestor_ventas.ventas_servicio import ingerir_ventas
+from gestor_ventas.exportar_factura import exportar_facturas_lote
+
+PROCESOS = (1, 2, 4, 8)
+
+def generar_ventas(cantidad: int, n_clientes: int, n_productos: int):
+    """
+    Genera `cantidad` comandos de venta aleatorios (con semilla fija).
+    """
+    azar = random.Random(42)
+    for numero in range(1, cantidad + 1):
+        productos = [
+            {"producto_id": azar.randint(1, n_productos), "cantidad": azar.randint(1, 3)}
+            for _ in range(azar.randint(1, 8))
+        ]
+        yield numero, {"cliente_id": azar.randint(1, n_clientes), "productos": productos}
+
+if __name__ == "__main__":
+    facturas = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    ruta_db = preparar_base_temporal("exportacion_pdf")
+    cargar_datos_basicos(n_clientes=500, n_productos=500)
+    ingerir_ventas(generar_ventas(facturas, 500, 500))
+
+    print(f"CPUs disponibles: {os.cpu_count()}")
+    for procesos in PROCESOS:
+        carpeta = os.path.join(os.path.dirname(ruta_db), f"pdf_{procesos}")
+        inicio = time.perf_counter()
+        resumen = exportar_facturas_lote(procesos=procesos, carpeta=carpeta)
+        duracion = time.perf_counter() - inicio
+        print(f"procesos {procesos}: {resumen['exportadas']} facturas en {duracion:.2f} s → {resumen['exportadas'] / duracion:.0f} facturas/s")
@@ -0,0 +1,38 @@
+# Benchmark de ingesta masiva de ventas
+# Genera un archivo JSONL de ventas sintéticas y mide cuántas ventas por
+# segundo registra ingerir_ventas_desde_archivo según el tamaño de lote.
+#
+# Uso: python -m benchmarks.bench_ingesta_ventas [ventas]
+
+import json
+import os
+import random
+import sys
+
+from benchmarks.comun import preparar_base_temporal, cargar_datos_basicos
+from gestor_ventas.ventas_servicio import ingerir_ventas_desde_archivo
+
+LOTES = (1, 100, 1000)
+
+def generar_archivo(ruta: str, ventas: int, n_clientes: int, n_productos: int) -> None:
+    """
+    Escribe `ventas` comandos de venta aleatorios (con semilla fija) en formato JSONL.
+    """
+    azar = random.Random(42)
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        for _ in range(ventas):
+            productos = [
+                {"producto_id": azar.randint(1, n_productos), "cantidad": azar.randint(1, 3)}
+                for _ in range(azar.randint(1, 4))
+            ]
+            archivo.write(json.dumps({"cliente_id": azar.randint(1, n_clientes), "productos": productos}) + "\n")
+
+if __name__ == "__main__":
+    ventas = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    for lote in LOTES:
+        ruta_db = preparar_base_temporal(f"ingesta_{lote}")
+        cargar_datos_basicos(n_clientes=1000, n_productos=1000)
+        ruta = os.path.join(os.path.dirname(ruta_db), "ventas.jsonl")
+        generar_archivo(ruta, ventas, 1000, 1000)
+        resumen = ingerir_ventas_desde_archivo(ruta, lote)
+        print(f"lote {lote:>5}: {resumen['registradas']} ventas en {resumen['duracion_seg']} s → {resumen['ventas_por_seg']} ventas/s")
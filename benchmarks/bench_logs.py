@@ -0,0 +1,62 @@
+# Benchmark del costo de los logs en una venta
+# Registra ventas con los logs desactivados, escribiendo en el momento (como el
+# FileHandler anterior) y escribiendo desde el hilo de fondo, sobre un archivo de
+# log temporal, con los perfiles balanced y durable. Después repite las dos formas
+# de escritura simulando un disco lento (cada escritura del log tarda ESPERA_DISCO_MS).
+#
+# Uso: python -m benchmarks.bench_logs [ventas]
+
+import os
+import sys
+import time
+
+import core.logger as logger
+import db.data_base as data_base
+from benchmarks.comun import preparar_base_temporal, cargar_datos_basicos, medir, resumir
+from core.logger import configurar_logs
+from gestor_ventas.ventas_servicio import registrar_venta_servicio
+
+ESPERA_DISCO_MS = 2
+
+MODOS = (
+    ("sin logs", {"activo": False}),
+    ("sincrónico", {"asincronico": False}),
+    ("asincrónico", {"asincronico": True}),
+)
+
+if __name__ == "__main__":
+    ventas = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    carrito = [{"producto_id": 10, "cantidad": 1}, {"producto_id": 50, "cantidad": 2}]
+
+    for perfil in ("balanced", "durable"):
+        data_base.configurar_perfil(perfil)
+        ruta = preparar_base_temporal(f"logs_{perfil}")
+        cargar_datos_basicos()
+        ruta_log = os.path.join(os.path.dirname(ruta), "registro.log")
+
+        print(f"perfil {perfil}:")
+        for nombre, opciones in MODOS:
+            configurar_logs(ruta_log, **opciones)
+            print(f"  {nombre:<12} {resumir(medir(lambda: registrar_venta_servicio(1, carrito), ventas))}")
+
+    # Disco lento: el handler de archivo tarda ESPERA_DISCO_MS en cada escritura
+    crear_handler_original = logger.crear_handler_archivo
+
+    def crear_handler_lento(ruta: str = None):
+        handler = crear_handler_original(ruta)
+        emitir = handler.emit
+
+        def emitir_lento(record):
+            time.sleep(ESPERA_DISCO_MS / 1000)
+            emitir(record)
+
+        handler.emit = emitir_lento
+        return handler
+
+    logger.crear_handler_archivo = crear_handler_lento
+    print(f"disco lento ({ESPERA_DISCO_MS} ms por escritura), perfil durable:")
+    for nombre, opciones in MODOS[1:]:
+        configurar_logs(ruta_log, **opciones)
+        print(f"  {nombre:<12} {resumir(medir(lambda: registrar_venta_servicio(1, carrito), ventas // 4))}")
+    logger.crear_handler_archivo = crear_handler_original
+    configurar_logs()
@@ -0,0 +1,44 @@
+# Benchmark de tablas paginadas
+# Compara el tiempo de mostrar todos los productos en una sola tabla Rich contra
+# consultar y dibujar solo la primera página (por ID, por nombre y con filtro),
+# para catálogos de distintos tamaños. La salida de Rich se descarta.
+#
+# Uso: python -m benchmarks.bench_paginacion
+
+import io
+
+from rich.console import Console
+
+import interfaz.mostrar_resumen as mostrar_resumen
+from benchmarks.comun import preparar_base_temporal, cargar_datos_basicos, medir, resumir
+from benchmarks.bench_busqueda_texto import cargar_catalogo
+from gestor_productos.productos_db import listar_productos, listar_productos_pagina
+
+TAMANIOS = (1_000, 10_000, 50_000)
+
+def primera_pagina(orden: str = None, filtro: str = ""):
+    """
+    Consulta y dibuja la primera página, como la muestra paginar_tabla().
+    """
+    tamanio = mostrar_resumen.TAMANIO_PAGINA
+    filas = listar_productos_pagina(tamanio + 1, 0, orden, False, filtro)
+    mostrar_resumen._dibujar_pagina("Productos registrados", mostrar_resumen.COLUMNAS_PRODUCTOS, filas[:tamanio],
+                                    mostrar_resumen._fila_producto, 1, orden, False, filtro)
+
+if __name__ == "__main__":
+    mostrar_resumen.console = Console(file=io.StringIO(), width=120)
+
+    for cantidad in TAMANIOS:
+        preparar_base_temporal("paginacion")
+        cargar_datos_basicos(n_clientes=0, n_productos=0)
+        cargar_catalogo(cantidad, 0)
+
+        completa = resumir(medir(lambda: mostrar_resumen.mostrar_productos(listar_productos()), 1))
+        por_id = resumir(medir(primera_pagina, 50))
+        por_nombre = resumir(medir(lambda: primera_pagina("nombre"), 50))
+        filtrada = resumir(medir(lambda: primera_pagina("nombre", "teclado"), 50))
+        print(f"productos: {cantidad}")
+        print(f"  tabla completa:           p50 {completa['p50_ms']:.1f} ms")
+        print(f"  primera página (ID):      p50 {por_id['p50_ms']:.2f} ms")
+        print(f"  primera página (nombre):  p50 {por_nombre['p50_ms']:.2f} ms")
+        print(f"  primera página (filtro):  p50 {filtrada['p50_ms']:.2f} ms")
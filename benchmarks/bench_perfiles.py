@@ -0,0 +1,46 @@
+# Benchmark de perfiles de almacenamiento
+# Mide el throughput de escritura (insertar_producto con un commit por fila y
+# registrar_venta) para cada perfil definido en db.data_base.
+#
+# Uso: python -m benchmarks.bench_perfiles [operaciones]
+
+import sys
+import time
+
+import db.data_base as data_base
+from benchmarks.comun import preparar_base_temporal, cargar_datos_basicos
+from gestor_productos.productos_db import insertar_producto
+from gestor_ventas.ventas_gestor import registrar_venta
+
+def correr(perfil: str, operaciones: int) -> dict:
+    """
+    Ejecuta las escrituras de prueba con un perfil de almacenamiento.
+
+    Parámetros:
+        perfil (str): Nombre del perfil a medir.
+        operaciones (int): Cantidad de inserciones y de ventas.
+
+    Retorna:
+        dict: Operaciones por segundo de cada tipo de escritura.
+    """
+    preparar_base_temporal(f"perfil_{perfil}")
+    data_base.configurar_perfil(perfil)
+    cargar_datos_basicos()
+
+    inicio = time.perf_counter()
+    for i in range(operaciones):
+        insertar_producto(f"Producto bench {i}", 1, 1, 100, 10.0)
+    inserciones = operaciones / (time.perf_counter() - inicio)
+
+    carrito = [{"producto_id": 1, "cantidad": 1}, {"producto_id": 2, "cantidad": 1}]
+    inicio = time.perf_counter()
+    for _ in range(operaciones):
+        registrar_venta(1, carrito)
+    ventas = operaciones / (time.perf_counter() - inicio)
+
+    return {"inserciones_por_seg": round(inserciones), "ventas_por_seg": round(ventas)}
+
+if __name__ == "__main__":
+    operaciones = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    for perfil in data_base.PERFILES_ALMACENAMIENTO:
+        print(f"{perfil:>9}: {correr(perfil, operaciones)}")
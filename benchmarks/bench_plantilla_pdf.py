@@ -0,0 +1,92 @@
+# Benchmark de la plantilla compilada de facturas PDF
+# Compara el tiempo de dibujar y serializar una factura con el dibujo directo
+# anterior (todas las llamadas a set_font y cell en cada factura, sin encabezado
+# ni pie por hoja) y con la plantilla compilada, para facturas cortas y largas
+# (varias hojas).
+#
+# Uso: python -m benchmarks.bench_plantilla_pdf [repeticiones]
+
+import sys
+
+from fpdf import FPDF
+
+from benchmarks.comun import medir, resumir
+from gestor_ventas.plantilla_factura import obtener_plantilla
+
+LINEAS = (3, 60)
+
+def detalle_sintetico(lineas: int) -> list:
+    """
+    Arma filas de detalle con la forma de obtener_detalle_venta().
+    """
+    filas = []
+    for i in range(1, lineas + 1):
+        precio = 1000.0 + i
+        filas.append((1, "2025-07-15 10:00:00", 7, "Laura Martínez", "laura@mail.com", "40875231",
+                      i, f"Producto {i}", f"Categoría {i % 5}", 2, precio, precio * 2, 0.0))
+    total = sum(fila[11] for fila in filas)
+    return [fila[:12] + (total,) for fila in filas]
+
+def dibujo_directo(id_factura: int, detalle: list) -> str:
+    """
+    Dibujo anterior a la plantilla, conservado como referencia del benchmark.
+    """
+    _, fecha, cliente_id, nombre_cliente, email, dni, *_, total_factura = detalle[0]
+    pdf = FPDF()
+    pdf.add_page()
+    pdf.set_auto_page_break(auto=True, margin=15)
+    pdf.set_font("Arial", style="B", size=16)
+    pdf.cell(190, 10, "Electro Mundo S.A.", ln=True, align="C")
+    pdf.set_font("Arial", size=10)
+    pdf.cell(190, 6, "CUIT: 30-12345678-9 | contacto@gestionavanzada.com", ln=True, align="C")
+    pdf.cell(190, 6, "Av. Siempre Viva 123, CABA | Tel: (011) 4567-8910", ln=True, align="C")
+    pdf.ln(4)
+    pdf.set_font("Arial", style="B", size=14)
+    pdf.cell(190, 10, f"FACTURA Nº {id_factura}", ln=True, align="C")
+    pdf.set_font("Arial", size=11)
+    pdf.cell(190, 8, f"Fecha: {fecha}", ln=True)
+    pdf.cell(190, 8, f"Cliente: {nombre_cliente} (ID: {cliente_id})", ln=True)
+    pdf.cell(190, 8, f"Email: {email}", ln=True)
+    pdf.cell(190, 8, f"DNI: {dni}", ln=True)
+    pdf.ln(5)
+    pdf.set_font("Arial", style="B", size=12)
+    pdf.cell(0, 8, "Detalle de Productos", ln=True)
+    pdf.set_fill_color(230, 230, 230)
+    pdf.set_font("Arial", style="B", size=10)
+    pdf.cell(50, 8, "Producto", border=1, fill=1)
+    pdf.cell(40, 8, "Categoría", border=1, fill=1)
+    pdf.cell(25, 8, "Cantidad", border=1, fill=1, align="C")
+    pdf.cell(35, 8, "Precio Unit.", border=1, fill=1, align="R")
+    pdf.cell(40, 8, "Subtotal", border=1, ln=True, fill=1, align="R")
+    pdf.set_font("Arial", size=10)
+    for fila in detalle:
+        pdf.cell(50, 8, fila[7], border=1)
+        pdf.cell(40, 8, fila[8], border=1)
+        pdf.cell(25, 8, str(fila[9]), border=1, align="C")
+        pdf.cell(35, 8, f"${fila[10]:.2f}", border=1, align="R")
+        pdf.cell(40, 8, f"${fila[11]:.2f}", border=1, ln=True, align="R")
+    pdf.ln(4)
+    pdf.set_font("Arial", style="B", size=12)
+    pdf.cell(150, 8, "TOTAL FACTURA:", align="R")
+    pdf.set_font("Arial", style="", size=12)
+    pdf.cell(40, 8, f"${total_factura:.2f}", ln=True, align="R")
+    return pdf.output(dest="S")
+
+def con_plantilla(id_factura: int, detalle: list) -> str:
+    """
+    Dibujo con la plantilla compilada.
+    """
+    plantilla = obtener_plantilla()
+    pdf = plantilla.nuevo_documento()
+    plantilla.dibujar(pdf, id_factura, detalle)
+    return pdf.output(dest="S")
+
+if __name__ == "__main__":
+    repeticiones = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    obtener_plantilla()
+    for lineas in LINEAS:
+        detalle = detalle_sintetico(lineas)
+        for nombre, funcion in (("directo", dibujo_directo), ("plantilla", con_plantilla)):
+            tiempos = medir(lambda: funcion(1, detalle), repeticiones)
+            r = resumir(tiempos)
+            print(f"{lineas:>3} líneas, {nombre:<9}: p50 {r['p50_ms']} ms | p95 {r['p95_ms']} ms")
@@ -0,0 +1,28 @@
+# Benchmark del ranking de productos y clientes
+# Carga un historial sintético y mide top_productos / top_clientes en un trimestre
+# y en todo el historial, leyendo de los resúmenes y agrupando el detalle.
+#
+# Uso: python -m benchmarks.bench_ranking [lineas]   (por defecto 1.000.000)
+
+import sys
+
+from benchmarks.comun import preparar_base_temporal, cargar_datos_basicos, medir, resumir
+from benchmarks.bench_resumenes import cargar_historial
+from gestor_ventas.resumen_ventas_db import reconstruir_resumenes
+from gestor_ventas.analitica_ventas import top_productos, top_clientes
+
+RANGOS = {"trimestre": ("2026-01-01", "2026-03-31"), "todo": (None, None)}
+
+if __name__ == "__main__":
+    lineas = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    preparar_base_temporal("ranking")
+    cargar_datos_basicos()
+    cargar_historial(lineas)
+    reconstruir_resumenes()
+
+    for nombre_rango, (desde, hasta) in RANGOS.items():
+        for calcular, criterio in ((top_productos, "importe"), (top_clientes, "importe"), (top_productos, "facturas")):
+            for usar_resumenes in (True, False):
+                tiempos = medir(lambda: calcular(10, criterio, desde, hasta, usar_resumenes=usar_resumenes), 5)
+                origen = "resúmenes" if usar_resumenes else "detalle"
+                print(f"{calcular.__name__} por {criterio}, {nombre_rango}, {origen}: p50 {resumir(tiempos)['p50_ms']:.1f} ms")
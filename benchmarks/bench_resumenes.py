@@ -0,0 +1,59 @@
+# Benchmark de resúmenes de ventas
+# Carga un historial sintético de líneas de venta repartido en varios años,
+# reconstruye los resúmenes y compara "ventas de este mes por categoría"
+# leída de resumen_ventas_dia_categoria contra la misma consulta sobre el detalle.
+#
+# Uso: python -m benchmarks.bench_resumenes [lineas]   (por defecto 1.000.000)
+
+import sys
+import time
+
+import db.data_base as data_base
+from benchmarks.comun import preparar_base_temporal, cargar_datos_basicos, medir, resumir
+from gestor_ventas.resumen_ventas_db import reconstruir_resumenes, ventas_por_categoria
+from insert_datos_prueba import generar_datos_sinteticos
+
+DIAS_HISTORIAL = 3 * 365
+
+CONSULTA_DIRECTA = """
+    SELECT fd.nombre_categoria, SUM(fd.cantidad), SUM(fd.total_linea), COUNT(*)
+    FROM facturas f
+    JOIN factura_detalle fd ON fd.factura_id = f.id_factura
+    WHERE f.fecha BETWEEN ? AND ?
+    GROUP BY fd.nombre_categoria
+    ORDER BY SUM(fd.total_linea) DESC
+"""
+
+def cargar_historial(lineas: int) -> None:
+    """
+    Genera facturas y líneas sintéticas sobre el catálogo cargado, repartidas en los
+    últimos DIAS_HISTORIAL días (ver generar_datos_sinteticos()).
+    """
+    generar_datos_sinteticos(productos=0, clientes=0, categorias=0, proveedores=0,
+                             lineas=lineas, dias=DIAS_HISTORIAL)
+
+if __name__ == "__main__":
+    lineas = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    preparar_base_temporal("resumenes")
+    cargar_datos_basicos()
+
+    inicio = time.perf_counter()
+    cargar_historial(lineas)
+    print(f"Historial: {lineas} líneas cargadas en {time.perf_counter() - inicio:.1f} s")
+
+    inicio = time.perf_counter()
+    reconstruir_resumenes()
+    print(f"Reconstrucción de resúmenes: {time.perf_counter() - inicio:.1f} s")
+
+    with data_base.conexion_db() as conexion:
+        mes = conexion.execute("SELECT substr(MAX(fecha), 1, 7) FROM facturas").fetchone()[0]
+    desde, hasta = f"{mes}-01", f"{mes}-31"
+
+    def consulta_directa():
+        with data_base.conexion_db() as conexion:
+            conexion.execute(CONSULTA_DIRECTA, (desde, f"{hasta} 23:59:59")).fetchall()
+
+    resumen_tablas = resumir(medir(lambda: ventas_por_categoria(desde, hasta), 50))
+    resumen_directo = resumir(medir(consulta_directa, 5))
+    print(f"Ventas de {mes} por categoría (resúmenes): p50 {resumen_tablas['p50_ms']:.2f} ms, p95 {resumen_tablas['p95_ms']:.2f} ms")
+    print(f"Ventas de {mes} por categoría (detalle):   p50 {resumen_directo['p50_ms']:.2f} ms, p95 {resumen_directo['p95_ms']:.2f} ms")
@@ -0,0 +1,36 @@
+# Benchmark de validaciones de unicidad
+# Mide validar_dni, validar_cuit y validar_nombre_categoria a distintos
+# tamaños de tabla para comprobar que la latencia se mantiene plana.
+#
+# Uso: python -m benchmarks.bench_unicidad
+
+import db.data_base as data_base
+from benchmarks.comun import preparar_base_temporal, medir, resumir
+from core.utils import normalizar_texto
+from gestor_categorias.categorias_validaciones import validar_nombre_categoria
+from gestor_clientes.clientes_validaciones import validar_dni
+from gestor_proveedores.proveedores_validaciones import validar_cuit
+
+TAMANIOS = (1_000, 10_000, 100_000)
+
+def poblar(cantidad: int) -> None:
+    """
+    Inserta `cantidad` clientes, proveedores y categorías con valores únicos.
+    """
+    with data_base.conexion_db() as conexion:
+        conexion.executemany("INSERT INTO clientes (nombre, telefono, email, dni) VALUES (?, ?, ?, ?)",
+                             [(f"Cliente {i}", "", "", f"{i:08d}") for i in range(cantidad)])
+        conexion.executemany("INSERT INTO proveedores (nombre, telefono, email, cuit) VALUES (?, ?, ?, ?)",
+                             [(f"Proveedor {i}", "", "", f"30{i:09d}") for i in range(cantidad)])
+        conexion.executemany("INSERT INTO categorias (nombre, nombre_normalizado) VALUES (?, ?)",
+                             [(f"Categoría {i}", normalizar_texto(f"Categoría {i}")) for i in range(cantidad)])
+        conexion.commit()
+
+if __name__ == "__main__":
+    for cantidad in TAMANIOS:
+        preparar_base_temporal(f"unicidad_{cantidad}")
+        poblar(cantidad)
+        print(f"filas por tabla: {cantidad}")
+        print(f"  validar_dni:              {resumir(medir(lambda: validar_dni('99999999'), 1000))}")
+        print(f"  validar_cuit:             {resumir(medir(lambda: validar_cuit('20999999999'), 1000))}")
+        print(f"  validar_nombre_categoria: {resumir(medir(lambda: validar_nombre_categoria('Categoría Nueva'), 1000))}")
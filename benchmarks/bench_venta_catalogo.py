@@ -0,0 +1,21 @@
+# Benchmark de registrar_venta según el tamaño del catálogo
+# Registra ventas de un carrito fijo con catálogos cada vez más grandes; la
+# latencia debe depender del carrito y no de la cantidad de productos.
+#
+# Uso: python -m benchmarks.bench_venta_catalogo
+
+from benchmarks.comun import preparar_base_temporal, cargar_datos_basicos, medir, resumir
+from gestor_ventas.ventas_gestor import registrar_venta
+
+TAMANIOS = (1_000, 10_000, 100_000)
+
+if __name__ == "__main__":
+    carrito = [
+        {"producto_id": 10, "cantidad": 1},
+        {"producto_id": 500, "cantidad": 2},
+        {"producto_id": 900, "cantidad": 1},
+    ]
+    for cantidad in TAMANIOS:
+        preparar_base_temporal(f"venta_catalogo_{cantidad}")
+        cargar_datos_basicos(n_productos=cantidad)
+        print(f"productos: {cantidad:>7} → {resumir(medir(lambda: registrar_venta(1, carrito), 300))}")
@@ -0,0 +1,79 @@
+# Utilidades comunes para los benchmarks
+# Este módulo prepara bases de datos temporales con datos sintéticos y ofrece
+# funciones de medición de tiempos para los scripts de la carpeta benchmarks.
+
+import os
+import statistics
+import tempfile
+import time
+
+import db.data_base as data_base
+from insert_datos_prueba import generar_datos_sinteticos
+
+def preparar_base_temporal(nombre: str = "bench") -> str:
+    """
+    Crea una base de datos vacía y migrada en una carpeta temporal y la deja activa.
+
+    Parámetros:
+        nombre (str): Prefijo del archivo de base de datos.
+
+    Retorna:
+        str: Ruta de la base de datos creada.
+    """
+    carpeta = tempfile.mkdtemp(prefix=f"inventario_{nombre}_")
+    data_base.RUTA_DB = os.path.join(carpeta, f"{nombre}.db")
+    data_base.inicializar_base()
+    return data_base.RUTA_DB
+
+def cargar_datos_basicos(n_clientes: int = 100, n_productos: int = 100, stock: int = 1_000_000) -> None:
+    """
+    Inserta 10 categorías, 10 proveedores y los clientes y productos pedidos con el
+    generador sintético de insert_datos_prueba.py (semilla fija, IDs desde 1).
+
+    Parámetros:
+        n_clientes (int): Cantidad de clientes a insertar.
+        n_productos (int): Cantidad de productos a insertar.
+        stock (int): Stock inicial de cada producto.
+    """
+    generar_datos_sinteticos(productos=n_productos, clientes=n_clientes, lineas=0,
+                             categorias=10, proveedores=10, stock=stock)
+
+def medir(funcion, repeticiones: int) -> list[float]:
+    """
+    Ejecuta una función varias veces y devuelve la duración de cada llamada.
+
+    Parámetros:
+        funcion (callable): Función sin argumentos a medir.
+        repeticiones (int): Cantidad de ejecuciones.
+
+    Retorna:
+        list[float]: Duraciones en milisegundos.
+    """
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    return tiempos
+
+def resumir(tiempos: list[float]) -> dict:
+    """
+    Resume una lista de duraciones en promedio y percentiles.
+
+    Parámetros:
+        tiempos (list[float]): Duraciones en milisegundos.
+
+    Retorna:
+        dict: Promedio, p50, p95 y p99 en milisegundos.
+    """
+    ordenados = sorted(tiempos)
+
+    def percentil(p: float) -> float:
+        return ordenados[min(len(ordenados) - 1, int(len(ordenados) * p))]
+
+    return {
+        "promedio_ms": round(statistics.fmean(ordenados), 3),
+        "p50_ms": round(percentil(0.50), 3),
+        "p95_ms": round(percentil(0.95), 3),
+        "p99_ms": round(percentil(0.99), 3),
+    }
@@ -0,0 +1,290 @@
+# Suite de benchmarks de punta a punta
+# Ejecuta las funciones reales de los gestores (sin los menús interactivos) sobre bases
+# sintéticas de varios tamaños: insertar_producto, listar_productos, registrar_venta,
+# obtener_detalle_venta, generar_pdf_factura y las validaciones de altas. Por operación
+# registra p50/p95/p99, promedio y operaciones por segundo; por tamaño, el tiempo de
+# carga y el pico de memoria (RSS) del proceso que mide.
+#
+# Cada tamaño corre en un subproceso propio, así el pico de memoria de uno no se
+# arrastra al siguiente; la carga de datos se hace en otro proceso hijo para que no
+# cuente en ese pico. El resultado es JSON, para guardar corridas y compararlas entre
+# commits: --comparar marca las operaciones cuyo p50 o p95 empeoró más que la
+# tolerancia y termina con código 1 si hay alguna.
+#
+# Uso: python -m benchmarks.suite [--tamanios 1000 10000 100000] [--escala 1] [--salida resultados.json]
+#      python -m benchmarks.suite --salida nuevo.json --comparar anterior.json
+#      python -m benchmarks.suite --comparar anterior.json nuevo.json   (sin correr)
+
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import sqlite3
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+TAMANIOS = (1_000, 10_000, 100_000)
+
+# Repeticiones de cada operación con --escala 1 (listar_productos lee toda la tabla)
+REPETICIONES = {
+    "insertar_producto": 500,
+    "listar_productos": 20,
+    "registrar_venta": 500,
+    "obtener_detalle_venta": 1000,
+    "generar_pdf_factura": 100,
+    "generar_pdf_factura_cache": 500,
+    "validar_producto": 2000,
+    "validar_cliente": 2000,
+    "validar_proveedor": 2000,
+}
+
+# Empeoramiento relativo de p50 o p95 que se informa como regresión
+TOLERANCIA = 0.20
+
+def escala_datos(tamanio: int) -> dict:
+    """
+    Devuelve los parámetros del generador sintético para un tamaño (cantidad de productos).
+    """
+    return {"productos": tamanio, "clientes": max(100, tamanio // 2), "lineas": tamanio * 2,
+            "categorias": 10, "proveedores": 50, "stock": 10_000_000}
+
+def rss_pico_mb() -> float:
+    """
+    Devuelve el pico de memoria residente del proceso actual en MB.
+    """
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa KB; macOS, bytes
+    return round(pico / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+def _cargar(ruta_db: str, parametros: dict) -> None:
+    """
+    Carga los datos sintéticos (se ejecuta en un proceso hijo).
+    """
+    import db.data_base as data_base
+    from insert_datos_prueba import generar_datos_sinteticos
+
+    data_base.RUTA_DB = ruta_db
+    generar_datos_sinteticos(**parametros)
+
+def medir_tamanio(tamanio: int, escala: float = 1.0) -> dict:
+    """
+    Prepara una base del tamaño pedido y mide todas las operaciones sobre ella.
+
+    Parámetros:
+        tamanio (int): Cantidad de productos (clientes y ventas se escalan con escala_datos()).
+        escala (float): Multiplica las repeticiones de REPETICIONES.
+
+    Retorna:
+        dict: Parámetros del tamaño, carga_seg, rss_pico_mb y resultados por operación.
+    """
+    import db.data_base as data_base
+    import gestor_ventas.exportar_factura as exportar_factura
+    from benchmarks.comun import preparar_base_temporal, medir, resumir
+    from core.logger import configurar_logs
+    from core.validaciones_generales import validar_nombre, validar_telefono, validar_email
+    from gestor_clientes.clientes_validaciones import validar_dni, validar_nombre_cliente, obtener_cliente_por_id_validado
+    from gestor_productos.productos_db import insertar_producto, listar_productos
+    from gestor_productos.productos_validaciones import obtener_producto_por_id_validado, validar_stock, validar_precio
+    from gestor_proveedores.proveedores_validaciones import validar_cuit, obtener_proveedor_por_id_validado
+    from gestor_ventas.facturas_db import obtener_detalle_venta
+    from gestor_ventas.ventas_gestor import registrar_venta
+
+    parametros = escala_datos(tamanio)
+    ruta_db = preparar_base_temporal(f"suite_{tamanio}")
+    carpeta = os.path.dirname(ruta_db)
+    configurar_logs(os.path.join(carpeta, "registro.log"))
+    exportar_factura.RUTA_FACTURAS = os.path.join(carpeta, "facturas")
+
+    # Carga en un proceso aparte: su memoria no cuenta en el pico de las mediciones
+    inicio = time.perf_counter()
+    carga = multiprocessing.get_context("fork").Process(target=_cargar, args=(ruta_db, parametros))
+    carga.start()
+    carga.join()
+    if carga.exitcode != 0:
+        raise RuntimeError(f"Falló la carga de datos para el tamaño {tamanio}")
+    carga_seg = round(time.perf_counter() - inicio, 2)
+
+    azar = random.Random(42)
+    productos, clientes = parametros["productos"], parametros["clientes"]
+    with data_base.conexion_db() as conexion:
+        facturas = conexion.execute("SELECT MAX(id_factura) FROM facturas").fetchone()[0] or 0
+    contador = iter(range(10**9))
+
+    def carrito() -> list[dict]:
+        return [{"producto_id": azar.randint(1, productos), "cantidad": azar.randint(1, 3)}
+                for _ in range(azar.randint(1, 5))]
+
+    def validar_alta_producto():
+        id_producto = str(azar.randint(1, productos))
+        validar_nombre("Producto de prueba")
+        validar_stock("25")
+        validar_precio("1499.90")
+        obtener_producto_por_id_validado(id_producto)
+
+    def validar_alta_cliente():
+        validar_nombre_cliente("Ana Gomez")
+        validar_dni(f"{10_000_000 + next(contador)}")
+        validar_telefono("1123456789")
+        validar_email("ana.gomez@mail.com")
+        obtener_cliente_por_id_validado(str(azar.randint(1, clientes)))
+
+    def validar_alta_proveedor():
+        validar_cuit(f"27{next(contador):09d}")
+        obtener_proveedor_por_id_validado(str(azar.randint(1, parametros["proveedores"])))
+
+    # Facturas distintas para la exportación sin caché y un grupo chico que se repite
+    cantidad_pdf = min(facturas, int(REPETICIONES["generar_pdf_factura"] * escala) + 1)
+    ids_pdf = itertools.cycle(azar.sample(range(1, facturas + 1), cantidad_pdf))
+    ids_pdf_cache = [azar.randint(1, facturas) for _ in range(20)]
+    for id_factura in ids_pdf_cache:
+        exportar_factura.generar_pdf_factura(id_factura)
+
+    operaciones = {
+        "insertar_producto": lambda: insertar_producto(f"Producto suite {next(contador)}", 1, 1, 10, 999.0),
+        "listar_productos": listar_productos,
+        "registrar_venta": lambda: registrar_venta(azar.randint(1, clientes), carrito()),
+        "obtener_detalle_venta": lambda: obtener_detalle_venta(azar.randint(1, facturas)),
+        "generar_pdf_factura": lambda: exportar_factura.generar_pdf_factura(next(ids_pdf)),
+        "generar_pdf_factura_cache": lambda: exportar_factura.generar_pdf_factura(azar.choice(ids_pdf_cache)),
+        "validar_producto": validar_alta_producto,
+        "validar_cliente": validar_alta_cliente,
+        "validar_proveedor": validar_alta_proveedor,
+    }
+
+    resultados = {}
+    for nombre, operacion in operaciones.items():
+        repeticiones = max(1, int(REPETICIONES[nombre] * escala))
+        operacion()  # calentamiento: conexión del pool, cachés y plan de consultas
+        tiempos = medir(operacion, repeticiones)
+        total_seg = sum(tiempos) / 1000
+        resultados[nombre] = {
+            "repeticiones": repeticiones,
+            **resumir(tiempos),
+            "ops_por_seg": round(repeticiones / total_seg, 1) if total_seg else None,
+        }
+
+    return {
+        "tamanio": tamanio,
+        **parametros,
+        "carga_seg": carga_seg,
+        "rss_pico_mb": rss_pico_mb(),
+        "operaciones": resultados,
+    }
+
+def _commit_actual() -> str | None:
+    """
+    Devuelve el hash del commit actual, o None si no hay git disponible.
+    """
+    try:
+        salida = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True)
+        return salida.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def ejecutar_suite(tamanios=TAMANIOS, escala: float = 1.0) -> dict:
+    """
+    Mide cada tamaño en un subproceso propio y junta los resultados.
+
+    Parámetros:
+        tamanios (iterable): Tamaños (cantidad de productos) a medir.
+        escala (float): Multiplica las repeticiones de cada operación.
+
+    Retorna:
+        dict: Datos del entorno y una entrada por tamaño con la forma de medir_tamanio().
+    """
+    corridas = []
+    for tamanio in tamanios:
+        print(f"midiendo tamaño {tamanio}...", file=sys.stderr)
+        salida = subprocess.run(
+            [sys.executable, "-m", "benchmarks.suite", "--interno", str(tamanio), "--escala", str(escala)],
+            stdout=subprocess.PIPE, text=True, check=True,
+        )
+        # El resultado es la última línea; lo anterior son mensajes de las funciones medidas
+        corridas.append(json.loads(salida.stdout.strip().splitlines()[-1]))
+
+    return {
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "commit": _commit_actual(),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "cpus": os.cpu_count(),
+        "escala": escala,
+        "tamanios": corridas,
+    }
+
+def comparar(anterior: dict, actual: dict, tolerancia: float = TOLERANCIA) -> list[dict]:
+    """
+    Compara dos corridas y devuelve las operaciones que empeoraron.
+
+    Solo se comparan los tamaños y operaciones presentes en ambas corridas.
+
+    Parámetros:
+        anterior (dict): Resultado de referencia (ejecutar_suite()).
+        actual (dict): Resultado nuevo.
+        tolerancia (float): Empeoramiento relativo permitido (0.2 = 20 %).
+
+    Retorna:
+        list[dict]: Una entrada por tamaño, operación y métrica que superó la tolerancia.
+    """
+    previos = {corrida["tamanio"]: corrida for corrida in anterior["tamanios"]}
+    regresiones = []
+    for corrida in actual["tamanios"]:
+        previa = previos.get(corrida["tamanio"])
+        if previa is None:
+            continue
+        for nombre, metricas in corrida["operaciones"].items():
+            referencia = previa["operaciones"].get(nombre)
+            if referencia is None:
+                continue
+            for metrica in ("p50_ms", "p95_ms"):
+                antes, ahora = referencia[metrica], metricas[metrica]
+                if antes > 0 and ahora > antes * (1 + tolerancia):
+                    regresiones.append({
+                        "tamanio": corrida["tamanio"], "operacion": nombre, "metrica": metrica,
+                        "antes": antes, "ahora": ahora, "cambio": round(ahora / antes - 1, 3),
+                    })
+    return regresiones
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Suite de benchmarks de punta a punta con salida JSON.")
+    parser.add_argument("--tamanios", type=int, nargs="+", default=list(TAMANIOS), help="Cantidades de productos a medir")
+    parser.add_argument("--escala", type=float, default=1.0, help="Multiplicador de repeticiones")
+    parser.add_argument("--salida", help="Archivo JSON de resultados (por defecto, la salida estándar)")
+    parser.add_argument("--comparar", nargs="+", metavar="JSON",
+                        help="Corrida de referencia (y opcionalmente la nueva, sin volver a medir)")
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA, help="Empeoramiento relativo tolerado")
+    parser.add_argument("--interno", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.interno is not None:
+        print(json.dumps(medir_tamanio(args.interno, args.escala)))
+        sys.exit(0)
+
+    if args.comparar and len(args.comparar) > 1:
+        with open(args.comparar[1], encoding="utf-8") as archivo:
+            resultado = json.load(archivo)
+    else:
+        resultado = ejecutar_suite(args.tamanios, args.escala)
+        texto = json.dumps(resultado, indent=2, ensure_ascii=False)
+        if args.salida:
+            with open(args.salida, "w", encoding="utf-8") as archivo:
+                archivo.write(texto + "\n")
+        else:
+            print(texto)
+
+    if args.comparar:
+        with open(args.comparar[0], encoding="utf-8") as archivo:
+            anterior = json.load(archivo)
+        regresiones = comparar(anterior, resultado, args.tolerancia)
+        for r in regresiones:
+            print(f"REGRESIÓN tamaño {r['tamanio']} {r['operacion']} {r['metrica']}: "
+                  f"{r['antes']} → {r['ahora']} ms (+{r['cambio']:.0%})", file=sys.stderr)
+        if not regresiones:
+            print("Sin regresiones respecto de la corrida anterior.", file=sys.stderr)
+        sys.exit(1 if regresiones else 0)
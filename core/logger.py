@@ -1,14 +1,37 @@
 # Módulo de configuración y manejo de logs
-# Este módulo se encarga de configurar el registro de logs, 
-# creando una carpeta para los archivos de logs y definiendo 
-# funciones para registrar mensajes de nivel INFO y ERROR.
+# Este módulo se encarga de configurar el registro de logs en "registro.log" y
+# define funciones para registrar mensajes de nivel INFO y ERROR.
+#
+# Las funciones de log no escriben en el archivo: encolan el registro y un hilo de
+# fondo (QueueListener) lo escribe, así una venta o una exportación no esperan al
+# disco. El archivo rota por tamaño y por día (u hora), los archivos rotados pueden
+# comprimirse con gzip y solo se conservan los más recientes. Los procesos hijos
+# (fork) no rotan, solo agregan líneas. Procesos independientes que escriben el mismo
+# archivo (el menú de main.py y un python -m inventario desde cron) rotan de a uno:
+# la rotación toma un candado sobre registro.log.lock y, si al obtenerlo otro proceso
+# ya rotó, solo se reabre el archivo nuevo.
+#
+# Cada mensaje puede llevar campos estructurados (operacion, IDs, duracion_ms...),
+# que se agregan al final de la línea como clave=valor, o como JSON por línea con
+# INVENTARIO_LOG_FORMATO=json.
 
+import atexit
+import gzip
+import json
 import logging
+import logging.handlers
 import os
-from datetime import datetime
+import queue
+import shutil
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
 
-import logging
-import os
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
 
 # Crear carpeta de logs si no existe
 LOG_DIR = "."
@@ -17,27 +40,330 @@ os.makedirs(LOG_DIR, exist_ok=True)
 # Usar un único archivo de log con el nombre fijo "registro.log"
 LOG_PATH = os.path.join(LOG_DIR, "registro.log")
 
-# Configuración básica para el logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] → %(message)s",
-    handlers=[logging.FileHandler(LOG_PATH, mode='a', encoding="utf-8")]  # Modo 'a' para añadir contenido
-)
+# Tamaño máximo del archivo antes de rotarlo (MB, 0 = sin límite)
+LOG_MAX_MB = float(os.environ.get("INVENTARIO_LOG_MAX_MB", "10"))
+
+# Rotación por tiempo: "diaria", "horaria" o "ninguna"
+LOG_ROTACION = os.environ.get("INVENTARIO_LOG_ROTACION", "diaria")
+
+# Archivos rotados que se conservan
+LOG_RESPALDOS = int(os.environ.get("INVENTARIO_LOG_RESPALDOS", "14"))
+
+# Comprimir con gzip los archivos rotados
+LOG_COMPRIMIR = os.environ.get("INVENTARIO_LOG_COMPRIMIR", "1") != "0"
+
+# Escritura en un hilo de fondo (0 escribe en el momento, como antes)
+LOG_ASINCRONICO = os.environ.get("INVENTARIO_LOG_ASINCRONICO", "1") != "0"
+
+# Formato de cada línea: "texto" o "json"
+LOG_FORMATO = os.environ.get("INVENTARIO_LOG_FORMATO", "texto")
+
+FORMATO_TEXTO = "%(asctime)s [%(levelname)s] → %(message)s"
+
+class FormatoRegistro(logging.Formatter):
+    """
+    Formato de las líneas del log, con los campos estructurados del mensaje.
+
+    En modo texto los campos se agregan al final ("| operacion=venta factura_id=12");
+    en modo JSON cada línea es un objeto con fecha, nivel, mensaje y los campos.
+    """
+
+    def __init__(self, formato: str = LOG_FORMATO):
+        super().__init__(FORMATO_TEXTO)
+        self.json = formato == "json"
+
+    def format(self, record: logging.LogRecord) -> str:
+        campos = getattr(record, "campos", None) or {}
+        if self.json:
+            datos = {
+                "fecha": self.formatTime(record),
+                "nivel": record.levelname,
+                "mensaje": record.getMessage(),
+                **campos,
+            }
+            if record.exc_info:
+                datos["excepcion"] = self.formatException(record.exc_info)
+            return json.dumps(datos, ensure_ascii=False, default=str)
+
+        linea = super().format(record)
+        if campos:
+            linea += " | " + " ".join(f"{clave}={valor}" for clave, valor in campos.items())
+        return linea
+
+def _comprimir(origen: str, destino: str) -> None:
+    """
+    Rotador que comprime el archivo rotado con gzip y borra el original.
+    """
+    with open(origen, "rb") as entrada, gzip.open(destino, "wb") as salida:
+        shutil.copyfileobj(entrada, salida)
+    os.remove(origen)
+
+class ArchivoRotativo(logging.handlers.BaseRotatingHandler):
+    """
+    Handler de archivo que rota por tamaño y por cambio de día (u hora).
+
+    El archivo rotado se renombra como registro.log.AAAAMMDD-HHMMSS (más .gz si se
+    comprime) y se borran los más viejos que superen la cantidad de respaldos.
+
+    Varios procesos pueden usar el mismo archivo: cada línea se escribe con el
+    candado compartido (reabriendo el archivo si otro proceso lo rotó) y la
+    rotación lo toma exclusivo, así ninguna línea va a parar a un archivo que se
+    está comprimiendo.
+    """
+
+    def __init__(self, ruta: str, max_bytes: int = 0, rotacion: str = "diaria",
+                 respaldos: int = 14, comprimir: bool = False):
+        super().__init__(ruta, "a", encoding="utf-8", delay=True)
+        self.max_bytes = max_bytes
+        self.rotacion = rotacion
+        self.respaldos = respaldos
+        if comprimir:
+            self.namer = lambda nombre: nombre + ".gz"
+            self.rotator = _comprimir
+        # Si el archivo existente es de un período anterior, se rota con el primer mensaje
+        inicio = os.path.getmtime(ruta) if os.path.exists(ruta) else time.time()
+        self.proxima_rotacion = self._fin_del_periodo(inicio)
+        self._archivo_candado = None
+
+    def _fin_del_periodo(self, instante: float) -> float | None:
+        """
+        Devuelve el momento en que termina el período (día u hora) de un instante.
+        """
+        fecha = datetime.fromtimestamp(instante)
+        if self.rotacion == "diaria":
+            return (fecha.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)).timestamp()
+        if self.rotacion == "horaria":
+            return (fecha.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)).timestamp()
+        return None
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if self.proxima_rotacion is not None and record.created >= self.proxima_rotacion:
+            return True
+        if self.max_bytes > 0:
+            if self.stream is None:
+                self.stream = self._open()
+            # Sin formatear el registro: el archivo puede pasarse del límite por una línea
+            self.stream.seek(0, 2)
+            return self.stream.tell() >= self.max_bytes
+        return False
+
+    @contextmanager
+    def _candado(self, compartido: bool = False):
+        """
+        Candado entre procesos sobre registro.log.lock: compartido para escribir,
+        exclusivo para rotar. En Windows (msvcrt) siempre es exclusivo.
+        """
+        if self._archivo_candado is None:
+            self._archivo_candado = open(self.baseFilename + ".lock", "a+")
+        descriptor = self._archivo_candado.fileno()
+        if fcntl is not None:
+            fcntl.flock(descriptor, fcntl.LOCK_SH if compartido else fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(descriptor, fcntl.LOCK_UN)
+            return
+        self._archivo_candado.seek(0)
+        msvcrt.locking(descriptor, msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            self._archivo_candado.seek(0)
+            msvcrt.locking(descriptor, msvcrt.LK_UNLCK, 1)
+
+    def _reabrir_si_rotado(self) -> None:
+        """
+        Cierra el archivo si otro proceso lo rotó; emit() abre el nuevo. Se llama con el candado tomado.
+        """
+        if self.stream is None:
+            return
+        try:
+            actual = os.stat(self.baseFilename)
+        except FileNotFoundError:
+            actual = None
+        abierto = os.fstat(self.stream.fileno())
+        if actual is None or (actual.st_dev, actual.st_ino) != (abierto.st_dev, abierto.st_ino):
+            self.stream.close()
+            self.stream = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            with self._candado(compartido=True):
+                self._reabrir_si_rotado()
+                logging.FileHandler.emit(self, record)
+        except Exception:
+            self.handleError(record)
+
+    def close(self) -> None:
+        super().close()
+        if self._archivo_candado is not None:
+            self._archivo_candado.close()
+            self._archivo_candado = None
+
+    def doRollover(self) -> None:
+        with self._candado():
+            try:
+                actual = os.stat(self.baseFilename)
+            except FileNotFoundError:
+                actual = None
+            # Si otro proceso rotó mientras se esperaba el candado, el archivo ya es
+            # otro (o es del período nuevo): no se rota de nuevo, solo se reabre.
+            # El archivo propio se compara antes de cerrarlo, para que su inodo no
+            # pueda haberse reutilizado.
+            if actual is None or actual.st_size == 0:
+                pendiente = False
+            elif self.stream:
+                abierto = os.fstat(self.stream.fileno())
+                pendiente = (actual.st_dev, actual.st_ino) == (abierto.st_dev, abierto.st_ino)
+            else:
+                pendiente = self.proxima_rotacion is None or actual.st_mtime < self.proxima_rotacion
+            if self.stream:
+                self.stream.close()
+                self.stream = None
+
+            if pendiente:
+                nombre = f"{self.baseFilename}.{datetime.now():%Y%m%d-%H%M%S}"
+                numero = 1
+                while os.path.exists(self.rotation_filename(nombre)):
+                    nombre = f"{self.baseFilename}.{datetime.now():%Y%m%d-%H%M%S}-{numero}"
+                    numero += 1
+                self.rotate(self.baseFilename, self.rotation_filename(nombre))
+                self._borrar_viejos()
+
+        self.proxima_rotacion = self._fin_del_periodo(time.time())
+
+    def _borrar_viejos(self) -> None:
+        """
+        Borra los archivos rotados más viejos que excedan la cantidad de respaldos.
+        """
+        carpeta, base = os.path.split(self.baseFilename)
+        rotados = sorted(
+            (os.path.join(carpeta, nombre) for nombre in os.listdir(carpeta or ".")
+             if nombre.startswith(base + ".") and nombre != base + ".lock"),
+            key=os.path.getmtime,
+        )
+        for ruta in rotados[:max(0, len(rotados) - self.respaldos)]:
+            try:
+                os.remove(ruta)
+            except OSError:
+                pass
+
+class ColaRegistros(logging.handlers.QueueHandler):
+    """
+    QueueHandler que encola el registro tal como llega, sin formatearlo en el hilo
+    que loguea: el formato y la escritura quedan a cargo del hilo de fondo.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Con argumentos o excepción se resuelven acá, antes de que cambien
+        if record.args or record.exc_info:
+            return super().prepare(record)
+        return record
+
+_listener = None
+_pid = None
+_ruta = None
+
+def crear_handler_archivo(ruta: str = None) -> ArchivoRotativo:
+    """
+    Crea el handler de archivo con la configuración de rotación vigente.
+
+    Parámetros:
+        ruta (str): Archivo de log; por defecto, LOG_PATH.
+
+    Retorna:
+        ArchivoRotativo: Handler listo para usar.
+    """
+    handler = ArchivoRotativo(ruta or LOG_PATH, int(LOG_MAX_MB * 1024 * 1024), LOG_ROTACION,
+                              LOG_RESPALDOS, LOG_COMPRIMIR)
+    handler.setFormatter(FormatoRegistro())
+    return handler
+
+def detener_logs() -> None:
+    """
+    Escribe los mensajes que quedan en cola y detiene el hilo de escritura.
+    Se llama sola al terminar el programa.
+    """
+    global _listener
+    if _listener is not None and _pid == os.getpid():
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+    _listener = None
+
+def configurar_logs(ruta: str = None, asincronico: bool = None, activo: bool = True) -> None:
+    """
+    (Re)configura el registro de logs del proceso.
+
+    Parámetros:
+        ruta (str): Archivo de log; por defecto, LOG_PATH.
+        asincronico (bool): Escribir desde un hilo de fondo; por defecto, LOG_ASINCRONICO.
+        activo (bool): Si es False, los mensajes se descartan (para medir sin logs).
+    """
+    global _listener, _pid, _ruta
+    detener_logs()
+    raiz = logging.getLogger()
+    for handler in raiz.handlers[:]:
+        raiz.removeHandler(handler)
+        handler.close()
+
+    raiz.setLevel(logging.INFO if activo else logging.CRITICAL + 1)
+    _pid = os.getpid()
+    _ruta = (ruta or LOG_PATH) if activo else None
+    if not activo:
+        return
+
+    handler = crear_handler_archivo(_ruta)
+    if LOG_ASINCRONICO if asincronico is None else asincronico:
+        cola = queue.SimpleQueue()
+        raiz.addHandler(ColaRegistros(cola))
+        _listener = logging.handlers.QueueListener(cola, handler)
+        _listener.start()
+    else:
+        raiz.addHandler(handler)
+
+def _despues_de_fork() -> None:
+    """
+    En un proceso hijo el hilo de escritura no existe y no se rota: dos procesos
+    rotando el mismo archivo se pisarían. El hijo agrega sus líneas directo al
+    archivo con un WatchedFileHandler, que lo vuelve a abrir si el padre lo rotó.
+    """
+    global _listener, _pid
+    _listener = None
+    _pid = os.getpid()
+    if _ruta is None:
+        return
+    raiz = logging.getLogger()
+    # Los handlers heredados no se cierran: comparten el archivo con el padre
+    for handler in raiz.handlers[:]:
+        raiz.removeHandler(handler)
+    handler = logging.handlers.WatchedFileHandler(_ruta, encoding="utf-8", delay=True)
+    handler.setFormatter(FormatoRegistro())
+    raiz.addHandler(handler)
+
+configurar_logs()
+atexit.register(detener_logs)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_despues_de_fork)
 
-def log_info(mensaje: str):
+def log_info(mensaje: str, **campos):
     """
     Registra un mensaje de nivel INFO en el archivo de logs.
 
     Parámetros:
         mensaje (str): El mensaje que se registrará en el log.
+        **campos: Datos estructurados opcionales (por ejemplo operacion, factura_id, duracion_ms).
     """
-    logging.info(mensaje)
+    logging.info(mensaje, extra={"campos": campos})
 
-def log_error(mensaje: str):
+def log_error(mensaje: str, **campos):
     """
     Registra un mensaje de nivel ERROR en el archivo de logs.
 
     Parámetros:
         mensaje (str): El mensaje que se registrará en el log.
+        **campos: Datos estructurados opcionales (por ejemplo operacion, factura_id, duracion_ms).
     """
-    logging.error(mensaje)
+    logging.error(mensaje, extra={"campos": campos})
@@ -1,7 +1,8 @@
 # Módulo de utilidades para fechas y texto
-# Funciones para obtener la fecha actual y formatear texto.
+# Funciones para obtener la fecha actual, formatear texto y armar consultas de búsqueda.
 
 from datetime import datetime
+import re
 import unicodedata
 
 def obtener_fecha_actual():
@@ -16,6 +17,16 @@ def normalizar_texto(texto: str) -> str:
     """
     return unicodedata.normalize("NFKD", texto.strip().lower()).encode("ASCII", "ignore").decode("utf-8")
 
+def consulta_busqueda(texto: str) -> str:
+    """
+    Arma una consulta MATCH de FTS5 a partir de lo que escribió el usuario.
+
+    Normaliza el texto como normalizar_texto() y busca cada palabra como prefijo;
+    todas las palabras deben aparecer. Retorna "" si no hay palabras para buscar.
+    """
+    palabras = re.findall(r"[a-z0-9]+", normalizar_texto(texto))
+    return " ".join(f'"{palabra}"*' for palabra in palabras)
+
 def formatear_nombre(texto: str) -> str:
     """
     Capitaliza el nombre (primera letra de cada palabra).
@@ -1,9 +1,61 @@
 # Módulo de validaciones generales
 # Este módulo contiene funciones para validar los campos de entrada comunes en el sistema:
 # nombre, teléfono y correo electrónico.
+#
+# Las reglas están en las funciones revisar_*, que devuelven el motivo del rechazo sin
+# mostrar nada (las usa la importación masiva); las validar_* las muestran por consola.
 
 from interfaz.diseño_interfaz import mostrar_error
 
+def revisar_nombre(nombre: str, permitir_vacio: bool = False) -> str | None:
+    """
+    Aplica la regla de validar_nombre() sin mostrar mensajes.
+
+    Parámetros:
+        nombre (str): El nombre a revisar.
+        permitir_vacio (bool): Si es True, el nombre vacío es válido.
+
+    Retorna:
+        str: El motivo por el que el nombre no es válido, o None si es válido.
+    """
+    if not nombre and not permitir_vacio:
+        return "El nombre no puede estar vacío"
+    return None
+
+def revisar_telefono(telefono: str, permitir_vacio: bool = False) -> str | None:
+    """
+    Aplica las reglas de validar_telefono() sin mostrar mensajes.
+
+    Parámetros:
+        telefono (str): El número de teléfono a revisar.
+        permitir_vacio (bool): Si es True, el teléfono vacío es válido.
+
+    Retorna:
+        str: El motivo por el que el teléfono no es válido, o None si es válido.
+    """
+    if not telefono:
+        return None if permitir_vacio else "El teléfono no puede estar vacío"
+    if not telefono.isdigit():
+        return "El teléfono solo puede contener números"
+    return None
+
+def revisar_email(email: str, permitir_vacio: bool = False) -> str | None:
+    """
+    Aplica las reglas de validar_email() sin mostrar mensajes.
+
+    Parámetros:
+        email (str): El correo electrónico a revisar.
+        permitir_vacio (bool): Si es True, el correo vacío es válido.
+
+    Retorna:
+        str: El motivo por el que el email no es válido, o None si es válido.
+    """
+    if not email:
+        return None if permitir_vacio else "El email no puede estar vacío"
+    if "@" not in email or "." not in email:
+        return "El formato del email no es válido"
+    return None
+
 def validar_nombre(nombre: str, permitir_vacio: bool = False) -> bool:
     """
     Valida que el nombre no esté vacío.
@@ -17,10 +69,10 @@ def validar_nombre(nombre: str, permitir_vacio: bool = False) -> bool:
     Retorna:
         bool: True si el nombre es válido, False en caso contrario.
     """
-    if not nombre:
-        if permitir_vacio:
-            return True  # se considera válido si se permite vacío (en edición)
-        mostrar_error("El nombre no puede estar vacío")
+    # Vacío se considera válido si se permite (en edición)
+    error = revisar_nombre(nombre, permitir_vacio)
+    if error:
+        mostrar_error(error)
         return False
     return True
 
@@ -37,13 +89,9 @@ def validar_telefono(telefono: str, permitir_vacio: bool = False) -> bool:
     Retorna:
         bool: True si el teléfono es válido, False en caso contrario.
     """
-    if not telefono:
-        if permitir_vacio:
-            return True
-        mostrar_error("El teléfono no puede estar vacío")
-        return False
-    if not telefono.isdigit():
-        mostrar_error("El teléfono solo puede contener números")
+    error = revisar_telefono(telefono, permitir_vacio)
+    if error:
+        mostrar_error(error)
         return False
     return True
 
@@ -60,12 +108,8 @@ def validar_email(email: str, permitir_vacio: bool = False) -> bool:
     Retorna:
         bool: True si el email es válido, False en caso contrario.
     """
-    if not email:
-        if permitir_vacio:
-            return True
-        mostrar_error("El email no puede estar vacío")
-        return False
-    if "@" not in email or "." not in email:
-        mostrar_error("El formato del email no es válido")
+    error = revisar_email(email, permitir_vacio)
+    if error:
+        mostrar_error(error)
         return False
     return True
@@ -0,0 +1,266 @@
+# Módulo de caché de datos de referencia
+# Las categorías y los proveedores cambian muy poco, pero se consultan en cada alta o
+# edición de producto y en cada validación de ID. Este módulo guarda en memoria las
+# filas de esas tablas (una lectura completa por tabla) y responde desde ahí los
+# listados y las búsquedas por ID. Una búsqueda por ID con la tabla todavía sin cargar
+# (o con la caché desactivada) va a la base por clave primaria, sin leer la tabla entera.
+#
+# Las funciones de escritura de categorias_db y proveedores_db invalidan su tabla
+# después de confirmar. Para enterarse de escrituras hechas por otras conexiones (otra
+# terminal con el programa abierto, insert_datos_prueba.py, una importación), la caché
+# mantiene una conexión propia y compara PRAGMA data_version en cada consulta. Ese
+# valor cambia cuando cualquier otra conexión confirma algo, incluidas las del pool de
+# este mismo proceso en cada venta; por eso, cuando cambia, se leen los contadores de
+# versiones_referencia (los suben disparadores en cada alta, modificación o baja) y
+# solo se descartan las tablas cuyo contador se movió.
+
+import os
+import sqlite3
+import threading
+
+import db.data_base as data_base
+
+# Con INVENTARIO_CACHE_REFERENCIAS=0 cada consulta va directo a la base (y cuenta como fallo)
+CACHE_REFERENCIAS_ACTIVA = os.environ.get("INVENTARIO_CACHE_REFERENCIAS", "1") != "0"
+
+# Tablas cacheables: consulta completa (con la forma de listar_*()), índice de la clave
+# y consulta de una fila por clave primaria
+TABLAS_REFERENCIA = {
+    "categorias": ("SELECT id_categoria, nombre FROM categorias ORDER BY id_categoria ASC", 0,
+                   "SELECT id_categoria, nombre FROM categorias WHERE id_categoria = ?"),
+    "proveedores": ("SELECT id_proveedor, nombre, telefono, email, cuit FROM proveedores ORDER BY id_proveedor ASC", 0,
+                    "SELECT id_proveedor, nombre, telefono, email, cuit FROM proveedores WHERE id_proveedor = ?"),
+}
+
+
+class CacheReferencias:
+    """
+    Caché de lectura para tablas chicas que casi no cambian, segura entre hilos.
+
+    Cada tabla se carga completa la primera vez que se listan sus filas y queda
+    guardada como lista de filas y como diccionario por ID, hasta que se invalida.
+    """
+
+    def __init__(self):
+        self.aciertos = 0
+        self.fallos = 0
+        self.invalidaciones = 0
+        self._tablas = {}
+        self._lock = threading.Lock()
+        self._conexion = None
+        self._ruta = None
+        self._pid = None
+        self._version = None
+        self._versiones_tablas = {}
+        self._generacion = 0
+
+    def _verificar_version(self) -> None:
+        """
+        Descarta las tablas que cambiaron desde otra conexión, o todo si cambió
+        la base activa (RUTA_DB) o el proceso (fork). Se llama con el lock tomado.
+        """
+        if self._conexion is None or self._ruta != data_base.RUTA_DB or self._pid != os.getpid():
+            if self._conexion is not None and self._pid == os.getpid():
+                self._conexion.close()
+            self._conexion = sqlite3.connect(data_base.RUTA_DB, check_same_thread=False)
+            self._ruta = data_base.RUTA_DB
+            self._pid = os.getpid()
+            self._version = None
+
+        version = self._conexion.execute("PRAGMA data_version").fetchone()[0]
+        if version == self._version:
+            return
+        try:
+            versiones = dict(self._conexion.execute("SELECT tabla, version FROM versiones_referencia"))
+        except sqlite3.Error:
+            # Base sin la migración de los contadores: no se sabe qué tabla cambió
+            versiones = {}
+        if self._version is None or not versiones:
+            self._descartar(len(self._tablas))
+        else:
+            for tabla in [t for t in self._tablas if versiones.get(t) != self._versiones_tablas.get(t)]:
+                self._descartar(1, tabla)
+        self._version = version
+        self._versiones_tablas = versiones
+
+    def _descartar(self, cantidad: int, tabla: str = None) -> None:
+        """
+        Vacía una tabla (o todas) y avanza la generación, así una lectura que ya
+        estaba en curso no guarda datos anteriores a la invalidación.
+        """
+        if tabla is None:
+            self._tablas = {}
+        else:
+            self._tablas.pop(tabla, None)
+        self.invalidaciones += cantidad
+        self._generacion += 1
+
+    def _en_memoria(self, tabla: str) -> tuple[tuple | None, int]:
+        """
+        Devuelve ((filas, filas_por_id) o None, generación actual) y cuenta el
+        acierto o el fallo.
+        """
+        with self._lock:
+            if CACHE_REFERENCIAS_ACTIVA:
+                self._verificar_version()
+                datos = self._tablas.get(tabla)
+                if datos is not None:
+                    self.aciertos += 1
+                    return datos, self._generacion
+            self.fallos += 1
+            return None, self._generacion
+
+    def _obtener(self, tabla: str) -> tuple[list, dict]:
+        """
+        Devuelve (filas, filas_por_id) de una tabla, desde memoria o leyendo la base.
+
+        La lectura se hace sin el lock tomado, para no bloquear a otros hilos que
+        esperan una conexión del pool. Si el hilo tiene una transacción abierta, el
+        resultado no se guarda: podría incluir cambios que todavía se revierten.
+        """
+        consulta, clave, _ = TABLAS_REFERENCIA[tabla]
+        datos, generacion = self._en_memoria(tabla)
+        if datos is not None:
+            return datos
+
+        with data_base.conexion_db() as conexion:
+            filas = conexion.execute(consulta).fetchall()
+            en_transaccion = conexion.in_transaction
+        datos = (filas, {fila[clave]: fila for fila in filas})
+
+        if CACHE_REFERENCIAS_ACTIVA and not en_transaccion:
+            with self._lock:
+                if generacion == self._generacion:
+                    self._tablas[tabla] = datos
+        return datos
+
+    def filas(self, tabla: str) -> list:
+        """
+        Devuelve todas las filas de una tabla de referencia, ordenadas por ID.
+
+        Parámetros:
+            tabla (str): Clave de TABLAS_REFERENCIA.
+
+        Retorna:
+            list: Copia de la lista de tuplas (se puede modificar sin afectar la caché).
+
+        Lanza:
+            sqlite3.Error: Si falla la lectura de la base.
+        """
+        return list(self._obtener(tabla)[0])
+
+    def por_id(self, tabla: str, id_registro: int):
+        """
+        Devuelve la fila de una tabla de referencia con ese ID.
+
+        Si la tabla no está en memoria (o la caché está desactivada), la busca en
+        la base por clave primaria en lugar de cargar la tabla entera.
+
+        Parámetros:
+            tabla (str): Clave de TABLAS_REFERENCIA.
+            id_registro (int): El ID buscado.
+
+        Retorna:
+            tuple: La fila si existe, None si no existe.
+
+        Lanza:
+            sqlite3.Error: Si falla la lectura de la base.
+        """
+        datos, _ = self._en_memoria(tabla)
+        if datos is not None:
+            return datos[1].get(id_registro)
+        with data_base.conexion_db() as conexion:
+            return conexion.execute(TABLAS_REFERENCIA[tabla][2], (id_registro,)).fetchone()
+
+    def invalidar(self, tabla: str = None) -> None:
+        """
+        Descarta una tabla guardada (o todas), para que la próxima consulta la relea.
+
+        Parámetros:
+            tabla (str): Clave de TABLAS_REFERENCIA; por defecto, todas.
+        """
+        with self._lock:
+            if tabla is None:
+                self._descartar(len(self._tablas))
+            else:
+                self._descartar(1 if tabla in self._tablas else 0, tabla)
+
+    def estadisticas(self) -> dict:
+        """
+        Devuelve los contadores de uso de la caché.
+
+        Retorna:
+            dict: aciertos, fallos, invalidaciones, tasa_aciertos (0 a 1) y tablas cargadas.
+        """
+        with self._lock:
+            consultas = self.aciertos + self.fallos
+            return {
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "invalidaciones": self.invalidaciones,
+                "tasa_aciertos": round(self.aciertos / consultas, 3) if consultas else 0.0,
+                "tablas": sorted(self._tablas),
+            }
+
+    def cerrar(self) -> None:
+        """
+        Cierra la conexión propia y descarta todo lo guardado.
+        """
+        with self._lock:
+            if self._conexion is not None and self._pid == os.getpid():
+                self._conexion.close()
+            self._conexion = None
+            self._descartar(0)
+
+
+_cache = CacheReferencias()
+
+
+def filas_referencia(tabla: str) -> list:
+    """
+    Devuelve las filas de una tabla de referencia desde la caché del proceso.
+
+    Parámetros:
+        tabla (str): "categorias" o "proveedores".
+
+    Retorna:
+        list: Tuplas con la forma de listar_*(), ordenadas por ID.
+
+    Lanza:
+        sqlite3.Error: Si falla la lectura de la base.
+    """
+    return _cache.filas(tabla)
+
+
+def fila_referencia_por_id(tabla: str, id_registro: int):
+    """
+    Devuelve una fila de una tabla de referencia por su ID desde la caché del proceso.
+
+    Parámetros:
+        tabla (str): "categorias" o "proveedores".
+        id_registro (int): El ID buscado.
+
+    Retorna:
+        tuple: La fila, o None si no existe.
+
+    Lanza:
+        sqlite3.Error: Si falla la lectura de la base.
+    """
+    return _cache.por_id(tabla, id_registro)
+
+
+def invalidar_referencias(tabla: str = None) -> None:
+    """
+    Descarta de la caché del proceso una tabla de referencia (o todas).
+
+    Parámetros:
+        tabla (str): "categorias" o "proveedores"; por defecto, todas.
+    """
+    _cache.invalidar(tabla)
+
+
+def estadisticas_cache_referencias() -> dict:
+    """
+    Devuelve los contadores de aciertos, fallos e invalidaciones de la caché del proceso.
+    """
+    return _cache.estadisticas()
@@ -4,11 +4,61 @@
 
 import os
 import sqlite3
+import threading
+from contextlib import contextmanager
 
 from core.logger import log_error, log_info
+from db.migraciones import aplicar_migraciones
 
 RUTA_DB = "data/inventario.db"
 
+# Cantidad máxima de conexiones abiertas por el pool (0 desactiva el pool:
+# cada operación abre y cierra su propia conexión, como antes).
+TAMANIO_POOL = int(os.environ.get("INVENTARIO_POOL_TAMANIO", "5"))
+
+# Segundos que un hilo espera una conexión libre antes de fallar.
+ESPERA_POOL = float(os.environ.get("INVENTARIO_POOL_ESPERA", "10"))
+
+# Perfiles de almacenamiento: PRAGMAs que se aplican a cada conexión nueva.
+# - durable: WAL con fsync en cada commit; máxima seguridad ante cortes de luz.
+# - balanced: WAL con synchronous=NORMAL; un commit no espera al disco, pero la
+#   base nunca queda corrupta (solo puede perderse la última transacción ante
+#   un corte de energía).
+# - bulk-load: sin fsync y journal en memoria; solo para cargas masivas con
+#   acceso exclusivo a la base, que pueden repetirse si se interrumpen.
+PERFILES_ALMACENAMIENTO = {
+    "durable": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "mmap_size": 0,
+        "cache_size": -2000,
+        "temp_store": "DEFAULT",
+        "busy_timeout": 5000,
+    },
+    "balanced": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 256 * 1024 * 1024,
+        "cache_size": -64 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+    "bulk-load": {
+        "journal_mode": "MEMORY",
+        "synchronous": "OFF",
+        "mmap_size": 1024 * 1024 * 1024,
+        "cache_size": -256 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 30000,
+    },
+}
+
+PERFIL_POR_DEFECTO = "balanced"
+
+# Perfil activo, seleccionable con la variable de entorno INVENTARIO_PERFIL_DB
+# o en tiempo de ejecución con configurar_perfil().
+PERFIL_DB = os.environ.get("INVENTARIO_PERFIL_DB", PERFIL_POR_DEFECTO)
+
 def crear_tablas() -> bool:
     """
     Crea las tablas necesarias en la base de datos si no existen.
@@ -25,7 +75,7 @@ def crear_tablas() -> bool:
     try:
         # Crear la carpeta si no existe
         os.makedirs(os.path.dirname(RUTA_DB), exist_ok=True)
-        conexion = sqlite3.connect(RUTA_DB)
+        conexion = obtener_conexion()
         cursor = conexion.cursor()
 
         # Crear tablas en la base de datos
@@ -112,27 +162,342 @@ def crear_tablas() -> bool:
             conexion.close()
 
 
+def migrar_base() -> bool:
+    """
+    Aplica las migraciones de esquema pendientes (índices y cambios posteriores
+    a crear_tablas), registradas en PRAGMA user_version.
+
+    Retorna:
+        bool: True si el esquema quedó actualizado, False si ocurrió un error.
+    """
+    conexion = None
+    try:
+        conexion = obtener_conexion()
+        return aplicar_migraciones(conexion)
+    except sqlite3.Error as e:
+        log_error(f"Error al migrar la base de datos: {e}")
+        return False
+    finally:
+        if conexion:
+            conexion.close()
+
+
 def inicializar_base() -> None:
     """
-    Inicializa la base de datos creando las tablas necesarias si no existen.
+    Inicializa la base de datos creando las tablas necesarias si no existen
+    y aplicando las migraciones pendientes.
     Si la creación de las tablas es exitosa, se registra un mensaje de éxito,
     en caso contrario, se registra un error.
     """
-    if crear_tablas():
+    if crear_tablas() and migrar_base():
         log_info("Inicialización completada.")
     else:
         log_error("Hubo un problema al iniciar el programa. Verificá el acceso a la base de datos.")
 
 
+def perfil_activo() -> str:
+    """
+    Devuelve el nombre del perfil de almacenamiento vigente.
+
+    Si PERFIL_DB no corresponde a un perfil conocido, se registra el error
+    y se usa el perfil por defecto.
+
+    Retorna:
+        str: Nombre de un perfil existente en PERFILES_ALMACENAMIENTO.
+    """
+    if PERFIL_DB in PERFILES_ALMACENAMIENTO:
+        return PERFIL_DB
+    log_error(f"Perfil de almacenamiento desconocido: {PERFIL_DB}. Se usa '{PERFIL_POR_DEFECTO}'.")
+    return PERFIL_POR_DEFECTO
+
+
+def aplicar_perfil(conexion: sqlite3.Connection, nombre: str = None) -> None:
+    """
+    Aplica los PRAGMAs de un perfil de almacenamiento a una conexión.
+
+    Parámetros:
+        conexion (sqlite3.Connection): Conexión recién abierta.
+        nombre (str): Perfil a aplicar; por defecto, el perfil activo.
+    """
+    perfil = PERFILES_ALMACENAMIENTO[nombre or perfil_activo()]
+    for pragma, valor in perfil.items():
+        conexion.execute(f"PRAGMA {pragma} = {valor}")
+
+
+def configurar_perfil(nombre: str) -> None:
+    """
+    Cambia el perfil de almacenamiento de las conexiones siguientes.
+
+    Las conexiones libres del pool se cierran para que las nuevas se abran
+    con el perfil elegido.
+
+    Parámetros:
+        nombre (str): Nombre del perfil ("durable", "balanced" o "bulk-load").
+    """
+    global PERFIL_DB
+    if nombre not in PERFILES_ALMACENAMIENTO:
+        raise ValueError(f"Perfil de almacenamiento desconocido: {nombre}")
+    PERFIL_DB = nombre
+    configurar_pool()
+    log_info(f"Perfil de almacenamiento activo → {nombre}")
+
+
+class ConexionPool(sqlite3.Connection):
+    """
+    Conexión que impide confirmar, desde un bloque conexion_db() anidado, la
+    transacción que dejó abierta un bloque externo.
+
+    Los bloques anidados del mismo hilo comparten la conexión; si una función interna
+    (por ejemplo insertar_producto) llamara a commit() con una transacción del
+    llamador abierta, confirmaría a medias el trabajo del llamador. En ese caso
+    commit() lanza sqlite3.ProgrammingError: quien escribe dentro de una transacción
+    ajena debe recibir la conexión por parámetro (como insertar_factura) y no confirmar.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Un valor por cada bloque anidado: si había una transacción abierta al entrar
+        self.transacciones_externas = []
+
+    def commit(self) -> None:
+        if any(self.transacciones_externas):
+            raise sqlite3.ProgrammingError(
+                "commit() en un conexion_db() anidado confirmaría la transacción del bloque externo."
+            )
+        super().commit()
+
+
 def obtener_conexion():
     """
-    Establece y devuelve una conexión activa a la base de datos.
+    Establece y devuelve una conexión nueva a la base de datos.
 
-    Configura PRAGMA foreign_keys en ON para habilitar las restricciones de clave externa.
+    Configura PRAGMA foreign_keys en ON para habilitar las restricciones de clave externa
+    y aplica el perfil de almacenamiento activo. Es la fábrica que usa el pool; las
+    funciones de los módulos *_db deben usar conexion_db() para reutilizar conexiones.
 
     Retorna:
         conexion: Objeto de conexión a la base de datos SQLite.
     """
-    conexion = sqlite3.connect(RUTA_DB)
+    conexion = sqlite3.connect(RUTA_DB, check_same_thread=False, factory=ConexionPool)
     conexion.execute("PRAGMA foreign_keys = ON")
+    aplicar_perfil(conexion)
     return conexion
+
+
+class PoolConexiones:
+    """
+    Pool de conexiones SQLite de larga duración, seguro entre hilos.
+
+    Mantiene hasta `tamanio` conexiones abiertas. Cada hilo reutiliza la misma
+    conexión mientras la tenga prestada, por lo que las llamadas anidadas
+    (por ejemplo, las validaciones dentro de registrar_venta) comparten la
+    conexión y la transacción del llamador. Los bloques anidados pueden leer y
+    escribir, pero no confirmar esa transacción (ver ConexionPool).
+
+    Al reemplazarlo con configurar_pool() queda cerrado: las conexiones que
+    estaban prestadas se cierran cuando se devuelven.
+    """
+
+    def __init__(self, ruta: str, tamanio: int = TAMANIO_POOL, espera: float = ESPERA_POOL):
+        self.ruta = ruta
+        self.tamanio = tamanio
+        self.espera = espera
+        self.pid = os.getpid()
+        self.conexiones_abiertas = 0  # Total histórico de conexiones creadas
+        self.cerrado = False
+        self._libres = []
+        self._en_uso = 0
+        self._condicion = threading.Condition()
+        self._local = threading.local()
+
+    def _conexion_sana(self, conexion: sqlite3.Connection) -> bool:
+        """
+        Verifica que una conexión del pool siga respondiendo.
+
+        Parámetros:
+            conexion (sqlite3.Connection): Conexión a verificar.
+
+        Retorna:
+            bool: True si la conexión responde, False si debe descartarse.
+        """
+        try:
+            conexion.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def _crear(self) -> sqlite3.Connection:
+        """
+        Abre una conexión nueva y actualiza el contador de conexiones abiertas.
+        """
+        conexion = obtener_conexion()
+        self.conexiones_abiertas += 1
+        return conexion
+
+    def adquirir(self) -> sqlite3.Connection:
+        """
+        Presta una conexión al hilo actual.
+
+        Si el hilo ya tiene una conexión prestada, devuelve la misma. Si no,
+        toma una libre (verificando que siga sana), abre una nueva si queda
+        lugar, o espera hasta que otro hilo libere una. Con el pool desactivado
+        (tamaño 0) siempre abre una conexión nueva.
+
+        Retorna:
+            sqlite3.Connection: Conexión lista para usar.
+        """
+        if self.tamanio <= 0:
+            with self._condicion:
+                return self._crear()
+
+        actual = getattr(self._local, "conexion", None)
+        if actual is not None:
+            self._local.profundidad += 1
+            actual.transacciones_externas.append(actual.in_transaction)
+            return actual
+
+        with self._condicion:
+            conexion = None
+            while conexion is None:
+                if self._libres:
+                    candidata = self._libres.pop()
+                    if self._conexion_sana(candidata):
+                        conexion = candidata
+                    else:
+                        log_error("Conexión del pool descartada por no responder.")
+                        candidata.close()
+                elif self._en_uso < self.tamanio:
+                    conexion = self._crear()
+                elif not self._condicion.wait(self.espera):
+                    raise sqlite3.OperationalError("No hay conexiones libres en el pool.")
+            self._en_uso += 1
+
+        self._local.conexion = conexion
+        self._local.profundidad = 1
+        return conexion
+
+    def liberar(self, conexion: sqlite3.Connection) -> None:
+        """
+        Devuelve la conexión del hilo actual al pool.
+
+        Solo se devuelve cuando termina el uso más externo. Si quedó una
+        transacción abierta sin confirmar, se revierte antes de reutilizarla.
+        Si el pool ya se cerró, la conexión se cierra en lugar de guardarse.
+
+        Parámetros:
+            conexion (sqlite3.Connection): Conexión prestada a liberar.
+        """
+        if self.tamanio <= 0:
+            conexion.close()
+            return
+
+        self._local.profundidad -= 1
+        if self._local.profundidad > 0:
+            conexion.transacciones_externas.pop()
+            return
+        self._local.conexion = None
+
+        try:
+            if conexion.in_transaction:
+                conexion.rollback()
+        except sqlite3.Error:
+            pass
+
+        with self._condicion:
+            self._en_uso -= 1
+            if not self.cerrado and len(self._libres) < self.tamanio:
+                self._libres.append(conexion)
+            else:
+                conexion.close()
+            self._condicion.notify()
+
+    def es_uso_externo(self) -> bool:
+        """
+        Indica si el hilo actual está en el bloque `with` más externo.
+        """
+        return getattr(self._local, "profundidad", 1) <= 1
+
+    def cerrar(self) -> None:
+        """
+        Cierra todas las conexiones libres del pool y marca el pool como cerrado,
+        para que las prestadas se cierren al devolverse.
+        """
+        with self._condicion:
+            self.cerrado = True
+            for conexion in self._libres:
+                conexion.close()
+            self._libres = []
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def obtener_pool() -> PoolConexiones:
+    """
+    Devuelve el pool de conexiones del proceso, creándolo si hace falta.
+
+    Si cambió RUTA_DB o el proceso es un hijo (fork), se descarta el pool
+    anterior y se crea uno nuevo para no compartir conexiones.
+
+    Retorna:
+        PoolConexiones: El pool activo.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None or _pool.ruta != RUTA_DB or _pool.pid != os.getpid():
+            if _pool is not None and _pool.pid == os.getpid():
+                _pool.cerrar()
+            _pool = PoolConexiones(RUTA_DB, TAMANIO_POOL, ESPERA_POOL)
+        return _pool
+
+
+def configurar_pool(tamanio: int = None, espera: float = None) -> PoolConexiones:
+    """
+    Reconfigura el pool de conexiones cerrando las conexiones libres actuales.
+
+    Parámetros:
+        tamanio (int): Máximo de conexiones abiertas (0 desactiva el pool).
+        espera (float): Segundos de espera por una conexión libre.
+
+    Retorna:
+        PoolConexiones: El nuevo pool activo.
+    """
+    global _pool, TAMANIO_POOL, ESPERA_POOL
+    if tamanio is not None:
+        TAMANIO_POOL = tamanio
+    if espera is not None:
+        ESPERA_POOL = espera
+    with _pool_lock:
+        if _pool is not None and _pool.pid == os.getpid():
+            _pool.cerrar()
+        _pool = None
+    return obtener_pool()
+
+
+@contextmanager
+def conexion_db():
+    """
+    Presta una conexión del pool mientras dura el bloque `with`.
+
+    Las llamadas anidadas en el mismo hilo reciben la misma conexión. Al
+    salir del bloque más externo con una excepción, la transacción abierta
+    se revierte; el commit queda a cargo de quien escribe, y un bloque anidado
+    no puede confirmar una transacción abierta por un bloque externo (commit()
+    lanza sqlite3.ProgrammingError).
+
+    Uso:
+        with conexion_db() as conexion:
+            conexion.execute(...)
+            conexion.commit()
+    """
+    pool = obtener_pool()
+    conexion = pool.adquirir()
+    try:
+        yield conexion
+    except Exception:
+        if pool.es_uso_externo() and conexion.in_transaction:
+            conexion.rollback()
+        raise
+    finally:
+        pool.liberar(conexion)
@@ -0,0 +1,376 @@
+# Módulo de exportación masiva a CSV, JSONL o JSON
+# Exporta cualquier tabla, o las vistas que arman los listados (productos con su
+# categoría y proveedor, como listar_productos(), y el detalle de ventas, como
+# obtener_detalle_venta()), leyendo un cursor de a bloques con fetchmany y escribiendo
+# cada bloque apenas se lee: la memoria usada no depende del tamaño de la tabla.
+#
+# Modos:
+# - completo: todas las filas, por ID.
+# - por fechas (facturas, factura_detalle y ventas_detalle): --desde/--hasta, por fecha.
+# - incremental: solo las filas con ID mayor al último exportado. Con --estado, el
+#   último ID de cada fuente se guarda en un archivo JSON y la próxima exportación
+#   sigue desde ahí. Solo toma altas, no modificaciones de filas ya exportadas. No se
+#   combina con --desde, --hasta ni --despues-de-id: el punto de partida es el estado.
+#
+# El formato sale de la extensión del archivo: .csv (con encabezado), .json (una sola
+# lista) o, con cualquier otra, JSONL.
+#
+# El archivo se escribe con un nombre temporal y se renombra al terminar; con la
+# extensión .gz (o --gzip) se comprime al escribir.
+#
+# Uso: python -m db.exportacion ventas_detalle ventas.csv.gz --desde 2025-07-01 --hasta 2025-07-31
+#      python -m db.exportacion facturas facturas.jsonl --estado exportaciones.json
+
+import argparse
+import csv
+import gzip
+import json
+import os
+import sqlite3
+import sys
+import time
+
+from db.data_base import conexion_db
+from core.logger import log_info, log_error
+
+# Filas leídas del cursor y escritas por vez
+TAMANIO_LOTE_EXPORTACION = 5000
+
+# Formatos que escribe escribir_filas()
+FORMATOS = ("csv", "jsonl", "json")
+
+# Fuentes exportables. La primera columna de cada consulta es el ID de la fuente
+# (incremental y último ID exportado); "fecha" es la columna del filtro por fechas
+# y "orden" desempata las filas de una misma fecha o ID (líneas de una factura).
+FUENTES = {
+    "categorias": {"consulta": "SELECT c.id_categoria, c.nombre FROM categorias c", "id": "c.id_categoria"},
+    "proveedores": {"consulta": "SELECT * FROM proveedores prov", "id": "prov.id_proveedor"},
+    "productos": {"consulta": "SELECT * FROM productos p", "id": "p.id_producto"},
+    "clientes": {"consulta": "SELECT * FROM clientes c", "id": "c.id_cliente"},
+    "facturas": {"consulta": "SELECT * FROM facturas f", "id": "f.id_factura", "fecha": "f.fecha"},
+    "factura_detalle": {
+        "consulta": "SELECT fd.* FROM factura_detalle fd JOIN facturas f ON f.id_factura = fd.factura_id",
+        "id": "fd.id_detalle",
+        "fecha": "f.fecha",
+    },
+    # Forma de listar_productos()
+    "productos_detalle": {
+        "consulta": """
+            SELECT
+                p.id_producto,
+                p.nombre,
+                c.nombre AS categoria,
+                prov.nombre AS proveedor,
+                p.stock,
+                p.precio_unitario
+            FROM productos p
+            JOIN categorias c ON p.categoria_id = c.id_categoria
+            JOIN proveedores prov ON p.proveedor_id = prov.id_proveedor
+        """,
+        "id": "p.id_producto",
+    },
+    # Forma de obtener_detalle_venta(), una fila por línea de factura
+    "ventas_detalle": {
+        "consulta": """
+            SELECT
+                f.id_factura,
+                f.fecha,
+                f.cliente_id,
+                f.nombre_cliente,
+                f.email_cliente,
+                f.dni_cliente,
+                fd.producto_id,
+                fd.nombre_producto,
+                fd.nombre_categoria,
+                fd.cantidad,
+                fd.precio_unitario,
+                fd.total_linea,
+                f.total
+            FROM facturas f
+            JOIN factura_detalle fd ON fd.factura_id = f.id_factura
+        """,
+        "id": "f.id_factura",
+        "fecha": "f.fecha",
+        "orden": "fd.id_detalle",
+    },
+}
+
+
+def armar_consulta(fuente: str, desde: str = None, hasta: str = None, despues_de_id: int = None,
+                   limite: int = None) -> tuple[str, list]:
+    """
+    Arma la consulta de exportación de una fuente con sus filtros.
+
+    Sin fechas ordena por ID (recorre la tabla por clave primaria); con fechas ordena
+    por fecha y usa el índice de fecha. En ningún caso SQLite necesita ordenar en
+    memoria el resultado completo.
+
+    Parámetros:
+        fuente (str): Clave de FUENTES.
+        desde (str): Fecha mínima inclusiva ('YYYY-MM-DD' o con hora), opcional.
+        hasta (str): Fecha máxima inclusiva ('YYYY-MM-DD' o con hora), opcional.
+        despues_de_id (int): Exportar solo las filas con ID mayor, opcional.
+        limite (int): Cantidad máxima de filas, opcional.
+
+    Retorna:
+        tuple: (consulta SQL, parámetros).
+
+    Lanza:
+        ValueError: Si la fuente no existe o no admite filtro por fechas.
+    """
+    if fuente not in FUENTES:
+        raise ValueError(f"No se puede exportar '{fuente}'. Opciones: {', '.join(FUENTES)}")
+    definicion = FUENTES[fuente]
+    columna_fecha = definicion.get("fecha")
+    if (desde or hasta) and columna_fecha is None:
+        raise ValueError(f"'{fuente}' no tiene fecha para filtrar")
+
+    condiciones, parametros = [], []
+    if despues_de_id is not None:
+        condiciones.append(f"{definicion['id']} > ?")
+        parametros.append(despues_de_id)
+    if desde:
+        condiciones.append(f"{columna_fecha} >= ?")
+        parametros.append(desde)
+    if hasta:
+        condiciones.append(f"{columna_fecha} <= ?")
+        # Una fecha sin hora incluye todo ese día
+        parametros.append(f"{hasta} 23:59:59" if len(hasta) == 10 else hasta)
+
+    orden = [columna_fecha] if (desde or hasta) else []
+    orden.append(definicion["id"])
+    if "orden" in definicion:
+        orden.append(definicion["orden"])
+
+    filtro = f"WHERE {' AND '.join(condiciones)}" if condiciones else ""
+    consulta = f"{definicion['consulta']} {filtro} ORDER BY {', '.join(orden)}"
+    if limite is not None:
+        consulta += " LIMIT ?"
+        parametros.append(limite)
+    return consulta, parametros
+
+
+def recorrer_fuente(conexion: sqlite3.Connection, fuente: str, desde: str = None, hasta: str = None,
+                    despues_de_id: int = None, limite: int = None,
+                    tamanio_lote: int = TAMANIO_LOTE_EXPORTACION) -> tuple[list[str], object]:
+    """
+    Ejecuta la consulta de una fuente y la recorre de a bloques con fetchmany.
+
+    Parámetros:
+        conexion (sqlite3.Connection): Conexión abierta; debe seguir abierta mientras se leen los bloques.
+        fuente (str): Clave de FUENTES.
+        desde, hasta, despues_de_id, limite: Filtros de armar_consulta().
+        tamanio_lote (int): Filas leídas del cursor por vez.
+
+    Retorna:
+        tuple: (nombres de las columnas, iterador de listas de filas).
+
+    Lanza:
+        ValueError: Si la fuente o el filtro no son válidos.
+    """
+    consulta, parametros = armar_consulta(fuente, desde, hasta, despues_de_id, limite)
+    cursor = conexion.execute(consulta, parametros)
+    columnas = [columna[0] for columna in cursor.description]
+    return columnas, iter(lambda: cursor.fetchmany(tamanio_lote), [])
+
+
+def escribir_filas(salida, formato: str, columnas: list[str], lotes) -> tuple[int, int | None]:
+    """
+    Escribe bloques de filas en CSV (con encabezado), JSONL o JSON a medida que llegan.
+
+    En JSON la salida es una sola lista, pero se escribe fila por fila, sin armarla
+    en memoria.
+
+    Parámetros:
+        salida: Archivo de texto abierto (o sys.stdout).
+        formato (str): Uno de FORMATOS.
+        columnas (list[str]): Nombres de las columnas (claves de cada objeto en JSON/JSONL).
+        lotes: Iterable de listas de filas, como el de recorrer_fuente().
+
+    Retorna:
+        tuple: (filas escritas, mayor valor de la primera columna o None si no hubo filas).
+
+    Lanza:
+        ValueError: Si el formato no es válido.
+    """
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato desconocido '{formato}'. Opciones: {', '.join(FORMATOS)}")
+    filas, ultimo_id = 0, None
+    escritor = csv.writer(salida) if formato == "csv" else None
+    if escritor:
+        escritor.writerow(columnas)
+    elif formato == "json":
+        salida.write("[")
+
+    for lote in lotes:
+        if escritor:
+            escritor.writerows(lote)
+        else:
+            objetos = (json.dumps(dict(zip(columnas, fila)), ensure_ascii=False) for fila in lote)
+            if formato == "jsonl":
+                salida.write("".join(objeto + "\n" for objeto in objetos))
+            else:
+                separador = ",\n" if filas else "\n"
+                salida.write(separador + ",\n".join(objetos))
+        filas += len(lote)
+        maximo = max(fila[0] for fila in lote)
+        ultimo_id = maximo if ultimo_id is None else max(ultimo_id, maximo)
+
+    if formato == "json":
+        salida.write("\n]\n" if filas else "]\n")
+    return filas, ultimo_id
+
+
+def _abrir_salida(ruta: str, comprimir: bool):
+    """
+    Abre el archivo de salida en modo texto, comprimido con gzip si corresponde.
+    """
+    if comprimir:
+        return gzip.open(ruta, "wt", encoding="utf-8", newline="", compresslevel=6)
+    return open(ruta, "w", encoding="utf-8", newline="")
+
+
+def formato_por_extension(ruta: str) -> str:
+    """
+    Devuelve el formato de FORMATOS que corresponde a la extensión de un archivo
+    (sin contar .gz): "csv", "json" o, con cualquier otra, "jsonl".
+    """
+    extension = os.path.splitext(ruta.lower().removesuffix(".gz"))[1]
+    return {".csv": "csv", ".json": "json"}.get(extension, "jsonl")
+
+
+def exportar(fuente: str, ruta: str, desde: str = None, hasta: str = None, despues_de_id: int = None,
+             comprimir: bool = None, tamanio_lote: int = TAMANIO_LOTE_EXPORTACION) -> dict:
+    """
+    Exporta una fuente a un archivo CSV (con encabezado), JSON o JSONL, según la
+    extensión (ver formato_por_extension()).
+
+    Parámetros:
+        fuente (str): Clave de FUENTES (tabla o vista).
+        ruta (str): Archivo de destino (.csv, .json o .jsonl, con .gz opcional).
+        desde (str): Fecha mínima inclusiva, opcional.
+        hasta (str): Fecha máxima inclusiva, opcional.
+        despues_de_id (int): Exportar solo las filas con ID mayor, opcional.
+        comprimir (bool): Comprimir con gzip; por defecto, si la ruta termina en .gz.
+        tamanio_lote (int): Filas leídas del cursor por vez.
+
+    Retorna:
+        dict: fuente, ruta, filas, ultimo_id (None si no hubo filas), duracion_seg y filas_por_seg.
+
+    Lanza:
+        ValueError: Si la fuente o el filtro no son válidos.
+        sqlite3.Error, OSError: Si falla la lectura o la escritura (no queda archivo a medias).
+    """
+    # Valida la fuente y el filtro antes de crear el archivo
+    armar_consulta(fuente, desde, hasta, despues_de_id)
+    if comprimir is None:
+        comprimir = ruta.lower().endswith(".gz")
+    formato = formato_por_extension(ruta)
+
+    carpeta = os.path.dirname(ruta)
+    if carpeta:
+        os.makedirs(carpeta, exist_ok=True)
+    temporal = f"{ruta}.{os.getpid()}.tmp"
+    inicio = time.perf_counter()
+    try:
+        with conexion_db() as conexion, _abrir_salida(temporal, comprimir) as salida:
+            columnas, lotes = recorrer_fuente(conexion, fuente, desde, hasta, despues_de_id,
+                                              tamanio_lote=tamanio_lote)
+            filas, ultimo_id = escribir_filas(salida, formato, columnas, lotes)
+        os.replace(temporal, ruta)
+    except BaseException:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+        raise
+
+    duracion = time.perf_counter() - inicio
+    resumen = {
+        "fuente": fuente,
+        "ruta": ruta,
+        "filas": filas,
+        "ultimo_id": ultimo_id,
+        "duracion_seg": round(duracion, 3),
+        "filas_por_seg": round(filas / duracion) if duracion > 0 else 0,
+    }
+    log_info(f"Exportación de {fuente}", operacion="exportacion", fuente=fuente, ruta=ruta, filas=filas,
+             ultimo_id=ultimo_id, duracion_ms=round(duracion * 1000, 2))
+    return resumen
+
+
+def leer_estado(ruta: str) -> dict:
+    """
+    Lee el archivo de estado de las exportaciones incrementales ({fuente: último ID}).
+
+    Retorna:
+        dict: El estado guardado, o un dict vacío si el archivo no existe o no se puede leer.
+    """
+    try:
+        with open(ruta, encoding="utf-8") as archivo:
+            estado = json.load(archivo)
+        return estado if isinstance(estado, dict) else {}
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        log_error(f"No se pudo leer el estado de exportación {ruta}: {e}")
+        return {}
+
+
+def exportar_incremental(fuente: str, ruta: str, ruta_estado: str, comprimir: bool = None) -> dict | None:
+    """
+    Exporta las filas de una fuente agregadas desde la exportación anterior y guarda
+    el último ID exportado en el archivo de estado.
+
+    Si no hay filas nuevas igual se escribe el archivo (solo con el encabezado, en CSV)
+    y el estado no cambia.
+
+    Parámetros:
+        fuente (str): Clave de FUENTES.
+        ruta (str): Archivo de destino.
+        ruta_estado (str): Archivo JSON con el último ID exportado de cada fuente.
+        comprimir (bool): Comprimir con gzip; por defecto, según la extensión.
+
+    Retorna:
+        dict: El resumen de exportar() con despues_de_id, o None si la exportación falló.
+    """
+    estado = leer_estado(ruta_estado)
+    despues_de_id = estado.get(fuente)
+    try:
+        resumen = exportar(fuente, ruta, despues_de_id=despues_de_id, comprimir=comprimir)
+    except (ValueError, OSError, sqlite3.Error) as e:
+        log_error(f"Error al exportar {fuente} a {ruta}: {e}")
+        return None
+
+    resumen["despues_de_id"] = despues_de_id
+    if resumen["ultimo_id"] is not None:
+        estado[fuente] = resumen["ultimo_id"]
+        temporal = f"{ruta_estado}.tmp"
+        with open(temporal, "w", encoding="utf-8") as archivo:
+            json.dump(estado, archivo, indent=2)
+        os.replace(temporal, ruta_estado)
+    return resumen
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Exportación masiva de tablas y vistas a CSV, JSONL o JSON.")
+    parser.add_argument("fuente", choices=list(FUENTES), help="Tabla o vista a exportar")
+    parser.add_argument("archivo", help="Archivo de destino (.csv, .json o .jsonl, con .gz opcional)")
+    parser.add_argument("--desde", help="Fecha mínima inclusiva (YYYY-MM-DD)")
+    parser.add_argument("--hasta", help="Fecha máxima inclusiva (YYYY-MM-DD)")
+    parser.add_argument("--despues-de-id", type=int, help="Exportar solo las filas con ID mayor")
+    parser.add_argument("--estado", help="Archivo de estado para la exportación incremental")
+    parser.add_argument("--gzip", action="store_true", default=None, help="Comprimir con gzip")
+    args = parser.parse_args()
+    if args.estado and (args.desde or args.hasta or args.despues_de_id is not None):
+        parser.error("--estado no se puede combinar con --desde, --hasta ni --despues-de-id")
+
+    if args.estado:
+        resumen = exportar_incremental(args.fuente, args.archivo, args.estado, args.gzip)
+    else:
+        try:
+            resumen = exportar(args.fuente, args.archivo, args.desde, args.hasta, args.despues_de_id, args.gzip)
+        except (ValueError, OSError, sqlite3.Error) as e:
+            log_error(f"Error al exportar {args.fuente} a {args.archivo}: {e}")
+            print(f"Error: {e}", file=sys.stderr)
+            resumen = None
+    print(json.dumps(resumen, ensure_ascii=False, indent=2))
+    sys.exit(0 if resumen is not None else 1)
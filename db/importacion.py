@@ -0,0 +1,449 @@
+# Módulo de importación masiva de productos, clientes y proveedores
+# Lee archivos CSV o JSONL de a bloques, sin cargarlos completos en memoria, y los
+# escribe con executemany en una transacción por bloque. Cada registro se valida con
+# las mismas reglas que las altas por consola (las funciones revisar_* de cada módulo
+# de validaciones), sin mostrar nada: los registros rechazados se escriben, con el
+# motivo, en un archivo de rechazados con el mismo formato que el de entrada.
+#
+# La importación actualiza los registros que ya existen (upsert):
+# - proveedores: por CUIT; clientes: por DNI (las claves únicas de la base).
+# - productos: por nombre y proveedor. La categoría y el proveedor se indican por
+#   nombre (el proveedor también por CUIT) y se resuelven con mapas en memoria.
+#   El stock importado reemplaza al anterior.
+#
+# Las altas se agregan a la búsqueda de texto en bloque, al final de cada transacción,
+# en lugar de hacerlo fila por fila con el trigger. Las filas actualizadas siguen
+# pasando por el trigger de modificación, que no se desactiva: un cambio de nombre,
+# email, DNI o categoría queda buscable apenas se confirma el lote.
+#
+# Después de cada lote confirmado se descarta de la caché de referencia la tabla
+# importada (si es una de las cacheadas), así un error en un lote posterior no deja
+# la caché con datos anteriores a los lotes que sí se guardaron.
+#
+# Uso: python -m db.importacion productos catalogo.csv [--rechazados rechazados.csv] [--lote 50000]
+
+import argparse
+import csv
+import itertools
+import json
+import os
+import sqlite3
+import sys
+import time
+from contextlib import contextmanager
+
+import db.data_base as data_base
+from db.cache_referencias import TABLAS_REFERENCIA, filas_referencia, invalidar_referencias
+from core.logger import log_info, log_error
+from core.utils import normalizar_texto, formatear_nombre, formatear_email
+from core.validaciones_generales import revisar_nombre, revisar_telefono, revisar_email
+from gestor_clientes.clientes_validaciones import revisar_dni, revisar_nombre_cliente
+from gestor_productos.productos_validaciones import revisar_stock, revisar_precio
+from gestor_proveedores.proveedores_validaciones import revisar_cuit
+
+# Registros por executemany y por transacción
+TAMANIO_LOTE_IMPORTACION = 50_000
+
+# Trigger de alta en la búsqueda de texto de cada tabla y su equivalente en bloque
+# (las mismas columnas, para las filas con ID mayor o igual al indicado). Se salta las
+# filas ya indexadas: una alta modificada en la misma transacción (la misma clave dos
+# veces en un lote) ya la agregó el trigger de modificación.
+INDEXACION_BUSQUEDA = {
+    "productos": ("trg_busqueda_productos_alta", """
+        INSERT INTO busqueda_productos (rowid, nombre, categoria, proveedor)
+        SELECT p.id_producto, p.nombre, c.nombre, prov.nombre
+        FROM productos p
+        LEFT JOIN categorias c ON c.id_categoria = p.categoria_id
+        LEFT JOIN proveedores prov ON prov.id_proveedor = p.proveedor_id
+        WHERE p.id_producto >= ? AND p.id_producto NOT IN (SELECT rowid FROM busqueda_productos WHERE rowid >= ?)
+    """),
+    "clientes": ("trg_busqueda_clientes_alta", """
+        INSERT INTO busqueda_clientes (rowid, nombre, email, dni)
+        SELECT id_cliente, nombre, email, dni FROM clientes
+        WHERE id_cliente >= ? AND id_cliente NOT IN (SELECT rowid FROM busqueda_clientes WHERE rowid >= ?)
+    """),
+}
+
+_UPSERT_PROVEEDOR = """
+    INSERT INTO proveedores (id_proveedor, nombre, telefono, email, cuit) VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(cuit) DO UPDATE SET nombre = excluded.nombre, telefono = excluded.telefono, email = excluded.email
+"""
+
+_UPSERT_CLIENTE = """
+    INSERT INTO clientes (id_cliente, nombre, telefono, email, dni) VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(dni) DO UPDATE SET nombre = excluded.nombre, telefono = excluded.telefono, email = excluded.email
+"""
+
+_INSERTAR_PRODUCTO = """
+    INSERT INTO productos (id_producto, nombre, categoria_id, proveedor_id, stock, precio_unitario)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_ACTUALIZAR_PRODUCTO = "UPDATE productos SET stock = ?, precio_unitario = ? WHERE id_producto = ?"
+
+_ACTUALIZAR_PRODUCTO_CATEGORIA = "UPDATE productos SET categoria_id = ?, stock = ?, precio_unitario = ? WHERE id_producto = ?"
+
+
+class RegistroRechazado(Exception):
+    """Un registro del archivo no se puede importar; el mensaje es el motivo."""
+
+
+@contextmanager
+def indexacion_diferida(conexion: sqlite3.Connection, tabla: str, primer_id: int):
+    """
+    Desactiva el trigger que agrega cada alta de `tabla` a la búsqueda de texto y, al
+    salir sin errores, indexa juntas las filas con ID >= primer_id y restaura el
+    trigger. Es varias veces más rápido que una inserción en FTS por fila. El
+    trigger de modificación sigue activo, así que las filas existentes que se
+    actualizan dentro del bloque se reindexan como siempre.
+
+    Debe usarse dentro de una transacción abierta: si algo falla, el rollback del
+    llamador deshace también el cambio del trigger.
+
+    Parámetros:
+        conexion (sqlite3.Connection): Conexión con la transacción abierta.
+        tabla (str): "productos" o "clientes".
+        primer_id (int): Primer ID de las filas nuevas (todas las altas deben tener ID mayor o igual).
+    """
+    disparador, indexar = INDEXACION_BUSQUEDA[tabla]
+    fila = conexion.execute("SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = ?", (disparador,)).fetchone()
+    if fila:
+        conexion.execute(f"DROP TRIGGER {disparador}")
+    yield
+    if fila:
+        conexion.execute(indexar, (primer_id, primer_id))
+        conexion.execute(fila[0])
+
+
+def siguiente_id(conexion: sqlite3.Connection, tabla: str, columna: str) -> int:
+    """
+    Devuelve el ID que sigue al mayor de una tabla (1 si está vacía).
+    """
+    return conexion.execute(f"SELECT COALESCE(MAX({columna}), 0) + 1 FROM {tabla}").fetchone()[0]
+
+
+def leer_registros(ruta: str):
+    """
+    Lee los registros de un archivo CSV (con encabezado) o JSONL de forma incremental.
+
+    Parámetros:
+        ruta (str): Ruta del archivo (.csv o .jsonl).
+
+    Retorna:
+        generator: Tuplas (número de línea, registro) donde registro es un dict con los
+            campos leídos, o un RegistroRechazado si la línea no se pudo interpretar.
+    """
+    if ruta.lower().endswith(".csv"):
+        with open(ruta, newline="", encoding="utf-8-sig") as archivo:
+            lector = csv.DictReader(archivo)
+            for registro in lector:
+                yield lector.line_num, registro
+        return
+
+    with open(ruta, encoding="utf-8") as archivo:
+        for numero, linea in enumerate(archivo, start=1):
+            if not linea.strip():
+                continue
+            try:
+                registro = json.loads(linea)
+                if not isinstance(registro, dict):
+                    raise ValueError("se esperaba un objeto")
+                yield numero, registro
+            except ValueError as e:
+                yield numero, RegistroRechazado(f"JSON inválido: {e}")
+
+
+class ArchivoRechazados:
+    """
+    Escribe los registros rechazados con el número de línea y el motivo, en CSV o
+    JSONL según la extensión de la ruta. El archivo se crea con el primer rechazo.
+    """
+
+    def __init__(self, ruta: str):
+        self.ruta = ruta
+        self.cantidad = 0
+        self._archivo = None
+        self._escritor = None
+
+    def agregar(self, numero: int, registro, motivo: str) -> None:
+        self.cantidad += 1
+        datos = registro if isinstance(registro, dict) else {}
+        if self.ruta.lower().endswith(".csv"):
+            if self._archivo is None:
+                self._archivo = open(self.ruta, "w", newline="", encoding="utf-8")
+                columnas = [c for c in datos if c not in ("numero", "motivo")] + ["numero", "motivo"]
+                self._escritor = csv.DictWriter(self._archivo, columnas, extrasaction="ignore")
+                self._escritor.writeheader()
+            self._escritor.writerow({**datos, "numero": numero, "motivo": motivo})
+        else:
+            if self._archivo is None:
+                self._archivo = open(self.ruta, "w", encoding="utf-8")
+            self._archivo.write(json.dumps({"numero": numero, "motivo": motivo, "registro": datos},
+                                           ensure_ascii=False, default=str) + "\n")
+
+    def cerrar(self) -> None:
+        if self._archivo is not None:
+            self._archivo.close()
+
+
+def _texto(registro: dict, *campos: str) -> str:
+    """
+    Devuelve el primer campo presente del registro como texto sin espacios extremos.
+    """
+    for campo in campos:
+        valor = registro.get(campo)
+        if valor is not None:
+            return str(valor).strip()
+    return ""
+
+
+def _revisar(*errores) -> None:
+    """
+    Rechaza el registro con el primer motivo de error, si hay alguno.
+    """
+    for error in errores:
+        if error:
+            raise RegistroRechazado(error)
+
+
+class _ImportadorProveedores:
+    """Convierte registros en filas de proveedores; la clave es el CUIT."""
+
+    tabla, columna_id, sentencia = "proveedores", "id_proveedor", _UPSERT_PROVEEDOR
+
+    def __init__(self, conexion: sqlite3.Connection):
+        self.existentes = {fila[0] for fila in conexion.execute("SELECT cuit FROM proveedores")}
+
+    def convertir(self, registro: dict, nuevo_id) -> tuple:
+        nombre, telefono, email, cuit = (_texto(registro, campo) for campo in ("nombre", "telefono", "email", "cuit"))
+        _revisar(revisar_cuit(cuit), revisar_nombre(nombre), revisar_telefono(telefono), revisar_email(email))
+        # Un CUIT existente lleva ID nulo: el upsert actualiza esa fila
+        id_nuevo = None if cuit in self.existentes else nuevo_id()
+        self.existentes.add(cuit)
+        return id_nuevo, (id_nuevo, formatear_nombre(nombre), telefono, formatear_email(email), cuit)
+
+
+class _ImportadorClientes:
+    """Convierte registros en filas de clientes; la clave es el DNI."""
+
+    tabla, columna_id, sentencia = "clientes", "id_cliente", _UPSERT_CLIENTE
+
+    def __init__(self, conexion: sqlite3.Connection):
+        self.existentes = {fila[0] for fila in conexion.execute("SELECT dni FROM clientes")}
+
+    def convertir(self, registro: dict, nuevo_id) -> tuple:
+        nombre, telefono, email, dni = (_texto(registro, campo) for campo in ("nombre", "telefono", "email", "dni"))
+        _revisar(revisar_dni(dni), revisar_nombre_cliente(nombre), revisar_telefono(telefono), revisar_email(email))
+        # Un DNI existente lleva ID nulo: el upsert actualiza esa fila
+        id_nuevo = None if dni in self.existentes else nuevo_id()
+        self.existentes.add(dni)
+        return id_nuevo, (id_nuevo, formatear_nombre(nombre), telefono, formatear_email(email), dni)
+
+
+class _ImportadorProductos:
+    """
+    Convierte registros en filas de productos; la clave es el nombre normalizado
+    junto con el proveedor. Categorías y proveedores se resuelven por nombre (o CUIT).
+    """
+
+    tabla, columna_id = "productos", "id_producto"
+
+    def __init__(self, conexion: sqlite3.Connection):
+        self.categorias = {normalizar_texto(fila[1]): fila[0] for fila in filas_referencia("categorias")}
+        self.proveedores, self.cuits = {}, {}
+        for fila in filas_referencia("proveedores"):
+            clave = normalizar_texto(fila[1])
+            # Un nombre repetido en varios proveedores es ambiguo: solo sirve el CUIT
+            self.proveedores[clave] = None if clave in self.proveedores else fila[0]
+            self.cuits[fila[4]] = fila[0]
+        self.existentes = {
+            (normalizar_texto(nombre), proveedor_id): (id_producto, categoria_id)
+            for id_producto, nombre, proveedor_id, categoria_id
+            in conexion.execute("SELECT id_producto, nombre, proveedor_id, categoria_id FROM productos")
+        }
+
+    def convertir(self, registro: dict, nuevo_id) -> tuple:
+        nombre, categoria, proveedor = (_texto(registro, campo) for campo in ("nombre", "categoria", "proveedor"))
+        stock, precio = _texto(registro, "stock"), _texto(registro, "precio", "precio_unitario")
+        _revisar(revisar_nombre(nombre), revisar_stock(stock), revisar_precio(precio))
+
+        categoria_id = self.categorias.get(normalizar_texto(categoria))
+        if categoria_id is None:
+            raise RegistroRechazado(f"No existe la categoría '{categoria}'")
+        proveedor_id = self.cuits.get(proveedor) or self.proveedores.get(normalizar_texto(proveedor))
+        if proveedor_id is None:
+            if normalizar_texto(proveedor) in self.proveedores:
+                raise RegistroRechazado(f"Hay varios proveedores llamados '{proveedor}': indicá el CUIT")
+            raise RegistroRechazado(f"No existe el proveedor '{proveedor}'")
+
+        clave = (normalizar_texto(nombre), proveedor_id)
+        existente = self.existentes.get(clave)
+        if existente is not None:
+            id_producto, categoria_actual = existente
+            if categoria_actual == categoria_id:
+                return None, (_ACTUALIZAR_PRODUCTO, (int(stock), float(precio), id_producto))
+            self.existentes[clave] = (id_producto, categoria_id)
+            return None, (_ACTUALIZAR_PRODUCTO_CATEGORIA, (categoria_id, int(stock), float(precio), id_producto))
+
+        id_producto = nuevo_id()
+        self.existentes[clave] = (id_producto, categoria_id)
+        return id_producto, (_INSERTAR_PRODUCTO, (id_producto, formatear_nombre(nombre), categoria_id,
+                                                   proveedor_id, int(stock), float(precio)))
+
+
+IMPORTADORES = {
+    "proveedores": _ImportadorProveedores,
+    "clientes": _ImportadorClientes,
+    "productos": _ImportadorProductos,
+}
+
+
+def _escribir_lote(conexion: sqlite3.Connection, tabla: str, filas: list, primer_id: int, altas: int) -> None:
+    """
+    Escribe un lote en una transacción. Las filas de productos llegan como
+    (sentencia, parámetros) y se agrupan por sentencia respetando el orden; las de
+    clientes y proveedores van todas con el upsert de la tabla. Al confirmar,
+    descarta la tabla de la caché de referencia si está cacheada.
+    """
+    conexion.execute("BEGIN IMMEDIATE TRANSACTION;")
+    try:
+        if tabla in INDEXACION_BUSQUEDA and altas:
+            with indexacion_diferida(conexion, tabla, primer_id):
+                _ejecutar_filas(conexion, tabla, filas)
+        else:
+            _ejecutar_filas(conexion, tabla, filas)
+        conexion.commit()
+    except Exception:
+        conexion.rollback()
+        raise
+    if tabla in TABLAS_REFERENCIA:
+        invalidar_referencias(tabla)
+
+
+def _ejecutar_filas(conexion: sqlite3.Connection, tabla: str, filas: list) -> None:
+    if tabla != "productos":
+        conexion.executemany(IMPORTADORES[tabla].sentencia, filas)
+        return
+    for sentencia, grupo in itertools.groupby(filas, key=lambda fila: fila[0]):
+        conexion.executemany(sentencia, (parametros for _, parametros in grupo))
+
+
+def importar_registros(tabla: str, registros, rechazados: ArchivoRechazados,
+                       tamanio_lote: int = TAMANIO_LOTE_IMPORTACION) -> dict:
+    """
+    Importa registros en una tabla, en transacciones de `tamanio_lote` registros.
+
+    Las altas reciben IDs consecutivos desde el mayor existente y las filas que ya
+    existen (misma clave) se actualizan. Si una transacción falla, los lotes
+    anteriores quedan confirmados.
+
+    Parámetros:
+        tabla (str): "productos", "clientes" o "proveedores".
+        registros: Iterable de tuplas (número, registro) como las de leer_registros().
+        rechazados (ArchivoRechazados): Destino de los registros que no pasan la validación.
+        tamanio_lote (int): Registros por transacción.
+
+    Retorna:
+        dict: procesados, insertados, actualizados, rechazados, duracion_seg y registros_por_seg.
+
+    Lanza:
+        ValueError: Si la tabla no se puede importar.
+        sqlite3.Error: Si falla la escritura de un lote.
+    """
+    if tabla not in IMPORTADORES:
+        raise ValueError(f"No se puede importar la tabla '{tabla}'")
+
+    resumen = {"procesados": 0, "insertados": 0, "actualizados": 0, "rechazados": 0}
+    inicio = time.perf_counter()
+    with data_base.conexion_db() as conexion:
+        importador = IMPORTADORES[tabla](conexion)
+        proximo = itertools.count(siguiente_id(conexion, tabla, importador.columna_id))
+        lote, altas, primer_id = [], 0, None
+
+        for numero, registro in registros:
+            resumen["procesados"] += 1
+            try:
+                if isinstance(registro, RegistroRechazado):
+                    raise registro
+                nuevo_id, fila = importador.convertir(registro, lambda: next(proximo))
+            except RegistroRechazado as e:
+                rechazados.agregar(numero, registro, str(e))
+                resumen["rechazados"] += 1
+                continue
+
+            if nuevo_id is not None:
+                primer_id = nuevo_id if primer_id is None else primer_id
+                altas += 1
+            lote.append(fila)
+
+            if len(lote) >= tamanio_lote:
+                _escribir_lote(conexion, tabla, lote, primer_id, altas)
+                resumen["insertados"] += altas
+                resumen["actualizados"] += len(lote) - altas
+                lote, altas, primer_id = [], 0, None
+
+        if lote:
+            _escribir_lote(conexion, tabla, lote, primer_id, altas)
+            resumen["insertados"] += altas
+            resumen["actualizados"] += len(lote) - altas
+
+    duracion = time.perf_counter() - inicio
+    resumen["duracion_seg"] = round(duracion, 3)
+    resumen["registros_por_seg"] = round(resumen["procesados"] / duracion) if duracion > 0 else 0
+    log_info(f"Importación de {tabla}", operacion="importacion", tabla=tabla, insertados=resumen["insertados"],
+             actualizados=resumen["actualizados"], rechazados=resumen["rechazados"],
+             duracion_ms=round(duracion * 1000, 2))
+    return resumen
+
+
+def ruta_rechazados_por_defecto(ruta: str) -> str:
+    """
+    Devuelve la ruta del archivo de rechazados junto al de entrada: catalogo.csv → catalogo.rechazados.csv.
+    """
+    base, extension = os.path.splitext(ruta)
+    return f"{base}.rechazados{extension or '.jsonl'}"
+
+
+def importar_desde_archivo(tabla: str, ruta: str, ruta_rechazados: str = None,
+                           tamanio_lote: int = TAMANIO_LOTE_IMPORTACION) -> dict | None:
+    """
+    Importa todos los registros de un archivo CSV o JSONL en una tabla.
+
+    Parámetros:
+        tabla (str): "productos", "clientes" o "proveedores".
+        ruta (str): Ruta del archivo a importar.
+        ruta_rechazados (str): Archivo para los rechazados; por defecto, junto al de entrada.
+        tamanio_lote (int): Registros por transacción.
+
+    Retorna:
+        dict: El resumen de importar_registros() con la ruta del archivo de rechazados
+            (None si no hubo), o None si el archivo no se pudo importar.
+    """
+    if not os.path.isfile(ruta):
+        log_error(f"No existe el archivo a importar: {ruta}")
+        return None
+
+    rechazados = ArchivoRechazados(ruta_rechazados or ruta_rechazados_por_defecto(ruta))
+    try:
+        resumen = importar_registros(tabla, leer_registros(ruta), rechazados, tamanio_lote)
+        resumen["archivo_rechazados"] = rechazados.ruta if rechazados.cantidad else None
+        return resumen
+    except (OSError, csv.Error, sqlite3.Error, ValueError) as e:
+        log_error(f"Error al importar {tabla} desde {ruta}: {e}")
+        return None
+    finally:
+        rechazados.cerrar()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Importación masiva de productos, clientes o proveedores.")
+    parser.add_argument("tabla", choices=sorted(IMPORTADORES), help="Tabla de destino")
+    parser.add_argument("archivo", help="Archivo CSV (con encabezado) o JSONL")
+    parser.add_argument("--rechazados", help="Archivo de rechazados (por defecto, <archivo>.rechazados.<ext>)")
+    parser.add_argument("--lote", type=int, default=TAMANIO_LOTE_IMPORTACION, help="Registros por transacción")
+    args = parser.parse_args()
+
+    data_base.inicializar_base()
+    resumen = importar_desde_archivo(args.tabla, args.archivo, args.rechazados, args.lote)
+    print(json.dumps(resumen, ensure_ascii=False, indent=2))
+    sys.exit(0 if resumen is not None else 1)
@@ -0,0 +1,410 @@
+# Módulo de migraciones de esquema
+# Este módulo aplica, en orden, los cambios de esquema posteriores a crear_tablas().
+# La versión aplicada se guarda en PRAGMA user_version, por lo que cada migración
+# corre una única vez por base de datos y sin tocar los datos existentes.
+#
+# Uso: python -m db.migraciones  → aplica las pendientes y muestra los cambios
+#                                   en EXPLAIN QUERY PLAN de las consultas críticas.
+
+import difflib
+import sqlite3
+import unicodedata
+
+from core.logger import log_error, log_info
+
+
+def _normalizar_nombre_v3(texto: str) -> str:
+    """
+    Minúsculas, sin espacios en los extremos ni acentos: copia congelada de
+    core.utils.normalizar_texto() tal como estaba al escribir la migración 3.
+    """
+    return unicodedata.normalize("NFKD", texto.strip().lower()).encode("ASCII", "ignore").decode("utf-8")
+
+
+def _completar_nombre_normalizado_categorias(conexion: sqlite3.Connection) -> None:
+    """
+    Agrega categorias.nombre_normalizado y lo completa con _normalizar_nombre_v3()
+    para las categorías existentes.
+    """
+    conexion.execute("ALTER TABLE categorias ADD COLUMN nombre_normalizado TEXT")
+    categorias = conexion.execute("SELECT id_categoria, nombre FROM categorias").fetchall()
+    conexion.executemany(
+        "UPDATE categorias SET nombre_normalizado = ? WHERE id_categoria = ?",
+        [(_normalizar_nombre_v3(nombre), id_categoria) for id_categoria, nombre in categorias]
+    )
+
+
+# Cada migración es (versión, descripción, pasos). Un paso es una sentencia SQL
+# o una función que recibe la conexión. Las versiones deben ser consecutivas.
+# Los pasos quedan congelados: no usan código de la aplicación, que puede cambiar
+# después de que la migración ya corrió en otras bases.
+MIGRACIONES = [
+    (1, "Índices de facturas y detalle de facturas", [
+        "CREATE INDEX IF NOT EXISTS idx_factura_detalle_factura ON factura_detalle(factura_id)",
+        "CREATE INDEX IF NOT EXISTS idx_facturas_cliente ON facturas(cliente_id)",
+        "CREATE INDEX IF NOT EXISTS idx_facturas_fecha ON facturas(fecha)",
+    ]),
+    (2, "Índices de productos por categoría y proveedor", [
+        "CREATE INDEX IF NOT EXISTS idx_productos_categoria ON productos(categoria_id)",
+        "CREATE INDEX IF NOT EXISTS idx_productos_proveedor ON productos(proveedor_id)",
+    ]),
+    (3, "Nombre normalizado de categorías para validar unicidad por índice", [
+        _completar_nombre_normalizado_categorias,
+        "CREATE INDEX IF NOT EXISTS idx_categorias_nombre_normalizado ON categorias(nombre_normalizado)",
+    ]),
+    (4, "Resúmenes de ventas por día y producto, día y categoría, y cliente y mes", [
+        """
+        CREATE TABLE IF NOT EXISTS resumen_ventas_dia_producto (
+            fecha TEXT NOT NULL,
+            producto_id INTEGER NOT NULL,
+            nombre_producto TEXT,
+            unidades INTEGER NOT NULL DEFAULT 0,
+            importe REAL NOT NULL DEFAULT 0,
+            lineas INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (fecha, producto_id)
+        ) WITHOUT ROWID
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS resumen_ventas_dia_categoria (
+            fecha TEXT NOT NULL,
+            nombre_categoria TEXT NOT NULL,
+            unidades INTEGER NOT NULL DEFAULT 0,
+            importe REAL NOT NULL DEFAULT 0,
+            lineas INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (fecha, nombre_categoria)
+        ) WITHOUT ROWID
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS resumen_ventas_cliente_mes (
+            mes TEXT NOT NULL,
+            cliente_id INTEGER NOT NULL,
+            nombre_cliente TEXT,
+            facturas INTEGER NOT NULL DEFAULT 0,
+            importe REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (mes, cliente_id)
+        ) WITHOUT ROWID
+        """,
+        # Carga inicial con las facturas ya registradas (las tablas recién creadas están vacías)
+        """
+        INSERT INTO resumen_ventas_dia_producto (fecha, producto_id, nombre_producto, unidades, importe, lineas)
+        SELECT substr(f.fecha, 1, 10), fd.producto_id, MAX(fd.nombre_producto),
+               SUM(fd.cantidad), SUM(fd.total_linea), COUNT(*)
+        FROM factura_detalle fd
+        JOIN facturas f ON f.id_factura = fd.factura_id
+        GROUP BY 1, 2
+        """,
+        """
+        INSERT INTO resumen_ventas_dia_categoria (fecha, nombre_categoria, unidades, importe, lineas)
+        SELECT substr(f.fecha, 1, 10), COALESCE(fd.nombre_categoria, 'Sin categoría'),
+               SUM(fd.cantidad), SUM(fd.total_linea), COUNT(*)
+        FROM factura_detalle fd
+        JOIN facturas f ON f.id_factura = fd.factura_id
+        GROUP BY 1, 2
+        """,
+        """
+        INSERT INTO resumen_ventas_cliente_mes (mes, cliente_id, nombre_cliente, facturas, importe)
+        SELECT substr(f.fecha, 1, 7), f.cliente_id, MAX(f.nombre_cliente), COUNT(*), SUM(f.total)
+        FROM facturas f
+        GROUP BY 1, 2
+        """,
+    ]),
+    (5, "Búsqueda de texto completo (FTS5) de productos y clientes", [
+        # Sin acentos ni mayúsculas, igual que normalizar_texto(); rowid = ID de la entidad
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS busqueda_productos USING fts5(
+            nombre, categoria, proveedor, tokenize = 'unicode61 remove_diacritics 2', prefix = '1 2 3'
+        )
+        """,
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS busqueda_clientes USING fts5(
+            nombre, email, dni, tokenize = 'unicode61 remove_diacritics 2', prefix = '1 2 3'
+        )
+        """,
+        """
+        INSERT INTO busqueda_productos (rowid, nombre, categoria, proveedor)
+        SELECT p.id_producto, p.nombre, c.nombre, prov.nombre
+        FROM productos p
+        LEFT JOIN categorias c ON c.id_categoria = p.categoria_id
+        LEFT JOIN proveedores prov ON prov.id_proveedor = p.proveedor_id
+        """,
+        "INSERT INTO busqueda_clientes (rowid, nombre, email, dni) SELECT id_cliente, nombre, email, dni FROM clientes",
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_busqueda_productos_alta AFTER INSERT ON productos BEGIN
+            INSERT INTO busqueda_productos (rowid, nombre, categoria, proveedor) VALUES (
+                new.id_producto, new.nombre,
+                (SELECT nombre FROM categorias WHERE id_categoria = new.categoria_id),
+                (SELECT nombre FROM proveedores WHERE id_proveedor = new.proveedor_id)
+            );
+        END
+        """,
+        # Solo las columnas indexadas: los cambios de stock de cada venta no tocan el índice
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_busqueda_productos_modificacion
+        AFTER UPDATE OF nombre, categoria_id, proveedor_id ON productos BEGIN
+            DELETE FROM busqueda_productos WHERE rowid = old.id_producto;
+            INSERT INTO busqueda_productos (rowid, nombre, categoria, proveedor) VALUES (
+                new.id_producto, new.nombre,
+                (SELECT nombre FROM categorias WHERE id_categoria = new.categoria_id),
+                (SELECT nombre FROM proveedores WHERE id_proveedor = new.proveedor_id)
+            );
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_busqueda_productos_baja AFTER DELETE ON productos BEGIN
+            DELETE FROM busqueda_productos WHERE rowid = old.id_producto;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_busqueda_productos_categoria AFTER UPDATE OF nombre ON categorias BEGIN
+            UPDATE busqueda_productos SET categoria = new.nombre
+            WHERE rowid IN (SELECT id_producto FROM productos WHERE categoria_id = new.id_categoria);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_busqueda_productos_proveedor AFTER UPDATE OF nombre ON proveedores BEGIN
+            UPDATE busqueda_productos SET proveedor = new.nombre
+            WHERE rowid IN (SELECT id_producto FROM productos WHERE proveedor_id = new.id_proveedor);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_busqueda_clientes_alta AFTER INSERT ON clientes BEGIN
+            INSERT INTO busqueda_clientes (rowid, nombre, email, dni) VALUES (new.id_cliente, new.nombre, new.email, new.dni);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_busqueda_clientes_modificacion
+        AFTER UPDATE OF nombre, email, dni ON clientes BEGIN
+            DELETE FROM busqueda_clientes WHERE rowid = old.id_cliente;
+            INSERT INTO busqueda_clientes (rowid, nombre, email, dni) VALUES (new.id_cliente, new.nombre, new.email, new.dni);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_busqueda_clientes_baja AFTER DELETE ON clientes BEGIN
+            DELETE FROM busqueda_clientes WHERE rowid = old.id_cliente;
+        END
+        """,
+    ]),
+    (6, "Índices por nombre para los listados paginados", [
+        "CREATE INDEX IF NOT EXISTS idx_productos_nombre ON productos(nombre)",
+        "CREATE INDEX IF NOT EXISTS idx_clientes_nombre ON clientes(nombre)",
+        "CREATE INDEX IF NOT EXISTS idx_proveedores_nombre ON proveedores(nombre)",
+    ]),
+    (7, "Contadores de cambios de categorías y proveedores para la caché de referencia", [
+        """
+        CREATE TABLE IF NOT EXISTS versiones_referencia (
+            tabla TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0
+        ) WITHOUT ROWID
+        """,
+        "INSERT OR IGNORE INTO versiones_referencia (tabla, version) VALUES ('categorias', 0), ('proveedores', 0)",
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_version_categorias_alta AFTER INSERT ON categorias BEGIN
+            UPDATE versiones_referencia SET version = version + 1 WHERE tabla = 'categorias';
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_version_categorias_modificacion AFTER UPDATE ON categorias BEGIN
+            UPDATE versiones_referencia SET version = version + 1 WHERE tabla = 'categorias';
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_version_categorias_baja AFTER DELETE ON categorias BEGIN
+            UPDATE versiones_referencia SET version = version + 1 WHERE tabla = 'categorias';
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_version_proveedores_alta AFTER INSERT ON proveedores BEGIN
+            UPDATE versiones_referencia SET version = version + 1 WHERE tabla = 'proveedores';
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_version_proveedores_modificacion AFTER UPDATE ON proveedores BEGIN
+            UPDATE versiones_referencia SET version = version + 1 WHERE tabla = 'proveedores';
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_version_proveedores_baja AFTER DELETE ON proveedores BEGIN
+            UPDATE versiones_referencia SET version = version + 1 WHERE tabla = 'proveedores';
+        END
+        """,
+    ]),
+    (8, "Pesos de relevancia (bm25) de la búsqueda de texto completo como rank de cada tabla FTS", [
+        "INSERT INTO busqueda_productos (busqueda_productos, rank) VALUES ('rank', 'bm25(10.0, 2.0, 1.0)')",
+        "INSERT INTO busqueda_clientes (busqueda_clientes, rank) VALUES ('rank', 'bm25(5.0, 2.0, 2.0)')",
+    ]),
+]
+
+# Consultas frecuentes cuyo plan de ejecución conviene vigilar. Son copias de las que
+# ejecuta la aplicación, con valores fijos en lugar de los parámetros.
+CONSULTAS_CRITICAS = {
+    "obtener_detalle_venta": """
+        SELECT
+            f.id_factura, f.fecha, f.cliente_id, f.nombre_cliente, f.email_cliente, f.dni_cliente,
+            fd.producto_id, fd.nombre_producto, fd.nombre_categoria, fd.cantidad,
+            fd.precio_unitario, fd.total_linea, f.total
+        FROM facturas f
+        JOIN factura_detalle fd ON fd.factura_id = f.id_factura
+        WHERE f.id_factura = 1
+    """,
+    "listar_clientes_sin_facturas": """
+        SELECT c.id_cliente, c.nombre, c.telefono, c.email, c.dni
+        FROM clientes c
+        WHERE NOT EXISTS (SELECT 1 FROM facturas f WHERE f.cliente_id = c.id_cliente)
+        ORDER BY c.id_cliente ASC
+    """,
+    "listar_facturas": """
+        SELECT f.id_factura, f.fecha, f.nombre_cliente, f.total
+        FROM facturas f
+        ORDER BY fecha DESC
+    """,
+    "listar_categorias_sin_productos": """
+        SELECT c.id_categoria, c.nombre
+        FROM categorias c
+        WHERE NOT EXISTS (SELECT 1 FROM productos p WHERE p.categoria_id = c.id_categoria)
+        ORDER BY c.id_categoria ASC
+    """,
+    "listar_proveedores_sin_productos": """
+        SELECT prov.id_proveedor, prov.nombre, prov.telefono, prov.email, prov.cuit
+        FROM proveedores prov
+        WHERE NOT EXISTS (SELECT 1 FROM productos p WHERE p.proveedor_id = prov.id_proveedor)
+        ORDER BY prov.id_proveedor ASC
+    """,
+    "existe_producto_con_proveedor": "SELECT EXISTS(SELECT 1 FROM productos WHERE proveedor_id = 1)",
+    "existe_cliente_con_dni": "SELECT EXISTS(SELECT 1 FROM clientes WHERE dni = '1')",
+    "existe_proveedor_con_cuit": "SELECT EXISTS(SELECT 1 FROM proveedores WHERE cuit = '1')",
+    "ventas_por_categoria": """
+        SELECT nombre_categoria, SUM(unidades), SUM(importe), SUM(lineas)
+        FROM resumen_ventas_dia_categoria
+        WHERE fecha BETWEEN '2025-07-01' AND '2025-07-31'
+        GROUP BY nombre_categoria
+        ORDER BY SUM(importe) DESC
+    """,
+    "buscar_productos": """
+        SELECT p.id_producto, p.nombre, c.nombre AS categoria, prov.nombre AS proveedor, p.stock, p.precio_unitario
+        FROM (
+            SELECT rowid, rank
+            FROM busqueda_productos
+            WHERE busqueda_productos MATCH '"teclado"*'
+            ORDER BY rank
+            LIMIT 20
+        ) b
+        JOIN productos p ON p.id_producto = b.rowid
+        LEFT JOIN categorias c ON p.categoria_id = c.id_categoria
+        LEFT JOIN proveedores prov ON p.proveedor_id = prov.id_proveedor
+        ORDER BY b.rank
+    """,
+    "listar_productos_pagina": """
+        SELECT p.id_producto, p.nombre, c.nombre AS categoria, prov.nombre AS proveedor, p.stock, p.precio_unitario
+        FROM productos p
+        JOIN categorias c ON p.categoria_id = c.id_categoria
+        JOIN proveedores prov ON p.proveedor_id = prov.id_proveedor
+        ORDER BY p.nombre ASC, p.id_producto ASC
+        LIMIT 21 OFFSET 0
+    """,
+}
+
+
+def version_actual(conexion: sqlite3.Connection) -> int:
+    """
+    Devuelve la versión de esquema guardada en la base de datos.
+
+    Parámetros:
+        conexion (sqlite3.Connection): Conexión a la base de datos.
+
+    Retorna:
+        int: Valor de PRAGMA user_version (0 si nunca se migró).
+    """
+    return conexion.execute("PRAGMA user_version").fetchone()[0]
+
+
+def aplicar_migraciones(conexion: sqlite3.Connection) -> bool:
+    """
+    Aplica las migraciones pendientes, cada una en su propia transacción.
+
+    Si una migración falla (un error de SQLite o de un paso en Python) se revierte
+    completa y no se aplican las siguientes.
+
+    Parámetros:
+        conexion (sqlite3.Connection): Conexión a la base de datos.
+
+    Retorna:
+        bool: True si el esquema quedó al día, False si alguna migración falló.
+    """
+    version = version_actual(conexion)
+    for numero, descripcion, pasos in MIGRACIONES:
+        if numero <= version:
+            continue
+        try:
+            conexion.execute("BEGIN")
+            for paso in pasos:
+                if callable(paso):
+                    paso(conexion)
+                else:
+                    conexion.execute(paso)
+            conexion.execute(f"PRAGMA user_version = {numero}")
+            conexion.commit()
+            log_info(f"Migración aplicada → v{numero}: {descripcion}")
+        except Exception as e:
+            conexion.rollback()
+            log_error(f"Error al aplicar la migración v{numero} ({descripcion}): {e}")
+            return False
+    return True
+
+
+def explicar_consultas(conexion: sqlite3.Connection) -> dict:
+    """
+    Obtiene el EXPLAIN QUERY PLAN de cada consulta crítica.
+
+    Parámetros:
+        conexion (sqlite3.Connection): Conexión a la base de datos.
+
+    Retorna:
+        dict: Nombre de la consulta → lista de líneas del plan.
+    """
+    planes = {}
+    for nombre, consulta in CONSULTAS_CRITICAS.items():
+        try:
+            filas = conexion.execute(f"EXPLAIN QUERY PLAN {consulta}").fetchall()
+            planes[nombre] = [fila[3] for fila in filas]
+        except sqlite3.Error as e:
+            # Por ejemplo, la consulta usa una tabla que agrega una migración pendiente
+            planes[nombre] = [f"(no disponible: {e})"]
+    return planes
+
+
+def diferencias_de_planes(antes: dict, despues: dict) -> str:
+    """
+    Arma un diff legible entre dos juegos de planes de consulta.
+
+    Parámetros:
+        antes (dict): Planes previos a migrar.
+        despues (dict): Planes posteriores a migrar.
+
+    Retorna:
+        str: Diff unificado por consulta, o las líneas sin cambios.
+    """
+    bloques = []
+    for nombre in despues:
+        diff = list(difflib.unified_diff(antes.get(nombre, []), despues[nombre], "antes", "después", lineterm=""))
+        if diff:
+            bloques.append(f"## {nombre}\n" + "\n".join(diff[2:]))
+        else:
+            bloques.append(f"## {nombre} (sin cambios)\n" + "\n".join(f" {linea}" for linea in despues[nombre]))
+    return "\n\n".join(bloques)
+
+
+if __name__ == "__main__":
+    from db.data_base import crear_tablas, obtener_conexion
+
+    crear_tablas()
+    conexion = obtener_conexion()
+    try:
+        print(f"Versión de esquema actual: {version_actual(conexion)}")
+        planes_antes = explicar_consultas(conexion)
+        if aplicar_migraciones(conexion):
+            print(f"Versión de esquema final: {version_actual(conexion)}\n")
+        else:
+            print("Hubo un error al migrar. Revisá registro.log.\n")
+        print(diferencias_de_planes(planes_antes, explicar_consultas(conexion)))
+    finally:
+        conexion.close()
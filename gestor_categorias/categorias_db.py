@@ -4,13 +4,18 @@
 
 import sqlite3
 
-from db.data_base import obtener_conexion
+from db.data_base import conexion_db
+from db.cache_referencias import filas_referencia, fila_referencia_por_id, invalidar_referencias
 from core.logger import log_error
+from core.utils import normalizar_texto
 
 def insertar_categoria(nombre: str) -> bool:
     """
     Inserta una nueva categoría en la base de datos.
 
+    Guarda también el nombre normalizado (sin tildes ni mayúsculas) usado
+    para validar que no se repita.
+
     Parámetros:
         nombre (str): El nombre de la categoría a insertar.
 
@@ -18,12 +23,15 @@ def insertar_categoria(nombre: str) -> bool:
         bool: True si la categoría se insertó correctamente, False si hubo un error.
     """
     try:
-        conexion = obtener_conexion()
-        cursor = conexion.cursor()
-        cursor.execute("INSERT INTO categorias (nombre) VALUES (?)", (nombre,))
-        conexion.commit()
-        conexion.close()
-        return True
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute(
+                "INSERT INTO categorias (nombre, nombre_normalizado) VALUES (?, ?)",
+                (nombre, normalizar_texto(nombre))
+            )
+            conexion.commit()
+            invalidar_referencias("categorias")
+            return True
     except sqlite3.Error as e:
         log_error(f"Error al insertar categoría: {e}")
         return False
@@ -32,6 +40,8 @@ def modificar_categoria(id_categoria: int, nuevo_nombre: str) -> bool:
     """
     Modifica el nombre de una categoría existente por su ID.
 
+    Mantiene sincronizado el nombre normalizado.
+
     Parámetros:
         id_categoria (int): El ID de la categoría que se desea modificar.
         nuevo_nombre (str): El nuevo nombre para la categoría.
@@ -40,12 +50,15 @@ def modificar_categoria(id_categoria: int, nuevo_nombre: str) -> bool:
         bool: True si la categoría fue modificada correctamente, False si hubo un error.
     """
     try:
-        conexion = obtener_conexion()
-        cursor = conexion.cursor()
-        cursor.execute("UPDATE categorias SET nombre = ? WHERE id_categoria = ?", (nuevo_nombre, id_categoria))
-        conexion.commit()
-        conexion.close()
-        return True
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute(
+                "UPDATE categorias SET nombre = ?, nombre_normalizado = ? WHERE id_categoria = ?",
+                (nuevo_nombre, normalizar_texto(nuevo_nombre), id_categoria)
+            )
+            conexion.commit()
+            invalidar_referencias("categorias")
+            return True
     except sqlite3.Error as e:
         log_error(f"Error al modificar categoría: {e}")
         return False
@@ -61,12 +74,12 @@ def eliminar_categoria(id_categoria: int) -> bool:
         bool: True si la categoría fue eliminada correctamente, False si hubo un error.
     """
     try:
-        conexion = obtener_conexion()
-        cursor = conexion.cursor()
-        cursor.execute("DELETE FROM categorias WHERE id_categoria = ?", (id_categoria,))
-        conexion.commit()
-        conexion.close()
-        return True
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute("DELETE FROM categorias WHERE id_categoria = ?", (id_categoria,))
+            conexion.commit()
+            invalidar_referencias("categorias")
+            return True
     except sqlite3.Error as e:
         log_error(f"Error al eliminar categoría: {e}")
         return False
@@ -75,16 +88,79 @@ def listar_categorias() -> list:
     """
     Retorna todas las categorías registradas en la base de datos.
 
+    Las lee de la caché de datos de referencia, que se relee solo cuando las
+    categorías cambian.
+
     Retorna:
         list: Una lista de tuplas con las categorías, o una lista vacía en caso de error.
     """
     try:
-        conexion = obtener_conexion()
-        cursor = conexion.cursor()
-        cursor.execute("SELECT * FROM categorias ORDER BY id_categoria ASC")
-        resultados = cursor.fetchall()
-        conexion.close()
-        return resultados
+        return filas_referencia("categorias")
     except sqlite3.Error as e:
         log_error(f"Error al listar categorías: {e}")
         return []
+
+def obtener_categoria_por_id(id_categoria: int):
+    """
+    Devuelve la categoría por su ID desde la caché de datos de referencia.
+
+    Parámetros:
+        id_categoria (int): El ID de la categoría a consultar.
+
+    Retorna:
+        tuple: La categoría correspondiente al ID si existe, None si no existe.
+    """
+    try:
+        return fila_referencia_por_id("categorias", id_categoria)
+    except sqlite3.Error as e:
+        log_error(f"Error al consultar categoría por ID: {e}")
+        return None
+
+def existe_categoria_con_nombre(nombre: str) -> bool:
+    """
+    Indica si ya existe una categoría con el nombre indicado, ignorando
+    mayúsculas y tildes.
+
+    Compara contra la columna indexada nombre_normalizado.
+
+    Parámetros:
+        nombre (str): El nombre de la categoría a buscar.
+
+    Retorna:
+        bool: True si existe una categoría con ese nombre, False si no (o si hubo un error).
+    """
+    try:
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute(
+                "SELECT EXISTS(SELECT 1 FROM categorias WHERE nombre_normalizado = ?)",
+                (normalizar_texto(nombre),)
+            )
+            return bool(cursor.fetchone()[0])
+    except sqlite3.Error as e:
+        log_error(f"Error al verificar nombre de categoría: {e}")
+        return False
+
+def listar_categorias_sin_productos() -> list:
+    """
+    Retorna las categorías que no tienen productos asociados.
+
+    Cada categoría se resuelve con un NOT EXISTS sobre el índice de productos por
+    categoría, sin leer la tabla de productos.
+
+    Retorna:
+        list: Tuplas (id_categoria, nombre), como listar_categorias(), ordenadas por ID.
+    """
+    try:
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute("""
+                SELECT c.id_categoria, c.nombre
+                FROM categorias c
+                WHERE NOT EXISTS (SELECT 1 FROM productos p WHERE p.categoria_id = c.id_categoria)
+                ORDER BY c.id_categoria ASC
+            """)
+            return cursor.fetchall()
+    except sqlite3.Error as e:
+        log_error(f"Error al listar categorías sin productos: {e}")
+        return []
@@ -2,8 +2,7 @@
 # Este módulo contiene funciones para validar y gestionar las categorías,
 # incluyendo la validación de nombres y la obtención de categorías eliminables.
 
-from gestor_categorias.categorias_db import listar_categorias
-from gestor_productos.productos_db import listar_productos_crudos
+from gestor_categorias.categorias_db import obtener_categoria_por_id, existe_categoria_con_nombre, listar_categorias_sin_productos
 from core.utils import normalizar_texto
 from interfaz.diseño_interfaz import mostrar_error
 
@@ -23,18 +22,12 @@ def obtener_categoria_por_id_validado(id_str: str):
         mostrar_error("El ID debe ser un número.")
         return None
 
-    id_categoria = int(id_str)
+    categoria = obtener_categoria_por_id(int(id_str))
+    if categoria:
+        return categoria
 
-    # Solo intentar buscar si el ID es numérico
-    encontrado = False
-    for categoria in listar_categorias():
-        if categoria[0] == id_categoria:
-            encontrado = True
-            return categoria
-
-    if not encontrado:
-        mostrar_error("El ID de categoría ingresado no existe.")
-        return None
+    mostrar_error("El ID de categoría ingresado no existe.")
+    return None
 
 def validar_nombre_categoria(nombre: str, nombre_actual: str = None) -> bool:
     """
@@ -54,18 +47,12 @@ def validar_nombre_categoria(nombre: str, nombre_actual: str = None) -> bool:
         mostrar_error("El nombre de la categoría no puede estar vacío.")
         return False
 
-    # Normalizar nombre para comparar sin tildes ni mayúsculas
-    nombre_normalizado = normalizar_texto(nombre)
-    nombres_existentes = []
-
-    for categorias in listar_categorias():
-        nombres_existentes.append(normalizar_texto(categorias[1]))
-
     # Si se está editando, no comparar contra el propio nombre actual
-    if nombre_actual and nombre_normalizado == normalizar_texto(nombre_actual):
+    if nombre_actual and normalizar_texto(nombre) == normalizar_texto(nombre_actual):
         return True
 
-    if nombre_normalizado in nombres_existentes:
+    # La comparación sin tildes ni mayúsculas se resuelve en la base
+    if existe_categoria_con_nombre(nombre):
         mostrar_error("El nombre de la categoría ya existe.")
         return False
 
@@ -75,22 +62,7 @@ def listar_categorias_eliminables() -> list:
     """
     Devuelve una lista de categorías que no tienen productos asociados.
 
-    Revisa las categorías que no tienen productos vinculados a ellas en la base de datos.
-
     Retorna:
         list: Lista de categorías que pueden ser eliminadas.
     """
-    todas = listar_categorias()
-    productos = listar_productos_crudos()
-
-    categorias_con_productos = set()
-    for producto in productos:
-        if producto[2] is not None:  # producto[2] es categoria_id
-            categorias_con_productos.add(producto[2])
-
-    eliminables = []
-    for categoria in todas:
-        if categoria[0] not in categorias_con_productos:
-            eliminables.append(categoria)
-
-    return eliminables
+    return listar_categorias_sin_productos()
@@ -1,12 +1,22 @@
 # Módulo de operaciones con clientes
 # Este módulo maneja las operaciones de persistencia de clientes en la base de datos,
-# como insertar, modificar, eliminar y listar clientes, incluyendo la lista de clientes
-# sin facturas asociadas.
+# como insertar, modificar, eliminar, listar y buscar clientes, incluyendo la lista de
+# clientes sin facturas asociadas.
 
 import sqlite3
 
-from db.data_base import obtener_conexion
+from db.data_base import conexion_db
 from core.logger import log_error
+from core.utils import consulta_busqueda
+
+# Columnas por las que se puede ordenar el listado paginado (clave → columna)
+ORDEN_CLIENTES = {
+    "id": "id_cliente",
+    "nombre": "nombre",
+    "telefono": "telefono",
+    "email": "email",
+    "dni": "dni",
+}
 
 def insertar_cliente(nombre: str, telefono: str, email: str, dni: str) -> bool:
     """
@@ -22,15 +32,14 @@ def insertar_cliente(nombre: str, telefono: str, email: str, dni: str) -> bool:
         bool: True si el cliente fue insertado correctamente, False si hubo un error.
     """
     try:
-        conexion = obtener_conexion()
-        cursor = conexion.cursor()
-        cursor.execute("""
-            INSERT INTO clientes (nombre, telefono, email, dni)
-            VALUES (?, ?, ?, ?)
-        """, (nombre, telefono, email, dni))
-        conexion.commit()
-        conexion.close()
-        return True
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute("""
+                INSERT INTO clientes (nombre, telefono, email, dni)
+                VALUES (?, ?, ?, ?)
+            """, (nombre, telefono, email, dni))
+            conexion.commit()
+            return True
     except sqlite3.Error as e:
         log_error(f"Error al insertar cliente: {e}")
         return False
@@ -50,16 +59,15 @@ def modificar_cliente(id_cliente: int, nuevo_nombre: str, nuevo_telefono: str, n
         bool: True si los datos del cliente fueron modificados correctamente, False si hubo un error.
     """
     try:
-        conexion = obtener_conexion()
-        cursor = conexion.cursor()
-        cursor.execute("""
-            UPDATE clientes
-            SET nombre = ?, telefono = ?, email = ?, dni = ?
-            WHERE id_cliente = ?
-        """, (nuevo_nombre, nuevo_telefono, nuevo_email, nuevo_dni, id_cliente))
-        conexion.commit()
-        conexion.close()
-        return True
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute("""
+                UPDATE clientes
+                SET nombre = ?, telefono = ?, email = ?, dni = ?
+                WHERE id_cliente = ?
+            """, (nuevo_nombre, nuevo_telefono, nuevo_email, nuevo_dni, id_cliente))
+            conexion.commit()
+            return True
     except sqlite3.Error as e:
         log_error(f"Error al modificar cliente: {e}")
         return False
@@ -75,12 +83,11 @@ def eliminar_cliente(id_cliente: int) -> bool:
         bool: True si el cliente fue eliminado correctamente, False si hubo un error.
     """
     try:
-        conexion = obtener_conexion()
-        cursor = conexion.cursor()
-        cursor.execute("DELETE FROM clientes WHERE id_cliente = ?", (id_cliente,))
-        conexion.commit()
-        conexion.close()
-        return True
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute("DELETE FROM clientes WHERE id_cliente = ?", (id_cliente,))
+            conexion.commit()
+            return True
     except sqlite3.Error as e:
         log_error(f"Error al eliminar cliente: {e}")
         return False
@@ -93,45 +100,175 @@ def listar_clientes() -> list:
         list: Lista de tuplas con los datos de los clientes.
     """
     try:
-        conexion = obtener_conexion()
-        cursor = conexion.cursor()
-        cursor.execute("SELECT * FROM clientes ORDER BY id_cliente ASC")
-        resultados = cursor.fetchall()
-        conexion.close()
-        return resultados
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute("SELECT * FROM clientes ORDER BY id_cliente ASC")
+            resultados = cursor.fetchall()
+            return resultados
     except sqlite3.Error as e:
         log_error(f"Error al listar clientes: {e}")
         return []
 
+def obtener_cliente_por_id(id_cliente: int):
+    """
+    Devuelve el cliente por su ID mediante una búsqueda por clave primaria.
+
+    Parámetros:
+        id_cliente (int): El ID del cliente a consultar.
+
+    Retorna:
+        tuple: El cliente correspondiente al ID si existe, None si no existe.
+    """
+    try:
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute("SELECT * FROM clientes WHERE id_cliente = ?", (id_cliente,))
+            return cursor.fetchone()
+    except sqlite3.Error as e:
+        log_error(f"Error al consultar cliente por ID: {e}")
+        return None
+
+def existe_cliente_con_dni(dni: str) -> bool:
+    """
+    Indica si ya existe un cliente con el DNI indicado.
+
+    Usa una consulta EXISTS sobre el índice único de clientes.dni.
+
+    Parámetros:
+        dni (str): El DNI a buscar.
+
+    Retorna:
+        bool: True si existe un cliente con ese DNI, False si no (o si hubo un error).
+    """
+    try:
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute("SELECT EXISTS(SELECT 1 FROM clientes WHERE dni = ?)", (dni,))
+            return bool(cursor.fetchone()[0])
+    except sqlite3.Error as e:
+        log_error(f"Error al verificar DNI de cliente: {e}")
+        return False
+
 def listar_clientes_sin_facturas() -> list:
     """
     Retorna los clientes que NO tienen facturas asociadas.
 
     Esta función es útil para procesos de eliminación segura de clientes que no tienen 
-    transacciones registradas.
+    transacciones registradas. Cada cliente se resuelve con un NOT EXISTS sobre el
+    índice de facturas por cliente.
 
     Retorna:
         list: Lista de tuplas con los datos de los clientes sin facturas asociadas.
     """
     try:
-        conexion = obtener_conexion()
-        cursor = conexion.cursor()
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
 
-        cursor.execute("""
-            SELECT c.id_cliente, c.nombre, c.telefono, c.email, c.dni
-            FROM clientes c
-            LEFT JOIN facturas f ON c.id_cliente = f.cliente_id
-            WHERE f.cliente_id IS NULL
-            ORDER BY c.id_cliente ASC
-        """)
+            cursor.execute("""
+                SELECT c.id_cliente, c.nombre, c.telefono, c.email, c.dni
+                FROM clientes c
+                WHERE NOT EXISTS (SELECT 1 FROM facturas f WHERE f.cliente_id = c.id_cliente)
+                ORDER BY c.id_cliente ASC
+            """)
 
-        resultados = cursor.fetchall()
-        return resultados
+            resultados = cursor.fetchall()
+            return resultados
 
     except sqlite3.Error as e:
         log_error(f"Error al listar clientes sin facturas: {e}")
         return []
 
-    finally:
-        if conexion:
-            conexion.close()
+def contar_clientes() -> int:
+    """
+    Cuenta los clientes registrados.
+
+    Retorna:
+        int: Cantidad de clientes (0 si hubo un error).
+    """
+    try:
+        with conexion_db() as conexion:
+            return conexion.execute("SELECT COUNT(*) FROM clientes").fetchone()[0]
+    except sqlite3.Error as e:
+        log_error(f"Error al contar clientes: {e}")
+        return 0
+
+def buscar_clientes(texto: str, limite: int = 20) -> list:
+    """
+    Busca clientes por nombre, email o DNI con el índice de texto completo.
+
+    Cada palabra del texto se busca como prefijo, sin distinguir mayúsculas ni acentos,
+    y los resultados se ordenan por relevancia (pesa más el nombre; los pesos de bm25
+    se configuran como rank de la tabla FTS en la migración 8). El índice de texto
+    completo elige los `limite` mejores antes de unir con la tabla de clientes.
+
+    Parámetros:
+        texto (str): Lo que escribió el usuario, por ejemplo "laura mart" o "4087".
+        limite (int): Cantidad máxima de resultados.
+
+    Retorna:
+        list: Clientes con la misma forma que listar_clientes(), del más al menos relevante.
+    """
+    consulta = consulta_busqueda(texto)
+    if not consulta:
+        return []
+
+    try:
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute("""
+                SELECT c.*
+                FROM (
+                    SELECT rowid, rank
+                    FROM busqueda_clientes
+                    WHERE busqueda_clientes MATCH ?
+                    ORDER BY rank
+                    LIMIT ?
+                ) b
+                JOIN clientes c ON c.id_cliente = b.rowid
+                ORDER BY b.rank
+            """, (consulta, limite))
+            return cursor.fetchall()
+    except sqlite3.Error as e:
+        log_error(f"Error al buscar clientes: {e}")
+        return []
+
+def listar_clientes_pagina(tamanio: int, desplazamiento: int = 0, orden: str = None, descendente: bool = False,
+                           filtro: str = "") -> list:
+    """
+    Devuelve una página de clientes, con la misma forma que listar_clientes().
+
+    El orden y el filtro se resuelven en SQL, así solo viajan las filas de la página.
+
+    Parámetros:
+        tamanio (int): Cantidad máxima de clientes a devolver.
+        desplazamiento (int): Cantidad de clientes a saltear (por ejemplo, las páginas anteriores).
+        orden (str): Clave de ORDEN_CLIENTES; por defecto, el ID.
+        descendente (bool): Si es True, ordena de mayor a menor.
+        filtro (str): Texto a buscar en nombre, email o DNI (como buscar_clientes()).
+
+    Retorna:
+        list: Tuplas con los datos de los clientes.
+    """
+    columna = ORDEN_CLIENTES.get(orden, ORDEN_CLIENTES["id"])
+    sentido = "DESC" if descendente else "ASC"
+    condicion, parametros = "", []
+    if filtro:
+        consulta = consulta_busqueda(filtro)
+        if not consulta:
+            return []
+        condicion = "WHERE id_cliente IN (SELECT rowid FROM busqueda_clientes WHERE busqueda_clientes MATCH ?)"
+        parametros.append(consulta)
+
+    try:
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute(f"""
+                SELECT * FROM clientes
+                {condicion}
+                ORDER BY {columna} {sentido}, id_cliente {sentido}
+                LIMIT ? OFFSET ?
+            """, parametros + [tamanio, desplazamiento])
+            return cursor.fetchall()
+    except sqlite3.Error as e:
+        log_error(f"Error al listar página de clientes: {e}")
+        return []
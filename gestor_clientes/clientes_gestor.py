@@ -2,12 +2,12 @@
 # Este módulo permite agregar, editar, eliminar y listar clientes en el sistema,
 # gestionando la interacción con la base de datos y la interfaz de usuario.
 
-from gestor_clientes.clientes_db import insertar_cliente, listar_clientes, modificar_cliente, eliminar_cliente
+from gestor_clientes.clientes_db import insertar_cliente, listar_clientes, listar_clientes_pagina, modificar_cliente, eliminar_cliente
 from interfaz.diseño_interfaz import mostrar_error, mostrar_exito, mostrar_cancelado, mostrar_info, pedir_input_con_cancelacion
 from gestor_clientes.clientes_validaciones import validar_dni, obtener_cliente_por_id_validado, listar_clientes_eliminables, validar_nombre_cliente
 from core.validaciones_generales import validar_telefono, validar_email
 from core.utils import formatear_email, formatear_nombre
-from interfaz.mostrar_resumen import mostrar_clientes
+from interfaz.mostrar_resumen import mostrar_clientes, mostrar_clientes_paginados
 from core.logger import log_info
 
 def agregar_cliente():
@@ -69,24 +69,16 @@ def editar_cliente():
     Solicita al usuario el ID del cliente, y si es válido, permite modificar los datos
     (DNI, nombre, teléfono y email). Si se deja un campo vacío, se conserva el valor actual.
     """
-    clientes = listar_clientes()
-    if not clientes:
+    if not listar_clientes_pagina(1):
         mostrar_error("No hay clientes registrados\n")
         return
 
-    mostrar_clientes(clientes)
-
-    # Solicitar ID válido
-    while True:
-        id_cliente = pedir_input_con_cancelacion("Ingresá el ID del cliente a modificar (C para cancelar): ")
-        if id_cliente.lower() == "c":
-            mostrar_cancelado("Clientes")
-            return
-
-        cliente = obtener_cliente_por_id_validado(id_cliente)
-        if cliente is None:  # ID ingresado no existe
-            continue
-        break  # ID válido
+    # Solicitar ID válido (sobre la tabla paginada)
+    cliente = mostrar_clientes_paginados(obtener_cliente_por_id_validado, "Ingresá el ID del cliente a modificar")
+    if cliente is None:
+        mostrar_cancelado("Clientes")
+        return
+    id_cliente = cliente[0]
 
     # Datos actuales
     nombre_actual = cliente[1]
@@ -205,8 +197,7 @@ def mostrar_todos_los_clientes():
 
     Si no existen clientes, muestra un mensaje de error.
     """
-    clientes = listar_clientes()
-    if clientes:
-        mostrar_clientes(clientes)
+    if listar_clientes_pagina(1):
+        mostrar_clientes_paginados()
     else:
         mostrar_error("No hay clientes registrados\n")
@@ -5,8 +5,43 @@
 import re
 
 from interfaz.diseño_interfaz import mostrar_error
-from gestor_clientes.clientes_db import listar_clientes, listar_clientes_sin_facturas
-from gestor_ventas.facturas_db import listar_facturas
+from gestor_clientes.clientes_db import listar_clientes_sin_facturas, obtener_cliente_por_id, existe_cliente_con_dni
+
+def revisar_dni(dni: str, permitir_vacio: bool = False) -> str | None:
+    """
+    Aplica las reglas de formato de validar_dni() sin mostrar mensajes ni consultar
+    la base (no verifica duplicados).
+
+    Parámetros:
+        dni (str): El DNI a revisar.
+        permitir_vacio (bool): Si es True, el DNI vacío es válido.
+
+    Retorna:
+        str: El motivo por el que el DNI no es válido, o None si es válido.
+    """
+    if not dni:
+        return None if permitir_vacio else "El DNI no puede estar vacío"
+    if not dni.isdigit() or not (6 <= len(dni) <= 8):
+        return "El DNI debe contener entre 6 y 8 dígitos numéricos"
+    return None
+
+def revisar_nombre_cliente(nombre: str, permitir_vacio: bool = False) -> str | None:
+    """
+    Aplica las reglas de validar_nombre_cliente() sin mostrar mensajes.
+
+    Parámetros:
+        nombre (str): El nombre a revisar.
+        permitir_vacio (bool): Si es True, el nombre vacío es válido.
+
+    Retorna:
+        str: El motivo por el que el nombre no es válido, o None si es válido.
+    """
+    if not nombre:
+        return None if permitir_vacio else "El nombre no puede estar vacío"
+    # Solo letras y espacios
+    if not re.match(r"^[a-zA-ZáéíóúÁÉÍÓÚñÑ\s]+$", nombre):
+        return "El nombre solo puede contener letras y espacios."
+    return None
 
 def validar_dni(dni: str, dni_actual: str = None, permitir_vacio: bool = False) -> bool:
     """
@@ -21,26 +56,19 @@ def validar_dni(dni: str, dni_actual: str = None, permitir_vacio: bool = False)
     Retorna:
         bool: True si el DNI es válido, False si no lo es.
     """
-    if not dni:
-        if permitir_vacio:
-            return True  # Se permite mantener vacío (por ejemplo, Enter para dejar igual en edición)
-        else:
-            mostrar_error("El DNI no puede estar vacío")
-            return False
-
-    if not dni.isdigit() or not (6 <= len(dni) <= 8):
-        mostrar_error("El DNI debe contener entre 6 y 8 dígitos numéricos")
+    error = revisar_dni(dni, permitir_vacio)
+    if error:
+        mostrar_error(error)
         return False
 
-    dnis_existentes = []
-    for clientes in listar_clientes():
-        dnis_existentes.append(clientes[4])
+    if not dni:
+        return True  # Se permite mantener vacío (por ejemplo, Enter para dejar igual en edición)
 
     # Evita rechazar el mismo DNI en edición
     if dni_actual is not None and dni == dni_actual:
         return True
 
-    if dni in dnis_existentes:
+    if existe_cliente_con_dni(dni):
         mostrar_error("Ya existe un cliente con ese DNI")
         return False
 
@@ -57,17 +85,12 @@ def validar_nombre_cliente(nombre: str, permitir_vacio: bool = False) -> bool:
     Retorna:
         bool: True si el nombre es válido, False si no lo es.
     """
-    if not nombre:
-        if permitir_vacio:
-            return True  # Se permite vacío (para edición)
-        mostrar_error("El nombre no puede estar vacío")
+    # Vacío se considera válido si se permite (para edición)
+    error = revisar_nombre_cliente(nombre, permitir_vacio)
+    if error:
+        mostrar_error(error)
         return False
 
-    # Validar que el nombre contenga solo letras y espacios
-    if not re.match(r"^[a-zA-ZáéíóúÁÉÍÓÚñÑ\s]+$", nombre):
-        mostrar_error("El nombre solo puede contener letras y espacios.")
-        return False
-    
     return True
 
 def obtener_cliente_por_id_validado(id: str):
@@ -86,41 +109,18 @@ def obtener_cliente_por_id_validado(id: str):
         mostrar_error("El ID debe ser un número")
         return None
 
-    id_cliente = int(id)
-    encontrado = False
-    for cliente in listar_clientes():
-        if cliente[0] == id_cliente:
-            encontrado = True
-            return cliente
+    cliente = obtener_cliente_por_id(int(id))
+    if cliente:
+        return cliente
 
-    if not encontrado:
-        mostrar_error("El ID de cliente ingresado no existe")
-        return None
+    mostrar_error("El ID de cliente ingresado no existe")
+    return None
 
 def listar_clientes_eliminables() -> list:
     """
     Devuelve una lista de clientes que no tienen facturas asociadas y pueden ser eliminados.
 
-    Revisa las categorías que no tienen productos vinculados a ellas en la base de datos.
-
     Retorna:
         list: Lista de clientes que pueden ser eliminados.
     """
-    todos = listar_clientes_sin_facturas()
-    facturas = listar_facturas()
-
-    # Obtener IDs de clientes que tienen facturas
-    clientes_con_factura = set()
-    for factura in facturas:
-        cliente_id = factura[2]
-        if cliente_id is not None:
-            clientes_con_factura.add(cliente_id)
-
-    # Filtrar clientes que no están en la lista de los que tienen facturas
-    eliminables = []
-    for cliente in todos:
-        id_cliente = cliente[0]
-        if id_cliente not in clientes_con_factura:
-            eliminables.append(cliente)
-
-    return eliminables
\ No newline at end of file
+    return listar_clientes_sin_facturas()
\ No newline at end of file
@@ -1,11 +1,22 @@
 # Módulo de operaciones con productos
 # Este módulo maneja las operaciones de persistencia de productos en la base de datos,
-# como insertar, modificar, eliminar, y listar productos.
+# como insertar, modificar, eliminar, listar y buscar productos.
 
 import sqlite3
 
-from db.data_base import obtener_conexion
+from db.data_base import conexion_db
 from core.logger import log_error
+from core.utils import consulta_busqueda
+
+# Columnas por las que se puede ordenar el listado paginado (clave → expresión SQL)
+ORDEN_PRODUCTOS = {
+    "id": "p.id_producto",
+    "nombre": "p.nombre",
+    "categoria": "c.nombre",
+    "proveedor": "prov.nombre",
+    "stock": "p.stock",
+    "precio": "p.precio_unitario",
+}
 
 def insertar_producto(nombre: str, categoria_id: int, proveedor_id: int, stock: int, precio_unitario: float) -> bool:
     """
@@ -22,15 +33,14 @@ def insertar_producto(nombre: str, categoria_id: int, proveedor_id: int, stock:
         bool: True si el producto fue insertado correctamente, False si hubo un error.
     """
     try:
-        conexion = obtener_conexion()
-        cursor = conexion.cursor()
-        cursor.execute("""
-            INSERT INTO productos (nombre, categoria_id, proveedor_id, stock, precio_unitario)
-            VALUES (?, ?, ?, ?, ?)
-        """, (nombre, categoria_id, proveedor_id, stock, precio_unitario))
-        conexion.commit()
-        conexion.close()
-        return True
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute("""
+                INSERT INTO productos (nombre, categoria_id, proveedor_id, stock, precio_unitario)
+                VALUES (?, ?, ?, ?, ?)
+            """, (nombre, categoria_id, proveedor_id, stock, precio_unitario))
+            conexion.commit()
+            return True
     except sqlite3.Error as e:
         log_error(f"Error al insertar producto: {e}")
         return False
@@ -51,16 +61,15 @@ def modificar_producto(id_producto: int, nuevo_nombre: str, nueva_categoria: int
         bool: True si el producto fue modificado correctamente, False si hubo un error.
     """
     try:
-        conexion = obtener_conexion()
-        cursor = conexion.cursor()
-        cursor.execute("""
-            UPDATE productos
-            SET nombre = ?, categoria_id = ?, proveedor_id = ?, stock = ?, precio_unitario = ?
-            WHERE id_producto = ?
-        """, (nuevo_nombre, nueva_categoria, nuevo_proveedor, nuevo_stock, nuevo_precio, id_producto))
-        conexion.commit()
-        conexion.close()
-        return True
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute("""
+                UPDATE productos
+                SET nombre = ?, categoria_id = ?, proveedor_id = ?, stock = ?, precio_unitario = ?
+                WHERE id_producto = ?
+            """, (nuevo_nombre, nueva_categoria, nuevo_proveedor, nuevo_stock, nuevo_precio, id_producto))
+            conexion.commit()
+            return True
     except sqlite3.Error as e:
         log_error(f"Error al modificar producto: {e}")
         return False
@@ -76,12 +85,11 @@ def eliminar_producto(id_producto: int) -> bool:
         bool: True si el producto fue eliminado correctamente, False si hubo un error.
     """
     try:
-        conexion = obtener_conexion()
-        cursor = conexion.cursor()
-        cursor.execute("DELETE FROM productos WHERE id_producto = ?", (id_producto,))
-        conexion.commit()
-        conexion.close()
-        return True
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute("DELETE FROM productos WHERE id_producto = ?", (id_producto,))
+            conexion.commit()
+            return True
     except sqlite3.Error as e:
         log_error(f"Error al eliminar producto: {e}")
         return False
@@ -94,24 +102,23 @@ def listar_productos() -> list:
         list: Lista de productos con información adicional de categoría y proveedor.
     """
     try:
-        conexion = obtener_conexion()
-        cursor = conexion.cursor()
-        cursor.execute("""
-            SELECT 
-                p.id_producto,
-                p.nombre,
-                c.nombre AS categoria,
-                prov.nombre AS proveedor,
-                p.stock,
-                p.precio_unitario
-            FROM productos p
-            JOIN categorias c ON p.categoria_id = c.id_categoria
-            JOIN proveedores prov ON p.proveedor_id = prov.id_proveedor
-            ORDER BY p.id_producto ASC
-        """)
-        resultados = cursor.fetchall()
-        conexion.close()
-        return resultados
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute("""
+                SELECT 
+                    p.id_producto,
+                    p.nombre,
+                    c.nombre AS categoria,
+                    prov.nombre AS proveedor,
+                    p.stock,
+                    p.precio_unitario
+                FROM productos p
+                JOIN categorias c ON p.categoria_id = c.id_categoria
+                JOIN proveedores prov ON p.proveedor_id = prov.id_proveedor
+                ORDER BY p.id_producto ASC
+            """)
+            resultados = cursor.fetchall()
+            return resultados
     except sqlite3.Error as e:
         log_error(f"Error al listar productos: {e}")
         return []
@@ -127,12 +134,11 @@ def listar_tabla_producto(id_producto: int):
         tuple: El producto correspondiente al ID si existe, None si no existe.
     """
     try:
-        conexion = obtener_conexion()
-        cursor = conexion.cursor()
-        cursor.execute("SELECT * FROM productos WHERE id_producto = ?", (id_producto,))
-        resultado = cursor.fetchone()
-        conexion.close()
-        return resultado
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute("SELECT * FROM productos WHERE id_producto = ?", (id_producto,))
+            resultado = cursor.fetchone()
+            return resultado
     except sqlite3.Error as e:
         log_error(f"Error al consultar producto directo: {e}")
         return None
@@ -145,12 +151,169 @@ def listar_productos_crudos() -> list:
         list: Lista de todos los productos directamente desde la tabla sin información adicional.
     """
     try:
-        conexion = obtener_conexion()
-        cursor = conexion.cursor()
-        cursor.execute("SELECT * FROM productos ORDER BY id_producto ASC")
-        resultados = cursor.fetchall()
-        conexion.close()
-        return resultados
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute("SELECT * FROM productos ORDER BY id_producto ASC")
+            resultados = cursor.fetchall()
+            return resultados
     except sqlite3.Error as e:
         log_error(f"Error al listar productos: {e}")
         return []
+
+def listar_productos_por_ids(ids: list[int]) -> dict:
+    """
+    Devuelve, en una sola consulta, los productos indicados junto con el nombre
+    de su categoría y de su proveedor.
+
+    Pensada para el carrito de una venta: el costo depende de la cantidad de IDs
+    pedidos, no del tamaño del catálogo.
+
+    Parámetros:
+        ids (list[int]): IDs de los productos a consultar (se ignoran repetidos).
+
+    Retorna:
+        dict: ID de producto → tupla (id_producto, nombre, stock, precio_unitario,
+            categoria, proveedor). Los IDs inexistentes no aparecen, y categoria
+            o proveedor son None si el vínculo no existe.
+    """
+    ids = list(dict.fromkeys(ids))
+    if not ids:
+        return {}
+
+    marcadores = ", ".join("?" for _ in ids)
+    try:
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute(f"""
+                SELECT
+                    p.id_producto,
+                    p.nombre,
+                    p.stock,
+                    p.precio_unitario,
+                    c.nombre AS categoria,
+                    prov.nombre AS proveedor
+                FROM productos p
+                LEFT JOIN categorias c ON p.categoria_id = c.id_categoria
+                LEFT JOIN proveedores prov ON p.proveedor_id = prov.id_proveedor
+                WHERE p.id_producto IN ({marcadores})
+            """, ids)
+            resultados = {}
+            for fila in cursor.fetchall():
+                resultados[fila[0]] = fila
+            return resultados
+    except sqlite3.Error as e:
+        log_error(f"Error al listar productos por ID: {e}")
+        return {}
+
+def contar_productos() -> int:
+    """
+    Cuenta los productos cargados.
+
+    Retorna:
+        int: Cantidad de productos (0 si hubo un error).
+    """
+    try:
+        with conexion_db() as conexion:
+            return conexion.execute("SELECT COUNT(*) FROM productos").fetchone()[0]
+    except sqlite3.Error as e:
+        log_error(f"Error al contar productos: {e}")
+        return 0
+
+def buscar_productos(texto: str, limite: int = 20) -> list:
+    """
+    Busca productos por nombre, categoría o proveedor con el índice de texto completo.
+
+    Cada palabra del texto se busca como prefijo, sin distinguir mayúsculas ni acentos,
+    y los resultados se ordenan por relevancia (pesa más el nombre del producto; los
+    pesos de bm25 se configuran como rank de la tabla FTS en la migración 8). El índice
+    de texto completo elige los `limite` mejores antes de unir con las demás tablas,
+    así una búsqueda muy amplia (una o dos letras) no arma la fila de cada coincidencia.
+
+    Parámetros:
+        texto (str): Lo que escribió el usuario, por ejemplo "tecl mec".
+        limite (int): Cantidad máxima de resultados.
+
+    Retorna:
+        list: Productos con la misma forma que listar_productos(), del más al menos relevante.
+    """
+    consulta = consulta_busqueda(texto)
+    if not consulta:
+        return []
+
+    try:
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute("""
+                SELECT
+                    p.id_producto,
+                    p.nombre,
+                    c.nombre AS categoria,
+                    prov.nombre AS proveedor,
+                    p.stock,
+                    p.precio_unitario
+                FROM (
+                    SELECT rowid, rank
+                    FROM busqueda_productos
+                    WHERE busqueda_productos MATCH ?
+                    ORDER BY rank
+                    LIMIT ?
+                ) b
+                JOIN productos p ON p.id_producto = b.rowid
+                LEFT JOIN categorias c ON p.categoria_id = c.id_categoria
+                LEFT JOIN proveedores prov ON p.proveedor_id = prov.id_proveedor
+                ORDER BY b.rank
+            """, (consulta, limite))
+            return cursor.fetchall()
+    except sqlite3.Error as e:
+        log_error(f"Error al buscar productos: {e}")
+        return []
+
+def listar_productos_pagina(tamanio: int, desplazamiento: int = 0, orden: str = None, descendente: bool = False,
+                            filtro: str = "") -> list:
+    """
+    Devuelve una página de productos, con la misma forma que listar_productos().
+
+    El orden y el filtro se resuelven en SQL, así solo viajan las filas de la página.
+
+    Parámetros:
+        tamanio (int): Cantidad máxima de productos a devolver.
+        desplazamiento (int): Cantidad de productos a saltear (por ejemplo, las páginas anteriores).
+        orden (str): Clave de ORDEN_PRODUCTOS; por defecto, el ID.
+        descendente (bool): Si es True, ordena de mayor a menor.
+        filtro (str): Texto a buscar en nombre, categoría o proveedor (como buscar_productos()).
+
+    Retorna:
+        list: Tuplas (id_producto, nombre, categoria, proveedor, stock, precio_unitario).
+    """
+    columna = ORDEN_PRODUCTOS.get(orden, ORDEN_PRODUCTOS["id"])
+    sentido = "DESC" if descendente else "ASC"
+    condicion, parametros = "", []
+    if filtro:
+        consulta = consulta_busqueda(filtro)
+        if not consulta:
+            return []
+        condicion = "WHERE p.id_producto IN (SELECT rowid FROM busqueda_productos WHERE busqueda_productos MATCH ?)"
+        parametros.append(consulta)
+
+    try:
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute(f"""
+                SELECT 
+                    p.id_producto,
+                    p.nombre,
+                    c.nombre AS categoria,
+                    prov.nombre AS proveedor,
+                    p.stock,
+                    p.precio_unitario
+                FROM productos p
+                JOIN categorias c ON p.categoria_id = c.id_categoria
+                JOIN proveedores prov ON p.proveedor_id = prov.id_proveedor
+                {condicion}
+                ORDER BY {columna} {sentido}, p.id_producto {sentido}
+                LIMIT ? OFFSET ?
+            """, parametros + [tamanio, desplazamiento])
+            return cursor.fetchall()
+    except sqlite3.Error as e:
+        log_error(f"Error al listar página de productos: {e}")
+        return []
@@ -2,7 +2,7 @@
 # Este módulo permite agregar, editar, eliminar y listar productos en el sistema,
 # gestionando la interacción con la base de datos y la interfaz de usuario.
 
-from gestor_productos.productos_db import insertar_producto, listar_productos, modificar_producto, eliminar_producto
+from gestor_productos.productos_db import insertar_producto, listar_productos_pagina, modificar_producto, eliminar_producto
 from gestor_productos.productos_validaciones import validar_precio, validar_stock, obtener_producto_por_id_validado
 from gestor_categorias.categorias_db import listar_categorias
 from gestor_categorias.categorias_validaciones import obtener_categoria_por_id_validado
@@ -10,7 +10,7 @@ from gestor_proveedores.proveedores_db import listar_proveedores
 from gestor_proveedores.proveedores_validaciones import obtener_proveedor_por_id_validado
 from interfaz.diseño_interfaz import pedir_input_con_cancelacion
 from interfaz.diseño_interfaz import mostrar_error, mostrar_exito, mostrar_cancelado, mostrar_info
-from interfaz.mostrar_resumen import mostrar_productos, mostrar_categorias, mostrar_proveedores
+from interfaz.mostrar_resumen import mostrar_productos_paginados, mostrar_categorias, mostrar_proveedores
 from core.utils import formatear_nombre
 from core.logger import log_info
 from core.validaciones_generales import validar_nombre
@@ -105,24 +105,16 @@ def editar_producto():
     Solicita al usuario el ID del producto y, si es válido, permite modificar los datos
     (nombre, categoría, proveedor, stock y precio). Si se deja un campo vacío, se conserva el valor actual.
     """
-    productos = listar_productos()
-    if not productos:
+    if not listar_productos_pagina(1):
         mostrar_error("No hay productos registrados\n")
         return
 
-    mostrar_productos(productos)
-
-    # --- Solicitar ID válido ---
-    while True:
-        id_producto = pedir_input_con_cancelacion("Ingresá el ID del producto a modificar (C para cancelar): ")
-        if id_producto.lower() == "c":
-            mostrar_cancelado("Productos")
-            return
-
-        producto = obtener_producto_por_id_validado(id_producto)
-        if producto is None:  # ID ingresado no existe
-            continue
-        break  # ID válido
+    # --- Solicitar ID válido (sobre la tabla paginada) ---
+    producto = mostrar_productos_paginados(obtener_producto_por_id_validado, "Ingresá el ID del producto a modificar")
+    if producto is None:
+        mostrar_cancelado("Productos")
+        return
+    id_producto = producto[0]
 
     nombre_actual = producto[1]
     id_categoria_actual = producto[2]
@@ -237,23 +229,15 @@ def borrar_producto():
 
     Solicita el ID de un producto, valida si el producto existe y lo elimina de la base de datos.
     """
-    productos = listar_productos()
-    if not productos:
+    if not listar_productos_pagina(1):
         mostrar_error("No hay productos registrados\n")
         return
 
-    mostrar_productos(productos)
-
-    while True:
-        id_producto = pedir_input_con_cancelacion("Ingresá el ID del producto a eliminar (C para cancelar): ")
-        if id_producto.lower() == "c":
-            mostrar_cancelado("Productos")
-            return
-
-        producto = obtener_proveedor_por_id_validado(id_producto)
-        if producto is None:  # ID ingresado no existe
-            continue
-        break  # ID válido
+    producto = mostrar_productos_paginados(obtener_producto_por_id_validado, "Ingresá el ID del producto a eliminar")
+    if producto is None:
+        mostrar_cancelado("Productos")
+        return
+    id_producto = producto[0]
 
     if eliminar_producto(id_producto):
         mostrar_exito(f"Producto eliminado correctamente → ID: {id_producto}")
@@ -267,8 +251,7 @@ def mostrar_todos_los_productos():
 
     Si no existen productos, muestra un mensaje de error.
     """
-    productos = listar_productos()
-    if productos:
-        mostrar_productos(productos)
+    if listar_productos_pagina(1):
+        mostrar_productos_paginados()
     else:
         mostrar_error("No hay productos registrados\n")
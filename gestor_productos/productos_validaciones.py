@@ -30,6 +30,40 @@ def obtener_producto_por_id_validado(id_str: str):
     mostrar_error("El ID de producto ingresado no existe.")
     return None
 
+def revisar_stock(stock_str: str) -> str | None:
+    """
+    Aplica las reglas de validar_stock() sin mostrar mensajes.
+
+    Parámetros:
+        stock_str (str): El stock a revisar.
+
+    Retorna:
+        str: El motivo por el que el stock no es válido, o None si es válido.
+    """
+    try:
+        if int(stock_str) < 0:
+            return "El stock no puede ser negativo."
+        return None
+    except (TypeError, ValueError):
+        return "El stock debe ser un número entero."
+
+def revisar_precio(precio_str: str) -> str | None:
+    """
+    Aplica las reglas de validar_precio() sin mostrar mensajes.
+
+    Parámetros:
+        precio_str (str): El precio a revisar.
+
+    Retorna:
+        str: El motivo por el que el precio no es válido, o None si es válido.
+    """
+    try:
+        if float(precio_str) <= 0:
+            return "El precio debe ser mayor que cero."
+        return None
+    except (TypeError, ValueError):
+        return "El precio debe ser un número válido."
+
 def validar_stock(stock_str: str) -> int | None:
     """
     Valida el stock de un producto.
@@ -42,15 +76,11 @@ def validar_stock(stock_str: str) -> int | None:
     Retorna:
         int: El stock como número entero si es válido, None si no lo es.
     """
-    try:
-        stock = int(stock_str)
-        if stock < 0:
-            mostrar_error("El stock no puede ser negativo.")
-            return None
-        return stock
-    except ValueError:
-        mostrar_error("El stock debe ser un número entero.")
+    error = revisar_stock(stock_str)
+    if error:
+        mostrar_error(error)
         return None
+    return int(stock_str)
 
 def validar_precio(precio_str: str) -> float | None:
     """
@@ -64,12 +94,8 @@ def validar_precio(precio_str: str) -> float | None:
     Retorna:
         float: El precio como número flotante si es válido, None si no lo es.
     """
-    try:
-        precio = float(precio_str)
-        if precio <= 0:
-            mostrar_error("El precio debe ser mayor que cero.")
-            return None
-        return precio
-    except ValueError:
-        mostrar_error("El precio debe ser un número válido.")
+    error = revisar_precio(precio_str)
+    if error:
+        mostrar_error(error)
         return None
+    return float(precio_str)
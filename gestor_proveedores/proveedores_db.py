@@ -4,9 +4,19 @@
 
 import sqlite3
 
-from db.data_base import obtener_conexion
+from db.data_base import conexion_db
+from db.cache_referencias import filas_referencia, fila_referencia_por_id, invalidar_referencias
 from core.logger import log_error
 
+# Columnas por las que se puede ordenar el listado paginado (clave → columna)
+ORDEN_PROVEEDORES = {
+    "id": "id_proveedor",
+    "nombre": "nombre",
+    "telefono": "telefono",
+    "email": "email",
+    "cuit": "cuit",
+}
+
 def insertar_proveedor(nombre: str, telefono: str, email: str, cuit: str) -> bool:
     """
     Inserta un nuevo proveedor en la base de datos.
@@ -21,15 +31,15 @@ def insertar_proveedor(nombre: str, telefono: str, email: str, cuit: str) -> boo
         bool: True si el proveedor fue insertado correctamente, False si hubo un error.
     """
     try:
-        conexion = obtener_conexion()
-        cursor = conexion.cursor()
-        cursor.execute("""
-            INSERT INTO proveedores (nombre, telefono, email, cuit)
-            VALUES (?, ?, ?, ?)
-        """, (nombre, telefono, email, cuit))
-        conexion.commit()
-        conexion.close()
-        return True
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute("""
+                INSERT INTO proveedores (nombre, telefono, email, cuit)
+                VALUES (?, ?, ?, ?)
+            """, (nombre, telefono, email, cuit))
+            conexion.commit()
+            invalidar_referencias("proveedores")
+            return True
     except sqlite3.Error as e:
         log_error(f"Error al insertar proveedor: {e}")
         return False
@@ -49,16 +59,16 @@ def modificar_proveedor(id_proveedor: int, nuevo_nombre: str, nuevo_telefono: st
         bool: True si el proveedor fue modificado correctamente, False si hubo un error.
     """
     try:
-        conexion = obtener_conexion()
-        cursor = conexion.cursor()
-        cursor.execute("""
-            UPDATE proveedores
-            SET nombre = ?, telefono = ?, email = ?, cuit = ?
-            WHERE id_proveedor = ?
-        """, (nuevo_nombre, nuevo_telefono, nuevo_email, nuevo_cuit, id_proveedor))
-        conexion.commit()
-        conexion.close()
-        return True
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute("""
+                UPDATE proveedores
+                SET nombre = ?, telefono = ?, email = ?, cuit = ?
+                WHERE id_proveedor = ?
+            """, (nuevo_nombre, nuevo_telefono, nuevo_email, nuevo_cuit, id_proveedor))
+            conexion.commit()
+            invalidar_referencias("proveedores")
+            return True
     except sqlite3.Error as e:
         log_error(f"Error al modificar proveedor: {e}")
         return False
@@ -74,12 +84,12 @@ def eliminar_proveedor(id_proveedor: int) -> bool:
         bool: True si el proveedor fue eliminado correctamente, False si hubo un error.
     """
     try:
-        conexion = obtener_conexion()
-        cursor = conexion.cursor()
-        cursor.execute("DELETE FROM proveedores WHERE id_proveedor = ?", (id_proveedor,))
-        conexion.commit()
-        conexion.close()
-        return True
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute("DELETE FROM proveedores WHERE id_proveedor = ?", (id_proveedor,))
+            conexion.commit()
+            invalidar_referencias("proveedores")
+            return True
     except sqlite3.Error as e:
         log_error(f"Error al eliminar proveedor: {e}")
         return False
@@ -88,16 +98,132 @@ def listar_proveedores() -> list:
     """
     Retorna todos los proveedores registrados en la base de datos.
 
+    Los lee de la caché de datos de referencia, que se relee solo cuando los
+    proveedores cambian.
+
     Retorna:
         list: Lista de tuplas con los datos de los proveedores.
     """
     try:
-        conexion = obtener_conexion()
-        cursor = conexion.cursor()
-        cursor.execute("SELECT * FROM proveedores ORDER BY id_proveedor ASC")
-        resultados = cursor.fetchall()
-        conexion.close()
-        return resultados
+        return filas_referencia("proveedores")
     except sqlite3.Error as e:
         log_error(f"Error al listar proveedores: {e}")
         return []
+
+def obtener_proveedor_por_id(id_proveedor: int):
+    """
+    Devuelve el proveedor por su ID desde la caché de datos de referencia.
+
+    Parámetros:
+        id_proveedor (int): El ID del proveedor a consultar.
+
+    Retorna:
+        tuple: El proveedor correspondiente al ID si existe, None si no existe.
+    """
+    try:
+        return fila_referencia_por_id("proveedores", id_proveedor)
+    except sqlite3.Error as e:
+        log_error(f"Error al consultar proveedor por ID: {e}")
+        return None
+
+def existe_proveedor_con_cuit(cuit: str) -> bool:
+    """
+    Indica si ya existe un proveedor con el CUIT indicado.
+
+    Usa una consulta EXISTS sobre el índice único de proveedores.cuit.
+
+    Parámetros:
+        cuit (str): El CUIT a buscar.
+
+    Retorna:
+        bool: True si existe un proveedor con ese CUIT, False si no (o si hubo un error).
+    """
+    try:
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute("SELECT EXISTS(SELECT 1 FROM proveedores WHERE cuit = ?)", (cuit,))
+            return bool(cursor.fetchone()[0])
+    except sqlite3.Error as e:
+        log_error(f"Error al verificar CUIT de proveedor: {e}")
+        return False
+
+def listar_proveedores_sin_productos() -> list:
+    """
+    Retorna los proveedores que no tienen productos asociados.
+
+    Cada proveedor se resuelve con un NOT EXISTS sobre el índice de productos por
+    proveedor, sin leer la tabla de productos.
+
+    Retorna:
+        list: Tuplas con la forma de listar_proveedores(), ordenadas por ID.
+    """
+    try:
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute("""
+                SELECT prov.id_proveedor, prov.nombre, prov.telefono, prov.email, prov.cuit
+                FROM proveedores prov
+                WHERE NOT EXISTS (SELECT 1 FROM productos p WHERE p.proveedor_id = prov.id_proveedor)
+                ORDER BY prov.id_proveedor ASC
+            """)
+            return cursor.fetchall()
+    except sqlite3.Error as e:
+        log_error(f"Error al listar proveedores sin productos: {e}")
+        return []
+
+def existe_producto_con_proveedor(id_proveedor: int) -> bool:
+    """
+    Indica si el proveedor tiene al menos un producto asociado.
+
+    Parámetros:
+        id_proveedor (int): ID del proveedor a verificar.
+
+    Retorna:
+        bool: True si tiene productos, False si no (o si hubo un error).
+    """
+    try:
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute("SELECT EXISTS(SELECT 1 FROM productos WHERE proveedor_id = ?)", (id_proveedor,))
+            return bool(cursor.fetchone()[0])
+    except sqlite3.Error as e:
+        log_error(f"Error al verificar productos del proveedor: {e}")
+        return False
+
+def listar_proveedores_pagina(tamanio: int, desplazamiento: int = 0, orden: str = None, descendente: bool = False,
+                              filtro: str = "") -> list:
+    """
+    Devuelve una página de proveedores, con la misma forma que listar_proveedores().
+
+    El orden y el filtro se resuelven en SQL, así solo viajan las filas de la página.
+
+    Parámetros:
+        tamanio (int): Cantidad máxima de proveedores a devolver.
+        desplazamiento (int): Cantidad de proveedores a saltear (por ejemplo, las páginas anteriores).
+        orden (str): Clave de ORDEN_PROVEEDORES; por defecto, el ID.
+        descendente (bool): Si es True, ordena de mayor a menor.
+        filtro (str): Texto contenido en el nombre, el email o el CUIT.
+
+    Retorna:
+        list: Tuplas con los datos de los proveedores.
+    """
+    columna = ORDEN_PROVEEDORES.get(orden, ORDEN_PROVEEDORES["id"])
+    sentido = "DESC" if descendente else "ASC"
+    condicion, parametros = "", []
+    if filtro:
+        condicion = "WHERE nombre LIKE ? OR email LIKE ? OR cuit LIKE ?"
+        parametros = [f"%{filtro.strip()}%"] * 3
+
+    try:
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute(f"""
+                SELECT * FROM proveedores
+                {condicion}
+                ORDER BY {columna} {sentido}, id_proveedor {sentido}
+                LIMIT ? OFFSET ?
+            """, parametros + [tamanio, desplazamiento])
+            return cursor.fetchall()
+    except sqlite3.Error as e:
+        log_error(f"Error al listar página de proveedores: {e}")
+        return []
@@ -2,12 +2,12 @@
 # Este módulo maneja las operaciones de gestión de proveedores en el sistema,
 # permitiendo agregar, editar, eliminar y listar proveedores.
 
-from gestor_proveedores.proveedores_db import insertar_proveedor, listar_proveedores, modificar_proveedor, eliminar_proveedor
+from gestor_proveedores.proveedores_db import insertar_proveedor, listar_proveedores, listar_proveedores_pagina, modificar_proveedor, eliminar_proveedor
 from interfaz.diseño_interfaz import mostrar_error, mostrar_exito, mostrar_cancelado, mostrar_info
 from gestor_proveedores.proveedores_validaciones import validar_cuit, obtener_proveedor_por_id_validado, listar_proveedores_eliminables, proveedor_tiene_productos
 from core.validaciones_generales import validar_nombre, validar_telefono, validar_email
 from interfaz.diseño_interfaz import pedir_input_con_cancelacion
-from interfaz.mostrar_resumen import mostrar_proveedores
+from interfaz.mostrar_resumen import mostrar_proveedores, mostrar_proveedores_paginados
 from core.utils import formatear_nombre, formatear_email
 from core.logger import log_info
 
@@ -70,24 +70,16 @@ def editar_proveedor():
     Solicita al usuario el ID del proveedor y, si es válido, permite modificar los datos
     (CUIT, nombre, teléfono, y email). Si se deja un campo vacío, se conserva el valor actual.
     """
-    proveedores = listar_proveedores()
-    if not proveedores:
+    if not listar_proveedores_pagina(1):
         mostrar_error("No hay proveedores registrados\n")
         return
 
-    mostrar_proveedores(proveedores)
-
-    # --- Solicitar ID válido ---
-    while True:
-        id_proveedor = pedir_input_con_cancelacion("Ingresá el ID del proveedor a modificar (C para cancelar): ")
-        if id_proveedor.lower() == "c":
-            mostrar_cancelado("Proveedores")
-            return
-
-        proveedor = obtener_proveedor_por_id_validado(id_proveedor)
-        if proveedor is None:  # ID ingresado no existe
-            continue
-        break  # ID válido
+    # --- Solicitar ID válido (sobre la tabla paginada) ---
+    proveedor = mostrar_proveedores_paginados(obtener_proveedor_por_id_validado, "Ingresá el ID del proveedor a modificar")
+    if proveedor is None:
+        mostrar_cancelado("Proveedores")
+        return
+    id_proveedor = proveedor[0]
 
     # --- Guardar valores actuales ---
     nombre_actual = proveedor[1]
@@ -208,8 +200,7 @@ def mostrar_todos_los_proveedores():
 
     Si no existen proveedores, muestra un mensaje de error.
     """
-    proveedores = listar_proveedores()
-    if proveedores:
-        mostrar_proveedores(proveedores)
+    if listar_proveedores_pagina(1):
+        mostrar_proveedores_paginados()
     else:
         mostrar_error("No hay proveedores registrados\n")
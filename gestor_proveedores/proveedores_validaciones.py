@@ -3,8 +3,27 @@
 # listar proveedores eliminables y verificar si un proveedor tiene productos asociados.
 
 from interfaz.diseño_interfaz import mostrar_error
-from gestor_proveedores.proveedores_db import listar_proveedores
-from gestor_productos.productos_db import listar_productos_crudos, listar_productos
+from gestor_proveedores.proveedores_db import (
+    obtener_proveedor_por_id, existe_proveedor_con_cuit, listar_proveedores_sin_productos, existe_producto_con_proveedor
+)
+
+def revisar_cuit(cuit: str, permitir_vacio: bool = False) -> str | None:
+    """
+    Aplica las reglas de formato de validar_cuit() sin mostrar mensajes ni consultar
+    la base (no verifica duplicados).
+
+    Parámetros:
+        cuit (str): El CUIT a revisar.
+        permitir_vacio (bool): Si es True, el CUIT vacío es válido.
+
+    Retorna:
+        str: El motivo por el que el CUIT no es válido, o None si es válido.
+    """
+    if not cuit:
+        return None if permitir_vacio else "El CUIT no puede estar vacío."
+    if not cuit.isdigit() or len(cuit) != 11:
+        return "El CUIT debe contener 11 dígitos numéricos."
+    return None
 
 def validar_cuit(cuit: str, cuit_actual: str = None, permitir_vacio: bool = False) -> bool:
     """
@@ -21,26 +40,19 @@ def validar_cuit(cuit: str, cuit_actual: str = None, permitir_vacio: bool = Fals
     Retorna:
         bool: True si el CUIT es válido, False si no lo es.
     """
-    if not cuit:
-        if permitir_vacio:
-            return True
-        else:
-            mostrar_error("El CUIT no puede estar vacío.")
-            return False
-
-    if not cuit.isdigit() or len(cuit) != 11:
-        mostrar_error("El CUIT debe contener 11 dígitos numéricos.")
+    error = revisar_cuit(cuit, permitir_vacio)
+    if error:
+        mostrar_error(error)
         return False
 
-    cuits_existentes = []
-    for proveedor in listar_proveedores():
-        cuits_existentes.append(proveedor[4])
+    if not cuit:
+        return True
 
     # Evita rechazar el mismo CUIT en edición
     if cuit_actual is not None and cuit == cuit_actual:
         return True
 
-    if cuit in cuits_existentes:
+    if existe_proveedor_con_cuit(cuit):
         mostrar_error("Ya existe un proveedor con ese CUIT.")
         return False
 
@@ -62,10 +74,9 @@ def obtener_proveedor_por_id_validado(id: str):
         mostrar_error("El ID debe ser un número.")
         return None
 
-    id_proveedor = int(id)
-    for proveedor in listar_proveedores():
-        if proveedor[0] == id_proveedor:
-            return proveedor
+    proveedor = obtener_proveedor_por_id(int(id))
+    if proveedor:
+        return proveedor
 
     mostrar_error("El ID ingresado no corresponde a ningún proveedor.")
     return None
@@ -77,20 +88,7 @@ def listar_proveedores_eliminables() -> list:
     Retorna:
         list: Lista de proveedores eliminables (sin productos asociados).
     """
-    todos = listar_proveedores()
-    productos = listar_productos_crudos()
-
-    proveedores_con_productos = set()
-    for producto in productos:
-        if producto[3] is not None:  # producto[3] es proveedor_id
-            proveedores_con_productos.add(producto[3])
-
-    eliminables = []
-    for proveedor in todos:
-        if proveedor[0] not in proveedores_con_productos:
-            eliminables.append(proveedor)
-
-    return eliminables
+    return listar_proveedores_sin_productos()
 
 def proveedor_tiene_productos(id_proveedor: int) -> bool:
     """
@@ -102,8 +100,4 @@ def proveedor_tiene_productos(id_proveedor: int) -> bool:
     Retorna:
         bool: True si el proveedor tiene productos asociados, False si no.
     """
-    productos = listar_productos()
-    for producto in productos:
-        if producto[3] == int(id_proveedor):  # producto[3] es proveedor_id
-            return True
-    return False
+    return existe_producto_con_proveedor(int(id_proveedor))
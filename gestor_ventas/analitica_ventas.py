@@ -0,0 +1,198 @@
+# Módulo de analítica de ventas
+# Este módulo calcula rankings (top N) de productos y clientes por unidades, importe o
+# cantidad de facturas en cualquier rango de fechas.
+#
+# Cuando el criterio y el rango lo permiten, agrupa sobre las tablas de resúmenes
+# (por día para productos, por mes para clientes). Si no, agrupa el detalle filtrando
+# facturas por el índice de fecha. En ambos casos los grupos se leen de un cursor por
+# lotes y se conservan solo los N mejores en un heap, así la memoria no depende de
+# cuántos productos o clientes haya.
+#
+# Uso: python -m gestor_ventas.analitica_ventas productos importe 10 [desde] [hasta]
+
+import heapq
+import sqlite3
+import sys
+from calendar import monthrange
+
+from db.data_base import conexion_db
+from gestor_ventas.facturas_db import _filtro_facturas
+from core.logger import log_error
+
+CRITERIOS = ("unidades", "importe", "facturas")
+
+# Grupos leídos del cursor por vez
+TAMANIO_LOTE_RANKING = 1000
+
+# Expresión SQL de cada criterio sobre el detalle (alias f = facturas, fd = factura_detalle)
+_METRICA_DETALLE = {
+    "unidades": "SUM(fd.cantidad)",
+    "importe": "SUM(fd.total_linea)",
+    "facturas": "COUNT(DISTINCT fd.factura_id)",
+}
+
+
+def _es_fecha(valor: str | None) -> bool:
+    """
+    Indica si un límite es una fecha sin hora ('YYYY-MM-DD') o no está.
+    """
+    return valor is None or len(valor) == 10
+
+
+def _es_mes_completo(desde: str | None, hasta: str | None) -> bool:
+    """
+    Indica si el rango empieza el primer día de un mes y termina en el último de otro
+    (o no tiene límite de ese lado), es decir, si se puede responder por meses.
+    """
+    if not (_es_fecha(desde) and _es_fecha(hasta)):
+        return False
+    if desde and not desde.endswith("-01"):
+        return False
+    if hasta:
+        anio, mes, dia = (int(parte) for parte in hasta.split("-"))
+        return dia == monthrange(anio, mes)[1]
+    return True
+
+
+def _mejores(cursor: sqlite3.Cursor, n: int) -> list:
+    """
+    Consume un cursor de filas (id, nombre, valor) por lotes y devuelve las N de mayor
+    valor (a igual valor, la de menor ID), sin cargar todas las filas en memoria.
+    """
+    def filas():
+        while True:
+            lote = cursor.fetchmany(TAMANIO_LOTE_RANKING)
+            if not lote:
+                return
+            yield from lote
+
+    return heapq.nlargest(n, filas(), key=lambda fila: (fila[2], -fila[0]))
+
+
+def _ranking(consulta: str, parametros: list, n: int) -> list:
+    with conexion_db() as conexion:
+        return _mejores(conexion.execute(consulta, parametros), n)
+
+
+def _validar(n: int, criterio: str) -> None:
+    if criterio not in CRITERIOS:
+        raise ValueError(f"Criterio inválido: {criterio!r}. Opciones: {', '.join(CRITERIOS)}.")
+    if n <= 0:
+        raise ValueError("N debe ser un entero positivo.")
+
+
+def top_productos(n: int = 10, criterio: str = "unidades", desde: str = None, hasta: str = None,
+                  usar_resumenes: bool = True) -> list:
+    """
+    Devuelve los N productos que más vendieron según un criterio.
+
+    Parámetros:
+        n (int): Cantidad de productos a devolver.
+        criterio (str): "unidades", "importe" o "facturas" (facturas distintas que lo incluyen).
+        desde (str): Fecha mínima inclusiva 'YYYY-MM-DD', opcional.
+        hasta (str): Fecha máxima inclusiva 'YYYY-MM-DD', opcional.
+        usar_resumenes (bool): Si es False, siempre agrupa el detalle (para comparar).
+
+    Retorna:
+        list: Tuplas (producto_id, nombre_producto, valor), de mayor a menor valor.
+
+    Lanza:
+        ValueError: Si el criterio o N no son válidos.
+    """
+    _validar(n, criterio)
+    try:
+        if usar_resumenes and criterio != "facturas" and _es_fecha(desde) and _es_fecha(hasta):
+            try:
+                return _ranking(f"""
+                    SELECT producto_id, MAX(nombre_producto), SUM({criterio})
+                    FROM resumen_ventas_dia_producto
+                    WHERE fecha BETWEEN ? AND ?
+                    GROUP BY producto_id
+                """, [desde or "0000-00-00", hasta or "9999-99-99"], n)
+            except sqlite3.OperationalError as e:
+                log_error(f"Resúmenes de productos no disponibles, se usa el detalle: {e}")
+
+        filtro, parametros = _filtro_facturas(desde=desde, hasta=hasta, alias="f")
+        # Sin rango de fechas no hace falta pasar por facturas
+        origen = "factura_detalle fd" if not filtro else \
+            "facturas f JOIN factura_detalle fd ON fd.factura_id = f.id_factura"
+        return _ranking(f"""
+            SELECT fd.producto_id, MAX(fd.nombre_producto), {_METRICA_DETALLE[criterio]}
+            FROM {origen}
+            {filtro}
+            GROUP BY fd.producto_id
+        """, parametros, n)
+    except sqlite3.Error as e:
+        log_error(f"Error al calcular el ranking de productos: {e}")
+        return []
+
+
+def top_clientes(n: int = 10, criterio: str = "importe", desde: str = None, hasta: str = None,
+                 usar_resumenes: bool = True) -> list:
+    """
+    Devuelve los N clientes que más compraron según un criterio.
+
+    Parámetros:
+        n (int): Cantidad de clientes a devolver.
+        criterio (str): "unidades", "importe" o "facturas".
+        desde (str): Fecha mínima inclusiva 'YYYY-MM-DD', opcional.
+        hasta (str): Fecha máxima inclusiva 'YYYY-MM-DD', opcional.
+        usar_resumenes (bool): Si es False, siempre agrupa las facturas (para comparar).
+
+    Retorna:
+        list: Tuplas (cliente_id, nombre_cliente, valor), de mayor a menor valor.
+
+    Lanza:
+        ValueError: Si el criterio o N no son válidos.
+    """
+    _validar(n, criterio)
+    try:
+        if usar_resumenes and criterio != "unidades" and _es_mes_completo(desde, hasta):
+            try:
+                return _ranking(f"""
+                    SELECT cliente_id, MAX(nombre_cliente), SUM({criterio})
+                    FROM resumen_ventas_cliente_mes
+                    WHERE mes BETWEEN ? AND ?
+                    GROUP BY cliente_id
+                """, [desde[:7] if desde else "0000-00", hasta[:7] if hasta else "9999-99"], n)
+            except sqlite3.OperationalError as e:
+                log_error(f"Resúmenes de clientes no disponibles, se usan las facturas: {e}")
+
+        filtro, parametros = _filtro_facturas(desde=desde, hasta=hasta, alias="f")
+        if criterio == "unidades":
+            consulta = f"""
+                SELECT f.cliente_id, MAX(f.nombre_cliente), SUM(fd.cantidad)
+                FROM facturas f
+                JOIN factura_detalle fd ON fd.factura_id = f.id_factura
+                {filtro}
+                GROUP BY f.cliente_id
+            """
+        else:
+            metrica = "SUM(f.total)" if criterio == "importe" else "COUNT(*)"
+            consulta = f"""
+                SELECT f.cliente_id, MAX(f.nombre_cliente), {metrica}
+                FROM facturas f
+                {filtro}
+                GROUP BY f.cliente_id
+            """
+        return _ranking(consulta, parametros, n)
+    except sqlite3.Error as e:
+        log_error(f"Error al calcular el ranking de clientes: {e}")
+        return []
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3 or sys.argv[1] not in ("productos", "clientes"):
+        print("Uso: python -m gestor_ventas.analitica_ventas productos|clientes "
+              "unidades|importe|facturas [n] [desde] [hasta]")
+        sys.exit(1)
+
+    entidad, criterio = sys.argv[1], sys.argv[2]
+    n = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+    desde = sys.argv[4] if len(sys.argv) > 4 else None
+    hasta = sys.argv[5] if len(sys.argv) > 5 else None
+
+    calcular = top_productos if entidad == "productos" else top_clientes
+    for posicion, (id_, nombre, valor) in enumerate(calcular(n, criterio, desde, hasta), start=1):
+        valor = f"${valor:.2f}" if criterio == "importe" else valor
+        print(f"{posicion:>3}. [{id_}] {nombre}: {valor}")
@@ -0,0 +1,302 @@
+# Módulo de caché de facturas PDF
+# Los datos de una factura quedan congelados al momento de la venta, así que su PDF
+# solo cambia si cambia la plantilla. Este módulo guarda cada PDF con un nombre
+# derivado del hash de sus filas de detalle y de la versión de plantilla: si el
+# archivo ya existe, se reutiliza en lugar de volver a dibujarlo.
+#
+# El índice que relaciona cada id_factura con su archivo es una tabla SQLite en la
+# carpeta de la caché: cada alta se escribe como una fila, en su propia transacción,
+# así varios procesos pueden compartir la carpeta sin pisarse y nunca hay que
+# reescribir el índice entero. Un acierto no escribe nada: la hora de uso queda en
+# memoria y se anota junto con las demás cada INTERVALO_USOS aciertos, antes de
+# depurar y al cerrar. Cada proceso usa una sola instancia por carpeta (ver
+# obtener_cache()). Las entradas se descartan por antigüedad, si su archivo ya no
+# existe y, si la caché supera el tamaño máximo, empezando por las menos usadas.
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from core.logger import log_info, log_error
+
+NOMBRE_INDICE = "indice_cache.db"
+
+# Tamaño máximo de la caché (MB) y días sin uso tras los cuales se descarta un PDF
+CACHE_MAX_MB = float(os.environ.get("INVENTARIO_CACHE_PDF_MB", "512"))
+CACHE_MAX_DIAS = float(os.environ.get("INVENTARIO_CACHE_PDF_DIAS", "180"))
+
+# Cada cuántos PDF registrados se depura la caché
+INTERVALO_DEPURACION = 200
+
+# Cada cuántos aciertos se anotan juntas sus horas de uso en el índice
+INTERVALO_USOS = 100
+
+
+def clave_factura(detalle: list, version_plantilla: int) -> str:
+    """
+    Calcula la clave de contenido de una factura.
+
+    Parámetros:
+        detalle (list): Filas con la forma de obtener_detalle_venta().
+        version_plantilla (int): Versión de la plantilla con la que se dibuja el PDF.
+
+    Retorna:
+        str: Hash SHA-256 en hexadecimal.
+    """
+    contenido = json.dumps([version_plantilla, [list(fila) for fila in detalle]],
+                           ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(contenido.encode("utf-8")).hexdigest()
+
+
+class CachePDF:
+    """
+    Caché de PDF de facturas direccionada por contenido, segura entre hilos.
+
+    El índice vive en una base SQLite propia de la carpeta; los aciertos y fallos
+    se cuentan por instancia (es decir, por proceso).
+    """
+
+    def __init__(self, carpeta: str, max_mb: float = None, max_dias: float = None):
+        self.carpeta = carpeta
+        self.max_bytes = int((CACHE_MAX_MB if max_mb is None else max_mb) * 1024 * 1024)
+        self.max_segundos = (CACHE_MAX_DIAS if max_dias is None else max_dias) * 86400
+        self.ruta_indice = os.path.join(carpeta, NOMBRE_INDICE)
+        self.aciertos = 0
+        self.fallos = 0
+        self._registradas = 0
+        self._usos = {}
+        self._lock = threading.Lock()
+        self._conexion = None
+        self._pid = None
+
+    def _indice(self) -> sqlite3.Connection:
+        """
+        Devuelve la conexión al índice, abriéndola (y creando la tabla) si hace
+        falta o si el proceso cambió (fork). Se llama con el lock tomado.
+        """
+        if self._conexion is None or self._pid != os.getpid():
+            os.makedirs(self.carpeta, exist_ok=True)
+            self._conexion = sqlite3.connect(self.ruta_indice, timeout=30, isolation_level=None,
+                                             check_same_thread=False)
+            self._pid = os.getpid()
+            self._conexion.execute("PRAGMA journal_mode = WAL")
+            self._conexion.execute("""
+                CREATE TABLE IF NOT EXISTS facturas (
+                    id_factura INTEGER PRIMARY KEY,
+                    clave TEXT NOT NULL,
+                    archivo TEXT NOT NULL,
+                    bytes INTEGER NOT NULL,
+                    creado REAL NOT NULL,
+                    usado REAL NOT NULL
+                )
+            """)
+            self._conexion.execute("CREATE INDEX IF NOT EXISTS idx_facturas_usado ON facturas(usado)")
+        return self._conexion
+
+    def ruta_para(self, id_factura: int, clave: str) -> str:
+        """
+        Devuelve la ruta que le corresponde al PDF de una factura con esa clave.
+        """
+        return os.path.join(self.carpeta, f"factura_{id_factura}_{clave[:16]}.pdf")
+
+    def buscar(self, id_factura: int, clave: str) -> str | None:
+        """
+        Busca el PDF de una factura y cuenta el acierto o el fallo.
+
+        Parámetros:
+            id_factura (int): El ID de la factura.
+            clave (str): La clave de contenido calculada con clave_factura().
+
+        Retorna:
+            str: La ruta del PDF existente, o None si hay que generarlo.
+        """
+        ruta = self.ruta_para(id_factura, clave)
+        if not os.path.isfile(ruta):
+            with self._lock:
+                self.fallos += 1
+            return None
+        with self._lock:
+            self.aciertos += 1
+            self._usos[id_factura] = (clave, os.path.basename(ruta), time.time())
+            anotar = len(self._usos) >= INTERVALO_USOS
+        if anotar:
+            self.anotar_usos()
+        return ruta
+
+    def anotar_usos(self) -> None:
+        """
+        Escribe en el índice, en una sola transacción, la hora de uso de los PDF
+        reutilizados desde la última anotación. Si el archivo reutilizado no tenía
+        entrada (por ejemplo, el índice se borró), se la crea.
+        """
+        try:
+            with self._lock:
+                usos, self._usos = self._usos, {}
+                filas = []
+                for id_factura, (clave, archivo, usado) in usos.items():
+                    try:
+                        cantidad_bytes = os.path.getsize(os.path.join(self.carpeta, archivo))
+                    except OSError:
+                        continue
+                    filas.append((id_factura, clave, archivo, cantidad_bytes, usado, usado))
+                if not filas:
+                    return
+                indice = self._indice()
+                indice.execute("BEGIN IMMEDIATE")
+                try:
+                    # Si otro proceso ya registró otra versión de la factura, se deja la suya
+                    indice.executemany("""
+                        INSERT INTO facturas (id_factura, clave, archivo, bytes, creado, usado)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                        ON CONFLICT(id_factura) DO UPDATE SET usado = MAX(usado, excluded.usado)
+                        WHERE clave = excluded.clave
+                    """, filas)
+                    indice.execute("COMMIT")
+                except BaseException:
+                    indice.execute("ROLLBACK")
+                    raise
+        except (OSError, sqlite3.Error) as e:
+            log_error(f"Error al anotar el uso de {len(usos)} PDF en la caché: {e}")
+
+    def registrar(self, id_factura: int, clave: str, ruta: str) -> None:
+        """
+        Anota en el índice el PDF de una factura, y borra el anterior si la clave cambió.
+
+        Parámetros:
+            id_factura (int): El ID de la factura.
+            clave (str): La clave de contenido del PDF.
+            ruta (str): La ruta del PDF generado o reutilizado.
+        """
+        archivo = os.path.basename(ruta)
+        ahora = time.time()
+        try:
+            with self._lock:
+                self._usos.pop(id_factura, None)
+                indice = self._indice()
+                indice.execute("BEGIN IMMEDIATE")
+                try:
+                    anterior = indice.execute("SELECT archivo FROM facturas WHERE id_factura = ?",
+                                              (id_factura,)).fetchone()
+                    indice.execute("""
+                        INSERT INTO facturas (id_factura, clave, archivo, bytes, creado, usado)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                        ON CONFLICT(id_factura) DO UPDATE SET
+                            creado = CASE WHEN clave = excluded.clave THEN creado ELSE excluded.creado END,
+                            clave = excluded.clave, archivo = excluded.archivo,
+                            bytes = excluded.bytes, usado = excluded.usado
+                    """, (id_factura, clave, archivo, os.path.getsize(ruta), ahora, ahora))
+                    indice.execute("COMMIT")
+                except BaseException:
+                    indice.execute("ROLLBACK")
+                    raise
+                self._registradas += 1
+                depurar = self._registradas % INTERVALO_DEPURACION == 0
+        except (OSError, sqlite3.Error) as e:
+            log_error(f"Error al registrar la factura ID {id_factura} en la caché de PDF: {e}")
+            return
+
+        if anterior and anterior[0] != archivo:
+            self._borrar_archivo(anterior[0])
+        if depurar:
+            self.depurar()
+
+    def _borrar_archivo(self, nombre_archivo: str) -> None:
+        try:
+            os.remove(os.path.join(self.carpeta, nombre_archivo))
+        except FileNotFoundError:
+            pass
+
+    def depurar(self) -> int:
+        """
+        Descarta las entradas cuyo PDF ya no existe, los PDF sin uso más allá de
+        la antigüedad máxima y, si la caché sigue superando el tamaño máximo, los
+        menos usados recientemente.
+
+        Retorna:
+            int: Cantidad de entradas descartadas.
+        """
+        self.anotar_usos()
+        limite = time.time() - self.max_segundos
+        try:
+            with self._lock:
+                indice = self._indice()
+                por_uso = indice.execute(
+                    "SELECT id_factura, archivo, bytes, usado FROM facturas ORDER BY usado ASC").fetchall()
+                total = sum(fila[2] for fila in por_uso)
+                descartadas = []
+                for id_factura, archivo, cantidad_bytes, usado in por_uso:
+                    perdida = not os.path.isfile(os.path.join(self.carpeta, archivo))
+                    if not perdida and usado >= limite and total <= self.max_bytes:
+                        continue
+                    if not perdida:
+                        self._borrar_archivo(archivo)
+                    descartadas.append((id_factura, archivo))
+                    total -= cantidad_bytes
+                # Se borra solo si la fila sigue apuntando al mismo archivo (otro proceso pudo regenerarla)
+                indice.executemany("DELETE FROM facturas WHERE id_factura = ? AND archivo = ?", descartadas)
+        except sqlite3.Error as e:
+            log_error(f"Error al depurar la caché de PDF: {e}")
+            return 0
+
+        if descartadas:
+            log_info(f"Caché de PDF → Descartados: {len(descartadas)}, Tamaño actual: {total} bytes")
+        return len(descartadas)
+
+    def estadisticas(self) -> dict:
+        """
+        Resume el estado de la caché.
+
+        Retorna:
+            dict: aciertos, fallos, tasa_aciertos (0 a 1), entradas y bytes.
+        """
+        try:
+            with self._lock:
+                aciertos, fallos = self.aciertos, self.fallos
+                entradas, cantidad_bytes = self._indice().execute(
+                    "SELECT COUNT(*), COALESCE(SUM(bytes), 0) FROM facturas").fetchone()
+        except sqlite3.Error as e:
+            log_error(f"Error al leer el índice de la caché de PDF: {e}")
+            aciertos, fallos = self.aciertos, self.fallos
+            entradas, cantidad_bytes = 0, 0
+        return {
+            "aciertos": aciertos,
+            "fallos": fallos,
+            "tasa_aciertos": round(aciertos / (aciertos + fallos), 4) if aciertos + fallos else 0.0,
+            "entradas": entradas,
+            "bytes": cantidad_bytes,
+        }
+
+    def cerrar(self) -> None:
+        """
+        Anota los usos pendientes y cierra la conexión al índice.
+        """
+        self.anotar_usos()
+        with self._lock:
+            if self._conexion is not None and self._pid == os.getpid():
+                self._conexion.close()
+            self._conexion = None
+
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def obtener_cache(carpeta: str) -> CachePDF:
+    """
+    Devuelve la caché de PDF del proceso para una carpeta, creándola la primera vez.
+
+    Parámetros:
+        carpeta (str): Carpeta donde se guardan los PDF.
+
+    Retorna:
+        CachePDF: La misma instancia en cada llamada con esa carpeta.
+    """
+    clave = os.path.abspath(carpeta)
+    with _caches_lock:
+        cache = _caches.get(clave)
+        if cache is None:
+            cache = _caches[clave] = CachePDF(carpeta)
+        return cache
@@ -1,25 +1,92 @@
 # Módulo de gestión de exportación de facturas
 # Este módulo permite generar un archivo PDF con la información de una factura y exportarla,
-# así como gestionar la exportación de facturas desde la base de datos.
+# así como gestionar la exportación de facturas desde la base de datos, de a una o por lote
+# en paralelo con un pool de procesos. Los PDF ya generados se reutilizan desde la caché
+# (ver gestor_ventas/cache_pdf.py) mientras no cambien los datos ni la plantilla.
+# También arma un PDF consolidado con todas las facturas de un cliente o de un período.
+#
+# Uso por lote: python -m gestor_ventas.exportar_factura --desde 2025-07-01 --hasta 2025-07-31 --procesos 4
+# Consolidado:  python -m gestor_ventas.exportar_factura --consolidado --cliente 3 --desde 2025-07-01
 
 from fpdf import FPDF
-from datetime import datetime
+from itertools import groupby, islice
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+import argparse
 import os
+import sys
+import time
 
-from gestor_ventas.facturas_db import obtener_detalle_venta, listar_facturas
-from interfaz.mostrar_resumen import mostrar_facturas
-from interfaz.diseño_interfaz import pedir_input_con_cancelacion
-from interfaz.diseño_interfaz import mostrar_error, mostrar_cancelado, mostrar_exito
+from gestor_ventas.facturas_db import (obtener_detalle_venta, obtener_detalles_ventas, iterar_facturas,
+                                      iterar_detalles_ventas, contar_facturas)
+from gestor_ventas.plantilla_factura import PLANTILLA_FACTURA, obtener_plantilla
+from gestor_ventas.cache_pdf import obtener_cache, clave_factura
+from gestor_ventas.ventas_validaciones import seleccionar_factura_paginada
+from interfaz.diseño_interfaz import mostrar_exito
 from core.logger import log_info, log_error
 
 RUTA_FACTURAS = "./facturas_exportadas"
 
+# Versión del diseño del PDF; al cambiar, invalida los archivos en caché
+VERSION_PLANTILLA = PLANTILLA_FACTURA["version"]
+
+# Facturas cuyo detalle se consulta junto en la exportación por lote
+TAMANIO_BLOQUE_EXPORTACION = 100
+
+# Facturas por documento del PDF consolidado; con más, se parte en varios archivos
+FACTURAS_POR_CONSOLIDADO = int(os.environ.get("INVENTARIO_CONSOLIDADO_FACTURAS", "250"))
+
+
+def _dibujar_factura(pdf: FPDF, id_factura: int, detalle: list) -> None:
+    """
+    Dibuja una factura en el documento con la plantilla compilada, a partir de una página nueva.
+
+    Parámetros:
+        pdf (FPDF): Documento creado con PlantillaCompilada.nuevo_documento().
+        id_factura (int): El ID de la factura.
+        detalle (list): Filas con la forma de obtener_detalle_venta().
+    """
+    obtener_plantilla().dibujar(pdf, id_factura, detalle)
+
+
+def _guardar_pdf(pdf: FPDF, ruta: str) -> str:
+    """
+    Guarda el documento de forma atómica: se escribe a un temporal y se renombra.
+    """
+    os.makedirs(os.path.dirname(ruta) or ".", exist_ok=True)
+    temporal = f"{ruta}.{os.getpid()}.tmp"
+    pdf.output(temporal, "F")
+    os.replace(temporal, ruta)
+    return ruta
+
+
+def renderizar_pdf_factura(id_factura: int, detalle: list, ruta: str) -> str:
+    """
+    Dibuja y guarda el PDF de una factura a partir de sus filas de detalle.
+
+    No consulta la base de datos, por lo que puede ejecutarse en otro proceso.
+    El archivo se escribe primero con un nombre temporal y luego se renombra,
+    así nunca queda un PDF a medio escribir con el nombre definitivo.
+
+    Parámetros:
+        id_factura (int): El ID de la factura.
+        detalle (list): Filas con la forma de obtener_detalle_venta().
+        ruta (str): Ruta del archivo PDF a escribir.
+
+    Retorna:
+        str: La ruta del archivo PDF generado.
+    """
+    pdf = obtener_plantilla().nuevo_documento()
+    _dibujar_factura(pdf, id_factura, detalle)
+    return _guardar_pdf(pdf, ruta)
+
+
 def generar_pdf_factura(id_factura: int) -> str | None:
     """
     Genera un archivo PDF con los detalles de una factura.
 
     Extrae la información de la factura y sus productos asociados desde la base de datos,
-    luego genera un archivo PDF con el formato adecuado.
+    luego genera un archivo PDF con el formato adecuado. Si ya existe un PDF con los
+    mismos datos y la misma versión de plantilla, devuelve ese archivo sin regenerarlo.
 
     Parámetros:
         id_factura (int): El ID de la factura que se quiere exportar a PDF.
@@ -27,76 +94,25 @@ def generar_pdf_factura(id_factura: int) -> str | None:
     Retorna:
         str: La ruta del archivo PDF generado si la operación fue exitosa, None en caso de error.
     """
+    inicio = time.perf_counter()
     detalle = obtener_detalle_venta(id_factura)
     if not detalle:
         log_error(f"No se encontró información para la factura ID {id_factura}")
         return None
 
+    cache = obtener_cache(RUTA_FACTURAS)
+    clave = clave_factura(detalle, VERSION_PLANTILLA)
+    ruta = cache.buscar(id_factura, clave)
+    if ruta:
+        log_info("Factura PDF reutilizada desde la caché", operacion="exportar_pdf", factura_id=id_factura,
+                 ruta=ruta, duracion_ms=round((time.perf_counter() - inicio) * 1000, 2))
+        return ruta
+
     try:
-        (
-            _, fecha, cliente_id, nombre_cliente, email, dni,
-            _, producto, categoria, cantidad, precio_unitario, total_linea, total_factura
-        ) = detalle[0]
-
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-        pdf = FPDF()
-        pdf.add_page()
-        pdf.set_auto_page_break(auto=True, margin=15)
-
-        # ENCABEZADO EMPRESA
-        pdf.set_font("Arial", style="B", size=16)
-        pdf.cell(190, 10, "Electro Mundo S.A.", ln=True, align="C")
-        pdf.set_font("Arial", size=10)
-        pdf.cell(190, 6, "CUIT: 30-12345678-9 | contacto@gestionavanzada.com", ln=True, align="C")
-        pdf.cell(190, 6, "Av. Siempre Viva 123, CABA | Tel: (011) 4567-8910", ln=True, align="C")
-        pdf.ln(4)
-
-        # DATOS FACTURA
-        pdf.set_font("Arial", style="B", size=14)
-        pdf.cell(190, 10, f"FACTURA Nº {id_factura}", ln=True, align="C")
-        pdf.set_font("Arial", size=11)
-        pdf.cell(190, 8, f"Fecha: {fecha}", ln=True)
-        pdf.cell(190, 8, f"Cliente: {nombre_cliente} (ID: {cliente_id})", ln=True)
-        pdf.cell(190, 8, f"Email: {email}", ln=True)
-        pdf.cell(190, 8, f"DNI: {dni}", ln=True)
-
-        # TABLA PRODUCTOS
-        pdf.ln(5)
-        pdf.set_font("Arial", style="B", size=12)
-        pdf.cell(0, 8, "Detalle de Productos", ln=True)
-        pdf.set_fill_color(230, 230, 230)
-        pdf.set_font("Arial", style="B", size=10)
-        pdf.cell(50, 8, "Producto", border=1, fill=1)
-        pdf.cell(40, 8, "Categoría", border=1, fill=1)
-        pdf.cell(25, 8, "Cantidad", border=1, fill=1, align="C")
-        pdf.cell(35, 8, "Precio Unit.", border=1, fill=1, align="R")
-        pdf.cell(40, 8, "Subtotal", border=1, ln=True, fill=1, align="R")
-
-        pdf.set_font("Arial", size=10)
-        for row in detalle:
-            (_, _, _, _, _, _, _, producto, categoria,
-            cantidad, precio_unitario, total_linea, _) = row
-
-            pdf.cell(50, 8, producto, border=1)
-            pdf.cell(40, 8, categoria, border=1)
-            pdf.cell(25, 8, str(cantidad), border=1, align="C")
-            pdf.cell(35, 8, f"${precio_unitario:.2f}", border=1, align="R")
-            pdf.cell(40, 8, f"${total_linea:.2f}", border=1, ln=True, align="R")
-
-        pdf.ln(4)
-        pdf.set_font("Arial", style="B", size=12)
-        pdf.cell(150, 8, "TOTAL FACTURA:", align="R")
-        pdf.set_font("Arial", style="", size=12)
-        pdf.cell(40, 8, f"${total_factura:.2f}", ln=True, align="R")
-
-        # GUARDADO
-        os.makedirs(RUTA_FACTURAS, exist_ok=True)
-        nombre_archivo = f"factura_{id_factura}_{timestamp}.pdf"
-        ruta = os.path.join(RUTA_FACTURAS, nombre_archivo)
-        pdf.output(ruta)
-
-        log_info(f"Factura PDF generada correctamente → ID: {id_factura}, Ruta: {ruta}")
+        ruta = renderizar_pdf_factura(id_factura, detalle, cache.ruta_para(id_factura, clave))
+        cache.registrar(id_factura, clave, ruta)
+        log_info("Factura PDF generada correctamente", operacion="exportar_pdf", factura_id=id_factura,
+                 ruta=ruta, duracion_ms=round((time.perf_counter() - inicio) * 1000, 2))
         return ruta
 
     except Exception as e:
@@ -104,36 +120,339 @@ def generar_pdf_factura(id_factura: int) -> str | None:
         return None
 
 
+def _en_bloques(ids, tamanio: int):
+    """
+    Agrupa un iterable de IDs en listas de hasta `tamanio` elementos.
+    """
+    bloque = []
+    for id_factura in ids:
+        bloque.append(id_factura)
+        if len(bloque) == tamanio:
+            yield bloque
+            bloque = []
+    if bloque:
+        yield bloque
+
+
+def exportar_facturas_lote(ids: list[int] = None, desde: str = None, hasta: str = None,
+                           procesos: int = None, carpeta: str = RUTA_FACTURAS, al_avanzar=None) -> dict:
+    """
+    Exporta muchas facturas a PDF, repartiendo el dibujo en un pool de procesos.
+
+    Las facturas se eligen por lista de IDs o por rango de fechas. El proceso
+    principal lee los IDs en bloques y trae el detalle de cada bloque con una
+    sola consulta; los procesos del pool solo dibujan y guardan los PDF. La
+    cantidad de trabajos en vuelo está acotada, así la memoria no crece con
+    el tamaño del lote. Las facturas con un PDF vigente en la caché no se
+    vuelven a dibujar.
+
+    Parámetros:
+        ids (list[int]): IDs a exportar; si es None se usa el rango de fechas.
+        desde (str): Fecha mínima inclusiva (si no se pasan IDs).
+        hasta (str): Fecha máxima inclusiva (si no se pasan IDs).
+        procesos (int): Procesos del pool; por defecto, uno por CPU. Con 1 se
+            exporta en el proceso actual.
+        carpeta (str): Carpeta de destino de los PDF.
+        al_avanzar (callable): Función opcional llamada como al_avanzar(hechas, total)
+            cada vez que termina una factura.
+
+    Retorna:
+        dict: exportadas, reutilizadas (desde la caché), fallidas (lista de IDs),
+            total y cache (estadísticas de CachePDF, con los aciertos y fallos de este lote).
+    """
+    procesos = procesos or os.cpu_count() or 1
+    if ids is not None:
+        total = len(ids)
+        fuente = iter(ids)
+    else:
+        total = contar_facturas(desde, hasta)
+        fuente = (factura[0] for factura in iterar_facturas(TAMANIO_BLOQUE_EXPORTACION, desde, hasta))
+
+    resumen = {"exportadas": 0, "reutilizadas": 0, "fallidas": [], "total": total}
+    cache = obtener_cache(carpeta)
+    aciertos_previos, fallos_previos = cache.aciertos, cache.fallos
+
+    def registrar(id_factura: int, ruta: str | None, clave: str = None) -> None:
+        if ruta:
+            resumen["exportadas"] += 1
+            if clave:
+                cache.registrar(id_factura, clave, ruta)
+        else:
+            resumen["fallidas"].append(id_factura)
+        if al_avanzar:
+            al_avanzar(resumen["exportadas"] + len(resumen["fallidas"]), total)
+
+    def pendientes_de_bloque(bloque: list[int]):
+        """Registra los aciertos de caché del bloque y devuelve las facturas a dibujar."""
+        detalles = obtener_detalles_ventas(bloque)
+        for id_factura in bloque:
+            if id_factura not in detalles:
+                registrar(id_factura, None)
+                continue
+            clave = clave_factura(detalles[id_factura], VERSION_PLANTILLA)
+            ruta = cache.buscar(id_factura, clave)
+            if ruta:
+                resumen["reutilizadas"] += 1
+                registrar(id_factura, ruta)
+                continue
+            yield id_factura, clave, detalles[id_factura], cache.ruta_para(id_factura, clave)
+
+    if procesos <= 1:
+        for bloque in _en_bloques(fuente, TAMANIO_BLOQUE_EXPORTACION):
+            for id_factura, clave, detalle, destino in pendientes_de_bloque(bloque):
+                ruta = None
+                try:
+                    ruta = renderizar_pdf_factura(id_factura, detalle, destino)
+                except Exception as e:
+                    log_error(f"Error al generar PDF de la factura ID {id_factura}: {e}")
+                registrar(id_factura, ruta, clave)
+    else:
+        with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+            pendientes = {}
+
+            def recoger(terminados) -> None:
+                for futuro in terminados:
+                    id_factura, clave = pendientes.pop(futuro)
+                    ruta = None
+                    try:
+                        ruta = futuro.result()
+                    except Exception as e:
+                        log_error(f"Error al generar PDF de la factura ID {id_factura}: {e}")
+                    registrar(id_factura, ruta, clave)
+
+            for bloque in _en_bloques(fuente, TAMANIO_BLOQUE_EXPORTACION):
+                for id_factura, clave, detalle, destino in pendientes_de_bloque(bloque):
+                    futuro = ejecutor.submit(renderizar_pdf_factura, id_factura, detalle, destino)
+                    pendientes[futuro] = (id_factura, clave)
+                    if len(pendientes) >= procesos * 4:
+                        terminados, _ = wait(pendientes, return_when=FIRST_COMPLETED)
+                        recoger(terminados)
+
+            recoger(list(pendientes))
+
+    cache.depurar()
+    estadisticas = cache.estadisticas()
+    aciertos, fallos = cache.aciertos - aciertos_previos, cache.fallos - fallos_previos
+    estadisticas.update(aciertos=aciertos, fallos=fallos,
+                        tasa_aciertos=round(aciertos / (aciertos + fallos), 4) if aciertos + fallos else 0.0)
+    resumen["cache"] = estadisticas
+
+    if resumen["fallidas"]:
+        log_error(f"Exportación por lote → Facturas sin exportar: {resumen['fallidas']}")
+    log_info(f"Exportación por lote → Exportadas: {resumen['exportadas']} de {total} "
+             f"(reutilizadas: {resumen['reutilizadas']}), Carpeta: {carpeta}")
+    return resumen
+
+
+def _escribir_parte_consolidado(ruta: str, facturas, encabezado: list[str], total_previo: float = None,
+                                es_ultima: bool = True, al_agregar=None) -> tuple[int, float]:
+    """
+    Escribe un PDF consolidado (o una parte de uno): portada, facturas e índice enlazado.
+
+    Parámetros:
+        ruta (str): Ruta del PDF a escribir.
+        facturas (iterable): Pares (id_factura, filas de detalle), como los de groupby().
+        encabezado (list[str]): Líneas de la portada debajo del título.
+        total_previo (float): Importe de las partes anteriores; si no es None, el índice
+            cierra con el total de esta parte y el acumulado hasta ella.
+        es_ultima (bool): Si es la última parte, el acumulado se rotula como total general.
+        al_agregar (callable): Función opcional llamada sin argumentos por cada factura.
+
+    Retorna:
+        tuple: (cantidad de facturas, importe total) de este PDF.
+    """
+    pdf = obtener_plantilla().nuevo_documento()
+
+    # PORTADA
+    pdf.add_page()
+    pdf.set_font("Arial", style="B", size=16)
+    pdf.cell(190, 10, "Electro Mundo S.A.", ln=True, align="C")
+    pdf.set_font("Arial", style="B", size=14)
+    pdf.cell(190, 10, "Resumen de facturas", ln=True, align="C")
+    pdf.ln(4)
+    pdf.set_font("Arial", size=11)
+    for linea in encabezado:
+        pdf.cell(190, 8, linea, ln=True)
+    enlace_indice = pdf.add_link()
+    pdf.set_text_color(0, 0, 200)
+    pdf.cell(190, 8, "Ver índice al final del documento", ln=True, link=enlace_indice)
+    pdf.set_text_color(0, 0, 0)
+
+    # FACTURAS (una a la vez, en el orden de los lotes)
+    indice = []
+    for id_factura, filas in facturas:
+        detalle = list(filas)
+        _, fecha, _, nombre_cliente, *_, total_factura = detalle[0]
+        indice.append((id_factura, fecha, nombre_cliente, total_factura, pdf.page + 1))
+        _dibujar_factura(pdf, id_factura, detalle)
+        if al_agregar:
+            al_agregar()
+
+    # ÍNDICE
+    pdf.add_page()
+    pdf.set_link(enlace_indice, page=pdf.page)
+    pdf.set_font("Arial", style="B", size=14)
+    pdf.cell(190, 10, "Índice", ln=True, align="C")
+    pdf.set_fill_color(230, 230, 230)
+    pdf.set_font("Arial", style="B", size=10)
+    pdf.cell(25, 8, "Factura", border=1, fill=1)
+    pdf.cell(45, 8, "Fecha", border=1, fill=1)
+    pdf.cell(65, 8, "Cliente", border=1, fill=1)
+    pdf.cell(35, 8, "Total", border=1, fill=1, align="R")
+    pdf.cell(20, 8, "Página", border=1, ln=True, fill=1, align="C")
+
+    pdf.set_font("Arial", size=10)
+    for id_factura, fecha, nombre_cliente, total_factura, pagina in indice:
+        enlace = pdf.add_link()
+        pdf.set_link(enlace, page=pagina)
+        pdf.cell(25, 7, f"Nº {id_factura}", border=1, link=enlace)
+        pdf.cell(45, 7, str(fecha), border=1)
+        pdf.cell(65, 7, nombre_cliente, border=1)
+        pdf.cell(35, 7, f"${total_factura:.2f}", border=1, align="R")
+        pdf.cell(20, 7, str(pagina), border=1, ln=True, align="C", link=enlace)
+
+    importe = sum(fila[3] for fila in indice)
+    totales = [("TOTAL GENERAL:", importe)] if total_previo is None else \
+        [("TOTAL PARTE:", importe), ("TOTAL GENERAL:" if es_ultima else "TOTAL ACUMULADO:", total_previo + importe)]
+    pdf.ln(4)
+    pdf.set_font("Arial", style="B", size=12)
+    for etiqueta, valor in totales:
+        pdf.cell(135, 8, etiqueta, align="R")
+        pdf.cell(35, 8, f"${valor:.2f}", ln=True, align="R")
+
+    _guardar_pdf(pdf, ruta)
+    return len(indice), importe
+
+
+def generar_pdf_consolidado(cliente_id: int = None, desde: str = None, hasta: str = None,
+                            carpeta: str = RUTA_FACTURAS, al_avanzar=None) -> list[str] | None:
+    """
+    Genera un PDF con todas las facturas de un cliente y/o de un período.
+
+    Cada documento empieza con una portada, sigue con una factura por página (o más,
+    si el detalle es largo) y termina con un índice cuyas filas enlazan a la
+    página de cada factura. Las filas se leen de la base por lotes, así el
+    detalle de un mes completo nunca está entero en memoria.
+
+    FPDF arma cada documento entero en memoria antes de escribirlo, y ese armado
+    crece más rápido que la cantidad de páginas. Por eso un documento lleva como
+    máximo FACTURAS_POR_CONSOLIDADO facturas: si hay más, se escriben varias
+    partes (..._parte_1.pdf, ..._parte_2.pdf, ...), cada una con su portada e
+    índice, y la última cierra con el total general. Así la memoria queda acotada
+    por el tamaño de una parte y el tiempo crece en proporción a las facturas.
+
+    Parámetros:
+        cliente_id (int): ID del cliente, opcional.
+        desde (str): Fecha mínima inclusiva, opcional.
+        hasta (str): Fecha máxima inclusiva, opcional.
+        carpeta (str): Carpeta de destino.
+        al_avanzar (callable): Función opcional llamada como al_avanzar(hechas, total)
+            cada vez que se agrega una factura.
+
+    Retorna:
+        list[str]: Las rutas de los PDF generados, en orden (una sola si no hizo falta
+            partir el consolidado), o None si no hay facturas o hubo un error.
+    """
+    total = contar_facturas(desde, hasta, cliente_id)
+    if not total:
+        log_error(f"No hay facturas para consolidar → Cliente: {cliente_id}, Desde: {desde}, Hasta: {hasta}")
+        return None
+
+    nombre = ["consolidado"]
+    if cliente_id is not None:
+        nombre.append(f"cliente_{cliente_id}")
+    nombre += [fecha.replace(" ", "_").replace(":", "") for fecha in (desde, hasta) if fecha]
+    base = os.path.join(carpeta, "_".join(nombre))
+
+    cantidad_partes = -(-total // FACTURAS_POR_CONSOLIDADO)
+    encabezado = [
+        f"Cliente: {'ID ' + str(cliente_id) if cliente_id is not None else 'Todos'}",
+        f"Período: {desde or 'inicio'} a {hasta or 'hoy'}",
+        f"Cantidad de facturas: {total}",
+    ]
+    hechas = 0
+
+    def al_agregar() -> None:
+        nonlocal hechas
+        hechas += 1
+        if al_avanzar:
+            al_avanzar(hechas, total)
+
+    try:
+        # Se consolidan las facturas contadas; las que se registren mientras tanto quedan afuera
+        facturas = islice(groupby(iterar_detalles_ventas(cliente_id, desde, hasta), key=lambda fila: fila[0]), total)
+        if cantidad_partes == 1:
+            _escribir_parte_consolidado(f"{base}.pdf", facturas, encabezado, al_agregar=al_agregar)
+            rutas = [f"{base}.pdf"]
+        else:
+            rutas = []
+            importe = 0.0
+            for numero in range(1, cantidad_partes + 1):
+                primera = hechas + 1
+                ultima = min(hechas + FACTURAS_POR_CONSOLIDADO, total)
+                ruta = f"{base}_parte_{numero}.pdf"
+                _, importe_parte = _escribir_parte_consolidado(
+                    ruta, islice(facturas, FACTURAS_POR_CONSOLIDADO),
+                    encabezado + [f"Parte {numero} de {cantidad_partes}: facturas {primera} a {ultima}"],
+                    importe, numero == cantidad_partes, al_agregar)
+                importe += importe_parte
+                rutas.append(ruta)
+
+        log_info(f"PDF consolidado generado → Facturas: {hechas}, Archivos: {len(rutas)}, Ruta: {rutas[0]}")
+        return rutas
+
+    except Exception as e:
+        log_error(f"Error al generar el PDF consolidado: {e}")
+        return None
+
+
 def exportar_factura_interactivamente():
     """
     Permite al usuario exportar una factura a PDF de manera interactiva.
 
-    Muestra una lista de facturas, permite seleccionar el ID de la factura y genera el archivo PDF correspondiente.
+    Muestra las facturas de a una página, permite seleccionar el ID de la factura y genera el archivo PDF correspondiente.
     """
-    facturas = listar_facturas()
-    if not facturas:
-        mostrar_error("No hay facturas registradas.\n")
+    id_factura = seleccionar_factura_paginada("Ingresá el ID de la factura a exportar")
+    if id_factura is None:
         return
 
-    mostrar_facturas(facturas)
-
-    while True:
-        entrada = pedir_input_con_cancelacion("Ingresá el ID de la factura a exportar (C para cancelar): ")
-        if entrada.lower() == "c":
-            mostrar_cancelado("Ventas")
-            return
-        try:
-            id_factura = int(entrada)
-        except ValueError:
-            mostrar_error("El ID debe ser un número.")
-            continue
-        ids = []
-        for factura in facturas:
-            ids.append(factura[0])
-        if id_factura not in ids:
-            mostrar_error("El ID de factura no existe.")
-            continue
-        break
-
     resultado = generar_pdf_factura(id_factura)
     mostrar_exito(f"Factura guardada en: {resultado}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Exportación de facturas a PDF por lote")
+    parser.add_argument("--ids", help="IDs separados por coma, por ejemplo 1,2,3")
+    parser.add_argument("--desde", help="Fecha mínima inclusiva (YYYY-MM-DD)")
+    parser.add_argument("--hasta", help="Fecha máxima inclusiva (YYYY-MM-DD)")
+    parser.add_argument("--procesos", type=int, default=None, help="Procesos del pool (por defecto, uno por CPU)")
+    parser.add_argument("--carpeta", default=RUTA_FACTURAS, help="Carpeta de destino")
+    parser.add_argument("--consolidado", action="store_true", help="Generar un único PDF con todas las facturas")
+    parser.add_argument("--cliente", type=int, help="ID del cliente (solo con --consolidado)")
+    argumentos = parser.parse_args()
+    if argumentos.cliente is not None and not argumentos.consolidado:
+        parser.error("--cliente solo se puede usar junto con --consolidado")
+
+    ids = [int(valor) for valor in argumentos.ids.split(",")] if argumentos.ids else None
+
+    def mostrar_avance(hechas: int, total: int) -> None:
+        print(f"\rExportando facturas: {hechas}/{total}", end="", file=sys.stderr, flush=True)
+
+    if argumentos.consolidado:
+        rutas = generar_pdf_consolidado(argumentos.cliente, argumentos.desde, argumentos.hasta,
+                                        argumentos.carpeta, mostrar_avance)
+        print(file=sys.stderr)
+        if not rutas:
+            print("No se generó el PDF consolidado. Revisá registro.log.")
+            sys.exit(1)
+        for ruta in rutas:
+            print(f"PDF consolidado: {ruta}")
+        sys.exit(0)
+
+    resumen = exportar_facturas_lote(ids, argumentos.desde, argumentos.hasta, argumentos.procesos,
+                                     argumentos.carpeta, mostrar_avance)
+    print(file=sys.stderr)
+    print(f"Exportadas: {resumen['exportadas']} de {resumen['total']} (reutilizadas: {resumen['reutilizadas']}). "
+          f"Fallidas: {resumen['fallidas'] or 'ninguna'}")
+    print(f"Caché: {resumen['cache']['aciertos']} aciertos, {resumen['cache']['fallos']} fallos, "
+          f"tasa de aciertos {resumen['cache']['tasa_aciertos']:.0%}")
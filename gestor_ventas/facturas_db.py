@@ -4,7 +4,7 @@
 
 import sqlite3
 
-from db.data_base import obtener_conexion
+from db.data_base import conexion_db
 from core.logger import log_error
 
 def insertar_factura(fecha: str, cliente_id: int, total: float, conexion: sqlite3.Connection) -> int | None:
@@ -41,91 +41,228 @@ def insertar_factura(fecha: str, cliente_id: int, total: float, conexion: sqlite
         log_error(f"Error al insertar factura: {e}")
         return None
 
-def insertar_factura_detalle(factura_id: int, producto_id: int, cantidad: int, precio_unitario: float, total_linea: float, conexion: sqlite3.Connection):
+def descontar_stock_lote(lineas: list[dict], conexion: sqlite3.Connection) -> list[int] | None:
     """
-    Inserta un detalle de factura en la base de datos.
+    Descuenta el stock de todas las líneas de una venta de forma condicional.
+
+    Agrupa las cantidades por producto y ejecuta un único UPDATE ... WHERE
+    stock >= ? por producto. Si alguno no tenía stock suficiente, el llamador
+    debe revertir la transacción.
 
     Parámetros:
-        factura_id (int): El ID de la factura a la que pertenece el detalle.
-        producto_id (int): El ID del producto en la factura.
-        cantidad (int): La cantidad de productos en el detalle.
-        precio_unitario (float): El precio unitario del producto.
-        total_linea (float): El total de la línea de factura (cantidad * precio unitario).
-        conexion (sqlite3.Connection): Conexión a la base de datos.
+        lineas (list[dict]): Líneas con las claves producto_id y cantidad.
+        conexion (sqlite3.Connection): Conexión con la transacción de la venta.
+
+    Retorna:
+        list[int]: IDs de los productos sin stock suficiente (vacía si se descontó
+            el stock de todos), o None si hubo un error de base de datos.
     """
+    cantidades = {}
+    for linea in lineas:
+        cantidades[linea["producto_id"]] = cantidades.get(linea["producto_id"], 0) + linea["cantidad"]
+
     try:
         cursor = conexion.cursor()
+        sin_stock = [
+            producto_id for producto_id, cantidad in cantidades.items()
+            if cursor.execute("UPDATE productos SET stock = stock - ? WHERE id_producto = ? AND stock >= ?",
+                              (cantidad, producto_id, cantidad)).rowcount != 1
+        ]
+        if sin_stock:
+            log_error(f"Stock insuficiente al descontar: productos {sin_stock}")
+        return sin_stock
+    except sqlite3.Error as e:
+        log_error(f"Error al descontar stock: {e}")
+        return None
 
-        # Obtener datos congelados del producto, categoría y proveedor
-        cursor.execute("""
-            SELECT p.nombre, c.nombre, pr.nombre
+def insertar_detalles_factura(factura_id: int, lineas: list[dict], conexion: sqlite3.Connection) -> list[int] | None:
+    """
+    Inserta todas las líneas de una factura y descuenta su stock en lote.
+
+    Obtiene en una sola consulta los nombres congelados de producto, categoría y
+    proveedor de todas las líneas, y escribe el detalle y los descuentos de stock
+    con executemany dentro de la transacción del llamador (no hace commit).
+    El stock se descuenta con descontar_stock_lote(), que falla si no alcanza.
+
+    Parámetros:
+        factura_id (int): El ID de la factura a la que pertenecen las líneas.
+        lineas (list[dict]): Líneas con las claves producto_id, cantidad,
+            precio_unitario y total_linea.
+        conexion (sqlite3.Connection): Conexión con la transacción de la venta.
+
+    Retorna:
+        list[int]: IDs de los productos sin stock suficiente (vacía si se insertaron
+            todas las líneas y se descontó el stock), o None si hubo un error de base
+            de datos o faltan el producto, la categoría o el proveedor de alguna línea.
+    """
+    ids = list(dict.fromkeys(linea["producto_id"] for linea in lineas))
+    marcadores = ", ".join("?" for _ in ids)
+    try:
+        cursor = conexion.cursor()
+
+        # Obtener datos congelados de todos los productos, categorías y proveedores
+        cursor.execute(f"""
+            SELECT p.id_producto, p.nombre, c.nombre, pr.nombre
             FROM productos p
             JOIN categorias c ON p.categoria_id = c.id_categoria
             JOIN proveedores pr ON p.proveedor_id = pr.id_proveedor
-            WHERE p.id_producto = ?
-        """, (producto_id,))
-        resultado = cursor.fetchone()
-        if not resultado:
-            raise ValueError("Producto, categoría o proveedor no encontrados.")
-        producto_nombre, categoria_nombre, proveedor_nombre = resultado
+            WHERE p.id_producto IN ({marcadores})
+        """, ids)
+        nombres = {}
+        for id_producto, producto_nombre, categoria_nombre, proveedor_nombre in cursor.fetchall():
+            nombres[id_producto] = (producto_nombre, categoria_nombre, proveedor_nombre)
 
-        cursor.execute("""
+        faltantes = [pid for pid in ids if pid not in nombres]
+        if faltantes:
+            log_error(f"Error al insertar detalle de factura: productos, categorías o proveedores no encontrados {faltantes}")
+            return None
+
+        cursor.executemany("""
             INSERT INTO factura_detalle (
                 factura_id, producto_id, cantidad, precio_unitario, total_linea,
                 nombre_producto, nombre_categoria, nombre_proveedor
             )
             VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            factura_id, producto_id, cantidad, precio_unitario, total_linea,
-            producto_nombre, categoria_nombre, proveedor_nombre
-        ))
+        """, [
+            (
+                factura_id, linea["producto_id"], linea["cantidad"], linea["precio_unitario"],
+                linea["total_linea"], *nombres[linea["producto_id"]]
+            )
+            for linea in lineas
+        ])
+
+        return descontar_stock_lote(lineas, conexion)
     except sqlite3.Error as e:
         log_error(f"Error al insertar detalle de factura: {e}")
         return None
 
-def descontar_stock(producto_id: int, cantidad: int, conexion: sqlite3.Connection):
+def listar_facturas() -> list:
     """
-    Descuenta la cantidad de un producto en el inventario.
+    Retorna todas las facturas registradas en la base de datos.
 
-    Parámetros:
-        producto_id (int): El ID del producto al que se le va a descontar stock.
-        cantidad (int): La cantidad de productos a descontar del inventario.
-        conexion (sqlite3.Connection): Conexión a la base de datos.
+    Retorna:
+        list: Lista de tuplas con los detalles de las facturas.
     """
     try:
-        cursor = conexion.cursor()
-        cursor.execute("""
-            UPDATE productos SET stock = stock - ? WHERE id_producto = ?
-        """, (cantidad, producto_id))
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute("""
+                SELECT 
+                    f.id_factura,
+                    f.fecha,
+                    f.nombre_cliente,
+                    f.total 
+                FROM facturas f
+                ORDER BY fecha DESC
+            """)
+            return cursor.fetchall()
     except sqlite3.Error as e:
-        log_error(f"Error al descontar stock: {e}")
+        log_error(f"Error al listar facturas: {e}")
+        return []
 
-def listar_facturas() -> list:
+def _normalizar_hasta(hasta: str | None) -> str | None:
     """
-    Retorna todas las facturas registradas en la base de datos.
+    Vuelve inclusiva una fecha límite sin hora ('YYYY-MM-DD' → hasta el final del día).
+    """
+    if hasta and len(hasta) == 10:
+        return f"{hasta} 23:59:59"
+    return hasta
+
+def listar_facturas_pagina(tamanio: int = 50, despues_de: tuple = None, desde: str = None, hasta: str = None) -> list:
+    """
+    Retorna una página de facturas ordenadas de la más reciente a la más antigua.
+
+    Usa paginación por clave (fecha, id_factura) sobre el índice de fecha, así el
+    costo de cada página no depende de cuántas páginas se recorrieron antes.
+
+    Parámetros:
+        tamanio (int): Cantidad máxima de facturas de la página.
+        despues_de (tuple): (fecha, id_factura) de la última factura de la página
+            anterior, o None para la primera página.
+        desde (str): Fecha mínima inclusiva ('YYYY-MM-DD' o con hora), opcional.
+        hasta (str): Fecha máxima inclusiva ('YYYY-MM-DD' o con hora), opcional.
 
     Retorna:
-        list: Lista de tuplas con los detalles de las facturas.
+        list: Tuplas (id_factura, fecha, nombre_cliente, total), como listar_facturas().
     """
+    condiciones = []
+    parametros = []
+    if despues_de is not None:
+        condiciones.append("(f.fecha, f.id_factura) < (?, ?)")
+        parametros.extend(despues_de)
+    if desde:
+        condiciones.append("f.fecha >= ?")
+        parametros.append(desde)
+    if hasta:
+        condiciones.append("f.fecha <= ?")
+        parametros.append(_normalizar_hasta(hasta))
+    filtro = f"WHERE {' AND '.join(condiciones)}" if condiciones else ""
+    parametros.append(tamanio)
+
     try:
-        conexion = obtener_conexion()
-        cursor = conexion.cursor()
-        cursor.execute("""
-            SELECT 
-                f.id_factura,
-                f.fecha,
-                f.nombre_cliente,
-                f.total 
-            FROM facturas f
-            ORDER BY fecha DESC
-        """)
-        return cursor.fetchall()
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute(f"""
+                SELECT
+                    f.id_factura,
+                    f.fecha,
+                    f.nombre_cliente,
+                    f.total
+                FROM facturas f
+                {filtro}
+                ORDER BY f.fecha DESC, f.id_factura DESC
+                LIMIT ?
+            """, parametros)
+            return cursor.fetchall()
     except sqlite3.Error as e:
-        log_error(f"Error al listar facturas: {e}")
+        log_error(f"Error al listar página de facturas: {e}")
         return []
-    finally:
-        if conexion:
-            conexion.close()
+
+def iterar_facturas(tamanio_pagina: int = 500, desde: str = None, hasta: str = None):
+    """
+    Recorre todas las facturas (de la más reciente a la más antigua) página por página.
+
+    Solo mantiene una página en memoria a la vez.
+
+    Parámetros:
+        tamanio_pagina (int): Facturas leídas por consulta.
+        desde (str): Fecha mínima inclusiva, opcional.
+        hasta (str): Fecha máxima inclusiva, opcional.
+
+    Retorna:
+        generator: Tuplas (id_factura, fecha, nombre_cliente, total).
+    """
+    despues_de = None
+    while True:
+        pagina = listar_facturas_pagina(tamanio_pagina, despues_de, desde, hasta)
+        yield from pagina
+        if len(pagina) < tamanio_pagina:
+            return
+        ultima = pagina[-1]
+        despues_de = (ultima[1], ultima[0])
+
+def obtener_factura_por_id(id_factura: int):
+    """
+    Devuelve los datos principales de una factura mediante una búsqueda por clave primaria.
+
+    Parámetros:
+        id_factura (int): El ID de la factura a consultar.
+
+    Retorna:
+        tuple: (id_factura, fecha, nombre_cliente, total) si existe, None si no existe.
+    """
+    try:
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute("""
+                SELECT id_factura, fecha, nombre_cliente, total
+                FROM facturas
+                WHERE id_factura = ?
+            """, (id_factura,))
+            return cursor.fetchone()
+    except sqlite3.Error as e:
+        log_error(f"Error al consultar factura por ID: {e}")
+        return None
 
 def obtener_detalle_venta(id_factura: int) -> list:
     """
@@ -138,31 +275,202 @@ def obtener_detalle_venta(id_factura: int) -> list:
         list: Detalles de la factura y sus productos asociados.
     """
     try:
-        conexion = obtener_conexion()
-        cursor = conexion.cursor()
-        cursor.execute("""
-            SELECT 
-                f.id_factura,
-                f.fecha,
-                f.cliente_id,
-                f.nombre_cliente,
-                f.email_cliente,
-                f.dni_cliente,
-                fd.producto_id,
-                fd.nombre_producto,
-                fd.nombre_categoria,
-                fd.cantidad,
-                fd.precio_unitario,
-                fd.total_linea,
-                f.total
-            FROM facturas f
-            JOIN factura_detalle fd ON fd.factura_id = f.id_factura
-            WHERE f.id_factura = ?
-        """, (id_factura,))
-        return cursor.fetchall()
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute("""
+                SELECT 
+                    f.id_factura,
+                    f.fecha,
+                    f.cliente_id,
+                    f.nombre_cliente,
+                    f.email_cliente,
+                    f.dni_cliente,
+                    fd.producto_id,
+                    fd.nombre_producto,
+                    fd.nombre_categoria,
+                    fd.cantidad,
+                    fd.precio_unitario,
+                    fd.total_linea,
+                    f.total
+                FROM facturas f
+                JOIN factura_detalle fd ON fd.factura_id = f.id_factura
+                WHERE f.id_factura = ?
+            """, (id_factura,))
+            return cursor.fetchall()
     except sqlite3.Error as e:
         log_error(f"Error al obtener detalle de venta: {e}")
         return []
-    finally:
-        if conexion:
-            conexion.close()
+
+def obtener_detalles_ventas(ids_facturas: list[int]) -> dict:
+    """
+    Obtiene el detalle de varias facturas en una sola consulta.
+
+    Devuelve las filas con la misma forma que obtener_detalle_venta(), agrupadas
+    por factura; pensada para exportaciones por lote.
+
+    Parámetros:
+        ids_facturas (list[int]): IDs de las facturas a consultar.
+
+    Retorna:
+        dict: ID de factura → lista de filas de detalle. Las facturas inexistentes no aparecen.
+    """
+    if not ids_facturas:
+        return {}
+
+    marcadores = ", ".join("?" for _ in ids_facturas)
+    try:
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute(f"""
+                SELECT 
+                    f.id_factura,
+                    f.fecha,
+                    f.cliente_id,
+                    f.nombre_cliente,
+                    f.email_cliente,
+                    f.dni_cliente,
+                    fd.producto_id,
+                    fd.nombre_producto,
+                    fd.nombre_categoria,
+                    fd.cantidad,
+                    fd.precio_unitario,
+                    fd.total_linea,
+                    f.total
+                FROM facturas f
+                JOIN factura_detalle fd ON fd.factura_id = f.id_factura
+                WHERE f.id_factura IN ({marcadores})
+                ORDER BY f.id_factura, fd.id_detalle
+            """, list(ids_facturas))
+            detalles = {}
+            for fila in cursor.fetchall():
+                detalles.setdefault(fila[0], []).append(fila)
+            return detalles
+    except sqlite3.Error as e:
+        log_error(f"Error al obtener detalles de ventas: {e}")
+        return {}
+
+def _filtro_facturas(cliente_id: int = None, desde: str = None, hasta: str = None, alias: str = "") -> tuple[str, list]:
+    """
+    Arma la cláusula WHERE (y sus parámetros) para filtrar facturas por cliente y rango de fechas.
+    """
+    prefijo = f"{alias}." if alias else ""
+    condiciones = []
+    parametros = []
+    if cliente_id is not None:
+        condiciones.append(f"{prefijo}cliente_id = ?")
+        parametros.append(cliente_id)
+    if desde:
+        condiciones.append(f"{prefijo}fecha >= ?")
+        parametros.append(desde)
+    if hasta:
+        condiciones.append(f"{prefijo}fecha <= ?")
+        parametros.append(_normalizar_hasta(hasta))
+    filtro = f"WHERE {' AND '.join(condiciones)}" if condiciones else ""
+    return filtro, parametros
+
+def contar_facturas(desde: str = None, hasta: str = None, cliente_id: int = None) -> int:
+    """
+    Cuenta las facturas, opcionalmente de un cliente y dentro de un rango de fechas inclusivo.
+
+    Parámetros:
+        desde (str): Fecha mínima inclusiva, opcional.
+        hasta (str): Fecha máxima inclusiva, opcional.
+        cliente_id (int): ID del cliente, opcional.
+
+    Retorna:
+        int: Cantidad de facturas (0 si hubo un error).
+    """
+    filtro, parametros = _filtro_facturas(cliente_id, desde, hasta)
+
+    try:
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute(f"SELECT COUNT(*) FROM facturas {filtro}", parametros)
+            return cursor.fetchone()[0]
+    except sqlite3.Error as e:
+        log_error(f"Error al contar facturas: {e}")
+        return 0
+
+def listar_detalles_ventas_lote(cliente_id: int = None, desde: str = None, hasta: str = None,
+                                despues_de: tuple = None, tamanio_lote: int = 500) -> list:
+    """
+    Retorna un lote de filas de detalle de facturas, ordenadas por fecha, factura y línea.
+
+    Usa paginación por clave (fecha, id_factura, id_detalle): cada lote es una
+    consulta independiente que arranca después de la última fila del anterior.
+
+    Parámetros:
+        cliente_id (int): ID del cliente, opcional.
+        desde (str): Fecha mínima inclusiva, opcional.
+        hasta (str): Fecha máxima inclusiva, opcional.
+        despues_de (tuple): (fecha, id_factura, id_detalle) de la última fila del
+            lote anterior, o None para el primero.
+        tamanio_lote (int): Cantidad máxima de filas del lote.
+
+    Retorna:
+        list: Filas con la forma de obtener_detalle_venta() más el id_detalle al final.
+    """
+    filtro, parametros = _filtro_facturas(cliente_id, desde, hasta, alias="f")
+    if despues_de is not None:
+        filtro = f"{filtro} AND " if filtro else "WHERE "
+        filtro += "(f.fecha, f.id_factura, fd.id_detalle) > (?, ?, ?)"
+        parametros.extend(despues_de)
+    parametros.append(tamanio_lote)
+
+    try:
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute(f"""
+                SELECT 
+                    f.id_factura,
+                    f.fecha,
+                    f.cliente_id,
+                    f.nombre_cliente,
+                    f.email_cliente,
+                    f.dni_cliente,
+                    fd.producto_id,
+                    fd.nombre_producto,
+                    fd.nombre_categoria,
+                    fd.cantidad,
+                    fd.precio_unitario,
+                    fd.total_linea,
+                    f.total,
+                    fd.id_detalle
+                FROM facturas f
+                JOIN factura_detalle fd ON fd.factura_id = f.id_factura
+                {filtro}
+                ORDER BY f.fecha, f.id_factura, fd.id_detalle
+                LIMIT ?
+            """, parametros)
+            return cursor.fetchall()
+    except sqlite3.Error as e:
+        log_error(f"Error al listar lote de detalles de ventas: {e}")
+        return []
+
+def iterar_detalles_ventas(cliente_id: int = None, desde: str = None, hasta: str = None, tamanio_lote: int = 500):
+    """
+    Recorre el detalle de muchas facturas lote por lote (ver listar_detalles_ventas_lote()).
+
+    Las filas tienen la forma de obtener_detalle_venta() y salen ordenadas por fecha,
+    factura y línea, así las de una misma factura quedan contiguas. Solo mantiene un
+    lote de filas en memoria a la vez, y la conexión del pool se devuelve después de
+    leer cada lote, no queda tomada mientras quien recorre procesa las filas.
+
+    Parámetros:
+        cliente_id (int): ID del cliente, opcional.
+        desde (str): Fecha mínima inclusiva, opcional.
+        hasta (str): Fecha máxima inclusiva, opcional.
+        tamanio_lote (int): Filas leídas por consulta.
+
+    Retorna:
+        generator: Filas de detalle.
+    """
+    despues_de = None
+    while True:
+        lote = listar_detalles_ventas_lote(cliente_id, desde, hasta, despues_de, tamanio_lote)
+        for fila in lote:
+            yield fila[:-1]
+        if len(lote) < tamanio_lote:
+            return
+        ultima = lote[-1]
+        despues_de = (ultima[1], ultima[0], ultima[-1])
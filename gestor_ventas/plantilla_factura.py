@@ -0,0 +1,311 @@
+# Módulo de plantilla de facturas PDF
+# Describe el diseño de la factura de forma declarativa (textos, fuentes, anchos de columna)
+# y lo compila una sola vez: se miden los textos fijos y se calcula dónde va cada línea
+# del encabezado, cada título y columna de la tabla, el pie y hasta dónde llegan las
+# filas en cada hoja. Al dibujar una factura solo se escriben textos y rectángulos en esas
+# posiciones con la API pública de FPDF (text(), rect(), line()), sin el cálculo de
+# cell() por cada celda. DocumentoFactura repite el encabezado de la empresa (y el de
+# la tabla, si una tabla quedó cortada) en header() y escribe el pie con el número de
+# hoja en footer(). Los anchos de los textos variables se miden una sola vez por
+# fuente y texto, compartidos entre documentos.
+
+from fpdf import FPDF
+
+# Nombre de cada posición de una fila de obtener_detalle_venta()
+CAMPOS_DETALLE = (
+    "id_factura", "fecha", "cliente_id", "nombre_cliente", "email", "dni",
+    "producto_id", "producto", "categoria", "cantidad", "precio_unitario", "total_linea", "total",
+)
+
+# Diseño de la factura. Cada texto es (estilo, tamaño, ancho, alto, texto, alineación);
+# los de "titulo" y "datos" se completan con str.format() sobre CAMPOS_DETALLE.
+# Subir "version" al cambiar el diseño invalida los PDF guardados en la caché.
+PLANTILLA_FACTURA = {
+    "version": 3,
+    "fuente": "Arial",
+    "margen_inferior": 15,
+    "encabezado": [
+        ("B", 16, 190, 10, "Electro Mundo S.A.", "C"),
+        ("", 10, 190, 6, "CUIT: 30-12345678-9 | contacto@gestionavanzada.com", "C"),
+        ("", 10, 190, 6, "Av. Siempre Viva 123, CABA | Tel: (011) 4567-8910", "C"),
+    ],
+    "espacio_encabezado": 4,
+    "titulo": ("B", 14, 190, 10, "FACTURA Nº {id_factura}", "C"),
+    "datos": [
+        ("", 11, 190, 8, "Fecha: {fecha}", ""),
+        ("", 11, 190, 8, "Cliente: {nombre_cliente} (ID: {cliente_id})", ""),
+        ("", 11, 190, 8, "Email: {email}", ""),
+        ("", 11, 190, 8, "DNI: {dni}", ""),
+    ],
+    "espacio_tabla": 5,
+    "titulo_tabla": ("B", 12, 0, 8, "Detalle de Productos", ""),
+    "encabezado_tabla": ("B", 10, (230, 230, 230)),
+    # (título, ancho, alineación, campo, formato del valor)
+    "columnas": [
+        ("Producto", 50, "", "producto", "{}"),
+        ("Categoría", 40, "", "categoria", "{}"),
+        ("Cantidad", 25, "C", "cantidad", "{}"),
+        ("Precio Unit.", 35, "R", "precio_unitario", "${:.2f}"),
+        ("Subtotal", 40, "R", "total_linea", "${:.2f}"),
+    ],
+    # (estilo, tamaño, alto de fila)
+    "filas": ("", 10, 8),
+    "espacio_total": 4,
+    # (texto, ancho de la etiqueta, ancho del valor, alto, tamaño)
+    "total": ("TOTAL FACTURA:", 150, 40, 8, 12),
+    # (estilo, tamaño, alto, texto)
+    "pie": ("", 8, 6, "Electro Mundo S.A. - Gracias por su compra"),
+}
+
+
+class DocumentoFactura(FPDF):
+    """
+    Documento FPDF que aplica el encabezado y el pie de una plantilla compilada.
+
+    Las páginas que no son de una factura (por ejemplo, la portada y el índice
+    del PDF consolidado) quedan sin encabezado ni pie.
+    """
+
+    def __init__(self, plantilla: "PlantillaCompilada"):
+        super().__init__()
+        self.set_auto_page_break(auto=True, margin=plantilla.plantilla["margen_inferior"])
+        self.plantilla = plantilla
+        self.factura = None
+        self.primera_hoja = 0
+        self.en_tabla = False
+        self._pie = None
+
+    def header(self):
+        # El pie de esta página se decide acá: footer() se llama recién al
+        # empezar la página siguiente, cuando ya puede haber otra factura en curso.
+        if self.factura is None:
+            self._pie = None
+            return
+        self._pie = (self.factura, self.page - self.primera_hoja + 1)
+        self.plantilla.dibujar_encabezado(self)
+        if self.en_tabla:
+            self.plantilla.dibujar_encabezado_tabla(self, self.plantilla.y_tabla_siguientes, False)
+
+    def footer(self):
+        if self._pie is not None:
+            self.plantilla.dibujar_pie(self, *self._pie)
+
+    def get_string_width(self, s):
+        """
+        Ancho de un texto con la fuente actual, medido una sola vez por fuente y
+        texto para todos los documentos de la plantilla.
+        """
+        anchos = self.plantilla.anchos_texto
+        clave = (self.font_family, self.font_style, self.font_size_pt, s)
+        ancho = anchos.get(clave)
+        if ancho is None:
+            if len(anchos) > 50_000:
+                anchos.clear()
+            ancho = anchos[clave] = super().get_string_width(s)
+        return ancho
+
+
+class PlantillaCompilada:
+    """
+    Versión compilada de PLANTILLA_FACTURA, lista para dibujar facturas.
+
+    Al compilar se mide cada texto fijo y se calcula la posición de todo lo que
+    no depende de la factura: las líneas del encabezado, los títulos de la
+    tabla, el pie, la columna de cada campo y cuántas filas entran en cada hoja.
+    Al dibujar solo quedan text() y rect() en esas posiciones; las filas se
+    parten entre hojas con las mismas cuentas que el salto automático de FPDF.
+    """
+
+    def __init__(self, plantilla: dict):
+        self.plantilla = plantilla
+        self.version = plantilla["version"]
+        self.fuente = plantilla["fuente"]
+        self.anchos_texto = {}
+
+        # Un documento sin páginas alcanza para medir: da los márgenes y las fuentes
+        medidor = FPDF()
+        self.k = medidor.k
+        self.margen = medidor.l_margin
+        self.margen_celda = medidor.c_margin
+        self.ancho_util = medidor.w - medidor.l_margin - medidor.r_margin
+        self.limite_hoja = medidor.h - plantilla["margen_inferior"]
+
+        # ENCABEZADO (textos fijos, desde el margen superior de cada hoja)
+        y = medidor.t_margin
+        self.encabezado = []
+        for estilo, tamanio, ancho, alto, texto, alineacion in plantilla["encabezado"]:
+            medidor.set_font(self.fuente, estilo, tamanio)
+            x = self._x_texto(self.margen, ancho, medidor.get_string_width(texto), alineacion)
+            self.encabezado.append((estilo, tamanio, x, self._linea_base(y, alto, tamanio), texto))
+            y += alto
+        self.y_tabla_siguientes = y + plantilla["espacio_encabezado"]
+
+        # DATOS FACTURA (posiciones fijas; el texto se completa en cada factura)
+        y = self.y_tabla_siguientes
+        self.datos = []
+        for estilo, tamanio, ancho, alto, texto, alineacion in [plantilla["titulo"], *plantilla["datos"]]:
+            self.datos.append((estilo, tamanio, *self._anclaje(self.margen, ancho, alineacion),
+                               self._linea_base(y, alto, tamanio), texto))
+            y += alto
+        self.y_tabla = y + plantilla["espacio_tabla"]
+
+        # ENCABEZADO TABLA (relativo al comienzo de la tabla)
+        estilo, tamanio, ancho, alto, texto, alineacion = plantilla["titulo_tabla"]
+        medidor.set_font(self.fuente, estilo, tamanio)
+        ancho = ancho or self.ancho_util
+        self.titulo_tabla = (estilo, tamanio, self._x_texto(self.margen, ancho, medidor.get_string_width(texto), alineacion),
+                             self._linea_base(0, alto, tamanio), texto)
+        self.alto_titulo_tabla = alto
+
+        self.estilo_filas, self.tamanio_filas, self.alto_fila = plantilla["filas"]
+        self.estilo_encabezado_tabla, self.tamanio_encabezado_tabla, self.relleno = plantilla["encabezado_tabla"]
+        medidor.set_font(self.fuente, self.estilo_encabezado_tabla, self.tamanio_encabezado_tabla)
+        self.base_encabezado_tabla = self._linea_base(0, self.alto_fila, self.tamanio_encabezado_tabla)
+        self.encabezado_tabla = []
+        self.columnas = []
+        self.divisiones = []
+        x = self.margen
+        for titulo, ancho, alineacion, campo, formato in plantilla["columnas"]:
+            self.encabezado_tabla.append(
+                (x, ancho, self._x_texto(x, ancho, medidor.get_string_width(titulo), alineacion), titulo))
+            self.columnas.append((*self._anclaje(x, ancho, alineacion), CAMPOS_DETALLE.index(campo), formato))
+            x += ancho
+            self.divisiones.append(x)
+        self.ancho_tabla = x - self.margen
+        self.divisiones.pop()
+        self.base_filas = self._linea_base(0, self.alto_fila, self.tamanio_filas)
+
+        # PIE (a una altura fija; solo el número de hoja cambia)
+        estilo, tamanio, alto, texto = plantilla["pie"]
+        medidor.set_font(self.fuente, estilo, tamanio)
+        self.pie = (estilo, tamanio, self.margen + self.margen_celda,
+                    self._linea_base(medidor.h - plantilla["margen_inferior"] + 3, alto, tamanio), texto)
+        self.ancla_numero_pie = self._anclaje(self.margen, self.ancho_util, "R")[0]
+
+    def _linea_base(self, y: float, alto: float, tamanio: float) -> float:
+        # Misma línea base que FPDF.cell() para un texto en una celda de ese alto
+        return y + 0.5 * alto + 0.3 * tamanio / self.k
+
+    def _anclaje(self, x: float, ancho: float, alineacion: str) -> tuple:
+        # Mismo margen y alineación que FPDF.cell(): el texto empieza en
+        # ancla - proporcion * su ancho
+        if alineacion == "R":
+            return x + ancho - self.margen_celda, 1
+        if alineacion == "C":
+            return x + ancho / 2, 0.5
+        return x + self.margen_celda, 0
+
+    def _x_texto(self, x: float, ancho: float, ancho_texto: float, alineacion: str) -> float:
+        ancla, proporcion = self._anclaje(x, ancho, alineacion)
+        return ancla - proporcion * ancho_texto
+
+    def nuevo_documento(self) -> DocumentoFactura:
+        """
+        Crea un documento vacío preparado para dibujar facturas con esta plantilla.
+
+        Retorna:
+            DocumentoFactura: El documento, con el salto de página automático configurado.
+        """
+        return DocumentoFactura(self)
+
+    def dibujar_encabezado(self, pdf: FPDF) -> None:
+        for estilo, tamanio, x, y, texto in self.encabezado:
+            pdf.set_font(self.fuente, estilo, tamanio)
+            pdf.text(x, y, texto)
+        # Lo que siga en la hoja (por ejemplo, un total cortado por el salto automático) va debajo
+        pdf.set_y(self.y_tabla_siguientes)
+
+    def dibujar_encabezado_tabla(self, pdf: FPDF, y: float, con_titulo: bool) -> float:
+        """
+        Dibuja el encabezado de la tabla de productos y devuelve dónde empieza la primera fila.
+        """
+        if con_titulo:
+            estilo, tamanio, x, base, texto = self.titulo_tabla
+            pdf.set_font(self.fuente, estilo, tamanio)
+            pdf.text(x, y + base, texto)
+            y += self.alto_titulo_tabla
+        pdf.set_fill_color(*self.relleno)
+        pdf.set_font(self.fuente, self.estilo_encabezado_tabla, self.tamanio_encabezado_tabla)
+        base = y + self.base_encabezado_tabla
+        for x, ancho, x_texto, titulo in self.encabezado_tabla:
+            pdf.rect(x, y, ancho, self.alto_fila, "DF")
+            pdf.text(x_texto, base, titulo)
+        return y + self.alto_fila
+
+    def dibujar_pie(self, pdf: FPDF, id_factura: int, hoja: int) -> None:
+        estilo, tamanio, x, y, texto = self.pie
+        pdf.set_font(self.fuente, estilo, tamanio)
+        pdf.text(x, y, texto)
+        numero = f"Factura Nº {id_factura} - Hoja {hoja}"
+        pdf.text(self.ancla_numero_pie - pdf.get_string_width(numero), y, numero)
+
+    def _dibujar_divisiones(self, pdf: FPDF, desde: float, hasta: float) -> None:
+        # Líneas verticales entre columnas para las filas de una hoja; el contorno
+        # de cada fila ya lo dibuja su rect()
+        for x in self.divisiones:
+            pdf.line(x, desde, x, hasta)
+
+    def dibujar(self, pdf: DocumentoFactura, id_factura: int, detalle: list) -> None:
+        """
+        Dibuja una factura en el documento, a partir de una página nueva.
+
+        Parámetros:
+            pdf (DocumentoFactura): Documento creado con nuevo_documento().
+            id_factura (int): El ID de la factura.
+            detalle (list): Filas con la forma de obtener_detalle_venta().
+        """
+        campos = dict(zip(CAMPOS_DETALLE, detalle[0]))
+        campos["id_factura"] = id_factura
+
+        pdf.factura = id_factura
+        pdf.primera_hoja = pdf.page + 1
+        pdf.add_page()
+
+        # DATOS FACTURA
+        for estilo, tamanio, ancla, proporcion, y, texto in self.datos:
+            pdf.set_font(self.fuente, estilo, tamanio)
+            texto = texto.format(**campos)
+            pdf.text(ancla - proporcion * pdf.get_string_width(texto) if proporcion else ancla, y, texto)
+
+        # TABLA PRODUCTOS (header() repite su encabezado en cada hoja nueva)
+        y = inicio = self.dibujar_encabezado_tabla(pdf, self.y_tabla, True)
+        pdf.set_font(self.fuente, self.estilo_filas, self.tamanio_filas)
+        pdf.en_tabla = True
+        for fila in detalle:
+            if y + self.alto_fila > self.limite_hoja:
+                self._dibujar_divisiones(pdf, inicio, y)
+                pdf.add_page()
+                y = inicio = self.y_tabla_siguientes + self.alto_fila
+            pdf.rect(self.margen, y, self.ancho_tabla, self.alto_fila)
+            base = y + self.base_filas
+            for ancla, proporcion, indice, formato in self.columnas:
+                texto = formato.format(fila[indice])
+                pdf.text(ancla - proporcion * pdf.get_string_width(texto) if proporcion else ancla, base, texto)
+            y += self.alto_fila
+        self._dibujar_divisiones(pdf, inicio, y)
+        pdf.en_tabla = False
+
+        # TOTAL (con cell(): si no entra en la hoja, la corta el salto automático)
+        texto, ancho_etiqueta, ancho_valor, alto, tamanio = self.plantilla["total"]
+        pdf.set_y(y + self.plantilla["espacio_total"])
+        pdf.set_font(self.fuente, "B", tamanio)
+        pdf.cell(ancho_etiqueta, alto, texto, align="R")
+        pdf.set_font(self.fuente, "", tamanio)
+        pdf.cell(ancho_valor, alto, f"${campos['total']:.2f}", ln=True, align="R")
+        pdf.factura = None
+
+
+_compilada = None
+
+
+def obtener_plantilla() -> PlantillaCompilada:
+    """
+    Devuelve la plantilla de factura compilada, compilándola la primera vez.
+
+    Retorna:
+        PlantillaCompilada: La plantilla lista para dibujar.
+    """
+    global _compilada
+    if _compilada is None:
+        _compilada = PlantillaCompilada(PLANTILLA_FACTURA)
+    return _compilada
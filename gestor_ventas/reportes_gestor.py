@@ -0,0 +1,199 @@
+# Módulo de reportes de ventas
+# Este módulo muestra por consola los reportes mensuales de ventas (por categoría, día,
+# producto y cliente), que se leen de las tablas de resúmenes sin recorrer las facturas,
+# y el ranking de productos y clientes de cualquier período.
+
+import calendar
+from datetime import date, datetime
+
+from gestor_ventas.resumen_ventas_db import (
+    ventas_por_categoria, ventas_por_dia, ventas_por_producto, ventas_por_cliente, reconstruir_resumenes
+)
+from gestor_ventas.analitica_ventas import top_productos, top_clientes
+from interfaz.mostrar_resumen import mostrar_reporte_ventas
+from interfaz.diseño_interfaz import mostrar_error, mostrar_exito, mostrar_cancelado
+from interfaz.diseño_interfaz import pedir_input_con_cancelacion
+
+def pedir_mes() -> str | None:
+    """
+    Pide al usuario el mes del reporte.
+
+    Retorna:
+        str: El mes en formato 'YYYY-MM' (el actual si no se ingresa nada), o None si se cancela.
+    """
+    while True:
+        entrada = pedir_input_con_cancelacion("Ingresá el mes (AAAA-MM, Enter para el mes actual, C para cancelar): ")
+        if entrada.lower() == "c":
+            mostrar_cancelado("Reportes de ventas")
+            return None
+        if not entrada:
+            return date.today().strftime("%Y-%m")
+
+        partes = entrada.split("-")
+        if len(partes) != 2 or not all(p.isdigit() for p in partes) or not 1 <= int(partes[1]) <= 12:
+            mostrar_error("El mes debe tener el formato AAAA-MM, por ejemplo 2025-03.")
+            continue
+        return f"{int(partes[0]):04d}-{int(partes[1]):02d}"
+
+def pedir_fecha(mensaje: str) -> str | None:
+    """
+    Pide una fecha opcional al usuario.
+
+    Parámetros:
+        mensaje (str): Texto del pedido, por ejemplo "Desde".
+
+    Retorna:
+        str: La fecha 'YYYY-MM-DD', "" si no se ingresa nada (sin límite), o None si se cancela.
+    """
+    while True:
+        entrada = pedir_input_con_cancelacion(f"{mensaje} (AAAA-MM-DD, Enter para no limitar, C para cancelar): ")
+        if entrada.lower() == "c":
+            mostrar_cancelado("Ventas")
+            return None
+        if not entrada:
+            return ""
+        try:
+            return datetime.strptime(entrada, "%Y-%m-%d").strftime("%Y-%m-%d")
+        except ValueError:
+            mostrar_error("La fecha debe tener el formato AAAA-MM-DD, por ejemplo 2025-03-15.")
+
+def rango_del_mes(mes: str) -> tuple[str, str]:
+    """
+    Devuelve el primer y el último día de un mes.
+
+    Parámetros:
+        mes (str): Mes en formato 'YYYY-MM'.
+
+    Retorna:
+        tuple[str, str]: Fechas 'YYYY-MM-DD' de inicio y fin del mes.
+    """
+    anio, numero = int(mes[:4]), int(mes[5:7])
+    ultimo_dia = calendar.monthrange(anio, numero)[1]
+    return f"{mes}-01", f"{mes}-{ultimo_dia:02d}"
+
+def reporte_mes_por_categoria():
+    """
+    Muestra las ventas de un mes agrupadas por categoría.
+    """
+    mes = pedir_mes()
+    if mes is None:
+        return
+
+    filas = ventas_por_categoria(*rango_del_mes(mes))
+    tabla = [(cat, str(unidades), f"${importe:.2f}") for cat, unidades, importe, _ in filas]
+    total = ("TOTAL", str(sum(f[1] for f in filas)), f"${sum(f[2] for f in filas):.2f}")
+    mostrar_reporte_ventas(f"Ventas de {mes} por categoría",
+                           [("Categoría", "left"), ("Unidades", "center"), ("Importe", "right")], tabla, total)
+
+def reporte_mes_por_dia():
+    """
+    Muestra las ventas de un mes día por día.
+    """
+    mes = pedir_mes()
+    if mes is None:
+        return
+
+    filas = ventas_por_dia(*rango_del_mes(mes))
+    tabla = [(fecha, str(unidades), f"${importe:.2f}") for fecha, unidades, importe, _ in filas]
+    total = ("TOTAL", str(sum(f[1] for f in filas)), f"${sum(f[2] for f in filas):.2f}")
+    mostrar_reporte_ventas(f"Ventas de {mes} por día",
+                           [("Fecha", "center"), ("Unidades", "center"), ("Importe", "right")], tabla, total)
+
+def reporte_mes_por_producto():
+    """
+    Muestra las ventas de un mes agrupadas por producto, del mayor importe al menor.
+    """
+    mes = pedir_mes()
+    if mes is None:
+        return
+
+    filas = ventas_por_producto(*rango_del_mes(mes))
+    tabla = [(str(pid), nombre, str(unidades), f"${importe:.2f}") for pid, nombre, unidades, importe, _ in filas]
+    total = ("", "TOTAL", str(sum(f[2] for f in filas)), f"${sum(f[3] for f in filas):.2f}")
+    mostrar_reporte_ventas(f"Ventas de {mes} por producto",
+                           [("ID", "center"), ("Producto", "left"), ("Unidades", "center"), ("Importe", "right")],
+                           tabla, total)
+
+def reporte_mes_por_cliente():
+    """
+    Muestra las ventas de un mes agrupadas por cliente, del mayor importe al menor.
+    """
+    mes = pedir_mes()
+    if mes is None:
+        return
+
+    filas = ventas_por_cliente(mes, mes)
+    tabla = [(str(cid), nombre, str(facturas), f"${importe:.2f}") for cid, nombre, facturas, importe in filas]
+    total = ("", "TOTAL", str(sum(f[2] for f in filas)), f"${sum(f[3] for f in filas):.2f}")
+    mostrar_reporte_ventas(f"Ventas de {mes} por cliente",
+                           [("ID", "center"), ("Cliente", "left"), ("Facturas", "center"), ("Importe", "right")],
+                           tabla, total)
+
+def reconstruir_resumenes_interactivo():
+    """
+    Recalcula los resúmenes de ventas desde las facturas y muestra el resultado.
+    """
+    if reconstruir_resumenes():
+        mostrar_exito("Resúmenes de ventas reconstruidos.\n")
+    else:
+        mostrar_error("No se pudieron reconstruir los resúmenes de ventas.\n")
+
+def ranking_ventas_interactivo():
+    """
+    Muestra el top N de productos o clientes de un período por unidades, importe o facturas.
+    """
+    while True:
+        entidad = pedir_input_con_cancelacion("¿Ranking de (P) productos o (L) clientes? (C para cancelar): ").lower()
+        if entidad == "c":
+            mostrar_cancelado("Ventas")
+            return
+        if entidad in ("p", "l"):
+            break
+        mostrar_error("Opción inválida. Ingresá P o L.")
+
+    opciones = {"1": "unidades", "2": "importe", "3": "facturas"}
+    while True:
+        opcion = pedir_input_con_cancelacion("Ordenar por (1) unidades, (2) importe o (3) facturas (C para cancelar): ")
+        if opcion.lower() == "c":
+            mostrar_cancelado("Ventas")
+            return
+        if opcion in opciones:
+            criterio = opciones[opcion]
+            break
+        mostrar_error("Opción inválida. Ingresá 1, 2 o 3.")
+
+    desde = pedir_fecha("Desde")
+    if desde is None:
+        return
+    hasta = pedir_fecha("Hasta")
+    if hasta is None:
+        return
+
+    while True:
+        cantidad = pedir_input_con_cancelacion("¿Cuántos mostrar? (Enter para 10, C para cancelar): ")
+        if cantidad.lower() == "c":
+            mostrar_cancelado("Ventas")
+            return
+        if not cantidad:
+            n = 10
+            break
+        if cantidad.isdigit() and int(cantidad) > 0:
+            n = int(cantidad)
+            break
+        mostrar_error("La cantidad debe ser un número mayor a cero.")
+
+    if entidad == "p":
+        filas = top_productos(n, criterio, desde or None, hasta or None)
+        nombre_entidad, columna = "productos", "Producto"
+    else:
+        filas = top_clientes(n, criterio, desde or None, hasta or None)
+        nombre_entidad, columna = "clientes", "Cliente"
+
+    periodo = f"{desde or 'inicio'} a {hasta or 'hoy'}"
+    tabla = [
+        (str(posicion), str(id_), nombre, f"${valor:.2f}" if criterio == "importe" else str(valor))
+        for posicion, (id_, nombre, valor) in enumerate(filas, start=1)
+    ]
+    mostrar_reporte_ventas(f"Top {n} {nombre_entidad} por {criterio} ({periodo})",
+                           [("#", "center"), ("ID", "center"), (columna, "left"), (criterio.capitalize(), "right")],
+                           tabla)
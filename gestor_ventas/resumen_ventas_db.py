@@ -0,0 +1,229 @@
+# Módulo de resúmenes de ventas
+# Este módulo mantiene tablas de totales ya agregados (por día y producto, por día y
+# categoría, y por cliente y mes) para que los reportes no tengan que recorrer todas
+# las facturas. Cada venta suma sus líneas a los resúmenes dentro de su propia
+# transacción; reconstruir_resumenes() los vuelve a calcular desde cero.
+#
+# Uso: python -m gestor_ventas.resumen_ventas_db  → reconstruye todos los resúmenes
+
+import sqlite3
+import time
+
+from db.data_base import conexion_db
+from core.logger import log_info, log_error
+
+# Cada SELECT agrupa las ventas que cumplen {filtro}; con ON CONFLICT la misma
+# sentencia sirve para sumar una factura nueva y para reconstruir todo.
+_SUMAR_DIA_PRODUCTO = """
+    INSERT INTO resumen_ventas_dia_producto (fecha, producto_id, nombre_producto, unidades, importe, lineas)
+    SELECT substr(f.fecha, 1, 10), fd.producto_id, MAX(fd.nombre_producto),
+           SUM(fd.cantidad), SUM(fd.total_linea), COUNT(*)
+    FROM factura_detalle fd
+    JOIN facturas f ON f.id_factura = fd.factura_id
+    {filtro}
+    GROUP BY 1, 2
+    ON CONFLICT (fecha, producto_id) DO UPDATE SET
+        nombre_producto = excluded.nombre_producto,
+        unidades = unidades + excluded.unidades,
+        importe = importe + excluded.importe,
+        lineas = lineas + excluded.lineas
+"""
+
+_SUMAR_DIA_CATEGORIA = """
+    INSERT INTO resumen_ventas_dia_categoria (fecha, nombre_categoria, unidades, importe, lineas)
+    SELECT substr(f.fecha, 1, 10), COALESCE(fd.nombre_categoria, 'Sin categoría'),
+           SUM(fd.cantidad), SUM(fd.total_linea), COUNT(*)
+    FROM factura_detalle fd
+    JOIN facturas f ON f.id_factura = fd.factura_id
+    {filtro}
+    GROUP BY 1, 2
+    ON CONFLICT (fecha, nombre_categoria) DO UPDATE SET
+        unidades = unidades + excluded.unidades,
+        importe = importe + excluded.importe,
+        lineas = lineas + excluded.lineas
+"""
+
+_SUMAR_CLIENTE_MES = """
+    INSERT INTO resumen_ventas_cliente_mes (mes, cliente_id, nombre_cliente, facturas, importe)
+    SELECT substr(f.fecha, 1, 7), f.cliente_id, MAX(f.nombre_cliente), COUNT(*), SUM(f.total)
+    FROM facturas f
+    {filtro}
+    GROUP BY 1, 2
+    ON CONFLICT (mes, cliente_id) DO UPDATE SET
+        nombre_cliente = excluded.nombre_cliente,
+        facturas = facturas + excluded.facturas,
+        importe = importe + excluded.importe
+"""
+
+TABLAS_RESUMEN = ("resumen_ventas_dia_producto", "resumen_ventas_dia_categoria", "resumen_ventas_cliente_mes")
+
+
+def sumar_factura_a_resumenes(factura_id: int, conexion: sqlite3.Connection) -> None:
+    """
+    Suma una factura recién insertada (con su detalle) a los resúmenes.
+
+    Corre dentro de la transacción del llamador y no hace commit, así la venta
+    y sus totales se confirman o se revierten juntos.
+
+    Parámetros:
+        factura_id (int): El ID de la factura a sumar.
+        conexion (sqlite3.Connection): Conexión con la transacción de la venta.
+
+    Lanza:
+        sqlite3.Error: Si falla alguna actualización.
+    """
+    conexion.execute(_SUMAR_DIA_PRODUCTO.format(filtro="WHERE fd.factura_id = ?"), (factura_id,))
+    conexion.execute(_SUMAR_DIA_CATEGORIA.format(filtro="WHERE fd.factura_id = ?"), (factura_id,))
+    conexion.execute(_SUMAR_CLIENTE_MES.format(filtro="WHERE f.id_factura = ?"), (factura_id,))
+
+
+def reconstruir_resumenes_en(conexion: sqlite3.Connection) -> None:
+    """
+    Vacía y recalcula todos los resúmenes dentro de la transacción del llamador.
+
+    Parámetros:
+        conexion (sqlite3.Connection): Conexión con una transacción de escritura abierta.
+    """
+    for tabla in TABLAS_RESUMEN:
+        conexion.execute(f"DELETE FROM {tabla}")
+    conexion.execute(_SUMAR_DIA_PRODUCTO.format(filtro="WHERE 1"))
+    conexion.execute(_SUMAR_DIA_CATEGORIA.format(filtro="WHERE 1"))
+    conexion.execute(_SUMAR_CLIENTE_MES.format(filtro="WHERE 1"))
+
+
+def reconstruir_resumenes() -> bool:
+    """
+    Recalcula todos los resúmenes a partir de las facturas (para carga inicial o reparación).
+
+    Retorna:
+        bool: True si se reconstruyeron, False si hubo un error.
+    """
+    try:
+        inicio = time.perf_counter()
+        with conexion_db() as conexion:
+            conexion.execute("BEGIN IMMEDIATE TRANSACTION;")
+            reconstruir_resumenes_en(conexion)
+            conexion.commit()
+        log_info(f"Resúmenes de ventas reconstruidos en {time.perf_counter() - inicio:.2f} s")
+        return True
+    except sqlite3.Error as e:
+        log_error(f"Error al reconstruir resúmenes de ventas: {e}")
+        return False
+
+
+def ventas_por_categoria(desde: str, hasta: str) -> list:
+    """
+    Totales por categoría entre dos fechas inclusivas, del mayor importe al menor.
+
+    Parámetros:
+        desde (str): Fecha mínima 'YYYY-MM-DD'.
+        hasta (str): Fecha máxima 'YYYY-MM-DD'.
+
+    Retorna:
+        list: Tuplas (nombre_categoria, unidades, importe, lineas).
+    """
+    try:
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute("""
+                SELECT nombre_categoria, SUM(unidades), SUM(importe), SUM(lineas)
+                FROM resumen_ventas_dia_categoria
+                WHERE fecha BETWEEN ? AND ?
+                GROUP BY nombre_categoria
+                ORDER BY SUM(importe) DESC
+            """, (desde, hasta))
+            return cursor.fetchall()
+    except sqlite3.Error as e:
+        log_error(f"Error al consultar ventas por categoría: {e}")
+        return []
+
+
+def ventas_por_dia(desde: str, hasta: str) -> list:
+    """
+    Totales por día entre dos fechas inclusivas.
+
+    Parámetros:
+        desde (str): Fecha mínima 'YYYY-MM-DD'.
+        hasta (str): Fecha máxima 'YYYY-MM-DD'.
+
+    Retorna:
+        list: Tuplas (fecha, unidades, importe, lineas) ordenadas por fecha.
+    """
+    try:
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute("""
+                SELECT fecha, SUM(unidades), SUM(importe), SUM(lineas)
+                FROM resumen_ventas_dia_categoria
+                WHERE fecha BETWEEN ? AND ?
+                GROUP BY fecha
+                ORDER BY fecha
+            """, (desde, hasta))
+            return cursor.fetchall()
+    except sqlite3.Error as e:
+        log_error(f"Error al consultar ventas por día: {e}")
+        return []
+
+
+def ventas_por_producto(desde: str, hasta: str) -> list:
+    """
+    Totales por producto entre dos fechas inclusivas, del mayor importe al menor.
+
+    Parámetros:
+        desde (str): Fecha mínima 'YYYY-MM-DD'.
+        hasta (str): Fecha máxima 'YYYY-MM-DD'.
+
+    Retorna:
+        list: Tuplas (producto_id, nombre_producto, unidades, importe, lineas).
+    """
+    try:
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute("""
+                SELECT producto_id, MAX(nombre_producto), SUM(unidades), SUM(importe), SUM(lineas)
+                FROM resumen_ventas_dia_producto
+                WHERE fecha BETWEEN ? AND ?
+                GROUP BY producto_id
+                ORDER BY SUM(importe) DESC
+            """, (desde, hasta))
+            return cursor.fetchall()
+    except sqlite3.Error as e:
+        log_error(f"Error al consultar ventas por producto: {e}")
+        return []
+
+
+def ventas_por_cliente(mes_desde: str, mes_hasta: str) -> list:
+    """
+    Totales por cliente entre dos meses inclusivos, del mayor importe al menor.
+
+    Parámetros:
+        mes_desde (str): Mes mínimo 'YYYY-MM'.
+        mes_hasta (str): Mes máximo 'YYYY-MM'.
+
+    Retorna:
+        list: Tuplas (cliente_id, nombre_cliente, facturas, importe).
+    """
+    try:
+        with conexion_db() as conexion:
+            cursor = conexion.cursor()
+            cursor.execute("""
+                SELECT cliente_id, MAX(nombre_cliente), SUM(facturas), SUM(importe)
+                FROM resumen_ventas_cliente_mes
+                WHERE mes BETWEEN ? AND ?
+                GROUP BY cliente_id
+                ORDER BY SUM(importe) DESC
+            """, (mes_desde, mes_hasta))
+            return cursor.fetchall()
+    except sqlite3.Error as e:
+        log_error(f"Error al consultar ventas por cliente: {e}")
+        return []
+
+
+if __name__ == "__main__":
+    from db.data_base import inicializar_base
+
+    inicializar_base()
+    if reconstruir_resumenes():
+        print("Resúmenes de ventas reconstruidos.")
+    else:
+        print("No se pudieron reconstruir los resúmenes. Revisá registro.log.")
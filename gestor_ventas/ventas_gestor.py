@@ -8,26 +8,23 @@ from rich.text import Text
 from rich.panel import Panel
 from rich.columns import Columns
 
-from db.data_base import obtener_conexion
-from gestor_clientes.clientes_db import listar_clientes
-from gestor_productos.productos_db import listar_productos_crudos, listar_productos
-from gestor_ventas.facturas_db import insertar_factura, insertar_factura_detalle, descontar_stock, obtener_detalle_venta, listar_facturas
-from gestor_proveedores.proveedores_validaciones import obtener_proveedor_por_id_validado
-from gestor_ventas.ventas_validaciones import cargar_productos_para_venta
+from gestor_productos.productos_db import listar_productos_por_ids
+from gestor_ventas.facturas_db import obtener_detalle_venta
+from gestor_ventas.ventas_servicio import registrar_venta_servicio, ErrorVenta
+from gestor_ventas.ventas_validaciones import cargar_productos_para_venta, seleccionar_factura_paginada
+from gestor_ventas.ventas_validaciones import seleccionar_cliente_para_venta
 from gestor_ventas.exportar_factura import generar_pdf_factura
-from gestor_clientes.clientes_validaciones import obtener_cliente_por_id_validado
-from gestor_categorias.categorias_validaciones import obtener_categoria_por_id_validado
-from interfaz.mostrar_resumen import mostrar_clientes,mostrar_facturas, mostrar_resumen_venta
-from interfaz.diseño_interfaz import mostrar_error,mostrar_exito, mostrar_cancelado, mostrar_info
+from interfaz.mostrar_resumen import mostrar_resumen_venta
+from interfaz.diseño_interfaz import mostrar_error,mostrar_exito, mostrar_cancelado
 from interfaz.diseño_interfaz import pedir_input_con_cancelacion
-from core.utils import obtener_fecha_actual
-from core.logger import log_info, log_error
+from core.logger import log_error
 
 def registrar_venta(cliente_id: int, productos: list[dict]) -> int | None:
     """
     Registra una venta en el sistema.
 
-    Provee los datos para los insert y actualizacion de stock en la base de datos
+    Delega en el servicio de ventas (sin consola) y muestra por pantalla
+    el motivo si la venta no se pudo registrar.
 
     Parámetros:
         cliente_id (int): El ID del cliente que realiza la compra.
@@ -36,98 +33,19 @@ def registrar_venta(cliente_id: int, productos: list[dict]) -> int | None:
     Retorna:
         int: El ID de la factura si la venta se realizó correctamente, o None en caso de error.
     """
-    fecha = obtener_fecha_actual()
-    conexion = obtener_conexion()
-
     try:
-        # Iniciar transacción
-        conexion.execute("BEGIN TRANSACTION;")
-        
-        # Validar cliente
-        cliente = obtener_cliente_por_id_validado(str(cliente_id))
-        if not cliente:
-            mostrar_error("Cliente no encontrado.")
-            conexion.rollback()
-            return None
-
-        # Construir diccionario de productos desde base
-        productos_db = {}
-        for prod in listar_productos_crudos():
-            productos_db[prod[0]] = {
-                "nombre": prod[1],
-                "categoria_id": prod[2],
-                "proveedor_id": prod[3],
-                "stock": prod[4],
-                "precio_unitario": prod[5]
-            }
-
-        total_factura = 0
-        detalles = []
-
-        for item in productos:
-            pid = item["producto_id"]
-            cantidad = item["cantidad"]
-
-            if pid not in productos_db:
-                mostrar_error(f"Producto con ID {pid} no encontrado.")
-                conexion.rollback()
-                return None
-
-            producto_info = productos_db[pid]
-            precio = producto_info["precio_unitario"]
-            subtotal = round(cantidad * precio, 2)
-            total_factura += subtotal
-
-            # Validar vínculos
-            if not obtener_categoria_por_id_validado(str(producto_info["categoria_id"])):
-                mostrar_error(f"Categoría no encontrada para '{producto_info['nombre']}'.")
-                conexion.rollback()
-                return None
-
-            if not obtener_proveedor_por_id_validado(str(producto_info["proveedor_id"])):
-                mostrar_error(f"Proveedor no encontrado para '{producto_info['nombre']}'.")
-                conexion.rollback()
-                return None
-
-            detalles.append({
-                "producto_id": pid,
-                "cantidad": cantidad,
-                "precio_unitario": precio,
-                "total_linea": subtotal
-            })
-
-        # Insertar factura y detalle de factura en una única transacción
-        factura_id = insertar_factura(fecha, cliente_id, total_factura, conexion)
-        if factura_id is None:
-            mostrar_error("No se pudo insertar la factura.")
-            conexion.rollback()
-            return None
-
-        for detalle in detalles:
-            insertar_factura_detalle(
-                factura_id,
-                detalle["producto_id"],
-                detalle["cantidad"],
-                detalle["precio_unitario"],
-                detalle["total_linea"],
-                conexion
-            )
-            descontar_stock(detalle["producto_id"], detalle["cantidad"], conexion)  # Descontar el stock
+        return registrar_venta_servicio(cliente_id, productos)["factura_id"]
 
-        # Confirmar cambios
-        conexion.commit()
-        log_info(f"Venta completada → Cliente ID: {cliente_id}, Factura ID: {factura_id}, Total: ${total_factura:.2f}")
-        return factura_id
+    except ErrorVenta as e:
+        mostrar_error(str(e))
+        return None
 
     except Exception as e:
-        conexion.rollback()
+        # El servicio ya revirtió la transacción al propagarse la excepción
         log_error(f"Error al registrar la venta: {e}")
         mostrar_error(f"Ocurrió un error al registrar la venta.")
         return None
 
-    finally:
-        conexion.close()
-
 def procesar_venta_interactiva():
     """
     Permite procesar una venta de manera interactiva, donde el usuario puede seleccionar un cliente
@@ -135,38 +53,23 @@ def procesar_venta_interactiva():
 
     Este proceso también genera la factura correspondiente y la exporta a PDF.
     """
-    clientes = listar_clientes()
-    if not clientes:
-        mostrar_error("No hay clientes registrados. Ingresa al nuevo cliente y luego reintenta la venta.\n")
+    # Selección de cliente (por ID o buscándolo)
+    cliente_id = seleccionar_cliente_para_venta()
+    if cliente_id is None:
         return
 
-    mostrar_clientes(clientes)
-    mostrar_info("Si el cliente no existe, primero crealo y luego reintenta la venta")
-
-    # Selección de cliente
-    while True:
-        cliente_id = pedir_input_con_cancelacion("Ingresá el ID del cliente para la venta (C para cancelar): ")
-        if cliente_id.lower() == "c":
-            mostrar_cancelado("Ventas")
-            return
-
-        cliente = obtener_cliente_por_id_validado(cliente_id)
-        if cliente is None:
-            continue
-        break
-
     # Carga de productos
     productos = cargar_productos_para_venta()
     if productos == "CANCELADO":
         return
 
     # Mostrar resumen previo a confirmar la venta
-    productos_db = listar_productos()
+    productos_db = listar_productos_por_ids([item["producto_id"] for item in productos])
     productos_dict = {}
-    for prod in productos_db:
+    for prod in productos_db.values():
         productos_dict[prod[0]] = {
             "nombre": prod[1],
-            "precio_unitario": prod[5]
+            "precio_unitario": prod[3]
         }
 
     console = Console()
@@ -224,34 +127,10 @@ def imprimir_detalle_venta():
 
     Permite al usuario ingresar un ID de factura y muestra todos los productos y detalles asociados.
     """
-    lista_facturas = listar_facturas()
-    if not lista_facturas:
-        mostrar_error("No hay facturas registradas.\n")
+    id_factura = seleccionar_factura_paginada("Ingresá el ID de la factura para ver el detalle")
+    if id_factura is None:
         return
 
-    mostrar_facturas(lista_facturas)
-
-    while True:
-        entrada = pedir_input_con_cancelacion("Ingresá el ID de la factura para ver el detalle (C para cancelar): ")
-        if entrada.lower() == "c":
-            mostrar_cancelado("Ventas")
-            return
-
-        try:
-            id_factura = int(entrada)
-        except ValueError:
-            mostrar_error("El ID debe ser un número.")
-            continue
-
-        ids_disponibles = []
-        for fact in lista_facturas:
-            ids_disponibles.append(fact[0])
-        if id_factura not in ids_disponibles:
-            mostrar_error("El ID de factura no existe.")
-            continue
-
-        break  # ID válido
-
     detalle = obtener_detalle_venta(id_factura)
     mostrar_resumen_venta(id_factura)
     return detalle
@@ -0,0 +1,382 @@
+# Módulo de servicio de ventas
+# Este módulo registra ventas sin ninguna interacción por consola: recibe comandos de venta
+# ya armados, devuelve resultados estructurados y señala los problemas con errores tipados.
+# Incluye la ingesta masiva de ventas desde archivos JSONL o CSV en transacciones agrupadas.
+#
+# Uso: python -m gestor_ventas.ventas_servicio ventas.jsonl [tamaño_lote]
+
+import csv
+import json
+import os
+import sqlite3
+import sys
+import time
+
+from db.data_base import conexion_db
+from gestor_clientes.clientes_db import obtener_cliente_por_id
+from gestor_productos.productos_db import listar_productos_por_ids
+from gestor_ventas.facturas_db import insertar_factura, insertar_detalles_factura
+from gestor_ventas.resumen_ventas_db import sumar_factura_a_resumenes
+from core.utils import obtener_fecha_actual
+from core.logger import log_info, log_error
+
+TAMANIO_LOTE = 500
+
+# Código de rechazo en la ingesta para las ventas que fallaron por un error de la base
+CODIGO_ERROR_BASE = "error_base_datos"
+
+
+class ErrorVenta(Exception):
+    """Error de negocio al registrar una venta. `codigo` lo identifica de forma estable."""
+    codigo = "error_venta"
+
+
+class VentaInvalida(ErrorVenta):
+    """El comando de venta está mal formado (carrito vacío, cantidades inválidas, etc.)."""
+    codigo = "venta_invalida"
+
+
+class ClienteNoEncontrado(ErrorVenta):
+    """El cliente de la venta no existe."""
+    codigo = "cliente_no_encontrado"
+
+
+class ProductoNoEncontrado(ErrorVenta):
+    """Algún producto del carrito no existe."""
+    codigo = "producto_no_encontrado"
+
+
+class VinculoNoEncontrado(ErrorVenta):
+    """La categoría o el proveedor de un producto no existe."""
+    codigo = "vinculo_no_encontrado"
+
+
+class StockInsuficiente(ErrorVenta):
+    """No hay stock suficiente para algún producto del carrito."""
+    codigo = "stock_insuficiente"
+
+
+class ProductoIncompleto(ErrorVenta):
+    """Algún producto del carrito no tiene precio o stock cargado."""
+    codigo = "producto_incompleto"
+
+
+def _entero(valor, campo: str) -> int:
+    """
+    Convierte un campo del comando a entero sin redondear ni truncar.
+
+    Acepta enteros, y números o textos con valor entero ("2", 2.0); rechaza los
+    valores con decimales (2.7), los booleanos y los campos vacíos.
+
+    Lanza:
+        VentaInvalida: Si el valor falta o no es un entero.
+    """
+    if isinstance(valor, int) and not isinstance(valor, bool):
+        return valor
+    if isinstance(valor, bool) or not isinstance(valor, (float, str)):
+        raise VentaInvalida(f"Falta {campo} o no es un número: {valor!r}.")
+    try:
+        numero = float(valor)
+    except ValueError:
+        raise VentaInvalida(f"{campo} no es un número: {valor!r}.")
+    if not numero.is_integer():
+        raise VentaInvalida(f"{campo} debe ser un número entero: {valor!r}.")
+    return int(numero)
+
+
+def validar_comando_venta(cliente_id, productos) -> tuple[int, list[dict]]:
+    """
+    Valida la forma de un comando de venta y normaliza sus tipos.
+
+    Parámetros:
+        cliente_id: ID del cliente (int o texto numérico).
+        productos: Lista de diccionarios con producto_id y cantidad.
+
+    Retorna:
+        tuple: (cliente_id, productos) con enteros en todos los campos.
+
+    Lanza:
+        VentaInvalida: Si falta algún dato, algún valor no es entero (sin truncar
+            decimales) o alguna cantidad no es positiva.
+    """
+    cliente_id = _entero(cliente_id, "cliente_id")
+    if not isinstance(productos, (list, tuple)):
+        raise VentaInvalida("Comando de venta mal formado: productos debe ser una lista.")
+    for item in productos:
+        if not isinstance(item, dict):
+            raise VentaInvalida(f"Comando de venta mal formado: línea inválida {item!r}.")
+    productos = [
+        {"producto_id": _entero(item.get("producto_id"), "producto_id"),
+         "cantidad": _entero(item.get("cantidad"), "cantidad")}
+        for item in productos
+    ]
+
+    if not productos:
+        raise VentaInvalida("La venta no tiene productos.")
+    for item in productos:
+        if item["cantidad"] <= 0:
+            raise VentaInvalida(f"Cantidad inválida para el producto con ID {item['producto_id']}.")
+    return cliente_id, productos
+
+
+def ejecutar_venta(conexion: sqlite3.Connection, cliente_id: int, productos: list[dict], fecha: str = None) -> dict:
+    """
+    Registra una venta dentro de la transacción abierta por el llamador.
+
+    No hace commit ni rollback: si la venta no es válida lanza un ErrorVenta
+    y el llamador decide qué revertir.
+
+    Parámetros:
+        conexion (sqlite3.Connection): Conexión con una transacción de escritura abierta.
+        cliente_id (int): El ID del cliente que realiza la compra.
+        productos (list[dict]): Productos a vender (producto_id y cantidad).
+        fecha (str): Fecha de la factura; por defecto, la actual.
+
+    Retorna:
+        dict: factura_id, cliente_id, fecha, total y lineas de la venta registrada.
+
+    Lanza:
+        ErrorVenta: Si el comando es inválido o no se puede registrar la venta.
+    """
+    cliente_id, productos = validar_comando_venta(cliente_id, productos)
+
+    if obtener_cliente_por_id(cliente_id) is None:
+        raise ClienteNoEncontrado(f"Cliente con ID {cliente_id} no encontrado.")
+
+    # Traer solo los productos del carrito, con su categoría y proveedor
+    productos_db = listar_productos_por_ids([item["producto_id"] for item in productos])
+
+    # Cantidad total pedida por producto (un producto puede repetirse en el carrito)
+    cantidades_pedidas = {}
+    for item in productos:
+        pid = item["producto_id"]
+        cantidades_pedidas[pid] = cantidades_pedidas.get(pid, 0) + item["cantidad"]
+
+    total_factura = 0
+    detalles = []
+
+    for item in productos:
+        pid = item["producto_id"]
+        cantidad = item["cantidad"]
+
+        if pid not in productos_db:
+            raise ProductoNoEncontrado(f"Producto con ID {pid} no encontrado.")
+
+        _, nombre, stock, precio, categoria, proveedor = productos_db[pid]
+
+        if precio is None or stock is None:
+            raise ProductoIncompleto(f"Falta el precio o el stock de '{nombre}'.")
+        if categoria is None:
+            raise VinculoNoEncontrado(f"Categoría no encontrada para '{nombre}'.")
+        if proveedor is None:
+            raise VinculoNoEncontrado(f"Proveedor no encontrado para '{nombre}'.")
+        if cantidades_pedidas[pid] > stock:
+            raise StockInsuficiente(f"Stock insuficiente para '{nombre}'.")
+
+        subtotal = round(cantidad * precio, 2)
+        total_factura += subtotal
+        detalles.append({
+            "producto_id": pid,
+            "cantidad": cantidad,
+            "precio_unitario": precio,
+            "total_linea": subtotal
+        })
+
+    fecha = fecha or obtener_fecha_actual()
+    factura_id = insertar_factura(fecha, cliente_id, total_factura, conexion)
+    if factura_id is None:
+        raise ErrorVenta("No se pudo insertar la factura.")
+
+    # Insertar todas las líneas y descontar el stock en lote (condicional)
+    sin_stock = insertar_detalles_factura(factura_id, detalles, conexion)
+    if sin_stock is None:
+        raise ErrorVenta("No se pudo insertar el detalle de la factura.")
+    if sin_stock:
+        nombres = ", ".join(f"'{productos_db[pid][1]}'" for pid in sin_stock)
+        raise StockInsuficiente(f"Stock insuficiente para {nombres}.")
+
+    # Totales para reportes, en la misma transacción que la venta
+    sumar_factura_a_resumenes(factura_id, conexion)
+
+    return {
+        "factura_id": factura_id,
+        "cliente_id": cliente_id,
+        "fecha": fecha,
+        "total": round(total_factura, 2),
+        "lineas": detalles,
+    }
+
+
+def registrar_venta_servicio(cliente_id: int, productos: list[dict]) -> dict:
+    """
+    Registra una venta en su propia transacción, sin salida por consola.
+
+    Parámetros:
+        cliente_id (int): El ID del cliente que realiza la compra.
+        productos (list[dict]): Productos a vender (producto_id y cantidad).
+
+    Retorna:
+        dict: El resultado de ejecutar_venta().
+
+    Lanza:
+        ErrorVenta: Si la venta no es válida (la transacción queda revertida).
+        sqlite3.Error: Si falla la base de datos (la transacción queda revertida).
+    """
+    inicio = time.perf_counter()
+    with conexion_db() as conexion:
+        # Bloqueo de escritura desde el inicio: el stock leído no cambia hasta el commit
+        conexion.execute("BEGIN IMMEDIATE TRANSACTION;")
+        resultado = ejecutar_venta(conexion, cliente_id, productos)
+        conexion.commit()
+
+    log_info("Venta completada", operacion="venta", factura_id=resultado["factura_id"],
+             cliente_id=resultado["cliente_id"], lineas=len(resultado["lineas"]),
+             total=f"{resultado['total']:.2f}", duracion_ms=round((time.perf_counter() - inicio) * 1000, 2))
+    return resultado
+
+
+def leer_comandos_venta(ruta: str):
+    """
+    Lee comandos de venta de un archivo JSONL o CSV de forma incremental.
+
+    JSONL: una venta por línea, {"cliente_id": 3, "productos": [{"producto_id": 5, "cantidad": 2}]}
+    (se acepta "items" como sinónimo de "productos").
+    CSV: columnas venta, cliente_id, producto_id, cantidad; las filas consecutivas con el
+    mismo valor de "venta" forman una única venta.
+
+    Parámetros:
+        ruta (str): Ruta del archivo (.jsonl o .csv).
+
+    Retorna:
+        generator: Tuplas (número de registro, comando) donde comando es un dict con
+            cliente_id y productos, o un ErrorVenta si el registro no se pudo leer.
+    """
+    if ruta.lower().endswith(".csv"):
+        with open(ruta, newline="", encoding="utf-8") as archivo:
+            actual, numero, comando = None, 0, None
+            for fila in csv.DictReader(archivo):
+                clave = fila.get("venta")
+                if comando is not None and clave == actual:
+                    comando["productos"].append({"producto_id": fila.get("producto_id"), "cantidad": fila.get("cantidad")})
+                    continue
+                if comando is not None:
+                    yield numero, comando
+                numero += 1
+                actual = clave
+                comando = {
+                    "cliente_id": fila.get("cliente_id"),
+                    "productos": [{"producto_id": fila.get("producto_id"), "cantidad": fila.get("cantidad")}],
+                }
+            if comando is not None:
+                yield numero, comando
+        return
+
+    with open(ruta, encoding="utf-8") as archivo:
+        for numero, linea in enumerate(archivo, start=1):
+            if not linea.strip():
+                continue
+            try:
+                datos = json.loads(linea)
+                yield numero, {
+                    "cliente_id": datos.get("cliente_id"),
+                    "productos": datos.get("productos", datos.get("items", [])),
+                }
+            except (json.JSONDecodeError, AttributeError) as e:
+                yield numero, VentaInvalida(f"JSON inválido: {e}")
+
+
+def ingerir_ventas(comandos, tamanio_lote: int = TAMANIO_LOTE) -> dict:
+    """
+    Registra muchas ventas agrupándolas en transacciones de `tamanio_lote`.
+
+    Cada venta corre dentro de un SAVEPOINT: si es rechazada, o si falla la base
+    al registrarla (código CODIGO_ERROR_BASE), se revierte solo esa venta y el resto
+    del lote se confirma igual. Si ni siquiera se puede volver al SAVEPOINT, el error
+    se propaga y el lote en curso queda revertido.
+
+    Parámetros:
+        comandos: Iterable de tuplas (número, comando) como las de leer_comandos_venta().
+        tamanio_lote (int): Ventas por transacción.
+
+    Retorna:
+        dict: procesadas, registradas, rechazadas (lista con numero, codigo y detalle),
+            duracion_seg y ventas_por_seg.
+    """
+    resumen = {"procesadas": 0, "registradas": 0, "rechazadas": []}
+    inicio = time.perf_counter()
+
+    with conexion_db() as conexion:
+        en_lote = 0
+        for numero, comando in comandos:
+            if en_lote == 0:
+                conexion.execute("BEGIN IMMEDIATE TRANSACTION;")
+            resumen["procesadas"] += 1
+            en_lote += 1
+
+            revertida = False
+            try:
+                if isinstance(comando, ErrorVenta):
+                    raise comando
+                conexion.execute("SAVEPOINT venta")
+                try:
+                    ejecutar_venta(conexion, comando["cliente_id"], comando["productos"])
+                    conexion.execute("RELEASE venta")
+                except Exception:
+                    conexion.execute("ROLLBACK TO venta")
+                    conexion.execute("RELEASE venta")
+                    revertida = True
+                    raise
+                resumen["registradas"] += 1
+            except ErrorVenta as e:
+                resumen["rechazadas"].append({"numero": numero, "codigo": e.codigo, "detalle": str(e)})
+            except sqlite3.Error as e:
+                # Solo se rechaza la venta si se pudo volver al SAVEPOINT
+                if not revertida:
+                    raise
+                log_error(f"Error de base de datos en la venta {numero} de la ingesta: {e}")
+                resumen["rechazadas"].append({"numero": numero, "codigo": CODIGO_ERROR_BASE, "detalle": str(e)})
+
+            if en_lote >= tamanio_lote:
+                conexion.commit()
+                en_lote = 0
+
+        if en_lote:
+            conexion.commit()
+
+    duracion = time.perf_counter() - inicio
+    resumen["duracion_seg"] = round(duracion, 3)
+    resumen["ventas_por_seg"] = round(resumen["registradas"] / duracion) if duracion > 0 else 0
+    log_info("Ingesta de ventas", operacion="ingesta_ventas", registradas=resumen["registradas"],
+             rechazadas=len(resumen["rechazadas"]), duracion_ms=round(duracion * 1000, 2))
+    return resumen
+
+
+def ingerir_ventas_desde_archivo(ruta: str, tamanio_lote: int = TAMANIO_LOTE) -> dict | None:
+    """
+    Ingresa todas las ventas de un archivo JSONL o CSV.
+
+    Parámetros:
+        ruta (str): Ruta del archivo de ventas.
+        tamanio_lote (int): Ventas por transacción.
+
+    Retorna:
+        dict: El resumen de ingerir_ventas(), o None si el archivo no se pudo procesar.
+    """
+    if not os.path.isfile(ruta):
+        log_error(f"No existe el archivo de ventas: {ruta}")
+        return None
+    try:
+        return ingerir_ventas(leer_comandos_venta(ruta), tamanio_lote)
+    except (OSError, csv.Error, sqlite3.Error) as e:
+        log_error(f"Error al ingresar ventas desde {ruta}: {e}")
+        return None
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Uso: python -m gestor_ventas.ventas_servicio ventas.jsonl [tamaño_lote]")
+        sys.exit(2)
+    lote = int(sys.argv[2]) if len(sys.argv) > 2 else TAMANIO_LOTE
+    resumen = ingerir_ventas_desde_archivo(sys.argv[1], lote)
+    print(json.dumps(resumen, ensure_ascii=False, indent=2))
+    sys.exit(0 if resumen is not None else 1)
@@ -1,41 +1,96 @@
 # Módulo de validaciones y utilidades para ventas
-# Este módulo contiene funciones de validación relacionadas con las ventas, como la carga de productos a la venta
-# y la validación del stock y cantidad disponible.
+# Este módulo contiene funciones de validación relacionadas con las ventas, como la elección del cliente,
+# la carga de productos a la venta (por ID o buscando por texto), la validación del stock y cantidad
+# disponible, y la selección paginada de facturas.
 
-from gestor_productos.productos_db import listar_productos
-from interfaz.mostrar_resumen import mostrar_productos
+from gestor_productos.productos_db import listar_productos, contar_productos, buscar_productos
+from gestor_clientes.clientes_db import listar_clientes, contar_clientes, buscar_clientes, obtener_cliente_por_id
+from gestor_ventas.facturas_db import listar_facturas_pagina, obtener_factura_por_id
+from interfaz.mostrar_resumen import mostrar_productos, mostrar_clientes, mostrar_facturas
 from interfaz.diseño_interfaz import mostrar_error, mostrar_cancelado, mostrar_info
 from interfaz.diseño_interfaz import pedir_input_con_cancelacion
 from gestor_productos.productos_validaciones import obtener_producto_por_id_validado
 
+# Facturas que se muestran por página al elegir una factura
+TAMANIO_PAGINA_FACTURAS = 20
+
+# Hasta esta cantidad de productos o clientes se muestra el listado completo al vender;
+# con más, solo los resultados de la búsqueda
+LIMITE_LISTADO_COMPLETO = 50
+
+def seleccionar_cliente_para_venta() -> int | None:
+    """
+    Pide el cliente de una venta por ID o buscándolo por nombre, email o DNI.
+
+    Cada texto ingresado que no sea un ID existente se busca en el índice de texto
+    completo y se muestran los clientes más relevantes, para afinar la búsqueda o
+    elegir uno por su ID.
+
+    Retorna:
+        int: El ID del cliente elegido, o None si no hay clientes o el usuario cancela.
+    """
+    cantidad = contar_clientes()
+    if not cantidad:
+        mostrar_error("No hay clientes registrados. Ingresa al nuevo cliente y luego reintenta la venta.\n")
+        return None
+
+    if cantidad <= LIMITE_LISTADO_COMPLETO:
+        mostrar_clientes(listar_clientes())
+    mostrar_info("Si el cliente no existe, primero crealo y luego reintenta la venta")
+
+    while True:
+        entrada = pedir_input_con_cancelacion("Ingresá el ID del cliente, o parte de su nombre, email o DNI para buscarlo (C para cancelar): ")
+        if entrada.lower() == "c":
+            mostrar_cancelado("Ventas")
+            return None
+
+        if entrada.isdigit() and obtener_cliente_por_id(int(entrada)) is not None:
+            return int(entrada)
+
+        resultados = buscar_clientes(entrada)
+        if not resultados:
+            mostrar_error("No se encontraron clientes con ese ID, nombre, email o DNI.")
+            continue
+        mostrar_clientes(resultados, titulo=f"Clientes que coinciden con '{entrada}'")
+
 def cargar_productos_para_venta() -> list[dict] | str:
     """
     Permite cargar uno o más productos a una venta, validando stock y cantidad.
     
-    Esta función pide al usuario que ingrese el ID del producto y la cantidad a vender, y valida que la cantidad
-    no sea mayor que el stock disponible. Si el usuario decide cancelar, la función devuelve "CANCELADO". 
+    Esta función pide al usuario que ingrese el ID del producto (o un texto para buscarlo) y la cantidad a vender,
+    y valida que la cantidad no sea mayor que el stock disponible. Si el usuario decide cancelar, la función devuelve "CANCELADO". 
     Si no se ingresan productos válidos, también se devuelve "CANCELADO".
 
     Retorna:
         list[dict]: Lista de diccionarios con los productos y cantidades seleccionados para la venta.
         str: "CANCELADO" si el usuario cancela la operación o si no se cargan productos válidos.
     """
-    productos_disponibles = listar_productos()
-    if not productos_disponibles:
+    cantidad_productos = contar_productos()
+    if not cantidad_productos:
         mostrar_error("No hay productos cargados en el sistema.")
         return "CANCELADO"
 
-    mostrar_productos(productos_disponibles)
+    if cantidad_productos <= LIMITE_LISTADO_COMPLETO:
+        mostrar_productos(listar_productos())
     productos = []
 
     mostrar_info("Si el producto no existe, primero crealo y luego reintenta la venta")
 
     while True:
-        id_producto = pedir_input_con_cancelacion("Ingresá el ID del producto que querés vender (C para cancelar): ")
+        id_producto = pedir_input_con_cancelacion("Ingresá el ID del producto, o parte de su nombre, categoría o proveedor para buscarlo (C para cancelar): ")
         if id_producto.lower() == "c":
             mostrar_cancelado("Ventas")
             return "CANCELADO"
 
+        # Un texto se busca y se muestran los productos más relevantes para elegir su ID
+        if not id_producto.isdigit():
+            resultados = buscar_productos(id_producto)
+            if resultados:
+                mostrar_productos(resultados, titulo=f"Productos que coinciden con '{id_producto}'")
+            else:
+                mostrar_error("No se encontraron productos para esa búsqueda.")
+            continue
+
         producto_elegido = obtener_producto_por_id_validado(id_producto)
         if producto_elegido is None:
             continue
@@ -69,3 +124,62 @@ def cargar_productos_para_venta() -> list[dict] | str:
             break
 
     return productos if productos else "CANCELADO"
+
+def seleccionar_factura_paginada(mensaje: str) -> int | None:
+    """
+    Muestra las facturas de a una página y pide al usuario el ID de una de ellas.
+
+    Permite avanzar (S) y retroceder (A) entre páginas; cada página se consulta
+    por clave (fecha, id_factura) y el ID ingresado se valida con una búsqueda
+    por clave primaria, sin cargar todas las facturas.
+
+    Parámetros:
+        mensaje (str): Texto del pedido de ID, por ejemplo "Ingresá el ID de la factura a exportar".
+
+    Retorna:
+        int: El ID de la factura elegida, o None si no hay facturas o el usuario cancela.
+    """
+    inicios = [None]  # Clave de inicio de cada página visitada
+
+    while True:
+        pagina = listar_facturas_pagina(TAMANIO_PAGINA_FACTURAS, inicios[-1])
+        if not pagina:
+            if len(inicios) == 1:
+                mostrar_error("No hay facturas registradas.\n")
+                return None
+            mostrar_info("No hay más facturas.")
+            inicios.pop()
+            continue
+
+        mostrar_facturas(pagina, numero_pagina=len(inicios))
+
+        while True:
+            entrada = pedir_input_con_cancelacion(f"{mensaje} (S: siguiente página, A: anterior, C para cancelar): ")
+            if entrada.lower() == "c":
+                mostrar_cancelado("Ventas")
+                return None
+
+            if entrada.lower() == "s":
+                if len(pagina) < TAMANIO_PAGINA_FACTURAS:
+                    mostrar_info("No hay más facturas.")
+                    continue
+                ultima = pagina[-1]
+                inicios.append((ultima[1], ultima[0]))
+                break
+
+            if entrada.lower() == "a":
+                if len(inicios) == 1:
+                    mostrar_info("Ya estás en la primera página.")
+                    continue
+                inicios.pop()
+                break
+
+            if not entrada.isdigit():
+                mostrar_error("El ID debe ser un número.")
+                continue
+
+            if obtener_factura_por_id(int(entrada)) is None:
+                mostrar_error("El ID de factura no existe.")
+                continue
+
+            return int(entrada)
@@ -1,14 +1,94 @@
+import argparse
+import itertools
+import random
 import sqlite3
+import time
+from datetime import date, datetime, timedelta
 
-from db.data_base import obtener_conexion
+import db.data_base as data_base
+from db.data_base import obtener_conexion, inicializar_base
+from db.importacion import indexacion_diferida, siguiente_id
+from gestor_ventas.resumen_ventas_db import reconstruir_resumenes_en
 from core.logger import log_error, log_info
+from core.utils import normalizar_texto
+
+# Registros fijos de la carga inicial; también son el vocabulario del generador sintético
+CATEGORIAS_PRUEBA = [
+    ("Periféricos"),
+    ("Computadoras"),
+    ("Sonido"),
+    ("Accesorios"),
+    ("Pantallas"),
+    ("Redes"),
+    ("Almacenamiento"),
+    ("Cámaras"),
+    ("Micrófonos"),
+    ("Conectividad")
+]
+
+PROVEEDORES_PRUEBA = [
+    ("TechDistrib SA", "1150001000", "ventas@techdistrib.com", "30548976123"),
+    ("PixelTrade SRL", "1144003000", "info@pixeltrade.com", "30765432987"),
+    ("ZendaTech", "1166004000", "contacto@zendatech.com", "30548911223"),
+    ("NovaElectro SA", "1177005000", "ventas@novaelectro.com", "30784291425"),
+    ("ElectroNet SRL", "1133006000", "soporte@electronet.com", "30698754123"),
+    ("Neotec Supplies", "1188007000", "pedidos@neotec.com", "30712549876"),
+    ("MasterTech", "1122008000", "ventas@mastertech.com", "30678912345"),
+    ("BitImport SRL", "1140009000", "compras@bitimport.com", "30789654123"),
+    ("CoreByte SRL", "1155001001", "contacto@corebyte.com", "30565498741"),
+    ("SysDistrib SA", "1170001100", "info@sysdistrib.com", "30874123698")
+]
+
+CLIENTES_PRUEBA = [
+    ("Laura Martínez", "1123456789", "laura.martinez@mail.com", "40875231"),
+    ("Ricardo Gómez", "1134567890", "ricardo.gomez@mail.com", "39548620"),
+    ("Daniela Torres", "1145678901", "daniela.torres@mail.com", "42319876"),
+    ("Javier Ruiz", "1156789012", "javier.ruiz@mail.com", "38765412"),
+    ("Sofía Fernández", "1167890123", "sofia.fernandez@mail.com", "41098567"),
+    ("Mateo Navarro", "1178901234", "mateo.navarro@mail.com", "40234687"),
+    ("Valentina Díaz", "1189012345", "valentina.diaz@mail.com", "41687452"),
+    ("Nicolás Romero", "1190123456", "nicolas.romero@mail.com", "42985741"),
+    ("Martina López", "1132145678", "martina.lopez@mail.com", "41987654"),
+    ("Tomás Herrera", "1143256789", "tomas.herrera@mail.com", "43127841")
+]
+
+PRODUCTOS_PRUEBA = [
+    ("Teclado mecánico RGB", 1, 1, 25, 90500),
+    ("Mouse inalámbrico", 1, 2, 40, 27800),
+    ("Auriculares gamer", 3, 3, 30, 89000),
+    ("Monitor LED 24\"", 5, 4, 15, 344500),
+    ("Laptop Intel i5 8GB SSD", 2, 5, 10, 1200500),
+    ("Parlantes Bluetooth", 3, 1, 35, 76000),
+    ("Alfombrilla XL antideslizante", 4, 6, 50, 22700),
+    ("Micrófono USB condensador", 9, 2, 20, 68000),
+    ("Webcam Full HD 1080p", 8, 3, 20, 85000),
+    ("Hub USB 4 puertos", 10, 7, 18, 37000)
+]
+
+# Filas por executemany y por transacción en la carga sintética
+TAMANIO_LOTE_SINTETICO = 100_000
+
+# Exponentes de Zipf: popularidad de productos (muy concentrada) y frecuencia de clientes
+ZIPF_PRODUCTOS = 1.1
+ZIPF_CLIENTES = 0.6
+
+# Líneas por factura y unidades por línea, con sus pesos relativos
+LINEAS_POR_FACTURA = ((1, 2, 3, 4, 5, 6, 8), (30, 24, 17, 11, 8, 6, 4))
+UNIDADES_POR_LINEA = ((1, 2, 3, 4, 5, 10), (55, 22, 10, 6, 4, 3))
+
+# Estacionalidad: peso de cada mes (noviembre y diciembre venden más) y de cada día de la semana (lunes = 0)
+PESO_MES = {1: 0.8, 2: 0.8, 3: 0.95, 4: 0.95, 5: 1.0, 6: 1.0, 7: 1.1, 8: 0.95, 9: 0.95, 10: 1.0, 11: 1.3, 12: 1.75}
+PESO_DIA_SEMANA = (0.9, 0.9, 0.95, 1.0, 1.15, 1.3, 0.8)
+
+# Crecimiento de las ventas entre el primer y el último día del historial
+CRECIMIENTO_ANUAL = 0.15
 
 def insertar_datos_prueba() -> bool:
     """
     Inserta datos de prueba en las tablas de categorías, proveedores, productos y clientes.
-    
+
     Retorna:
-        bool: True si los datos fueron insertados correctamente, 
+        bool: True si los datos fueron insertados correctamente,
             False si ocurrió un error.
     """
     conexion = None
@@ -17,64 +97,19 @@ def insertar_datos_prueba() -> bool:
         cursor = conexion.cursor()
 
         # Insertar categorías de prueba
-        categorias = [
-            ("Periféricos"),
-            ("Computadoras"),
-            ("Sonido"),
-            ("Accesorios"),
-            ("Pantallas"),
-            ("Redes"),
-            ("Almacenamiento"),
-            ("Cámaras"),
-            ("Micrófonos"),
-            ("Conectividad")
-        ]
-        cursor.executemany("INSERT OR IGNORE INTO categorias (nombre) VALUES (?)", [(categoria,) for categoria in categorias])
+        cursor.executemany(
+            "INSERT OR IGNORE INTO categorias (nombre, nombre_normalizado) VALUES (?, ?)",
+            [(categoria, normalizar_texto(categoria)) for categoria in CATEGORIAS_PRUEBA]
+        )
 
         # Insertar proveedores de prueba
-        proveedores = [
-            ("TechDistrib SA", "1150001000", "ventas@techdistrib.com", "30548976123"),
-            ("PixelTrade SRL", "1144003000", "info@pixeltrade.com", "30765432987"),
-            ("ZendaTech", "1166004000", "contacto@zendatech.com", "30548911223"),
-            ("NovaElectro SA", "1177005000", "ventas@novaelectro.com", "30784291425"),
-            ("ElectroNet SRL", "1133006000", "soporte@electronet.com", "30698754123"),
-            ("Neotec Supplies", "1188007000", "pedidos@neotec.com", "30712549876"),
-            ("MasterTech", "1122008000", "ventas@mastertech.com", "30678912345"),
-            ("BitImport SRL", "1140009000", "compras@bitimport.com", "30789654123"),
-            ("CoreByte SRL", "1155001001", "contacto@corebyte.com", "30565498741"),
-            ("SysDistrib SA", "1170001100", "info@sysdistrib.com", "30874123698")
-        ]
-        cursor.executemany("INSERT OR IGNORE INTO proveedores (nombre, telefono, email, cuit) VALUES (?, ?, ?, ?)", proveedores)
+        cursor.executemany("INSERT OR IGNORE INTO proveedores (nombre, telefono, email, cuit) VALUES (?, ?, ?, ?)", PROVEEDORES_PRUEBA)
 
         # Insertar clientes de prueba
-        clientes = [
-            ("Laura Martínez", "1123456789", "laura.martinez@mail.com", "40875231"),
-            ("Ricardo Gómez", "1134567890", "ricardo.gomez@mail.com", "39548620"),
-            ("Daniela Torres", "1145678901", "daniela.torres@mail.com", "42319876"),
-            ("Javier Ruiz", "1156789012", "javier.ruiz@mail.com", "38765412"),
-            ("Sofía Fernández", "1167890123", "sofia.fernandez@mail.com", "41098567"),
-            ("Mateo Navarro", "1178901234", "mateo.navarro@mail.com", "40234687"),
-            ("Valentina Díaz", "1189012345", "valentina.diaz@mail.com", "41687452"),
-            ("Nicolás Romero", "1190123456", "nicolas.romero@mail.com", "42985741"),
-            ("Martina López", "1132145678", "martina.lopez@mail.com", "41987654"),
-            ("Tomás Herrera", "1143256789", "tomas.herrera@mail.com", "43127841")
-        ]
-        cursor.executemany("INSERT OR IGNORE INTO clientes (nombre, telefono, email, dni) VALUES (?, ?, ?, ?)", clientes)
+        cursor.executemany("INSERT OR IGNORE INTO clientes (nombre, telefono, email, dni) VALUES (?, ?, ?, ?)", CLIENTES_PRUEBA)
 
         # Insertar productos de prueba
-        productos = [
-            ("Teclado mecánico RGB", 1, 1, 25, 90500),
-            ("Mouse inalámbrico", 1, 2, 40, 27800),
-            ("Auriculares gamer", 3, 3, 30, 89000),
-            ("Monitor LED 24\"", 5, 4, 15, 344500),
-            ("Laptop Intel i5 8GB SSD", 2, 5, 10, 1200500),
-            ("Parlantes Bluetooth", 3, 1, 35, 76000),
-            ("Alfombrilla XL antideslizante", 4, 6, 50, 22700),
-            ("Micrófono USB condensador", 9, 2, 20, 68000),
-            ("Webcam Full HD 1080p", 8, 3, 20, 85000),
-            ("Hub USB 4 puertos", 10, 7, 18, 37000)
-        ]
-        cursor.executemany("INSERT OR IGNORE INTO productos (nombre, categoria_id, proveedor_id, stock, precio_unitario) VALUES (?, ?, ?, ?, ?)", productos)
+        cursor.executemany("INSERT OR IGNORE INTO productos (nombre, categoria_id, proveedor_id, stock, precio_unitario) VALUES (?, ?, ?, ?, ?)", PRODUCTOS_PRUEBA)
 
         # Confirmar cambios
         conexion.commit()
@@ -87,6 +122,304 @@ def insertar_datos_prueba() -> bool:
         if conexion:
             conexion.close()
 
+def _en_lotes(filas, tamanio: int = TAMANIO_LOTE_SINTETICO):
+    """
+    Agrupa un iterable de filas en listas de hasta `tamanio` elementos.
+    """
+    iterador = iter(filas)
+    while lote := list(itertools.islice(iterador, tamanio)):
+        yield lote
+
+def _insertar_en_lotes(conexion: sqlite3.Connection, sentencia: str, filas) -> int:
+    """
+    Inserta filas con executemany, confirmando una transacción por lote.
+
+    Retorna:
+        int: Cantidad de filas insertadas.
+    """
+    total = 0
+    for lote in _en_lotes(filas):
+        conexion.execute("BEGIN")
+        conexion.executemany(sentencia, lote)
+        conexion.commit()
+        total += len(lote)
+    return total
+
+def _insertar_sin_disparador(conexion: sqlite3.Connection, sentencia: str, filas, tabla: str, primer_id: int) -> int:
+    """
+    Inserta filas de productos o clientes en una única transacción, con la búsqueda
+    de texto indexada en bloque al final (ver indexacion_diferida). Si algo falla se
+    revierte todo, trigger incluido.
+
+    Retorna:
+        int: Cantidad de filas insertadas.
+    """
+    total = 0
+    conexion.execute("BEGIN")
+    try:
+        with indexacion_diferida(conexion, tabla, primer_id):
+            for lote in _en_lotes(filas):
+                conexion.executemany(sentencia, lote)
+                total += len(lote)
+        conexion.commit()
+    except Exception:
+        conexion.rollback()
+        raise
+    return total
+
+def _pesos_zipf(cantidad: int, exponente: float) -> list[float]:
+    """
+    Pesos acumulados de una distribución de Zipf sobre `cantidad` posiciones.
+    """
+    return list(itertools.accumulate(1 / rango ** exponente for rango in range(1, cantidad + 1)))
+
+def _presupuesto_diario(lineas: int, desde: date, dias: int) -> list[tuple[date, int]]:
+    """
+    Reparte las líneas entre los días según el mes, el día de la semana y el
+    crecimiento, de modo que la suma sea exactamente `lineas`.
+    """
+    fechas = [desde + timedelta(days=i) for i in range(dias)]
+    pesos = [
+        PESO_MES[dia.month] * PESO_DIA_SEMANA[dia.weekday()] * (1 + CRECIMIENTO_ANUAL * i / 365)
+        for i, dia in enumerate(fechas)
+    ]
+    total_pesos = sum(pesos)
+    presupuesto, asignadas, acumulado = [], 0, 0.0
+    for dia, peso in zip(fechas, pesos):
+        acumulado += peso
+        hasta_hoy = round(lineas * acumulado / total_pesos)
+        presupuesto.append((dia, hasta_hoy - asignadas))
+        asignadas = hasta_hoy
+    return presupuesto
+
+def generar_datos_sinteticos(productos: int = 10_000, clientes: int = 5_000, lineas: int = 100_000,
+                             categorias: int = 10, proveedores: int = 50, dias: int = 730,
+                             hasta: str = None, semilla: int = 42, stock: int = None) -> dict:
+    """
+    Genera un volumen configurable de datos ficticios para pruebas de carga.
+
+    Agrega categorías, proveedores, productos y clientes a los que ya existan, y
+    después un historial de ventas sobre todo el catálogo: la popularidad de los
+    productos y la frecuencia de los clientes siguen una distribución de Zipf, y
+    las fechas tienen estacionalidad mensual y semanal con una tendencia creciente.
+    Con la misma semilla, la misma fecha final y la misma base inicial, el
+    resultado es idéntico.
+
+    Carga con executemany en transacciones de TAMANIO_LOTE_SINTETICO filas bajo el
+    perfil "bulk-load" (sin fsync; si se interrumpe, conviene empezar de nuevo) y
+    al final reconstruye los resúmenes de ventas. No descuenta stock.
+
+    Parámetros:
+        productos (int): Productos a agregar.
+        clientes (int): Clientes a agregar.
+        lineas (int): Líneas de factura a generar (las facturas salen de agruparlas).
+        categorias (int): Categorías a agregar.
+        proveedores (int): Proveedores a agregar.
+        dias (int): Días de historial de ventas.
+        hasta (str): Último día del historial 'YYYY-MM-DD'; por defecto, hoy.
+        semilla (int): Semilla del generador aleatorio.
+        stock (int): Stock de cada producto nuevo; por defecto, al azar entre 20 y 500.
+
+    Retorna:
+        dict: Filas insertadas por tabla, duracion_seg y filas_por_seg.
+
+    Lanza:
+        ValueError: Si hay líneas para generar pero no hay productos o clientes.
+        sqlite3.Error: Si falla la base de datos (se confirma lo insertado hasta el último lote).
+    """
+    azar = random.Random(semilla)
+    resumen = {"categorias": 0, "proveedores": 0, "productos": 0, "clientes": 0, "facturas": 0, "lineas": 0}
+    inicio = time.perf_counter()
+    perfil_anterior = data_base.perfil_activo()
+    data_base.configurar_perfil("bulk-load")
+    try:
+        with data_base.conexion_db() as conexion:
+            # Las claves foráneas se generan válidas; no hace falta verificarlas fila por fila
+            conexion.execute("PRAGMA foreign_keys = OFF")
+            # Categorías: los nombres de la carga inicial, numerados a partir de la segunda vuelta
+            primera = siguiente_id(conexion, "categorias", "id_categoria")
+            nombres = [
+                CATEGORIAS_PRUEBA[(i - 1) % len(CATEGORIAS_PRUEBA)] + ("" if i <= len(CATEGORIAS_PRUEBA) else f" {i}")
+                for i in range(primera, primera + categorias)
+            ]
+            resumen["categorias"] = _insertar_en_lotes(
+                conexion, "INSERT INTO categorias (id_categoria, nombre, nombre_normalizado) VALUES (?, ?, ?)",
+                ((i, nombre, normalizar_texto(nombre)) for i, nombre in enumerate(nombres, start=primera))
+            )
+
+            primera = siguiente_id(conexion, "proveedores", "id_proveedor")
+            resumen["proveedores"] = _insertar_en_lotes(
+                conexion, "INSERT INTO proveedores (id_proveedor, nombre, telefono, email, cuit) VALUES (?, ?, ?, ?, ?)",
+                ((i, f"{PROVEEDORES_PRUEBA[i % len(PROVEEDORES_PRUEBA)][0]} {i}", f"11{azar.randrange(10**8):08d}",
+                  f"proveedor{i}@mail.com", f"30{i:09d}") for i in range(primera, primera + proveedores))
+            )
+
+            # Productos: tipo de la carga inicial + marca + modelo; la categoría suele ser la del tipo
+            ids_categorias = {}
+            for id_categoria, nombre in conexion.execute("SELECT id_categoria, nombre FROM categorias"):
+                ids_categorias.setdefault(nombre.split()[0], []).append(id_categoria)
+            todas_categorias = [i for ids in ids_categorias.values() for i in ids]
+            ids_proveedores = [fila[0] for fila in conexion.execute("SELECT id_proveedor FROM proveedores")]
+            marcas = [proveedor[0].split()[0] for proveedor in PROVEEDORES_PRUEBA]
+
+            def filas_productos(primero: int):
+                for i in range(primero, primero + productos):
+                    tipo, categoria_base, _, _, precio_base = azar.choice(PRODUCTOS_PRUEBA)
+                    candidatas = ids_categorias.get(CATEGORIAS_PRUEBA[categoria_base - 1].split()[0])
+                    categoria = azar.choice(candidatas if candidatas and azar.random() < 0.8 else todas_categorias)
+                    precio = round(precio_base * azar.lognormvariate(0, 0.35), -2) or 100
+                    yield (i, f"{tipo} {azar.choice(marcas)} {azar.randint(100, 9999)}", categoria,
+                           azar.choice(ids_proveedores), stock if stock is not None else azar.randint(20, 500), precio)
+
+            if productos:
+                if not todas_categorias or not ids_proveedores:
+                    raise ValueError("Hacen falta categorías y proveedores para generar productos.")
+                primero = siguiente_id(conexion, "productos", "id_producto")
+                resumen["productos"] = _insertar_sin_disparador(
+                    conexion, "INSERT INTO productos (id_producto, nombre, categoria_id, proveedor_id, stock, precio_unitario) "
+                              "VALUES (?, ?, ?, ?, ?, ?)", filas_productos(primero),
+                    "productos", primero
+                )
+
+            nombres_pila = [cliente[0].split()[0] for cliente in CLIENTES_PRUEBA]
+            apellidos = [cliente[0].split()[1] for cliente in CLIENTES_PRUEBA]
+
+            def filas_clientes(primero: int):
+                for i in range(primero, primero + clientes):
+                    nombre, apellido = azar.choice(nombres_pila), azar.choice(apellidos)
+                    yield (i, f"{nombre} {apellido}", f"11{azar.randrange(10**8):08d}",
+                           f"{normalizar_texto(nombre)}.{normalizar_texto(apellido)}{i}@mail.com", f"{20_000_000 + i}")
+
+            if clientes:
+                primero = siguiente_id(conexion, "clientes", "id_cliente")
+                resumen["clientes"] = _insertar_sin_disparador(
+                    conexion, "INSERT INTO clientes (id_cliente, nombre, telefono, email, dni) VALUES (?, ?, ?, ?, ?)",
+                    filas_clientes(primero), "clientes", primero
+                )
+
+            if lineas:
+                resumen.update(_generar_ventas(conexion, azar, lineas, dias, hasta))
+                conexion.execute("BEGIN")
+                reconstruir_resumenes_en(conexion)
+                conexion.commit()
+    finally:
+        # Cierra las conexiones del pool (y con ellas foreign_keys = OFF)
+        data_base.configurar_perfil(perfil_anterior)
+
+    duracion = time.perf_counter() - inicio
+    filas = sum(resumen.values())
+    resumen["duracion_seg"] = round(duracion, 2)
+    resumen["filas_por_seg"] = round(filas / duracion) if duracion > 0 else 0
+    log_info("Datos sintéticos generados", operacion="datos_sinteticos", semilla=semilla,
+             **{clave: valor for clave, valor in resumen.items()})
+    return resumen
+
+def _generar_ventas(conexion: sqlite3.Connection, azar: random.Random, lineas: int, dias: int,
+                    hasta: str = None) -> dict:
+    """
+    Inserta facturas y líneas sintéticas sobre el catálogo y los clientes existentes.
+
+    Retorna:
+        dict: facturas y lineas insertadas.
+    """
+    catalogo = conexion.execute("""
+        SELECT p.id_producto, p.nombre, c.nombre, prov.nombre, p.precio_unitario
+        FROM productos p
+        JOIN categorias c ON p.categoria_id = c.id_categoria
+        JOIN proveedores prov ON p.proveedor_id = prov.id_proveedor
+        ORDER BY p.id_producto
+    """).fetchall()
+    compradores = conexion.execute("SELECT id_cliente, nombre, email, dni FROM clientes ORDER BY id_cliente").fetchall()
+    if not catalogo or not compradores:
+        raise ValueError("Hacen falta productos (con categoría y proveedor) y clientes para generar ventas.")
+
+    # La popularidad no depende del ID: se asignan los rangos de Zipf a un orden al azar
+    azar.shuffle(catalogo)
+    azar.shuffle(compradores)
+    pesos_productos = _pesos_zipf(len(catalogo), ZIPF_PRODUCTOS)
+    pesos_clientes = _pesos_zipf(len(compradores), ZIPF_CLIENTES)
+
+    ultimo_dia = datetime.strptime(hasta, "%Y-%m-%d").date() if hasta else date.today()
+    id_factura = siguiente_id(conexion, "facturas", "id_factura")
+    facturas, detalle = [], []
+    resumen = {"facturas": 0, "lineas": 0}
+
+    def volcar():
+        conexion.execute("BEGIN")
+        conexion.executemany("""
+            INSERT INTO facturas (id_factura, fecha, cliente_id, nombre_cliente, email_cliente, dni_cliente, total)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, facturas)
+        conexion.executemany("""
+            INSERT INTO factura_detalle (factura_id, producto_id, cantidad, precio_unitario, total_linea,
+                                         nombre_producto, nombre_categoria, nombre_proveedor)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, detalle)
+        conexion.commit()
+        resumen["facturas"] += len(facturas)
+        resumen["lineas"] += len(detalle)
+        facturas.clear()
+        detalle.clear()
+
+    for dia, presupuesto in _presupuesto_diario(lineas, ultimo_dia - timedelta(days=dias - 1), dias):
+        if presupuesto <= 0:
+            continue
+        # Primero se reparten las líneas del día en facturas, después se sortean productos y unidades
+        tamanios = []
+        for tamanio in azar.choices(*LINEAS_POR_FACTURA, k=presupuesto):
+            tamanios.append(min(tamanio, presupuesto))
+            presupuesto -= tamanios[-1]
+            if presupuesto <= 0:
+                break
+        vendidos = iter(azar.choices(catalogo, cum_weights=pesos_productos, k=sum(tamanios)))
+        unidades = iter(azar.choices(*UNIDADES_POR_LINEA, k=sum(tamanios)))
+        clientes_dia = azar.choices(compradores, cum_weights=pesos_clientes, k=len(tamanios))
+        segundos = sorted(azar.randrange(9 * 3600, 21 * 3600) for _ in tamanios)
+
+        for tamanio, cliente, segundo in zip(tamanios, clientes_dia, segundos):
+            total = 0.0
+            for _ in range(tamanio):
+                producto_id, nombre, categoria, proveedor, precio = next(vendidos)
+                cantidad = next(unidades)
+                total_linea = round(cantidad * precio, 2)
+                total += total_linea
+                detalle.append((id_factura, producto_id, cantidad, precio, total_linea, nombre, categoria, proveedor))
+            fecha = f"{dia.isoformat()} {segundo // 3600:02d}:{segundo // 60 % 60:02d}:{segundo % 60:02d}"
+            facturas.append((id_factura, fecha, cliente[0], cliente[1], cliente[2], cliente[3], round(total, 2)))
+            id_factura += 1
+
+        if len(detalle) >= TAMANIO_LOTE_SINTETICO:
+            volcar()
+
+    if detalle:
+        volcar()
+    return resumen
+
 if __name__ == "__main__":
-    insertar_datos_prueba()
-    print("Datos de prueba insertados correctamente.")
+    parser = argparse.ArgumentParser(description="Carga datos de prueba. Sin opciones, inserta los registros fijos; "
+                                                 "con --productos, --clientes o --lineas, genera datos sintéticos.")
+    parser.add_argument("--productos", type=int, default=0, help="Productos sintéticos a agregar")
+    parser.add_argument("--clientes", type=int, default=0, help="Clientes sintéticos a agregar")
+    parser.add_argument("--lineas", type=int, default=0, help="Líneas de factura sintéticas a generar")
+    parser.add_argument("--categorias", type=int, default=None, help="Categorías a agregar (por defecto 10)")
+    parser.add_argument("--proveedores", type=int, default=None, help="Proveedores a agregar (por defecto 50)")
+    parser.add_argument("--dias", type=int, default=730, help="Días de historial de ventas")
+    parser.add_argument("--hasta", default=None, help="Último día del historial AAAA-MM-DD (por defecto, hoy)")
+    parser.add_argument("--semilla", type=int, default=42, help="Semilla del generador aleatorio")
+    args = parser.parse_args()
+
+    inicializar_base()
+    if not (args.productos or args.clientes or args.lineas):
+        insertar_datos_prueba()
+        print("Datos de prueba insertados correctamente.")
+    else:
+        resultado = generar_datos_sinteticos(
+            productos=args.productos, clientes=args.clientes, lineas=args.lineas,
+            categorias=10 if args.categorias is None else args.categorias,
+            proveedores=50 if args.proveedores is None else args.proveedores,
+            dias=args.dias, hasta=args.hasta, semilla=args.semilla
+        )
+        print(f"Datos sintéticos generados en {resultado['duracion_seg']} s "
+              f"({resultado['filas_por_seg']} filas/s): " +
+              ", ".join(f"{tabla}: {resultado[tabla]}" for tabla in
+                        ("categorias", "proveedores", "productos", "clientes", "facturas", "lineas")))
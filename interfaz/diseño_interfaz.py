@@ -138,9 +138,30 @@ def menu_ventas() -> str:
     console.print(f"[{COLOR_NUMERO}]1[/{COLOR_NUMERO}]. [{COLOR_TEXTO}]Registrar venta[/{COLOR_TEXTO}]")
     console.print(f"[{COLOR_NUMERO}]2[/{COLOR_NUMERO}]. [{COLOR_TEXTO}]Ver todas las facturas[/{COLOR_TEXTO}]")
     console.print(f"[{COLOR_NUMERO}]3[/{COLOR_NUMERO}]. [{COLOR_TEXTO}]Exportar factura por ID[/{COLOR_TEXTO}]")
+    console.print(f"[{COLOR_NUMERO}]4[/{COLOR_NUMERO}]. [{COLOR_TEXTO}]Reportes de ventas[/{COLOR_TEXTO}]")
+    console.print(f"[{COLOR_NUMERO}]5[/{COLOR_NUMERO}]. [{COLOR_TEXTO}]Ranking de productos y clientes[/{COLOR_TEXTO}]")
     console.print(f"[{COLOR_NUMERO}]0[/{COLOR_NUMERO}]. [{COLOR_TEXTO}]Volver al menú principal[/{COLOR_TEXTO}]")
     return console.input(f"\n[{COLOR_INPUT}]Seleccioná una opción:[/{COLOR_INPUT}] ").strip()
 
+def menu_reportes() -> str:
+    """
+    Muestra el menú de reportes de ventas.
+
+    Retorna:
+        str: La opción seleccionada por el usuario.
+    """
+    if not hasattr(menu_reportes, "_encabezado_mostrado") or not menu_reportes._encabezado_mostrado:
+        encabezado_seccion("Reportes de ventas")
+        menu_reportes._encabezado_mostrado = True
+
+    console.print(f"[{COLOR_NUMERO}]1[/{COLOR_NUMERO}]. [{COLOR_TEXTO}]Ventas del mes por categoría[/{COLOR_TEXTO}]")
+    console.print(f"[{COLOR_NUMERO}]2[/{COLOR_NUMERO}]. [{COLOR_TEXTO}]Ventas del mes por día[/{COLOR_TEXTO}]")
+    console.print(f"[{COLOR_NUMERO}]3[/{COLOR_NUMERO}]. [{COLOR_TEXTO}]Ventas del mes por producto[/{COLOR_TEXTO}]")
+    console.print(f"[{COLOR_NUMERO}]4[/{COLOR_NUMERO}]. [{COLOR_TEXTO}]Ventas del mes por cliente[/{COLOR_TEXTO}]")
+    console.print(f"[{COLOR_NUMERO}]5[/{COLOR_NUMERO}]. [{COLOR_TEXTO}]Reconstruir resúmenes[/{COLOR_TEXTO}]")
+    console.print(f"[{COLOR_NUMERO}]0[/{COLOR_NUMERO}]. [{COLOR_TEXTO}]Volver[/{COLOR_TEXTO}]")
+    return console.input(f"\n[{COLOR_INPUT}]Seleccioná una opción:[/{COLOR_INPUT}] ").strip()
+
 def menu_clientes() -> str:
     """
     Muestra el menú de clientes.
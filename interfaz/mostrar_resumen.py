@@ -7,36 +7,56 @@ from rich.panel import Panel
 from rich.columns import Columns
 from rich.table import Table
 
-from interfaz.diseño_interfaz import mostrar_error
+from interfaz.diseño_interfaz import mostrar_error, pedir_input_con_cancelacion
 from gestor_ventas.facturas_db import obtener_detalle_venta
+from gestor_productos.productos_db import listar_productos_pagina
+from gestor_clientes.clientes_db import listar_clientes_pagina
+from gestor_proveedores.proveedores_db import listar_proveedores_pagina
 
 
 console = Console()
 
-
-def mostrar_productos(productos: list):
+# Filas por página en las tablas paginadas
+TAMANIO_PAGINA = 20
+
+# Columnas de cada tabla: (título, alineación, clave de orden en SQL o None)
+COLUMNAS_PRODUCTOS = [
+    ("ID", "center", "id"), ("Nombre", "left", "nombre"), ("Categoría", "left", "categoria"),
+    ("Proveedor", "left", "proveedor"), ("Stock", "center", "stock"), ("Precio Venta", "right", "precio"),
+]
+COLUMNAS_CLIENTES = [
+    ("ID", "center", "id"), ("Nombre", "left", "nombre"), ("Teléfono", "center", "telefono"),
+    ("Email", "left", "email"), ("DNI", "center", "dni"),
+]
+COLUMNAS_PROVEEDORES = [
+    ("ID", "center", "id"), ("Nombre", "left", "nombre"), ("Teléfono", "center", "telefono"),
+    ("Email", "left", "email"), ("CUIT", "center", "cuit"),
+]
+
+
+def mostrar_productos(productos: list, titulo: str = "Productos disponibles"):
     """
     Muestra una tabla con los productos disponibles en el sistema.
 
     Args:
         productos (list): Lista de productos a mostrar.
+        titulo (str): Título de la tabla (por ejemplo, para resultados de una búsqueda).
     """
     console.print()
-    titulo_tabla = Text("Productos disponibles", style="white")
+    titulo_tabla = Text(titulo, style="white")
     tabla = Table(title=titulo_tabla, header_style="bold green", border_style="grey39", show_lines=False)
-    tabla.add_column("ID", style="white", justify="center")
-    tabla.add_column("Nombre", style="white")
-    tabla.add_column("Categoría", style="white")
-    tabla.add_column("Proveedor", style="white")
-    tabla.add_column("Stock", style="white", justify="center")
-    tabla.add_column("Precio Venta", style="white", justify="right")
+    for nombre, alineacion, _ in COLUMNAS_PRODUCTOS:
+        tabla.add_column(nombre, style="white", justify=alineacion)
 
     for prod in productos:
-        tabla.add_row(str(prod[0]), str(prod[1]), str(prod[2]), str(prod[3]), str(prod[4]), f"${prod[5]:.2f}")
+        tabla.add_row(*_fila_producto(prod))
     
     console.print(tabla)
     console.print()
 
+def _fila_producto(prod: tuple) -> tuple:
+    return str(prod[0]), str(prod[1]), str(prod[2]), str(prod[3]), str(prod[4]), f"${prod[5]:.2f}"
+
 def mostrar_proveedores(proveedores: list):
     """
     Muestra una tabla con los proveedores registrados.
@@ -47,14 +67,11 @@ def mostrar_proveedores(proveedores: list):
     console.print()
     titulo_tabla = Text("Proveedores registrados", style="white")
     tabla = Table(title=titulo_tabla, header_style="bold green", border_style="grey39", show_lines=False)
-    tabla.add_column("ID", style="white", justify="center")
-    tabla.add_column("Nombre", style="white")
-    tabla.add_column("Teléfono", style="white", justify="center")
-    tabla.add_column("Email", style="white")
-    tabla.add_column("CUIT", style="white", justify="center")
+    for nombre, alineacion, _ in COLUMNAS_PROVEEDORES:
+        tabla.add_column(nombre, style="white", justify=alineacion)
 
     for prov in proveedores:
-        tabla.add_row(str(prov[0]), prov[1], prov[2], prov[3], prov[4])
+        tabla.add_row(*_fila_persona(prov))
     
     console.print(tabla)
     console.print()
@@ -78,41 +95,45 @@ def mostrar_categorias(categorias: list):
     console.print(tabla)
     console.print()
 
-def mostrar_clientes(clientes: list):
+def mostrar_clientes(clientes: list, titulo: str = "Clientes registrados"):
     """
     Muestra una tabla con los clientes registrados.
 
     Args:
         clientes (list): Lista de clientes a mostrar.
+        titulo (str): Título de la tabla (por ejemplo, para resultados de una búsqueda).
     """
     console.print()
-    titulo_tabla = Text("Clientes registrados", style="white")
+    titulo_tabla = Text(titulo, style="white")
     tabla = Table(title=titulo_tabla, header_style="bold green", border_style="grey39", show_lines=False)
-    tabla.add_column("ID", style="white", justify="center")
-    tabla.add_column("Nombre", style="white")
-    tabla.add_column("Teléfono", style="white", justify="center")
-    tabla.add_column("Email", style="white")
-    tabla.add_column("DNI", style="white", justify="center")
+    for nombre, alineacion, _ in COLUMNAS_CLIENTES:
+        tabla.add_column(nombre, style="white", justify=alineacion)
 
     for cli in clientes:
-        tabla.add_row(str(cli[0]), cli[1], cli[2], cli[3], cli[4])
+        tabla.add_row(*_fila_persona(cli))
     
     console.print(tabla)
     console.print()
 
-def mostrar_facturas(facturas: list):
+def _fila_persona(fila: tuple) -> tuple:
+    # Clientes y proveedores: ID, nombre, teléfono, email y DNI o CUIT
+    return str(fila[0]), fila[1], fila[2], fila[3], fila[4]
+
+def mostrar_facturas(facturas: list, numero_pagina: int = None):
     """
     Muestra una tabla con las facturas generadas.
 
     Args:
         facturas (list): Lista de facturas a mostrar.
+        numero_pagina (int): Si se indica, se muestra en el título (vista paginada).
     """
     if not facturas:
         mostrar_error("No hay facturas registradas\n")
         return
 
     console.print()
-    titulo_tabla = Text("Facturas generadas", style="white")
+    titulo = "Facturas generadas" if numero_pagina is None else f"Facturas generadas — página {numero_pagina}"
+    titulo_tabla = Text(titulo, style="white")
     tabla = Table(title=titulo_tabla, header_style="bold green", border_style="grey39", show_lines=False)
     tabla.add_column("ID", justify="center", style="white")
     tabla.add_column("Fecha", style="white", justify="center")
@@ -198,3 +219,167 @@ def mostrar_resumen_venta(id_factura: int):
 
     console.print(tabla)
     console.print()
+
+def mostrar_reporte_ventas(titulo: str, columnas: list[tuple[str, str]], filas: list, total: tuple = None):
+    """
+    Muestra una tabla de reporte de ventas, con un renglón de totales opcional.
+
+    Args:
+        titulo (str): Título de la tabla.
+        columnas (list[tuple[str, str]]): Pares (nombre, alineación) de cada columna.
+        filas (list): Filas ya formateadas como texto.
+        total (tuple): Renglón de totales ya formateado, opcional.
+    """
+    if not filas:
+        mostrar_error("No hay ventas en el período elegido\n")
+        return
+
+    console.print()
+    titulo_tabla = Text(titulo, style="white")
+    tabla = Table(title=titulo_tabla, header_style="bold green", border_style="grey39", show_lines=False)
+    for nombre, alineacion in columnas:
+        tabla.add_column(nombre, style="white", justify=alineacion)
+
+    for fila in filas:
+        tabla.add_row(*fila)
+    if total:
+        tabla.add_section()
+        tabla.add_row(*total, style="bold green")
+
+    console.print(tabla)
+    console.print()
+
+def paginar_tabla(titulo: str, columnas: list[tuple], obtener_pagina, formatear_fila, elegir=None,
+                  mensaje_eleccion: str = None, tamanio_pagina: int = TAMANIO_PAGINA):
+    """
+    Muestra una tabla de a una página por vez, leyendo cada página bajo demanda.
+
+    Solo se consulta y dibuja la página actual, así la primera aparece enseguida
+    sin importar el tamaño de la tabla. Comandos: S (siguiente), A (anterior),
+    I n (ir a la página n), O n (ordenar por la columna n; repetido invierte el
+    orden), F texto (filtrar; F solo quita el filtro).
+
+    Si se indica `elegir`, cualquier otra entrada se le pasa para elegir una fila
+    (por ejemplo, un ID) y la tabla se cierra cuando devuelve algo distinto de None.
+
+    Args:
+        titulo (str): Título de la tabla.
+        columnas (list[tuple]): (título, alineación, clave de orden o None) por columna.
+        obtener_pagina (callable): (tamanio, desplazamiento, orden, descendente, filtro) → filas.
+        formatear_fila (callable): Fila → tupla de textos, una por columna.
+        elegir (callable): Entrada del usuario → fila elegida o None, opcional.
+        mensaje_eleccion (str): Pedido que se muestra cuando se puede elegir.
+        tamanio_pagina (int): Filas por página.
+
+    Retorna:
+        El valor devuelto por `elegir`, o None si el usuario sale o cancela.
+    """
+    pagina, orden, descendente, filtro = 1, None, False, ""
+    # Se pide una fila de más para saber si hay página siguiente sin contar la tabla
+    filas = obtener_pagina(tamanio_pagina + 1, 0, orden, descendente, filtro)
+    dibujar = True
+
+    while True:
+        # Ante un error solo se vuelve a pedir el comando, sin redibujar la página
+        if dibujar:
+            _dibujar_pagina(titulo, columnas, filas[:tamanio_pagina], formatear_fila, pagina, orden, descendente, filtro)
+            dibujar = False
+        hay_siguiente = len(filas) > tamanio_pagina
+
+        comandos = "S: siguiente, A: anterior, I n: ir a página, O n: ordenar por columna, F texto: filtrar"
+        if elegir is None:
+            entrada = pedir_input_con_cancelacion(f"{comandos} (Enter o C para volver): ")
+        else:
+            entrada = pedir_input_con_cancelacion(f"{mensaje_eleccion} ({comandos}, C para cancelar): ")
+
+        comando, _, argumento = entrada.partition(" ")
+        comando, argumento = comando.lower(), argumento.strip()
+        nueva_pagina, nuevo_orden, nuevo_descendente, nuevo_filtro = pagina, orden, descendente, filtro
+
+        if comando in ("", "c"):
+            return None
+        elif comando == "s" and not argumento:
+            if not hay_siguiente:
+                mostrar_error("No hay más páginas.")
+                continue
+            nueva_pagina = pagina + 1
+        elif comando == "a" and not argumento:
+            if pagina == 1:
+                mostrar_error("Ya estás en la primera página.")
+                continue
+            nueva_pagina = pagina - 1
+        elif comando == "i" and argumento.isdigit() and int(argumento) > 0:
+            nueva_pagina = int(argumento)
+        elif comando == "o" and argumento.isdigit() and 1 <= int(argumento) <= len(columnas) \
+                and columnas[int(argumento) - 1][2]:
+            nuevo_orden = columnas[int(argumento) - 1][2]
+            nuevo_descendente = not descendente if nuevo_orden == orden else False
+            nueva_pagina = 1
+        elif comando == "f":
+            nuevo_filtro = argumento
+            nueva_pagina = 1
+        elif elegir is not None:
+            elegido = elegir(entrada)
+            if elegido is not None:
+                return elegido
+            continue
+        else:
+            mostrar_error("Comando inválido.")
+            continue
+
+        nuevas_filas = obtener_pagina(tamanio_pagina + 1, (nueva_pagina - 1) * tamanio_pagina,
+                                      nuevo_orden, nuevo_descendente, nuevo_filtro)
+        if not nuevas_filas and nueva_pagina > 1:
+            mostrar_error(f"La página {nueva_pagina} no existe.")
+            continue
+        filas = nuevas_filas
+        pagina, orden, descendente, filtro = nueva_pagina, nuevo_orden, nuevo_descendente, nuevo_filtro
+        dibujar = True
+
+def _dibujar_pagina(titulo: str, columnas: list[tuple], filas: list, formatear_fila, pagina: int,
+                    orden: str, descendente: bool, filtro: str):
+    """
+    Dibuja una página de paginar_tabla(), con el orden y el filtro en uso al pie.
+    """
+    console.print()
+    titulo_tabla = Text(f"{titulo} — página {pagina}", style="white")
+    tabla = Table(title=titulo_tabla, header_style="bold green", border_style="grey39", show_lines=False,
+                  caption_style="grey50")
+    for numero, (nombre, alineacion, clave) in enumerate(columnas, start=1):
+        marca = (" ▼" if descendente else " ▲") if clave is not None and clave == orden else ""
+        tabla.add_column(f"{nombre}{marca}" if clave is None else f"{numero}. {nombre}{marca}",
+                         style="white", justify=alineacion)
+
+    for fila in filas:
+        tabla.add_row(*formatear_fila(fila))
+
+    pie = []
+    if filtro:
+        pie.append(f"Filtro: '{filtro}'")
+    if not filas:
+        pie.append("Sin resultados")
+    tabla.caption = " · ".join(pie) or None
+
+    console.print(tabla)
+    console.print()
+
+def mostrar_productos_paginados(elegir=None, mensaje_eleccion: str = None):
+    """
+    Muestra los productos con paginar_tabla(); el filtro busca en nombre, categoría y proveedor.
+    """
+    return paginar_tabla("Productos registrados", COLUMNAS_PRODUCTOS, listar_productos_pagina,
+                         _fila_producto, elegir, mensaje_eleccion)
+
+def mostrar_clientes_paginados(elegir=None, mensaje_eleccion: str = None):
+    """
+    Muestra los clientes con paginar_tabla(); el filtro busca en nombre, email y DNI.
+    """
+    return paginar_tabla("Clientes registrados", COLUMNAS_CLIENTES, listar_clientes_pagina,
+                         _fila_persona, elegir, mensaje_eleccion)
+
+def mostrar_proveedores_paginados(elegir=None, mensaje_eleccion: str = None):
+    """
+    Muestra los proveedores con paginar_tabla(); el filtro busca en nombre, email y CUIT.
+    """
+    return paginar_tabla("Proveedores registrados", COLUMNAS_PROVEEDORES, listar_proveedores_pagina,
+                         _fila_persona, elegir, mensaje_eleccion)
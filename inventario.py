@@ -0,0 +1,356 @@
+# Línea de comandos no interactiva
+# Expone las mismas operaciones del menú de main.py como subcomandos, para usarlas
+# desde scripts, cron o tuberías, sobre las mismas funciones de *_db y de los servicios.
+#
+# La salida se elige con --formato: "tabla" (Rich, como el menú), "csv", "json" o "jsonl".
+# Por defecto es "tabla" en una terminal y "csv" cuando la salida va a un archivo o a
+# otro programa; en ese caso no se importa Rich ni la interfaz, y los listados se leen
+# y escriben de a bloques, sin cargar la tabla en memoria. Los comandos que modifican
+# datos imprimen un resumen JSON y salen con código 1 si fallan.
+#
+# Uso: python -m inventario productos listar --formato json
+#      python -m inventario ventas registrar --cliente 3 --item 5:2 --item 8:1
+#      python -m inventario facturas exportar --desde 2025-07-01 --hasta 2025-07-31
+#
+# Los subcomandos aceptan también su nombre en inglés (list, search, export...).
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+
+import db.data_base as data_base
+from db.exportacion import FORMATOS, recorrer_fuente, escribir_filas
+from gestor_productos.productos_db import buscar_productos
+from gestor_clientes.clientes_db import buscar_clientes
+from gestor_ventas.facturas_db import obtener_detalle_venta
+from gestor_ventas.ventas_servicio import (
+    ErrorVenta, TAMANIO_LOTE, registrar_venta_servicio, ingerir_ventas_desde_archivo
+)
+from gestor_ventas.analitica_ventas import CRITERIOS, top_productos, top_clientes
+from core.logger import log_error
+
+# Filas que se muestran en formato tabla si no se indica --limite
+LIMITE_TABLA = 100
+
+# Columnas de los resultados que no salen de una fuente de db.exportacion
+COLUMNAS_PRODUCTOS = ["id_producto", "nombre", "categoria", "proveedor", "stock", "precio_unitario"]
+COLUMNAS_CLIENTES = ["id_cliente", "nombre", "telefono", "email", "dni"]
+COLUMNAS_DETALLE = [
+    "id_factura", "fecha", "cliente_id", "nombre_cliente", "email_cliente", "dni_cliente", "producto_id",
+    "nombre_producto", "nombre_categoria", "cantidad", "precio_unitario", "total_linea", "total",
+]
+COLUMNAS_RANKING = ["id", "nombre", "valor"]
+
+# Rankings de "ventas ranking": tipo -> (función, criterio por defecto)
+RANKINGS = {
+    "productos": (top_productos, "unidades"),
+    "clientes": (top_clientes, "importe"),
+}
+
+def formato_por_defecto() -> str:
+    """
+    Devuelve "tabla" si la salida es una terminal y "csv" si va a un archivo o tubería.
+    """
+    return "tabla" if sys.stdout.isatty() else "csv"
+
+def imprimir_json(datos) -> None:
+    """
+    Imprime un resultado como JSON indentado.
+    """
+    print(json.dumps(datos, ensure_ascii=False, indent=2, default=str))
+
+def mostrar_tabla(entidad: str, filas: list) -> None:
+    """
+    Muestra filas con las tablas de Rich del menú interactivo.
+
+    Las importaciones son locales para que la salida por tubería no cargue Rich.
+
+    Parámetros:
+        entidad (str): productos, clientes, proveedores, categorias o facturas.
+        filas (list): Filas con la forma que espera la función de interfaz.mostrar_resumen.
+    """
+    from interfaz import mostrar_resumen
+
+    if entidad == "productos":
+        mostrar_resumen.mostrar_productos(filas)
+    elif entidad == "clientes":
+        mostrar_resumen.mostrar_clientes(filas)
+    elif entidad == "proveedores":
+        mostrar_resumen.mostrar_proveedores(filas)
+    elif entidad == "categorias":
+        mostrar_resumen.mostrar_categorias(filas)
+    elif entidad == "facturas":
+        # Tabla de facturas: ID, fecha, cliente y total
+        mostrar_resumen.mostrar_facturas([(f[0], f[1], f[3], f[6]) for f in filas])
+
+def emitir_filas(formato: str, columnas: list[str], filas: list, entidad: str = None) -> None:
+    """
+    Escribe una lista de filas ya leída en el formato pedido.
+
+    Parámetros:
+        formato (str): "tabla" o uno de FORMATOS.
+        columnas (list[str]): Nombres de las columnas para CSV/JSON.
+        filas (list): Filas a escribir.
+        entidad (str): Tabla de Rich a usar en formato "tabla"; sin entidad se usa JSON.
+    """
+    if formato == "tabla" and entidad:
+        mostrar_tabla(entidad, filas)
+    else:
+        escribir_filas(sys.stdout, "json" if formato == "tabla" else formato, columnas, [filas] if filas else [])
+
+def listar(args) -> int:
+    """
+    Lista una entidad completa, o las facturas de un rango de fechas.
+
+    En CSV/JSON/JSONL las filas se escriben a medida que se leen del cursor; en
+    formato tabla se muestran como máximo --limite filas (LIMITE_TABLA por defecto).
+    """
+    limite = args.limite
+    if args.formato == "tabla" and limite is None:
+        limite = LIMITE_TABLA
+    desde, hasta = getattr(args, "desde", None), getattr(args, "hasta", None)
+
+    with data_base.conexion_db() as conexion:
+        columnas, lotes = recorrer_fuente(conexion, args.fuente, desde, hasta, limite=limite)
+        if args.formato != "tabla":
+            escribir_filas(sys.stdout, args.formato, columnas, lotes)
+            return 0
+        filas = [fila for lote in lotes for fila in lote]
+
+    mostrar_tabla(args.entidad, filas)
+    if len(filas) == limite and args.limite is None:
+        print(f"Se muestran las primeras {limite} filas; use --limite o --formato csv para ver más.",
+              file=sys.stderr)
+    return 0
+
+def buscar(args) -> int:
+    """
+    Busca productos o clientes por texto, con el índice de texto completo.
+    """
+    if args.entidad == "productos":
+        filas, columnas = buscar_productos(args.texto, args.limite), COLUMNAS_PRODUCTOS
+    else:
+        filas, columnas = buscar_clientes(args.texto, args.limite), COLUMNAS_CLIENTES
+    emitir_filas(args.formato, columnas, filas, args.entidad)
+    return 0
+
+def leer_item(valor: str) -> dict:
+    """
+    Convierte un argumento "PRODUCTO:CANTIDAD" en una línea de venta.
+
+    Lanza:
+        argparse.ArgumentTypeError: Si el valor no tiene esa forma.
+    """
+    producto, separador, cantidad = valor.partition(":")
+    if not separador or not producto.strip().isdigit() or not cantidad.strip().isdigit():
+        raise argparse.ArgumentTypeError(f"'{valor}' no tiene la forma PRODUCTO:CANTIDAD (por ejemplo 5:2)")
+    return {"producto_id": int(producto), "cantidad": int(cantidad)}
+
+def registrar_venta(args) -> int:
+    """
+    Registra una venta con ventas_servicio; los errores de la venta salen por stderr.
+    """
+    try:
+        venta = registrar_venta_servicio(args.cliente, args.item)
+    except ErrorVenta as e:
+        print(f"Error ({e.codigo}): {e}", file=sys.stderr)
+        return 1
+    except sqlite3.Error as e:
+        log_error(f"Error al registrar la venta desde la línea de comandos: {e}")
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if args.formato == "tabla":
+        from interfaz.mostrar_resumen import mostrar_resumen_venta
+        mostrar_resumen_venta(venta["factura_id"])
+    else:
+        imprimir_json(venta)
+    return 0
+
+def ingerir_ventas(args) -> int:
+    """
+    Ingresa las ventas de un archivo JSONL o CSV e imprime el resumen.
+    """
+    resumen = ingerir_ventas_desde_archivo(args.archivo, args.lote)
+    imprimir_json(resumen)
+    return 0 if resumen is not None else 1
+
+def ranking(args) -> int:
+    """
+    Muestra los productos o clientes que más vendieron o compraron.
+    """
+    funcion, criterio_por_defecto = RANKINGS[args.tipo]
+    criterio = args.criterio or criterio_por_defecto
+    try:
+        filas = funcion(args.n, criterio, args.desde, args.hasta)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    emitir_filas(args.formato, COLUMNAS_RANKING, filas)
+    return 0
+
+def detalle_factura(args) -> int:
+    """
+    Muestra el detalle de una factura, una fila por línea.
+    """
+    detalle = obtener_detalle_venta(args.id_factura)
+    if not detalle:
+        print(f"Error: no se encontró la factura {args.id_factura}", file=sys.stderr)
+        return 1
+    if args.formato == "tabla":
+        from interfaz.mostrar_resumen import mostrar_resumen_venta
+        mostrar_resumen_venta(args.id_factura)
+    else:
+        escribir_filas(sys.stdout, args.formato, COLUMNAS_DETALLE, [detalle])
+    return 0
+
+def exportar_facturas(args) -> int:
+    """
+    Exporta a PDF las facturas indicadas por ID o por rango de fechas.
+    """
+    if not args.ids and not (args.desde or args.hasta):
+        print("Error: indique IDs o un rango con --desde/--hasta", file=sys.stderr)
+        return 1
+    # exportar_factura carga la interfaz; solo se importa al exportar
+    from gestor_ventas.exportar_factura import exportar_facturas_lote, RUTA_FACTURAS
+
+    resumen = exportar_facturas_lote(args.ids or None, args.desde, args.hasta, args.procesos,
+                                     args.carpeta or RUTA_FACTURAS)
+    imprimir_json(resumen)
+    return 0 if not resumen.get("fallidas") else 1
+
+def importar(args) -> int:
+    """
+    Importa registros de un archivo CSV o JSONL con db.importacion.
+    """
+    from db.importacion import importar_desde_archivo
+
+    resumen = importar_desde_archivo(args.entidad, args.archivo, args.rechazados)
+    imprimir_json(resumen)
+    return 0 if resumen is not None else 1
+
+def crear_parser() -> argparse.ArgumentParser:
+    """
+    Arma el parser con un subcomando por entidad y una acción por operación.
+    """
+    parser = argparse.ArgumentParser(prog="python -m inventario",
+                                     description="Sistema de gestión de inventario sin menú interactivo.")
+    parser.add_argument("--db", help=f"Base de datos a usar (por defecto {data_base.RUTA_DB})")
+
+    # Opciones comunes a los comandos que escriben filas
+    salida = argparse.ArgumentParser(add_help=False)
+    salida.add_argument("--formato", "--format", choices=("tabla", *FORMATOS), default=None,
+                        help="Formato de salida (por defecto: tabla en una terminal, csv en una tubería)")
+
+    entidades = parser.add_subparsers(dest="entidad", metavar="entidad", required=True)
+
+    # Listados simples: entidad -> fuente de db.exportacion
+    fuentes = {
+        "productos": ("productos_detalle", ["products"]),
+        "clientes": ("clientes", ["clients"]),
+        "proveedores": ("proveedores", ["suppliers"]),
+        "categorias": ("categorias", ["categories"]),
+        "facturas": ("facturas", ["invoices"]),
+    }
+    acciones = {}
+    for entidad, (fuente, alias) in fuentes.items():
+        sub = entidades.add_parser(entidad, aliases=alias, help=f"Operaciones sobre {entidad}")
+        sub.set_defaults(entidad=entidad)
+        acciones[entidad] = sub.add_subparsers(dest="accion", metavar="accion", required=True)
+
+        listado = acciones[entidad].add_parser("listar", aliases=["list"], parents=[salida],
+                                               help=f"Lista todos los {entidad}")
+        listado.add_argument("--limite", "--limit", type=int, help="Cantidad máxima de filas")
+        listado.set_defaults(funcion=listar, fuente=fuente)
+        if entidad == "facturas":
+            listado.add_argument("--desde", help="Fecha mínima inclusiva (YYYY-MM-DD)")
+            listado.add_argument("--hasta", help="Fecha máxima inclusiva (YYYY-MM-DD)")
+
+    for entidad in ("productos", "clientes"):
+        busqueda = acciones[entidad].add_parser("buscar", aliases=["search"], parents=[salida],
+                                                help=f"Busca {entidad} por texto")
+        busqueda.add_argument("texto", help="Palabras a buscar (como prefijos)")
+        busqueda.add_argument("--limite", "--limit", type=int, default=20, help="Cantidad máxima de resultados")
+        busqueda.set_defaults(funcion=buscar)
+
+    for entidad in ("productos", "clientes", "proveedores"):
+        carga = acciones[entidad].add_parser("importar", aliases=["import"],
+                                             help=f"Importa {entidad} desde un CSV o JSONL")
+        carga.add_argument("archivo", help="Archivo CSV o JSONL")
+        carga.add_argument("--rechazados", help="Archivo para los registros rechazados")
+        carga.set_defaults(funcion=importar)
+
+    detalle = acciones["facturas"].add_parser("detalle", aliases=["show"], parents=[salida],
+                                              help="Muestra el detalle de una factura")
+    detalle.add_argument("id_factura", type=int, help="ID de la factura")
+    detalle.set_defaults(funcion=detalle_factura)
+
+    pdf = acciones["facturas"].add_parser("exportar", aliases=["export"], help="Exporta facturas a PDF")
+    pdf.add_argument("ids", nargs="*", type=int, help="IDs de las facturas (o usar --desde/--hasta)")
+    pdf.add_argument("--desde", help="Fecha mínima inclusiva (YYYY-MM-DD)")
+    pdf.add_argument("--hasta", help="Fecha máxima inclusiva (YYYY-MM-DD)")
+    pdf.add_argument("--procesos", type=int, help="Procesos para dibujar los PDF (por defecto, uno por CPU)")
+    pdf.add_argument("--carpeta", help="Carpeta de destino")
+    pdf.set_defaults(funcion=exportar_facturas)
+
+    ventas = entidades.add_parser("ventas", aliases=["sales"], help="Registro e ingesta de ventas")
+    ventas.set_defaults(entidad="ventas")
+    acciones_ventas = ventas.add_subparsers(dest="accion", metavar="accion", required=True)
+
+    registro = acciones_ventas.add_parser("registrar", aliases=["register"], parents=[salida],
+                                          help="Registra una venta")
+    registro.add_argument("--cliente", "--client", type=int, required=True, help="ID del cliente")
+    registro.add_argument("--item", type=leer_item, action="append", required=True, metavar="PRODUCTO:CANTIDAD",
+                          help="Producto y cantidad; se repite por cada línea de la venta")
+    registro.set_defaults(funcion=registrar_venta)
+
+    ingesta = acciones_ventas.add_parser("ingerir", aliases=["ingest"], help="Ingresa ventas desde un JSONL o CSV")
+    ingesta.add_argument("archivo", help="Archivo de ventas")
+    ingesta.add_argument("--lote", type=int, default=TAMANIO_LOTE, help="Ventas por transacción")
+    ingesta.set_defaults(funcion=ingerir_ventas)
+
+    mejores = acciones_ventas.add_parser("ranking", aliases=["top"], parents=[salida],
+                                         help="Productos o clientes con más ventas")
+    # "tipo" y no "entidad": el subcomando de primer nivel ya usa args.entidad ("ventas")
+    mejores.add_argument("tipo", choices=list(RANKINGS), help="Qué se ordena: productos o clientes")
+    mejores.add_argument("-n", type=int, default=10, help="Cantidad de posiciones")
+    mejores.add_argument("--criterio", choices=CRITERIOS, help="Criterio del ranking")
+    mejores.add_argument("--desde", help="Fecha mínima inclusiva (YYYY-MM-DD)")
+    mejores.add_argument("--hasta", help="Fecha máxima inclusiva (YYYY-MM-DD)")
+    mejores.set_defaults(funcion=ranking)
+
+    return parser
+
+def main(argumentos: list[str] = None) -> int:
+    """
+    Interpreta los argumentos, inicializa la base y ejecuta el subcomando.
+
+    Retorna:
+        int: Código de salida (0 si la operación terminó bien).
+    """
+    args = crear_parser().parse_args(argumentos)
+    if getattr(args, "formato", "tabla") is None:
+        args.formato = formato_por_defecto()
+    if args.db:
+        data_base.RUTA_DB = args.db
+    data_base.inicializar_base()
+
+    try:
+        return args.funcion(args)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except sqlite3.Error as e:
+        log_error(f"Error en la línea de comandos ({args.entidad} {args.accion}): {e}")
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except BrokenPipeError:
+        # El programa que leía la salida (por ejemplo head) terminó antes; se
+        # redirige stdout para que Python no falle al vaciarla al salir
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
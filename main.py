@@ -3,6 +3,7 @@ from rich.console import Console
 from interfaz.diseño_interfaz import (
     mostrar_menu_principal,
     menu_ventas,
+    menu_reportes,
     menu_clientes,
     menu_proveedores,
     menu_productos,
@@ -14,6 +15,10 @@ from interfaz.diseño_interfaz import (
 from db.data_base import inicializar_base
 from gestor_ventas.ventas_gestor import procesar_venta_interactiva, imprimir_detalle_venta
 from gestor_ventas.exportar_factura import exportar_factura_interactivamente
+from gestor_ventas.reportes_gestor import (
+    reporte_mes_por_categoria, reporte_mes_por_dia, reporte_mes_por_producto,
+    reporte_mes_por_cliente, reconstruir_resumenes_interactivo, ranking_ventas_interactivo
+)
 from gestor_clientes.clientes_gestor import agregar_cliente, mostrar_todos_los_clientes, editar_cliente, borrar_cliente
 from gestor_proveedores.proveedores_gestor import agregar_proveedor, mostrar_todos_los_proveedores, editar_proveedor, borrar_proveedor
 from gestor_productos.productos_gestor import agregar_producto, mostrar_todos_los_productos, editar_producto, borrar_producto
@@ -46,6 +51,27 @@ def main():
                     imprimir_detalle_venta()
                 elif opcion == "3":
                     exportar_factura_interactivamente()
+                elif opcion == "4":
+                    menu_reportes._encabezado_mostrado = False
+                    while True:
+                        opcion_reporte = menu_reportes()
+                        if opcion_reporte == "1":
+                            reporte_mes_por_categoria()
+                        elif opcion_reporte == "2":
+                            reporte_mes_por_dia()
+                        elif opcion_reporte == "3":
+                            reporte_mes_por_producto()
+                        elif opcion_reporte == "4":
+                            reporte_mes_por_cliente()
+                        elif opcion_reporte == "5":
+                            reconstruir_resumenes_interactivo()
+                        elif opcion_reporte == "0":
+                            menu_ventas._encabezado_mostrado = False
+                            break
+                        else:
+                            mostrar_error("Opción inválida, vuelve a intentarlo.\n")
+                elif opcion == "5":
+                    ranking_ventas_interactivo()
                 elif opcion == "0":
                     break
                 else:
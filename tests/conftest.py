@@ -0,0 +1,26 @@
+# Configuración común de las pruebas
+# Cada prueba que pide la fixture `base` trabaja sobre una base de datos nueva y
+# migrada en una carpeta temporal, con el pool y la caché de referencia apuntando a ella.
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import db.data_base as data_base
+from db.cache_referencias import invalidar_referencias
+
+
+@pytest.fixture
+def base(tmp_path, monkeypatch):
+    """
+    Deja activa una base de datos vacía y migrada en tmp_path y devuelve su ruta.
+    """
+    monkeypatch.setattr(data_base, "RUTA_DB", str(tmp_path / "inventario.db"))
+    data_base.inicializar_base()
+    invalidar_referencias()
+    yield data_base.RUTA_DB
+    data_base.obtener_pool().cerrar()
+    invalidar_referencias()
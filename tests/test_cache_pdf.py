@@ -0,0 +1,51 @@
+# Pruebas de la caché de PDF de facturas (gestor_ventas/cache_pdf.py)
+# Un acierto no escribe en el índice: la hora de uso se anota por tandas.
+
+import sqlite3
+
+import gestor_ventas.cache_pdf as cache_pdf
+from gestor_ventas.cache_pdf import CachePDF
+
+
+def guardar_pdf(cache: CachePDF, id_factura: int, clave: str) -> str:
+    ruta = cache.ruta_para(id_factura, clave)
+    with open(ruta, "wb") as archivo:
+        archivo.write(b"%PDF-1.3")
+    return ruta
+
+
+def usos_en_indice(cache: CachePDF) -> dict:
+    with sqlite3.connect(cache.ruta_indice) as conexion:
+        return dict(conexion.execute("SELECT id_factura, usado FROM facturas"))
+
+
+def test_los_aciertos_se_anotan_por_tandas(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_pdf, "INTERVALO_USOS", 3)
+    cache = CachePDF(str(tmp_path))
+    claves = {id_factura: f"{id_factura:064x}" for id_factura in (1, 2, 3)}
+    for id_factura, clave in claves.items():
+        cache.registrar(id_factura, clave, guardar_pdf(cache, id_factura, clave))
+    registrados = usos_en_indice(cache)
+
+    assert cache.buscar(1, claves[1]) and cache.buscar(2, claves[2])
+    assert usos_en_indice(cache) == registrados
+
+    assert cache.buscar(3, claves[3])
+    anotados = usos_en_indice(cache)
+    assert all(anotados[id_factura] > registrados[id_factura] for id_factura in claves)
+    assert (cache.aciertos, cache.fallos) == (3, 0)
+    cache.cerrar()
+
+
+def test_acierto_sin_entrada_en_el_indice(tmp_path):
+    cache = CachePDF(str(tmp_path))
+    clave = "a" * 64
+    guardar_pdf(cache, 7, clave)
+
+    assert cache.buscar(7, clave) == cache.ruta_para(7, clave)
+    assert cache.buscar(8, clave) is None
+    cache.cerrar()
+
+    assert list(usos_en_indice(cache)) == [7]
+    assert cache.estadisticas()["entradas"] == 1
+    assert (cache.aciertos, cache.fallos) == (1, 1)
@@ -0,0 +1,40 @@
+# Pruebas de la caché de datos de referencia (db/cache_referencias.py)
+# Las búsquedas por ID sin la tabla en memoria van a la base por clave primaria,
+# sin cargar la tabla entera.
+
+import pytest
+
+import db.cache_referencias as cache_referencias
+from db.data_base import conexion_db
+from db.cache_referencias import (filas_referencia, fila_referencia_por_id, estadisticas_cache_referencias,
+                                  invalidar_referencias)
+
+
+@pytest.fixture
+def categorias(base):
+    with conexion_db() as conexion:
+        conexion.executemany("INSERT INTO categorias (nombre) VALUES (?)", [("Periféricos",), ("Sonido",)])
+        conexion.commit()
+    invalidar_referencias()
+
+
+def test_por_id_sin_la_tabla_cargada_no_la_carga(categorias):
+    assert fila_referencia_por_id("categorias", 2) == (2, "Sonido")
+    assert fila_referencia_por_id("categorias", 9) is None
+    assert estadisticas_cache_referencias()["tablas"] == []
+
+
+def test_por_id_con_la_tabla_cargada_responde_de_memoria(categorias):
+    filas_referencia("categorias")
+    aciertos = estadisticas_cache_referencias()["aciertos"]
+
+    assert fila_referencia_por_id("categorias", 1) == (1, "Periféricos")
+    assert estadisticas_cache_referencias()["aciertos"] == aciertos + 1
+
+
+def test_por_id_con_la_cache_desactivada(categorias, monkeypatch):
+    monkeypatch.setattr(cache_referencias, "CACHE_REFERENCIAS_ACTIVA", False)
+    filas_referencia("categorias")
+
+    assert fila_referencia_por_id("categorias", 2) == (2, "Sonido")
+    assert estadisticas_cache_referencias()["tablas"] == []
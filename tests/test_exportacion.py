@@ -0,0 +1,62 @@
+# Pruebas de la exportación masiva (db/exportacion.py)
+# El formato sale de la extensión del archivo, con o sin .gz.
+
+import csv
+import gzip
+import json
+
+import pytest
+
+from db.data_base import conexion_db
+from db.exportacion import exportar, formato_por_extension
+
+
+@pytest.fixture
+def clientes(base):
+    with conexion_db() as conexion:
+        conexion.executemany("INSERT INTO clientes (nombre, telefono, email, dni) VALUES (?, ?, ?, ?)",
+                             [(f"Cliente {n}", "1122334455", f"c{n}@mail.com", f"4000000{n}") for n in range(1, 6)])
+        conexion.commit()
+
+
+@pytest.mark.parametrize("ruta, formato", [
+    ("clientes.csv", "csv"),
+    ("clientes.CSV.gz", "csv"),
+    ("clientes.json", "json"),
+    ("clientes.json.gz", "json"),
+    ("clientes.jsonl", "jsonl"),
+    ("clientes.jsonl.gz", "jsonl"),
+    ("clientes", "jsonl"),
+])
+def test_formato_por_extension(ruta, formato):
+    assert formato_por_extension(ruta) == formato
+
+
+def test_exportar_json_es_una_lista(clientes, tmp_path):
+    ruta = str(tmp_path / "clientes.json")
+    resumen = exportar("clientes", ruta, despues_de_id=2, tamanio_lote=2)
+
+    with open(ruta, encoding="utf-8") as archivo:
+        filas = json.load(archivo)
+    assert (resumen["filas"], resumen["ultimo_id"]) == (3, 5)
+    assert [fila["id_cliente"] for fila in filas] == [3, 4, 5]
+    assert filas[0]["email"] == "c3@mail.com"
+
+
+def test_exportar_json_sin_filas(clientes, tmp_path):
+    ruta = str(tmp_path / "clientes.json.gz")
+    resumen = exportar("clientes", ruta, despues_de_id=5)
+
+    with gzip.open(ruta, "rt", encoding="utf-8") as archivo:
+        assert json.load(archivo) == []
+    assert resumen["ultimo_id"] is None
+
+
+def test_exportar_csv_y_jsonl(clientes, tmp_path):
+    exportar("clientes", str(tmp_path / "clientes.csv"))
+    exportar("clientes", str(tmp_path / "clientes.jsonl"))
+
+    with open(tmp_path / "clientes.csv", newline="", encoding="utf-8") as archivo:
+        assert [fila["dni"] for fila in csv.DictReader(archivo)] == [f"4000000{n}" for n in range(1, 6)]
+    with open(tmp_path / "clientes.jsonl", encoding="utf-8") as archivo:
+        assert [json.loads(linea)["id_cliente"] for linea in archivo] == [1, 2, 3, 4, 5]
@@ -0,0 +1,111 @@
+# Pruebas de la paginación por clave de facturas (gestor_ventas/facturas_db.py)
+# Las facturas se insertan con fechas repetidas para que los cortes de página caigan
+# en medio de un empate de fecha, que es donde una paginación por clave puede saltear
+# o repetir filas.
+
+import pytest
+
+from db.data_base import conexion_db
+from gestor_ventas.facturas_db import (listar_facturas_pagina, iterar_facturas, iterar_detalles_ventas,
+                                      contar_facturas)
+
+FECHAS = [
+    "2025-07-01 09:00:00",
+    "2025-07-01 09:00:00",
+    "2025-07-01 09:00:00",
+    "2025-07-15 12:30:00",
+    "2025-07-31 23:59:59",
+    "2025-07-31 23:59:59",
+    "2025-08-01 00:00:00",
+]
+
+
+@pytest.fixture
+def facturas(base):
+    """
+    Inserta una factura por fecha de FECHAS (IDs 1 a 7), con tantas líneas de detalle como su ID.
+    """
+    with conexion_db() as conexion:
+        conexion.executemany("INSERT INTO clientes (id_cliente, nombre, dni) VALUES (?, ?, ?)",
+                             [(1, "Cliente 1", "40875231"), (2, "Cliente 2", "39548620")])
+        conexion.executemany("INSERT INTO productos (id_producto, nombre) VALUES (?, ?)",
+                             [(linea, f"Producto {linea}") for linea in range(1, len(FECHAS) + 1)])
+        for id_factura, fecha in enumerate(FECHAS, start=1):
+            conexion.execute("""
+                INSERT INTO facturas (id_factura, fecha, cliente_id, nombre_cliente, email_cliente, dni_cliente, total)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (id_factura, fecha, id_factura % 2 + 1, f"Cliente {id_factura}", "c@mail.com", "40875231",
+                  100.0 * id_factura))
+            conexion.executemany("""
+                INSERT INTO factura_detalle (factura_id, producto_id, cantidad, precio_unitario, total_linea,
+                                             nombre_producto, nombre_categoria)
+                VALUES (?, ?, 1, 100.0, 100.0, ?, 'Periféricos')
+            """, [(id_factura, linea, f"Producto {linea}") for linea in range(1, id_factura + 1)])
+        conexion.commit()
+    return FECHAS
+
+
+def esperado(desde: str = None, hasta: str = None) -> list[int]:
+    """IDs en el orden de listar_facturas_pagina(): fecha y ID descendentes."""
+    filas = [(fecha, id_factura) for id_factura, fecha in enumerate(FECHAS, start=1)
+             if (not desde or fecha >= desde) and (not hasta or fecha <= hasta)]
+    return [id_factura for _, id_factura in sorted(filas, reverse=True)]
+
+
+@pytest.mark.parametrize("tamanio", [1, 2, 3, 6, 7, 8])
+def test_iterar_facturas_no_saltea_ni_repite(facturas, tamanio):
+    assert [fila[0] for fila in iterar_facturas(tamanio)] == esperado()
+
+
+def test_paginas_encadenadas_en_un_empate_de_fecha(facturas):
+    primera = listar_facturas_pagina(2)
+    assert [fila[0] for fila in primera] == [7, 6]
+
+    ultima = primera[-1]
+    segunda = listar_facturas_pagina(2, despues_de=(ultima[1], ultima[0]))
+    assert [fila[0] for fila in segunda] == [5, 4]
+
+    ultima = segunda[-1]
+    tercera = listar_facturas_pagina(10, despues_de=(ultima[1], ultima[0]))
+    assert [fila[0] for fila in tercera] == [3, 2, 1]
+
+
+def test_pagina_despues_de_la_ultima_factura_esta_vacia(facturas):
+    assert listar_facturas_pagina(5, despues_de=(FECHAS[0], 1)) == []
+
+
+@pytest.mark.parametrize("desde, hasta", [
+    ("2025-07-01", "2025-07-31"),
+    ("2025-07-15 12:30:00", None),
+    (None, "2025-07-01"),
+    ("2025-07-02", "2025-07-30"),
+])
+def test_iterar_facturas_con_rango_inclusivo(facturas, desde, hasta):
+    hasta_inclusivo = f"{hasta} 23:59:59" if hasta and len(hasta) == 10 else hasta
+    ids = esperado(desde, hasta_inclusivo)
+    assert [fila[0] for fila in iterar_facturas(2, desde, hasta)] == ids
+    assert contar_facturas(desde, hasta) == len(ids)
+
+
+def test_sin_facturas(base):
+    assert list(iterar_facturas(3)) == []
+    assert list(iterar_detalles_ventas(tamanio_lote=3)) == []
+
+
+@pytest.mark.parametrize("tamanio_lote", [1, 2, 3, 5, 28, 100])
+def test_iterar_detalles_ventas_por_lotes(facturas, tamanio_lote):
+    filas = list(iterar_detalles_ventas(tamanio_lote=tamanio_lote))
+
+    assert len(filas) == sum(range(1, len(FECHAS) + 1))
+    assert filas == list(iterar_detalles_ventas(tamanio_lote=1000))
+    # Ordenadas por fecha y factura, con las líneas de cada factura contiguas y completas
+    claves = [(fila[1], fila[0]) for fila in filas]
+    assert claves == sorted(claves)
+    for id_factura in range(1, len(FECHAS) + 1):
+        assert [fila[7] for fila in filas if fila[0] == id_factura] == [f"Producto {n}" for n in range(1, id_factura + 1)]
+
+
+def test_iterar_detalles_ventas_filtra_por_cliente_y_fecha(facturas):
+    ids = {fila[0] for fila in iterar_detalles_ventas(cliente_id=2, desde="2025-07-01", hasta="2025-07-31",
+                                                      tamanio_lote=2)}
+    assert ids == {1, 3, 5}
@@ -0,0 +1,176 @@
+# Pruebas de la importación masiva (db/importacion.py)
+# Cubren el upsert por clave única, el archivo de rechazados y la indexación diferida
+# de la búsqueda de texto, incluidas las filas que se actualizan.
+
+import csv
+import json
+
+from db.data_base import conexion_db
+from db.cache_referencias import filas_referencia
+from db.importacion import importar_desde_archivo
+from gestor_clientes.clientes_db import buscar_clientes
+from gestor_productos.productos_db import buscar_productos
+
+
+def escribir_csv(ruta, filas: list[dict]) -> str:
+    with open(ruta, "w", newline="", encoding="utf-8") as archivo:
+        escritor = csv.DictWriter(archivo, list(filas[0]))
+        escritor.writeheader()
+        escritor.writerows(filas)
+    return str(ruta)
+
+
+def escribir_jsonl(ruta, lineas: list) -> str:
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        for linea in lineas:
+            archivo.write((linea if isinstance(linea, str) else json.dumps(linea)) + "\n")
+    return str(ruta)
+
+
+def cliente(nombre: str, dni: str, email: str = None) -> dict:
+    return {"nombre": nombre, "telefono": "1122334455", "email": email or f"{dni}@mail.com", "dni": dni}
+
+
+def cargar_referencias(tmp_path) -> None:
+    with conexion_db() as conexion:
+        conexion.executemany("INSERT INTO categorias (nombre) VALUES (?)", [("Periféricos",), ("Sonido",)])
+        conexion.commit()
+    proveedores = [
+        {"nombre": "TechDistrib SA", "telefono": "1150001000", "email": "ventas@techdistrib.com", "cuit": "30548976123"},
+    ]
+    importar_desde_archivo("proveedores", escribir_csv(tmp_path / "proveedores.csv", proveedores))
+
+
+def test_upsert_clientes_por_dni(base, tmp_path):
+    primero = importar_desde_archivo("clientes", escribir_csv(tmp_path / "a.csv", [
+        cliente("Laura Martínez", "40875231"),
+        cliente("Ricardo Gómez", "39548620"),
+    ]))
+    assert (primero["insertados"], primero["actualizados"], primero["rechazados"]) == (2, 0, 0)
+
+    segundo = importar_desde_archivo("clientes", escribir_csv(tmp_path / "b.csv", [
+        cliente("Laura Fernández", "40875231", "laura.nueva@mail.com"),
+        cliente("Daniela Torres", "42319876"),
+    ]))
+    assert (segundo["insertados"], segundo["actualizados"]) == (1, 1)
+
+    with conexion_db() as conexion:
+        filas = conexion.execute("SELECT id_cliente, nombre, email, dni FROM clientes ORDER BY id_cliente").fetchall()
+    assert filas == [
+        (1, "Laura Fernández", "laura.nueva@mail.com", "40875231"),
+        (2, "Ricardo Gómez", "39548620@mail.com", "39548620"),
+        (3, "Daniela Torres", "42319876@mail.com", "42319876"),
+    ]
+
+
+def test_clientes_actualizados_quedan_buscables(base, tmp_path):
+    importar_desde_archivo("clientes", escribir_csv(tmp_path / "a.csv", [cliente("Laura Martínez", "40875231")]))
+    importar_desde_archivo("clientes", escribir_csv(tmp_path / "b.csv", [
+        cliente("Laura Fernández", "40875231"),
+        cliente("Tomás Herrera", "43127841"),
+    ]), tamanio_lote=1)
+
+    assert [fila[0] for fila in buscar_clientes("fernandez")] == [1]
+    assert buscar_clientes("martinez") == []
+    assert [fila[0] for fila in buscar_clientes("tomas")] == [2]
+
+
+def test_rechazados_con_numero_y_motivo(base, tmp_path):
+    ruta = escribir_jsonl(tmp_path / "clientes.jsonl", [
+        cliente("Laura Martínez", "40875231"),
+        "{no es json",
+        cliente("Ricardo Gómez", "12"),
+        cliente("Daniela Torres", "42319876", "sin-arroba"),
+        cliente("Javier Ruiz", "38765412"),
+    ])
+    resumen = importar_desde_archivo("clientes", ruta)
+
+    assert (resumen["procesados"], resumen["insertados"], resumen["rechazados"]) == (5, 2, 3)
+    assert resumen["archivo_rechazados"] == str(tmp_path / "clientes.rechazados.jsonl")
+    with open(resumen["archivo_rechazados"], encoding="utf-8") as archivo:
+        rechazados = [json.loads(linea) for linea in archivo]
+    assert [fila["numero"] for fila in rechazados] == [2, 3, 4]
+    assert rechazados[0]["motivo"].startswith("JSON inválido")
+    assert "DNI" in rechazados[1]["motivo"]
+    assert rechazados[1]["registro"]["nombre"] == "Ricardo Gómez"
+    assert "email" in rechazados[2]["motivo"]
+
+
+def test_rechazados_csv_conserva_columnas(base, tmp_path):
+    ruta = escribir_csv(tmp_path / "clientes.csv", [cliente("Laura Martínez", "40875231"), cliente("", "39548620")])
+    resumen = importar_desde_archivo("clientes", ruta)
+
+    with open(resumen["archivo_rechazados"], newline="", encoding="utf-8") as archivo:
+        rechazados = list(csv.DictReader(archivo))
+    assert len(rechazados) == 1
+    assert rechazados[0]["dni"] == "39548620"
+    assert rechazados[0]["numero"] == "3"
+    assert rechazados[0]["motivo"]
+
+
+def test_sin_rechazos_no_crea_archivo(base, tmp_path):
+    resumen = importar_desde_archivo("clientes", escribir_csv(tmp_path / "a.csv", [cliente("Laura Martínez", "40875231")]))
+    assert resumen["archivo_rechazados"] is None
+    assert not (tmp_path / "a.rechazados.csv").exists()
+
+
+def test_indexacion_diferida_de_productos(base, tmp_path):
+    cargar_referencias(tmp_path)
+    productos = [
+        {"nombre": f"Teclado mecánico {i}", "categoria": "Periféricos", "proveedor": "TechDistrib SA",
+         "stock": "10", "precio": "1000"}
+        for i in range(1, 8)
+    ]
+    # El mismo producto dos veces en un lote: alta y modificación en la misma transacción
+    productos.append({**productos[0], "stock": "99"})
+    resumen = importar_desde_archivo("productos", escribir_csv(tmp_path / "productos.csv", productos), tamanio_lote=3)
+
+    assert (resumen["insertados"], resumen["actualizados"]) == (7, 1)
+    assert sorted(fila[0] for fila in buscar_productos("teclado", 20)) == list(range(1, 8))
+    with conexion_db() as conexion:
+        assert conexion.execute("SELECT COUNT(*) FROM busqueda_productos").fetchone()[0] == 7
+        assert conexion.execute("SELECT stock FROM productos WHERE id_producto = 1").fetchone()[0] == 99
+        disparador = conexion.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'trg_busqueda_productos_alta'").fetchone()
+    assert disparador is not None
+
+
+def test_producto_actualizado_se_reindexa_con_la_categoria_nueva(base, tmp_path):
+    cargar_referencias(tmp_path)
+    producto = {"nombre": "Auriculares gamer", "categoria": "Periféricos", "proveedor": "30548976123",
+                "stock": "5", "precio": "8900"}
+    importar_desde_archivo("productos", escribir_csv(tmp_path / "a.csv", [producto]))
+    assert buscar_productos("sonido") == []
+
+    resumen = importar_desde_archivo("productos", escribir_csv(tmp_path / "b.csv", [
+        {**producto, "categoria": "Sonido", "stock": "7"},
+        {**producto, "nombre": "Parlante bluetooth", "categoria": "Sonido"},
+    ]))
+    assert (resumen["insertados"], resumen["actualizados"]) == (1, 1)
+    assert sorted(fila[1] for fila in buscar_productos("sonido")) == ["Auriculares Gamer", "Parlante Bluetooth"]
+
+
+def test_productos_con_referencias_inexistentes_se_rechazan(base, tmp_path):
+    cargar_referencias(tmp_path)
+    resumen = importar_desde_archivo("productos", escribir_csv(tmp_path / "productos.csv", [
+        {"nombre": "Mouse", "categoria": "Inexistente", "proveedor": "TechDistrib SA", "stock": "1", "precio": "10"},
+        {"nombre": "Mouse", "categoria": "Periféricos", "proveedor": "Nadie", "stock": "1", "precio": "10"},
+        {"nombre": "Mouse", "categoria": "Periféricos", "proveedor": "TechDistrib SA", "stock": "-1", "precio": "10"},
+    ]))
+    assert (resumen["insertados"], resumen["rechazados"]) == (0, 3)
+
+
+def test_importar_proveedores_actualiza_la_cache(base, tmp_path):
+    cargar_referencias(tmp_path)
+    assert [fila[1] for fila in filas_referencia("proveedores")] == ["Techdistrib Sa"]
+
+    importar_desde_archivo("proveedores", escribir_csv(tmp_path / "b.csv", [
+        {"nombre": "TechDistrib Argentina", "telefono": "1150001000", "email": "ventas@techdistrib.com",
+         "cuit": "30548976123"},
+        {"nombre": "ZendaTech", "telefono": "1166004000", "email": "contacto@zendatech.com", "cuit": "30548911223"},
+    ]), tamanio_lote=1)
+    assert [fila[1] for fila in filas_referencia("proveedores")] == ["Techdistrib Argentina", "Zendatech"]
+
+
+def test_archivo_inexistente(base, tmp_path):
+    assert importar_desde_archivo("clientes", str(tmp_path / "no_existe.csv")) is None
@@ -0,0 +1,19 @@
+# Pruebas del parser de la línea de comandos (inventario.py)
+
+import pytest
+
+from inventario import crear_parser
+
+
+@pytest.mark.parametrize("argumentos, tipo", [
+    (["ventas", "ranking", "productos"], "productos"),
+    (["sales", "top", "clientes", "-n", "3"], "clientes"),
+])
+def test_ranking_no_pisa_la_entidad(argumentos, tipo):
+    args = crear_parser().parse_args(argumentos)
+    assert (args.entidad, args.tipo) == ("ventas", tipo)
+
+
+def test_ranking_rechaza_tipos_desconocidos():
+    with pytest.raises(SystemExit):
+        crear_parser().parse_args(["ventas", "ranking", "proveedores"])
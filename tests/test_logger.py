@@ -0,0 +1,39 @@
+# Pruebas de la rotación del log (core/logger.py)
+# Dos handlers sobre el mismo archivo hacen de dos procesos independientes: solo uno
+# rota y el otro sigue escribiendo en el archivo nuevo.
+
+import gzip
+import logging
+
+from core.logger import ArchivoRotativo
+
+
+def escribir(handler: ArchivoRotativo, mensaje: str) -> None:
+    handler.handle(logging.LogRecord("prueba", logging.INFO, __file__, 0, mensaje, None, None))
+
+
+def rotados(carpeta) -> list:
+    return sorted(ruta.name for ruta in carpeta.iterdir() if ruta.name.startswith("registro.log.")
+                  and ruta.name != "registro.log.lock")
+
+
+def test_dos_procesos_rotan_una_sola_vez(tmp_path):
+    ruta = str(tmp_path / "registro.log")
+    primero = ArchivoRotativo(ruta, max_bytes=50, rotacion="ninguna", comprimir=True)
+    segundo = ArchivoRotativo(ruta, max_bytes=50, rotacion="ninguna", comprimir=True)
+    for handler in (primero, segundo):
+        handler.setFormatter(logging.Formatter("%(message)s"))
+
+    escribir(primero, "a" * 30)
+    escribir(segundo, "b" * 30)
+    # Los dos ven el archivo lleno; el primero rota y el segundo solo reabre el nuevo
+    escribir(primero, "primero")
+    escribir(segundo, "segundo")
+    primero.close()
+    segundo.close()
+
+    assert len(rotados(tmp_path)) == 1
+    with gzip.open(tmp_path / rotados(tmp_path)[0], "rt", encoding="utf-8") as archivo:
+        assert archivo.read().split() == ["a" * 30, "b" * 30]
+    with open(ruta, encoding="utf-8") as archivo:
+        assert archivo.read().split() == ["primero", "segundo"]
@@ -0,0 +1,58 @@
+# Pruebas del PDF consolidado (gestor_ventas/exportar_factura.py)
+# Con más facturas que FACTURAS_POR_CONSOLIDADO, el consolidado se parte en varios
+# archivos de tamaño acotado, sin perder ni repetir facturas.
+
+import re
+
+import pytest
+
+import gestor_ventas.exportar_factura as exportar_factura
+from db.data_base import conexion_db
+
+CANTIDAD_FACTURAS = 5
+
+
+@pytest.fixture
+def facturas(base):
+    with conexion_db() as conexion:
+        conexion.execute("INSERT INTO clientes (id_cliente, nombre, dni) VALUES (1, 'Cliente 1', '40875231')")
+        conexion.execute("INSERT INTO productos (id_producto, nombre) VALUES (1, 'Producto 1')")
+        for id_factura in range(1, CANTIDAD_FACTURAS + 1):
+            conexion.execute("""
+                INSERT INTO facturas (id_factura, fecha, cliente_id, nombre_cliente, email_cliente, dni_cliente, total)
+                VALUES (?, ?, 1, 'Cliente 1', 'c@mail.com', '40875231', 100.0)
+            """, (id_factura, f"2025-07-0{id_factura} 10:00:00"))
+            conexion.execute("""
+                INSERT INTO factura_detalle (factura_id, producto_id, cantidad, precio_unitario, total_linea,
+                                             nombre_producto, nombre_categoria)
+                VALUES (?, 1, 1, 100.0, 100.0, 'Producto 1', 'Periféricos')
+            """, (id_factura,))
+        conexion.commit()
+
+
+def paginas(ruta) -> int:
+    with open(ruta, "rb") as archivo:
+        return len(re.findall(rb"/Type /Page\b(?!s)", archivo.read()))
+
+
+def test_consolidado_en_un_solo_archivo(facturas, tmp_path):
+    rutas = exportar_factura.generar_pdf_consolidado(1, carpeta=str(tmp_path))
+
+    assert rutas == [str(tmp_path / "consolidado_cliente_1.pdf")]
+    # Portada, una hoja por factura e índice
+    assert paginas(rutas[0]) == CANTIDAD_FACTURAS + 2
+
+
+def test_consolidado_partido(facturas, tmp_path, monkeypatch):
+    monkeypatch.setattr(exportar_factura, "FACTURAS_POR_CONSOLIDADO", 2)
+    avance = []
+    rutas = exportar_factura.generar_pdf_consolidado(carpeta=str(tmp_path),
+                                                     al_avanzar=lambda hechas, total: avance.append((hechas, total)))
+
+    assert rutas == [str(tmp_path / f"consolidado_parte_{numero}.pdf") for numero in (1, 2, 3)]
+    assert [paginas(ruta) for ruta in rutas] == [4, 4, 3]
+    assert avance == [(hechas, CANTIDAD_FACTURAS) for hechas in range(1, CANTIDAD_FACTURAS + 1)]
+
+
+def test_consolidado_sin_facturas(base, tmp_path):
+    assert exportar_factura.generar_pdf_consolidado(carpeta=str(tmp_path)) is None
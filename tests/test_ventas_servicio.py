@@ -0,0 +1,52 @@
+# Pruebas del registro de ventas (gestor_ventas/ventas_servicio.py)
+# Un error al insertar el detalle solo se informa como falta de stock si de verdad
+# algún producto no alcanzaba.
+
+import pytest
+
+import gestor_ventas.ventas_servicio as ventas_servicio
+from db.data_base import conexion_db
+from gestor_ventas.facturas_db import insertar_factura, insertar_detalles_factura
+from gestor_ventas.ventas_servicio import ErrorVenta, StockInsuficiente, registrar_venta_servicio
+
+
+@pytest.fixture
+def catalogo(base):
+    with conexion_db() as conexion:
+        conexion.execute("INSERT INTO clientes (id_cliente, nombre, dni) VALUES (1, 'Cliente 1', '40875231')")
+        conexion.execute("INSERT INTO categorias (id_categoria, nombre) VALUES (1, 'Periféricos')")
+        conexion.execute("INSERT INTO proveedores (id_proveedor, nombre, cuit) VALUES (1, 'TechDistrib SA', '30548976123')")
+        conexion.executemany("""
+            INSERT INTO productos (id_producto, nombre, categoria_id, proveedor_id, stock, precio_unitario)
+            VALUES (?, ?, 1, 1, ?, 100.0)
+        """, [(1, "Teclado", 5), (2, "Mouse", 1)])
+        conexion.commit()
+
+
+def linea(producto_id: int, cantidad: int) -> dict:
+    return {"producto_id": producto_id, "cantidad": cantidad, "precio_unitario": 100.0, "total_linea": 100.0 * cantidad}
+
+
+def test_insertar_detalles_informa_los_productos_sin_stock(catalogo):
+    with conexion_db() as conexion:
+        factura_id = insertar_factura("2025-07-01 10:00:00", 1, 0, conexion)
+        assert insertar_detalles_factura(factura_id, [linea(1, 2), linea(2, 1), linea(2, 1)], conexion) == [2]
+        assert insertar_detalles_factura(factura_id, [linea(1, 2)], conexion) == []
+        assert insertar_detalles_factura(factura_id, [linea(99, 1)], conexion) is None
+        conexion.rollback()
+
+
+def test_falta_de_stock_al_descontar(catalogo, monkeypatch):
+    monkeypatch.setattr(ventas_servicio, "insertar_detalles_factura", lambda *args: [2])
+    with pytest.raises(StockInsuficiente, match="'Mouse'"):
+        registrar_venta_servicio(1, [{"producto_id": 2, "cantidad": 1}])
+
+
+def test_error_al_insertar_el_detalle_no_es_falta_de_stock(catalogo, monkeypatch):
+    monkeypatch.setattr(ventas_servicio, "insertar_detalles_factura", lambda *args: None)
+    with pytest.raises(ErrorVenta) as error:
+        registrar_venta_servicio(1, [{"producto_id": 1, "cantidad": 1}])
+    assert not isinstance(error.value, StockInsuficiente)
+
+    with conexion_db() as conexion:
+        assert conexion.execute("SELECT COUNT(*) FROM facturas").fetchone()[0] == 0